@@ -0,0 +1,3 @@
+"""
+데이터 수집/정리 스크립트 모음 (python -m scripts 로 통합 실행, cli.py 참고)
+"""
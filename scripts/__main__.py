@@ -0,0 +1,8 @@
+"""
+python -m scripts 진입점
+"""
+import sys
+
+from scripts.cli import main
+
+sys.exit(main())
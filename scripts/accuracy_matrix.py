@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+몬스터 x 유저 레벨 필요 명중 행렬 (uint16)
+
+지역 파서는 "N레벨 에서의 필요 명중 : 91.65"(N = 몬스터 레벨)에서 값만 stats.requiredAccuracy에 남기고,
+mapledb도 같은 레벨 기준 필요 명중률을 줍니다. 같은 레벨 기준 값은 회피 x 3.666(= 55/15를 사이트가 자른 값)이라
+회피를 되돌려 구한 뒤, 유저 레벨별 100% 명중에 필요한 명중을 계산합니다.
+
+    필요 명중(L) = (55 + 2 x max(0, 몬스터 레벨 - L)) x 회피 / 15   (올림)
+
+- 회피: stats.evasion이 있으면 그대로, 없으면 round(requiredAccuracy / 3.666)
+- 결과는 (몬스터 수, 200) uint16 행렬이고, 정보가 없는 몬스터 행은 UNKNOWN(65535)
+- 저장: accuracy_matrix.json(몬스터 ids/names/level/avoid + 행렬 형식)과 accuracy_matrix.bin
+  (little-endian uint16, 행 우선). 프론트엔드는 .bin을 그대로 Uint16Array로 읽고
+  required[i * 200 + (레벨 - 1)]로 조회합니다.
+- 조회: level, accuracy로 "이 레벨/명중으로 100% 맞힐 수 있는 몬스터" 목록
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/accuracy_matrix.py
+    python scripts/accuracy_matrix.py --query 70 120
+
+    from accuracy_matrix import AccuracyMatrix
+    matrix = AccuracyMatrix.load()
+    matrix.hittable(level=70, accuracy=120)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from monster_analytics import MAX_LEVEL, MonsterColumns, np, require_numpy
+from utils import PROJECT_ROOT
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "accuracy_matrix.json"
+FORMAT_VERSION = 1
+
+BASE_ACCURACY = 55
+PER_LEVEL_GAP = 2
+AVOID_DIVISOR = 15
+SITE_SAME_LEVEL_FACTOR = 3.666
+UNKNOWN = np.iinfo(np.uint16).max if np is not None else 65535
+
+
+def avoidability(cols: MonsterColumns) -> "np.ndarray":
+    """몬스터별 회피 (모르면 NaN)"""
+    derived = np.round(cols.stats["requiredAccuracy"] / SITE_SAME_LEVEL_FACTOR)
+    evasion = cols.stats["evasion"]
+    return np.where(np.isnan(evasion), derived, evasion)
+
+
+def required_accuracy(monster_level: "np.ndarray", avoid: "np.ndarray") -> "np.ndarray":
+    """(몬스터 수, MAX_LEVEL) 유저 레벨 1..MAX별 100% 명중 필요 명중 (uint16, 모르면 UNKNOWN)"""
+    players = np.arange(1, MAX_LEVEL + 1, dtype=np.int32)[None, :]
+    gap = np.maximum(0, monster_level[:, None] - players)
+    with np.errstate(invalid="ignore"):
+        value = np.ceil((BASE_ACCURACY + PER_LEVEL_GAP * gap) * avoid[:, None] / AVOID_DIVISOR - 1e-9)
+    return np.where(np.isnan(value), UNKNOWN, np.clip(value, 0, UNKNOWN - 1)).astype(np.uint16)
+
+
+@dataclass
+class AccuracyMatrix:
+    ids: List[str]
+    names: List[str]
+    level: "np.ndarray"
+    avoid: "np.ndarray"
+    required: "np.ndarray"     # (몬스터 수, MAX_LEVEL) uint16
+
+    @classmethod
+    def build(cls, cols: Optional[MonsterColumns] = None) -> "AccuracyMatrix":
+        require_numpy()
+        cols = cols or MonsterColumns.load()
+        avoid = avoidability(cols)
+        return cls(cols.ids, cols.names, cols.level, avoid, required_accuracy(cols.level, avoid))
+
+    def save(self, path: Path = OUTPUT_DEFAULT) -> Path:
+        """JSON 매니페스트(path) + 행렬 바이너리(path의 .bin) 저장, 바이너리 경로 반환"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        binary = path.with_suffix(".bin")
+        self.required.astype("<u2").tofile(binary)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": FORMAT_VERSION,
+                "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "matrix": {
+                    "file": binary.name,
+                    "dtype": "uint16",
+                    "byteOrder": "little",
+                    "shape": list(self.required.shape),
+                    "unknown": int(UNKNOWN),
+                    "columns": f"player level 1..{MAX_LEVEL}",
+                },
+                "ids": self.ids,
+                "names": self.names,
+                "level": self.level.tolist(),
+                "avoid": [None if math.isnan(a) else round(float(a), 3) for a in self.avoid],
+            }, f, ensure_ascii=False)
+        return binary
+
+    @classmethod
+    def load(cls, path: Path = OUTPUT_DEFAULT) -> "AccuracyMatrix":
+        require_numpy()
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported format version {manifest.get('version')}")
+        matrix = manifest["matrix"]
+        required = np.fromfile(path.with_name(matrix["file"]), dtype="<u2").reshape(matrix["shape"]).astype(np.uint16)
+        avoid = np.array([np.nan if a is None else a for a in manifest["avoid"]], dtype=np.float64)
+        return cls(manifest["ids"], manifest["names"], np.array(manifest["level"], dtype=np.int32), avoid, required)
+
+    @property
+    def known(self) -> "np.ndarray":
+        return self.required[:, 0] != UNKNOWN
+
+    def column(self, level: int) -> "np.ndarray":
+        return self.required[:, min(MAX_LEVEL, max(1, level)) - 1]
+
+    def hittable(self, level: int, accuracy: int) -> List[str]:
+        """이 레벨/명중으로 100% 맞힐 수 있는 몬스터 ID (필요 명중 오름차순, 정보 없는 몬스터 제외)"""
+        col = self.column(level)
+        idx = np.flatnonzero(col <= accuracy)
+        return [self.ids[i] for i in idx[np.argsort(col[idx], kind="stable")]]
+
+    def required_for(self, monster_id: str, level: int) -> Optional[int]:
+        try:
+            value = int(self.column(level)[self.ids.index(monster_id)])
+        except ValueError:
+            return None
+        return None if value == UNKNOWN else value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="몬스터 x 유저 레벨 필요 명중 행렬 생성/조회")
+    parser.add_argument("--query", type=int, nargs=2, metavar=("LEVEL", "ACCURACY"),
+                        help="저장된 행렬에서 100%% 명중 가능한 몬스터 조회")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    args = parser.parse_args()
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    if args.query:
+        if not args.output.exists():
+            print(f"행렬 파일이 없습니다: {args.output} (먼저 인자 없이 실행)", file=sys.stderr)
+            sys.exit(1)
+        matrix = AccuracyMatrix.load(args.output)
+        level, accuracy = args.query
+        col = matrix.column(level)
+        for mid in matrix.hittable(level, accuracy):
+            i = matrix.ids.index(mid)
+            print(f"  {mid:<9} Lv{int(matrix.level[i]):>3} {matrix.names[i]:<16} 필요 명중 {int(col[i])}")
+        return
+
+    started = time.perf_counter()
+    matrix = AccuracyMatrix.build()
+    binary = matrix.save(args.output)
+    elapsed = time.perf_counter() - started
+
+    known = int(matrix.known.sum())
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Monsters: {len(matrix.ids)} (avoidability known: {known})")
+    print(f"  - Matrix: {matrix.required.shape} {matrix.required.dtype}, {matrix.required.nbytes:,} bytes")
+    print(f"  - Elapsed: {elapsed * 1000:.1f}ms")
+    print(f"  - Output: {args.output} (+ {binary.name})")
+
+
+if __name__ == "__main__":
+    main()
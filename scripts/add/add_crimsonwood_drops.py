@@ -7,11 +7,17 @@
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_dir
+
 ROOT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / "src" / "data"
+DATA_DIR = get_data_dir()
 
 
 def load_json(path: Path):
@@ -20,8 +26,7 @@ def load_json(path: Path):
 
 
 def save_json(path: Path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_json_file(path, data, source=Path(__file__).stem)
 
 
 def sort_key_id(id_value: str):
@@ -1,6 +1,12 @@
 import json
+import sys
 from pathlib import Path
 
+# scripts/utils.py import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import PROJECT_ROOT, get_data_path
+
 def add_new_monsters(input_file, output_file=None):
     """
     새로운 몬스터들을 JSON 파일에 추가합니다.
@@ -66,8 +72,7 @@ def add_new_monsters(input_file, output_file=None):
     monsters.sort(key=lambda x: (x['level'], x['name']))
     
     # 파일에 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, monsters, source=Path(__file__).stem)
     
     print(f"\n총 {added_count}개의 몬스터가 추가되었습니다.")
     if skipped_count > 0:
@@ -78,8 +83,8 @@ def add_new_monsters(input_file, output_file=None):
 
 if __name__ == "__main__":
     # 프로젝트 루트와 src/data 모두 업데이트
-    root_file = Path(__file__).parent / "monster_data.json"
-    src_file = Path(__file__).parent / "src" / "data" / "monster_data.json"
+    root_file = PROJECT_ROOT / "monster_data.json"
+    src_file = get_data_path("monster_data.json")
     
     if root_file.exists():
         print("루트 monster_data.json 업데이트 중...")
@@ -15,8 +15,14 @@
 """
 
 import json
+import sys
 from pathlib import Path
 
+# scripts/utils.py import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import PROJECT_ROOT, get_data_path
+
 
 def add_region_ids(region_mapping_file, monster_data_file, output_file=None):
     """
@@ -99,8 +105,7 @@ def add_region_ids(region_mapping_file, monster_data_file, output_file=None):
     
     # 파일에 저장
     print(f"\n파일 저장 중: {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, monsters, source=Path(__file__).stem)
     
     print(f"\n✅ 완료!")
     print(f"  - {updated_count}개의 몬스터에 regionIds가 추가/업데이트되었습니다.")
@@ -133,12 +138,9 @@ def create_sample_mapping_file(file_path):
 
 def main():
     """메인 함수"""
-    import sys
-    
-    # 기본 경로
-    script_dir = Path(__file__).parent
-    mapping_file = script_dir / 'monster_regions.txt'
-    monster_file = script_dir / 'src' / 'data' / 'monster_data.json'
+    # 기본 경로 (프로젝트 루트의 monster_regions.txt, src/data/monster_data.json)
+    mapping_file = PROJECT_ROOT / 'monster_regions.txt'
+    monster_file = get_data_path('monster_data.json')
     
     # 커맨드라인 인자로 경로 지정 가능
     if len(sys.argv) > 1:
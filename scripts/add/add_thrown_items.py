@@ -9,11 +9,18 @@ from __future__ import annotations
 import json
 import re
 import ssl
+import sys
 from pathlib import Path
 from urllib.request import Request, urlopen
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from fetcher import rewrite_url
+from utils import get_data_dir
+
 ROOT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / "src" / "data"
+DATA_DIR = get_data_dir()
 DETAIL_URL_TEMPLATE = "https://xn--o80b01o9mlw3kdzc.com/item_detail/{item_id}"
 
 THROWN_ITEM_IDS = ["2070005", "2070010"]
@@ -21,7 +28,7 @@ THROWN_ITEM_IDS = ["2070005", "2070010"]
 
 def fetch_bytes(url: str, timeout: int = 30) -> bytes:
     req = Request(
-        url,
+        rewrite_url(url),
         headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
     )
     return urlopen(req, context=ssl.create_default_context(), timeout=timeout).read()
@@ -43,8 +50,7 @@ def load_json(path: Path):
 
 
 def save_json(path: Path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_json_file(path, data, source=Path(__file__).stem)
 
 
 def sort_key_id(id_value: str):
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Selenium 브라우저 세션 풀 (N개 브라우저 x M개 탭)
+
+기존 스크립트는 실행마다 headless Chrome을 새로 띄우고 driver.get() 후 time.sleep(3)으로 고정 대기했습니다.
+이 풀은
+- 브라우저 프로세스를 한 번 띄워서 여러 검색어/여러 fetch_many 호출에 재사용하고
+- 브라우저마다 M개의 탭에서 동시에 페이지를 로딩하며 (page_load_strategy="none" + location 이동)
+- 고정 sleep 대신 document.readyState와 준비 확인용 CSS selector로 로딩 완료를 판단합니다.
+
+WebDriver는 스레드 안전하지 않으므로 브라우저 하나당 스레드 하나가 자기 탭들을 돌아가며 확인하고,
+모든 브라우저 스레드는 하나의 작업 큐를 공유합니다.
+
+사용 예시:
+    from browser_pool import BrowserPool
+
+    with BrowserPool(browsers=2, tabs_per_browser=4) as pool:
+        for result in pool.fetch_many(urls, ready_selector=".drop-rate-box, a[href*='item_detail']"):
+            if result.ok:
+                parse(result.html)
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from fetcher import USER_AGENT, HostRateLimiter, rewrite_url
+
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.common.by import By
+except ImportError:
+    webdriver = None
+    WebDriverException = Exception
+    By = None
+
+# 탭 상태 확인 주기 (초)
+POLL_INTERVAL = 0.1
+
+
+@dataclass
+class BrowserResult:
+    url: str
+    html: str
+    elapsed: float
+    timed_out: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+@dataclass
+class _TabJob:
+    url: str
+    started: float
+    deadline: float
+
+
+def require_selenium() -> None:
+    if webdriver is None:
+        raise RuntimeError("selenium is not installed. Please install it with: pip install selenium")
+
+
+def make_chrome_options(headless: bool = True):
+    """기존 스크래퍼와 같은 Chrome 옵션 + 페이지 로딩 완료를 기다리지 않는 전략"""
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    # driver.get/location 이동이 로딩 완료까지 블로킹하지 않도록 (준비 여부는 직접 확인)
+    options.page_load_strategy = "none"
+    return options
+
+
+class BrowserSession:
+    """브라우저 1개 + 탭 M개"""
+
+    def __init__(self, tabs: int, headless: bool = True):
+        require_selenium()
+        self.driver = webdriver.Chrome(options=make_chrome_options(headless))
+        self.driver.implicitly_wait(0)
+        self.handles: List[str] = [self.driver.current_window_handle]
+        for _ in range(tabs - 1):
+            self.driver.switch_to.new_window("tab")
+            self.handles.append(self.driver.current_window_handle)
+
+    def navigate(self, handle: str, url: str) -> None:
+        self.driver.switch_to.window(handle)
+        # 이전 문서에 표시를 남겨서, 이동 직후 이전 페이지의 readyState를 새 페이지로 오인하지 않도록 함
+        self.driver.execute_script("window.__poolStale = true;")
+        self.driver.get(rewrite_url(url))
+
+    def is_ready(self, handle: str, ready_selector: Optional[str]) -> bool:
+        self.driver.switch_to.window(handle)
+        if not self.driver.execute_script("return !window.__poolStale && document.readyState === 'complete';"):
+            return False
+        if ready_selector:
+            return bool(self.driver.find_elements(By.CSS_SELECTOR, ready_selector))
+        return True
+
+    def page_source(self, handle: str) -> str:
+        self.driver.switch_to.window(handle)
+        return self.driver.page_source
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """여러 브라우저 세션이 하나의 작업 큐를 공유하는 풀"""
+
+    def __init__(
+        self,
+        browsers: int = 2,
+        tabs_per_browser: int = 4,
+        ready_timeout: float = 15.0,
+        per_host_interval: float = 0.25,
+        headless: bool = True,
+    ):
+        require_selenium()
+        self.browsers = browsers
+        self.tabs_per_browser = tabs_per_browser
+        self.ready_timeout = ready_timeout
+        self.headless = headless
+        self.limiter = HostRateLimiter(per_host_interval)
+        self.sessions: List[BrowserSession] = []
+
+    def __enter__(self) -> "BrowserPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """브라우저 프로세스를 띄웁니다. (이미 떠 있으면 재사용)"""
+        while len(self.sessions) < self.browsers:
+            self.sessions.append(BrowserSession(self.tabs_per_browser, self.headless))
+
+    def close(self) -> None:
+        for session in self.sessions:
+            session.quit()
+        self.sessions = []
+
+    def _run_session(
+        self,
+        session: BrowserSession,
+        jobs: "queue.Queue[str]",
+        results: "queue.Queue[BrowserResult]",
+        ready_selector: Optional[str],
+    ) -> None:
+        active: Dict[str, _TabJob] = {}
+        try:
+            self._drive_tabs(session, jobs, results, ready_selector, active)
+        except Exception as e:
+            # 브라우저가 죽은 경우 진행 중이던 작업만 실패 처리 (남은 작업은 다른 브라우저가 가져감)
+            for job in active.values():
+                results.put(BrowserResult(job.url, "", time.monotonic() - job.started, error=f"{type(e).__name__}: {e}"))
+
+    def _drive_tabs(
+        self,
+        session: BrowserSession,
+        jobs: "queue.Queue[str]",
+        results: "queue.Queue[BrowserResult]",
+        ready_selector: Optional[str],
+        active: Dict[str, _TabJob],
+    ) -> None:
+        idle = list(session.handles)
+
+        while True:
+            # 빈 탭에 새 작업 배정
+            while idle:
+                try:
+                    url = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                handle = idle.pop()
+                self.limiter.wait(urlparse(url).netloc)
+                now = time.monotonic()
+                try:
+                    session.navigate(handle, url)
+                    active[handle] = _TabJob(url, now, now + self.ready_timeout)
+                except WebDriverException as e:
+                    results.put(BrowserResult(url, "", time.monotonic() - now, error=f"{type(e).__name__}: {e}"))
+                    idle.append(handle)
+
+            if not active:
+                return
+
+            # 진행 중인 탭 확인
+            for handle, job in list(active.items()):
+                now = time.monotonic()
+                try:
+                    ready = session.is_ready(handle, ready_selector)
+                    if ready or now >= job.deadline:
+                        html = session.page_source(handle)
+                        results.put(BrowserResult(job.url, html, now - job.started, timed_out=not ready))
+                    else:
+                        continue
+                except WebDriverException as e:
+                    results.put(BrowserResult(job.url, "", now - job.started, error=f"{type(e).__name__}: {e}"))
+                del active[handle]
+                idle.append(handle)
+
+            time.sleep(POLL_INTERVAL)
+
+    def fetch_many(self, urls: Iterable[str], ready_selector: Optional[str] = None) -> Iterator[BrowserResult]:
+        """
+        URL들을 모든 브라우저 탭에 나눠 로딩하고 준비되는 순서대로 결과를 반환합니다.
+        ready_selector가 주어지면 해당 요소가 나타날 때까지(최대 ready_timeout초) 기다립니다.
+        시간 초과된 페이지도 그 시점의 HTML과 함께 timed_out=True로 반환합니다.
+        """
+        self.start()
+        url_list = list(dict.fromkeys(urls))
+        jobs: "queue.Queue[str]" = queue.Queue()
+        for url in url_list:
+            jobs.put(url)
+        results: "queue.Queue[BrowserResult]" = queue.Queue()
+
+        threads = [
+            threading.Thread(target=self._run_session, args=(s, jobs, results, ready_selector), daemon=True)
+            for s in self.sessions
+        ]
+        for t in threads:
+            t.start()
+
+        remaining = len(url_list)
+        while remaining:
+            try:
+                result = results.get(timeout=1.0)
+            except queue.Empty:
+                if any(t.is_alive() for t in threads):
+                    continue
+                # 모든 브라우저 스레드가 종료됨 -> 큐에 남은 작업은 실패로 반환
+                while remaining:
+                    try:
+                        url = jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    remaining -= 1
+                    yield BrowserResult(url, "", 0.0, error="no live browser session")
+                if results.empty():
+                    break
+                continue
+            remaining -= 1
+            yield result
+
+        for t in threads:
+            t.join()
+
+    def fetch(self, url: str, ready_selector: Optional[str] = None) -> BrowserResult:
+        return next(iter(self.fetch_many([url], ready_selector=ready_selector)))
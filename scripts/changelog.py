@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+src/data 변경 이력(append-only 이벤트 로그) + 스냅샷 압축 + 시점 조회
+
+- 모든 데이터 변경은 src/data/history/events.jsonl에 필드 단위 이벤트로 추가만 됩니다.
+- 이벤트가 SNAPSHOT_INTERVAL개 쌓일 때마다 전체 상태를 스냅샷(gzip)으로 압축 저장합니다.
+- 특정 시점/패치 태그 기준 데이터는 "가장 가까운 이전 스냅샷 + 이후 이벤트 재생"으로 복원합니다.
+  스냅샷에 이벤트 파일의 byte offset을 기록해 두므로, 재생은 로그 전체가 아니라 꼬리 부분만 읽습니다.
+
+사용 예시 (데이터 수정 스크립트에서):
+    from changelog import save_with_history
+    save_with_history("monster_data.json", monsters, tag="2025-12-23-patch", source="update_monster_exp_latest")
+
+이력 없이 파일을 직접 고친 경우에도, 다음 record()(또는 CLI history/materialize) 때
+로그 복원 상태와 파일을 비교해 차이를 source="out-of-band" 이벤트로 먼저 채워 넣습니다.
+JSON 저장 헬퍼가 있는 스크립트는 save_json_file(path, data, source=...)을 쓰면
+src/data 경로일 때만 자동으로 이력이 남습니다.
+
+사용 예시 (CLI):
+    python scripts/changelog.py history monster_data.json 6300001 --field exp
+    python scripts/changelog.py materialize monster_data.json --before-tag 2025-12-23-patch --output old.json
+    python scripts/changelog.py tags
+    python scripts/changelog.py compact
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils import get_data_path
+
+HISTORY_DIR = get_data_path("history")
+EVENTS_FILE_NAME = "events.jsonl"
+TAGS_FILE_NAME = "tags.json"
+SNAPSHOT_DIR_NAME = "snapshots"
+SNAPSHOT_INDEX_NAME = "index.json"
+
+# 이 개수만큼 이벤트가 쌓이면 자동으로 스냅샷을 만듭니다.
+SNAPSHOT_INTERVAL = 5000
+
+# 이벤트 종류
+OP_ADD = "add"        # 엔티티 추가 (value = 엔티티 전체)
+OP_REMOVE = "remove"  # 엔티티 삭제
+OP_SET = "set"        # 최상위 필드 설정 (field, value)
+OP_UNSET = "unset"    # 최상위 필드 삭제 (field)
+
+BASELINE_TAG = "baseline"
+# 이력 없이 파일이 직접 수정된 경우 record() 직전에 채워 넣는 이벤트의 source
+OUT_OF_BAND_SOURCE = "out-of-band"
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def parse_timestamp(text: str) -> str:
+    """ISO 날짜/시간 문자열을 UTC ISO 문자열로 정규화 (예: 2025-12-23 -> 2025-12-23T00:00:00+00:00)"""
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def entity_key(dataset: str, entity: dict) -> str:
+    """데이터셋별 엔티티 키 (monster_item_relations.json은 monsterId:itemId 조합)"""
+    if dataset == "monster_item_relations.json":
+        return f"{entity.get('monsterId')}:{entity.get('itemId')}"
+    return str(entity.get("id"))
+
+
+def index_by_key(dataset: str, rows: List[dict]) -> Dict[str, dict]:
+    return {entity_key(dataset, row): row for row in rows}
+
+
+def diff_entities(dataset: str, before: List[dict], after: List[dict]) -> List[dict]:
+    """두 버전 사이의 필드 단위 변경 이벤트 목록 (seq/ts는 아직 없음)"""
+    before_by_key = index_by_key(dataset, before)
+    after_by_key = index_by_key(dataset, after)
+    events: List[dict] = []
+
+    for key, old in before_by_key.items():
+        if key not in after_by_key:
+            events.append({"dataset": dataset, "key": key, "op": OP_REMOVE})
+
+    for key, new in after_by_key.items():
+        old = before_by_key.get(key)
+        if old is None:
+            events.append({"dataset": dataset, "key": key, "op": OP_ADD, "value": new})
+            continue
+        if old == new:
+            continue
+        for field, value in new.items():
+            if field not in old or old[field] != value:
+                events.append({"dataset": dataset, "key": key, "op": OP_SET, "field": field, "value": value})
+        for field in old:
+            if field not in new:
+                events.append({"dataset": dataset, "key": key, "op": OP_UNSET, "field": field})
+
+    return events
+
+
+def apply_event(state: Dict[str, Dict[str, dict]], event: dict) -> None:
+    """이벤트 하나를 {dataset: {key: entity}} 상태에 적용"""
+    entities = state.setdefault(event["dataset"], {})
+    key = event["key"]
+    op = event["op"]
+    if op == OP_ADD:
+        entities[key] = json.loads(json.dumps(event["value"]))
+    elif op == OP_REMOVE:
+        entities.pop(key, None)
+    elif op == OP_SET:
+        entities.setdefault(key, {})[event["field"]] = event["value"]
+    elif op == OP_UNSET:
+        if key in entities:
+            entities[key].pop(event["field"], None)
+
+
+class ChangeLog:
+    """src/data/history 디렉토리의 이벤트 로그/스냅샷/태그 관리"""
+
+    def __init__(self, history_dir: Path = HISTORY_DIR, snapshot_interval: int = SNAPSHOT_INTERVAL):
+        self.history_dir = Path(history_dir)
+        self.events_file = self.history_dir / EVENTS_FILE_NAME
+        self.tags_file = self.history_dir / TAGS_FILE_NAME
+        self.snapshot_dir = self.history_dir / SNAPSHOT_DIR_NAME
+        self.snapshot_index_file = self.snapshot_dir / SNAPSHOT_INDEX_NAME
+        self.snapshot_interval = snapshot_interval
+
+    # ---------- 저장소 메타데이터 ----------
+
+    def load_snapshot_index(self) -> List[dict]:
+        if not self.snapshot_index_file.exists():
+            return []
+        with open(self.snapshot_index_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def load_tags(self) -> Dict[str, dict]:
+        if not self.tags_file.exists():
+            return {}
+        with open(self.tags_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_json(self, path: Path, data) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+
+    def last_seq(self) -> int:
+        """마지막 이벤트 seq (이벤트가 없으면 0). 마지막 스냅샷 이후 꼬리만 읽습니다."""
+        index = self.load_snapshot_index()
+        seq = index[-1]["seq"] if index else 0
+        offset = index[-1]["offset"] if index else 0
+        for _, event in self._iter_events(offset):
+            seq = event["seq"]
+        return seq
+
+    def has_dataset(self, dataset: str) -> bool:
+        tags = self.load_tags()
+        return f"{BASELINE_TAG}:{dataset}" in tags
+
+    def sync(self, dataset: str, current: List[dict]) -> int:
+        """
+        로그로 복원한 데이터셋 상태와 현재 파일 내용(current)을 비교해,
+        이력 없이 바뀐 부분(직접 json.dump 등)을 out-of-band 이벤트로 기록합니다.
+        """
+        if not self.has_dataset(dataset):
+            return 0
+        logged = list(self.materialize_state().get(dataset, {}).values())
+        return self.append(diff_entities(dataset, logged, current), source=OUT_OF_BAND_SOURCE)
+
+    # ---------- 기록 ----------
+
+    def _iter_events(self, offset: int = 0) -> Iterator[Tuple[int, dict]]:
+        """(다음 이벤트 offset, 이벤트) 순회"""
+        if not self.events_file.exists():
+            return
+        with open(self.events_file, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                offset += len(line)
+                line = line.strip()
+                if line:
+                    yield offset, json.loads(line)
+
+    def append(self, events: List[dict], tag: Optional[str] = None, source: Optional[str] = None) -> int:
+        """이벤트 추가. seq/ts/tag/source를 채워서 로그 끝에 붙이고 추가된 개수를 반환합니다."""
+        if not events:
+            return 0
+
+        seq = self.last_seq()
+        ts = now_iso()
+        first_seq = seq + 1
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.events_file, "a", encoding="utf-8") as f:
+            for event in events:
+                seq += 1
+                record = {"seq": seq, "ts": ts, **event}
+                if tag:
+                    record["tag"] = tag
+                if source:
+                    record["source"] = source
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        if tag:
+            tags = self.load_tags()
+            entry = tags.get(tag)
+            if entry:
+                entry["lastSeq"] = seq
+                entry["lastTs"] = ts
+            else:
+                tags[tag] = {"firstSeq": first_seq, "lastSeq": seq, "ts": ts, "lastTs": ts}
+            self._save_json(self.tags_file, tags)
+
+        self.compact()
+        return len(events)
+
+    def record(
+        self,
+        dataset: str,
+        before: List[dict],
+        after: List[dict],
+        tag: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> int:
+        """
+        before -> after 변경분을 기록합니다.
+        해당 데이터셋의 첫 기록이면 before 전체를 baseline 이벤트로 먼저 남기고,
+        이미 기록된 데이터셋이면 로그 상태와 before의 차이를 out-of-band 이벤트로 먼저 남깁니다.
+        """
+        if self.has_dataset(dataset):
+            self.sync(dataset, before)
+        else:
+            baseline = [{"dataset": dataset, "key": entity_key(dataset, row), "op": OP_ADD, "value": row} for row in before]
+            self.append(baseline, tag=f"{BASELINE_TAG}:{dataset}", source=source)
+        return self.append(diff_entities(dataset, before, after), tag=tag, source=source)
+
+    # ---------- 스냅샷 ----------
+
+    def compact(self, force: bool = False) -> Optional[int]:
+        """
+        마지막 스냅샷 이후 이벤트가 snapshot_interval개 이상이면(또는 force) 새 스냅샷을 만듭니다.
+        Returns: 생성된 스냅샷의 seq (생성하지 않으면 None)
+        """
+        index = self.load_snapshot_index()
+        base_seq = index[-1]["seq"] if index else 0
+        tail = list(self._iter_events(index[-1]["offset"] if index else 0))
+        if not tail:
+            return None
+        if not force and len(tail) < self.snapshot_interval:
+            return None
+
+        state = self._load_snapshot(index[-1]) if index else {}
+        for _, event in tail:
+            apply_event(state, event)
+        offset, last_event = tail[-1]
+
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        file_name = f"snapshot_{last_event['seq']:010d}.json.gz"
+        with gzip.open(self.snapshot_dir / file_name, "wt", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+
+        index.append({
+            "seq": last_event["seq"],
+            "ts": last_event["ts"],
+            "offset": offset,
+            "file": file_name,
+            "eventsSincePrevious": last_event["seq"] - base_seq,
+        })
+        self._save_json(self.snapshot_index_file, index)
+        return last_event["seq"]
+
+    def _load_snapshot(self, entry: dict) -> Dict[str, Dict[str, dict]]:
+        with gzip.open(self.snapshot_dir / entry["file"], "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    # ---------- 조회 ----------
+
+    def resolve_seq(self, tag: Optional[str] = None, before_tag: Optional[str] = None) -> Optional[int]:
+        """태그 -> seq (tag: 해당 패치 적용 후, before_tag: 해당 패치 적용 전)"""
+        name = tag or before_tag
+        if name is None:
+            return None
+        tags = self.load_tags()
+        if name not in tags:
+            raise KeyError(f"Unknown tag: {name}")
+        return tags[name]["lastSeq"] if tag else tags[name]["firstSeq"] - 1
+
+    def materialize_state(self, at_seq: Optional[int] = None, at_ts: Optional[str] = None) -> Dict[str, Dict[str, dict]]:
+        """seq 또는 timestamp 시점의 전체 상태 ({dataset: {key: entity}})"""
+        index = self.load_snapshot_index()
+        start = None
+        for entry in index:
+            if at_seq is not None and entry["seq"] > at_seq:
+                break
+            if at_ts is not None and entry["ts"] > at_ts:
+                break
+            start = entry
+
+        state = self._load_snapshot(start) if start else {}
+        for _, event in self._iter_events(start["offset"] if start else 0):
+            if at_seq is not None and event["seq"] > at_seq:
+                break
+            if at_ts is not None and event["ts"] > at_ts:
+                break
+            apply_event(state, event)
+        return state
+
+    def materialize(
+        self,
+        dataset: str,
+        at: Optional[str] = None,
+        tag: Optional[str] = None,
+        before_tag: Optional[str] = None,
+    ) -> List[dict]:
+        """데이터셋을 특정 시점(at: ISO timestamp) 또는 패치 태그 기준으로 복원"""
+        at_seq = self.resolve_seq(tag=tag, before_tag=before_tag)
+        at_ts = parse_timestamp(at) if at else None
+        state = self.materialize_state(at_seq=at_seq, at_ts=at_ts)
+        return list(state.get(dataset, {}).values())
+
+    def field_history(self, dataset: str, key: str, field: Optional[str] = None) -> List[dict]:
+        """엔티티(와 필드)의 변경 이벤트 목록 (로그 전체 스캔)"""
+        result = []
+        for _, event in self._iter_events(0):
+            if event["dataset"] != dataset or event["key"] != key:
+                continue
+            if field is not None and event["op"] in (OP_SET, OP_UNSET) and event.get("field") != field:
+                continue
+            result.append(event)
+        return result
+
+
+def save_with_history(
+    filename: str,
+    data: List[dict],
+    tag: Optional[str] = None,
+    source: Optional[str] = None,
+    changelog: Optional[ChangeLog] = None,
+) -> int:
+    """
+    src/data/{filename}을 저장하면서 기존 파일 대비 변경분을 이벤트 로그에 기록합니다.
+
+    Returns:
+        기록된 이벤트 수
+    """
+    path = get_data_path(filename)
+    before: List[dict] = []
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            before = json.load(f)
+
+    log = changelog or ChangeLog()
+    recorded = log.record(filename, before, data, tag=tag, source=source)
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return recorded
+
+
+def save_json_file(
+    path: Path,
+    data,
+    tag: Optional[str] = None,
+    source: Optional[str] = None,
+    changelog: Optional[ChangeLog] = None,
+) -> int:
+    """
+    JSON 파일 저장. 경로가 src/data/{파일명}이면 save_with_history로 이력을 남기고,
+    그 외 경로(임시 출력 등)는 그대로 저장합니다.
+
+    Returns:
+        기록된 이벤트 수 (이력 대상이 아니면 0)
+    """
+    path = Path(path)
+    if isinstance(data, list) and path.resolve() == get_data_path(path.name).resolve():
+        return save_with_history(path.name, data, tag=tag, source=source, changelog=changelog)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+def sync_from_disk(log: ChangeLog, dataset: str) -> int:
+    """src/data/{dataset} 현재 내용과 로그를 맞춥니다 (조회 전에 out-of-band 변경 반영)."""
+    path = get_data_path(dataset)
+    if not path.exists():
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        return log.sync(dataset, json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="src/data 변경 이력 조회/복원")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_hist = sub.add_parser("history", help="엔티티(필드) 변경 이력 출력")
+    p_hist.add_argument("dataset", help="예: monster_data.json")
+    p_hist.add_argument("key", help="엔티티 ID (관계 데이터는 monsterId:itemId)")
+    p_hist.add_argument("--field", default=None)
+
+    p_mat = sub.add_parser("materialize", help="특정 시점/태그 기준 데이터셋 복원")
+    p_mat.add_argument("dataset")
+    group = p_mat.add_mutually_exclusive_group(required=True)
+    group.add_argument("--at", help="ISO 날짜/시간 (예: 2025-12-22 또는 2025-12-22T12:00:00)")
+    group.add_argument("--tag", help="해당 태그 적용 직후 상태")
+    group.add_argument("--before-tag", help="해당 태그 적용 직전 상태")
+    p_mat.add_argument("--output", type=Path, default=None, help="저장할 파일 (없으면 개수만 출력)")
+
+    sub.add_parser("tags", help="패치 태그 목록")
+    sub.add_parser("compact", help="지금 즉시 스냅샷 생성")
+
+    args = parser.parse_args()
+    log = ChangeLog()
+
+    if args.command in ("history", "materialize"):
+        synced = sync_from_disk(log, args.dataset)
+        if synced:
+            print(f"  (out-of-band 변경 {synced}건 기록)")
+
+    if args.command == "history":
+        for event in log.field_history(args.dataset, args.key, args.field):
+            value = event.get("value") if event["op"] != OP_ADD or args.field is None else event["value"].get(args.field)
+            print(f"  #{event['seq']} {event['ts']} {event['op']:<6} {event.get('field', '-'):<20} "
+                  f"{json.dumps(value, ensure_ascii=False)} [{event.get('tag', '')}]")
+    elif args.command == "materialize":
+        rows = log.materialize(args.dataset, at=args.at, tag=args.tag, before_tag=args.before_tag)
+        print(f"Materialized {len(rows)} rows of {args.dataset}")
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(rows, f, ensure_ascii=False, indent=2)
+            print(f"  Saved: {args.output}")
+    elif args.command == "tags":
+        for name, entry in log.load_tags().items():
+            print(f"  {name:<40} seq {entry['firstSeq']}..{entry['lastSeq']}  {entry['ts']}")
+    elif args.command == "compact":
+        seq = log.compact(force=True)
+        print(f"Snapshot created at seq {seq}" if seq else "Nothing to compact")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@
 
 import json
 
+from utils import get_data_path
+
 # 이미지 기준 알파벳별 몬스터 (그대로 표기)
 IMAGE_ALPHABET_MONSTERS = {
     'H': ['호브', '검켄', '예티', '메카티안', '돼지', '핑크테니', '모래두더지'],
@@ -48,7 +50,7 @@ def normalize(s: str) -> str:
 
 
 def main():
-    with open('src/data/monster_data.json', 'r', encoding='utf-8') as f:
+    with open(get_data_path('monster_data.json'), 'r', encoding='utf-8') as f:
         monsters = json.load(f)
 
     db_names = {normalize(m['name']): m['name'] for m in monsters}
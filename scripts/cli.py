@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scripts 통합 실행기 (python -m scripts)
+
+각 폴더의 스크립트를 용도별 서브커맨드로 묶어서 실행합니다.
+- crawl    : 사이트 수집 (parse/crawl_*, scrape_*, *_from_site, update/merge_monster_sources 등)
+- reparse  : 저장된 HTML/텍스트 재파싱 (나머지 parse/ 스크립트)
+- migrate  : 데이터 수정/추가/갱신 (fix/, add/, update/)
+- validate : 검증/벤치마크 (validate/, check_image_monsters 등)
+- build    : 데이터 생성 (generate/, 분석 표: monster_analytics, hunting_grounds, drop_simulation,
+             meso_economics, accuracy_matrix, similar_monsters)
+- query    : 조회 도구 (changelog 이력, html_archive, pipeline_daemon, drop_planner 드랍 동선,
+             region_index 지역 분류, map_graph 포탈 이동 거리)
+
+작업 목록은 파일 이름으로만 만들고, 실제 모듈은 실행할 때 runpy로 불러오므로
+selenium 같은 무거운 의존성은 그 작업을 실행할 때만 import 됩니다.
+chain으로 여러 작업을 한 프로세스에서 이어서 실행하면 인터프리터 기동과 공통 모듈(utils, changelog, fetcher 등)
+import 비용을 한 번만 냅니다.
+
+사용 예시:
+    python -m scripts                       # 작업 목록
+    python -m scripts validate check-data
+    python -m scripts crawl map-details --all --parse-timeout 2
+    python -m scripts chain "migrate fix-featured-drops-and-item-names" "validate check-data"
+"""
+
+from __future__ import annotations
+
+import runpy
+import shlex
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+GROUPS = ("crawl", "reparse", "migrate", "validate", "build", "query")
+
+# (그룹, glob 패턴) - 위에서부터 처음 맞는 그룹에 배정
+GROUP_RULES: List[Tuple[str, str]] = [
+    ("crawl", "parse/crawl_*.py"),
+    ("crawl", "parse/scrape_*.py"),
+    ("crawl", "parse/*_from_site.py"),
+    ("crawl", "parse/update_monsters_from_mapledb.py"),
+    ("crawl", "parse/check_search_results.py"),
+    ("crawl", "update/merge_monster_sources.py"),
+    ("crawl", "update/refresh_stale_monsters.py"),
+    ("crawl", "standin_server.py"),
+    ("reparse", "parse/*.py"),
+    ("migrate", "fix/*.py"),
+    ("migrate", "add/*.py"),
+    ("migrate", "update/*.py"),
+    ("validate", "validate/*.py"),
+    ("validate", "check_image_monsters.py"),
+    ("validate", "analyze_alphabet_drops*.py"),
+    ("build", "generate/*.py"),
+    ("build", "monster_analytics.py"),
+    ("build", "hunting_grounds.py"),
+    ("build", "drop_simulation.py"),
+    ("build", "meso_economics.py"),
+    ("build", "accuracy_matrix.py"),
+    ("build", "similar_monsters.py"),
+    ("query", "changelog.py"),
+    ("query", "html_archive.py"),
+    ("query", "pipeline_daemon.py"),
+    ("query", "drop_planner.py"),
+    ("query", "region_index.py"),
+    ("query", "map_graph.py"),
+]
+
+# 작업 이름에서 뗄 접두사/접미사 (update_ripa_monsters_from_site -> ripa-monsters)
+NAME_STRIP = {
+    "crawl": (("update_", "crawl_"), ("_from_site",)),
+    "build": (("generate_",), ()),
+}
+
+# 폴더 이름과 겹쳐서 알아보기 어려운 작업의 별칭
+ALIASES = {
+    ("query", "changelog"): "history",
+    ("query", "html-archive"): "archive",
+    ("query", "pipeline-daemon"): "daemon",
+    ("validate", "analyze-alphabet-drops"): "alphabet-drops",
+    ("validate", "analyze-alphabet-drops-v2"): "alphabet-drops-v2",
+}
+
+
+def job_name(group: str, path: Path) -> str:
+    stem = path.stem
+    prefixes, suffixes = NAME_STRIP.get(group, ((), ()))
+    for prefix in prefixes:
+        if stem.startswith(prefix):
+            stem = stem[len(prefix):]
+            break
+    for suffix in suffixes:
+        if stem.endswith(suffix):
+            stem = stem[: -len(suffix)]
+            break
+    name = stem.replace("_", "-").lower()
+    return ALIASES.get((group, name), name)
+
+
+def discover() -> Dict[str, Dict[str, Path]]:
+    """그룹 -> {작업 이름: 스크립트 경로}. 파일 이름만 보고 만들며 모듈은 import 하지 않음"""
+    jobs: Dict[str, Dict[str, Path]] = {group: {} for group in GROUPS}
+    assigned = set()
+    for group, pattern in GROUP_RULES:
+        for path in sorted(SCRIPTS_DIR.glob(pattern)):
+            if path in assigned or path.name.startswith("_"):
+                continue
+            assigned.add(path)
+            jobs[group][job_name(group, path)] = path
+    return jobs
+
+
+def resolve(jobs: Dict[str, Dict[str, Path]], group: str, name: str) -> Optional[Path]:
+    return jobs.get(group, {}).get(name.replace("_", "-").lower())
+
+
+def run_job(path: Path, args: List[str]) -> int:
+    """python <path> <args>와 같은 조건(sys.argv, sys.path[0])으로 현재 프로세스에서 실행하고 종료 코드 반환"""
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    sys.argv = [str(path), *args]
+    sys.path.insert(0, str(path.parent))
+    try:
+        runpy.run_path(str(path), run_name="__main__")
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        # 작업 안의 예외가 chain 전체를 끝내지 않도록 (--keep-going이면 다음 작업으로, 아니면 요약 후 종료)
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+
+def print_jobs(jobs: Dict[str, Dict[str, Path]], only: Optional[str] = None) -> None:
+    print("usage: python -m scripts <group> <job> [args...]")
+    print('       python -m scripts chain [--keep-going] "<group> <job> [args...]" ...\n')
+    for group in GROUPS:
+        if only and group != only:
+            continue
+        print(f"{group}:")
+        for name, path in sorted(jobs[group].items()):
+            print(f"  {name:<44} {path.relative_to(SCRIPTS_DIR).as_posix()}")
+
+
+def run_chain(jobs: Dict[str, Dict[str, Path]], lines: List[str], keep_going: bool) -> int:
+    planned: List[Tuple[str, Path, List[str]]] = []
+    for line in lines:
+        parts = shlex.split(line)
+        path = resolve(jobs, parts[0], parts[1]) if len(parts) >= 2 else None
+        if path is None:
+            # 중간에 멈추지 않도록 실행 전에 전부 확인
+            print(f"Unknown job: {line}", file=sys.stderr)
+            return 2
+        planned.append((line, path, parts[2:]))
+
+    results: List[Tuple[str, int, float]] = []
+    for line, path, args in planned:
+        print(f"\n>>> {line}")
+        started = time.perf_counter()
+        code = run_job(path, args)
+        results.append((line, code, time.perf_counter() - started))
+        if code != 0 and not keep_going:
+            break
+
+    print("\n" + "=" * 60)
+    print("Chain summary")
+    for line, code, elapsed in results:
+        print(f"  - [{'ok' if code == 0 else f'exit {code}'}] {line} ({elapsed:.2f}s)")
+    skipped = len(lines) - len(results)
+    if skipped:
+        print(f"  - Skipped: {skipped}")
+    return next((code for _, code, _ in results if code != 0), 0)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    jobs = discover()
+
+    if not argv or argv[0] in ("-h", "--help", "list"):
+        print_jobs(jobs, argv[1] if len(argv) > 1 and argv[0] == "list" else None)
+        return 0
+
+    if argv[0] == "chain":
+        keep_going = "--keep-going" in argv[1:]
+        lines = [a for a in argv[1:] if a != "--keep-going"]
+        if not lines:
+            print("chain: no jobs given", file=sys.stderr)
+            return 2
+        return run_chain(jobs, lines, keep_going)
+
+    group = argv[0]
+    if group not in jobs:
+        print(f"Unknown group: {group} (choose from {', '.join(GROUPS)})", file=sys.stderr)
+        return 2
+    if len(argv) < 2 or argv[1] in ("-h", "--help"):
+        print_jobs(jobs, group)
+        return 0
+    path = resolve(jobs, group, argv[1])
+    if path is None:
+        print(f"Unknown job: {group} {argv[1]}", file=sys.stderr)
+        print_jobs(jobs, group)
+        return 2
+    return run_job(path, argv[2:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
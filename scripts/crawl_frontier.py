@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+maplenote 상세 페이지 링크를 따라가는 크롤 프론티어 (우선순위 큐)
+
+monster_detail <-> map_detail <-> item_detail 링크를 따라가며 목록 페이지에 없는 몬스터/맵도 찾습니다.
+- (종류, ID) 단위 중복 제거
+- 깊이 제한(max_depth)과 요청 예산(budget)
+- 여러 워커 스레드가 pop()/done()으로 같은 프론티어를 공유
+- 중단 후 재개할 수 있도록 상태를 JSON으로 저장/복원
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import re
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+KIND_MONSTER = "monster"
+KIND_MAP = "map"
+KIND_ITEM = "item"
+
+BASE_URL = "https://xn--o80b01o9mlw3kdzc.com"
+URL_TEMPLATES = {
+    KIND_MONSTER: BASE_URL + "/monster_detail/{id}",
+    KIND_MAP: BASE_URL + "/map_detail/{id}",
+    KIND_ITEM: BASE_URL + "/item_detail/{id}",
+}
+
+# 링크 경로 -> 종류
+LINK_KINDS = {
+    "monster_detail": KIND_MONSTER,
+    "map_detail": KIND_MAP,
+    "item_detail": KIND_ITEM,
+}
+LINK_PATTERN = re.compile(r'href="[^"]*?/(monster_detail|map_detail|item_detail)/(\d+)"')
+
+# 어느 페이지에서 어느 링크를 따라갈지 (아이템 -> 아이템 링크 등은 그래프를 불필요하게 키움)
+DEFAULT_FOLLOW: Dict[str, Set[str]] = {
+    KIND_MONSTER: {KIND_MAP, KIND_ITEM},
+    KIND_MAP: {KIND_MONSTER},
+    KIND_ITEM: {KIND_MONSTER},
+}
+
+# 작은 값이 먼저. 몬스터/맵이 그래프의 뼈대이고 아이템 페이지는 수가 많아 뒤로 미룹니다.
+KIND_PRIORITY = {KIND_MONSTER: 0, KIND_MAP: 1, KIND_ITEM: 2}
+
+
+def extract_links(html_text: str) -> List[Tuple[str, str]]:
+    """페이지 내 상세 링크 (종류, ID) 목록 (순서 유지, 중복 제거)"""
+    seen = set()
+    links = []
+    for path, entity_id in LINK_PATTERN.findall(html_text):
+        key = (LINK_KINDS[path], entity_id)
+        if key not in seen:
+            seen.add(key)
+            links.append(key)
+    return links
+
+
+@dataclass
+class CrawlTask:
+    kind: str
+    id: str
+    depth: int
+    parent: Optional[str] = None  # "kind:id"
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}:{self.id}"
+
+    @property
+    def url(self) -> str:
+        return URL_TEMPLATES[self.kind].format(id=self.id)
+
+
+class CrawlFrontier:
+    """스레드 안전한 우선순위 크롤 프론티어"""
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        budget: Optional[int] = None,
+        follow: Optional[Dict[str, Set[str]]] = None,
+        kinds: Optional[Set[str]] = None,
+    ):
+        self.max_depth = max_depth
+        self.budget = budget
+        self.follow = follow or DEFAULT_FOLLOW
+        self.kinds = kinds or set(URL_TEMPLATES)
+        self._heap: List[Tuple[int, int, int, CrawlTask]] = []
+        self._counter = itertools.count()
+        self._seen: Set[str] = set()
+        self._done: Set[str] = set()
+        self._active: Dict[str, CrawlTask] = {}
+        self._issued = 0
+        self._cond = threading.Condition()
+        self.edges: Set[Tuple[str, str]] = set()
+
+    def _priority(self, task: CrawlTask) -> Tuple[int, int]:
+        return task.depth, KIND_PRIORITY.get(task.kind, 9)
+
+    def add(self, kind: str, entity_id: str, depth: int = 0, parent: Optional[str] = None) -> bool:
+        """작업 추가. 이미 본 (종류, ID)이거나 깊이/종류 제한에 걸리면 False"""
+        if kind not in self.kinds or depth > self.max_depth:
+            return False
+        task = CrawlTask(kind, entity_id, depth, parent)
+        with self._cond:
+            if task.key in self._seen:
+                return False
+            self._seen.add(task.key)
+            depth_p, kind_p = self._priority(task)
+            heapq.heappush(self._heap, (depth_p, kind_p, next(self._counter), task))
+            self._cond.notify()
+        return True
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[CrawlTask]:
+        """
+        다음 작업을 꺼냅니다. 큐가 비었어도 진행 중인 작업이 새 링크를 추가할 수 있으므로 기다립니다.
+        더 이상 작업이 없거나 예산이 소진되면 None.
+        """
+        with self._cond:
+            while True:
+                if self.budget is not None and self._issued >= self.budget:
+                    return None
+                if self._heap:
+                    _, _, _, task = heapq.heappop(self._heap)
+                    self._active[task.key] = task
+                    self._issued += 1
+                    return task
+                if not self._active:
+                    return None
+                if not self._cond.wait(timeout):
+                    return None
+
+    def done(self, task: CrawlTask, html_text: Optional[str] = None) -> int:
+        """
+        작업 완료 처리. html_text가 주어지면 링크를 추출해 후속 작업을 추가하고 간선을 기록합니다.
+        Returns: 새로 추가된 작업 수
+        """
+        added = 0
+        if html_text is not None:
+            follow = self.follow.get(task.kind, set())
+            for kind, entity_id in extract_links(html_text):
+                if kind == task.kind and entity_id == task.id:
+                    continue
+                with self._cond:
+                    self.edges.add((task.key, f"{kind}:{entity_id}"))
+                if kind in follow and self.add(kind, entity_id, task.depth + 1, task.key):
+                    added += 1
+        with self._cond:
+            self._active.pop(task.key, None)
+            self._done.add(task.key)
+            self._cond.notify_all()
+        return added
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "seen": len(self._seen),
+                "done": len(self._done),
+                "queued": len(self._heap),
+                "inFlight": len(self._active),
+                "issued": self._issued,
+                "edges": len(self.edges),
+            }
+
+    def discovered(self, kind: str) -> Set[str]:
+        """발견된 (종류)의 ID 집합"""
+        prefix = kind + ":"
+        with self._cond:
+            return {key[len(prefix):] for key in self._seen if key.startswith(prefix)}
+
+    # ---------- 저장/복원 ----------
+
+    def save(self, path: Path) -> None:
+        with self._cond:
+            state = {
+                "maxDepth": self.max_depth,
+                "seen": sorted(self._seen),
+                "done": sorted(self._done),
+                "queue": [asdict(t) for t in self._active.values()] + [asdict(t) for _, _, _, t in sorted(self._heap)],
+                "edges": sorted(self.edges),
+            }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+
+    def load(self, path: Path) -> None:
+        """저장된 상태 복원. 끝나지 않은 작업(큐 + 저장 시점에 진행 중이던 작업)은 다시 큐에 넣습니다."""
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        with self._cond:
+            self._done = set(state["done"])
+            self._seen = set(state["done"])
+            self.edges = {tuple(e) for e in state.get("edges", [])}
+        for t in state["queue"]:
+            self.add(t["kind"], t["id"], t["depth"], t.get("parent"))
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수집 파이프라인 계측 (fetch -> decode -> parse -> merge -> save)
+
+스크립트들은 항목별 print와 마지막 Summary만 출력해서 느린 실행이 네트워크/파서/병합 중 어디서 막히는지 알 수 없었습니다.
+CrawlMetrics는
+- 단계별 타이머 (with metrics.stage("parse"): ...)
+- 요청 수(상태 코드별), 수신 바이트, 재시도 횟수, 캐시 적중률
+- 요청/단계 지연 p50/p95/p99 및 Prometheus 히스토그램 버킷
+을 모아서 JSON-lines 트레이스와 node exporter textfile collector용 .prom 파일로 씁니다.
+
+사용 예시:
+    from crawl_metrics import CrawlMetrics
+
+    metrics = CrawlMetrics("crawl_map_details", metrics_dir=Path("src/request/metrics"))
+    fetcher = Fetcher(on_result=metrics.on_fetch)
+    for result in fetcher.fetch_many(urls):
+        with metrics.stage("decode"):
+            html = choose_decode(result.body)
+        with metrics.stage("parse"):
+            parsed = parse(html)
+    metrics.finish()   # .prom 파일 저장 + 요약 출력
+
+    # Fetcher 없이 순차로 받는 스크립트
+    raw = metrics.timed_fetch(fetch_bytes, url)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.error import HTTPError
+
+from utils import PROJECT_ROOT
+
+METRICS_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "metrics"
+
+# Prometheus 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUANTILES = (0.5, 0.95, 0.99)
+
+# 파이프라인 단계 (출력 순서)
+STAGES = ("fetch", "decode", "parse", "merge", "save")
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class CrawlMetrics:
+    """스레드 안전한 수집 지표 모음"""
+
+    def __init__(self, job: str, metrics_dir: Optional[Path] = METRICS_DIR_DEFAULT, trace: bool = True):
+        self.job = job
+        self.metrics_dir = Path(metrics_dir) if metrics_dir else None
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Counter = Counter()
+        self.bytes_received = 0
+        self.retries = 0
+        self.cache: Dict[str, Counter] = defaultdict(Counter)
+        self.counters: Counter = Counter()
+        self._trace_file = None
+        if self.metrics_dir and trace:
+            self.metrics_dir.mkdir(parents=True, exist_ok=True)
+            self._trace_file = open(self.metrics_dir / f"{job}_trace.jsonl", "a", encoding="utf-8")
+
+    # ---------- 기록 ----------
+
+    def _trace(self, event: Dict[str, object]) -> None:
+        if self._trace_file is None:
+            return
+        event = {"ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"), "job": self.job, **event}
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self._trace_file.write(line + "\n")
+
+    def observe(self, stage: str, seconds: float, **fields) -> None:
+        with self._lock:
+            self.durations[stage].append(seconds)
+        self._trace({"stage": stage, "seconds": round(seconds, 6), **fields})
+
+    @contextmanager
+    def stage(self, name: str, **fields) -> Iterator[None]:
+        """with 블록 실행 시간을 단계 name으로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **fields)
+
+    def on_fetch(self, result) -> None:
+        """fetcher.Fetcher(on_result=...) 콜백. FetchResult 또는 BrowserResult/PageResult 모두 받음"""
+        status = getattr(result, "status", None)
+        if status is None:
+            status = "error" if getattr(result, "error", None) else 200
+        body = getattr(result, "body", None)
+        size = len(body) if body is not None else len(getattr(result, "html", "") or "")
+        self._record_fetch(result.url, status, size, getattr(result, "attempts", 1), result.elapsed)
+
+    def timed_fetch(self, fetch: Callable[[str], bytes], url: str) -> bytes:
+        """
+        순차 fetch 함수(fetch_bytes(url) -> bytes) 호출을 계측합니다. (Fetcher를 쓰지 않는 지역별 업데이트 스크립트용)
+        예외는 상태 코드(HTTPError) 또는 "error"로 기록한 뒤 그대로 다시 던집니다.
+        """
+        started = time.perf_counter()
+        status: object = "error"
+        body = b""
+        try:
+            body = fetch(url)
+            status = 200
+            return body
+        except HTTPError as e:
+            status = e.code
+            raise
+        finally:
+            self._record_fetch(url, status, len(body), 1, time.perf_counter() - started)
+
+    def _record_fetch(self, url: str, status, size: int, attempts: int, elapsed: float) -> None:
+        with self._lock:
+            self.statuses[str(status)] += 1
+            self.bytes_received += size
+            self.retries += max(0, attempts - 1)
+            self.durations["fetch"].append(elapsed)
+        self._trace({"stage": "fetch", "url": url, "status": status, "bytes": size,
+                     "attempts": attempts, "seconds": round(elapsed, 6)})
+
+    def cache_hit(self, name: str, hit: bool) -> None:
+        with self._lock:
+            self.cache[name]["hit" if hit else "miss"] += 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    # ---------- 집계 ----------
+
+    def summary(self) -> Dict[str, object]:
+        with self._lock:
+            stages = {}
+            for name in sorted(self.durations, key=lambda s: (STAGES.index(s) if s in STAGES else len(STAGES), s)):
+                values = sorted(self.durations[name])
+                stages[name] = {
+                    "count": len(values),
+                    "total": round(sum(values), 4),
+                    **{f"p{int(q * 100)}": round(percentile(values, q), 4) for q in QUANTILES},
+                }
+            cache = {
+                name: {**c, "ratio": round(c["hit"] / (c["hit"] + c["miss"]), 4) if c["hit"] + c["miss"] else None}
+                for name, c in self.cache.items()
+            }
+            return {
+                "job": self.job,
+                "wallSeconds": round(time.monotonic() - self.started, 3),
+                "requests": sum(self.statuses.values()),
+                "statuses": dict(self.statuses),
+                "bytes": self.bytes_received,
+                "retries": self.retries,
+                "cache": cache,
+                "counters": dict(self.counters),
+                "stages": stages,
+            }
+
+    def prometheus_text(self) -> str:
+        """node exporter textfile collector 형식"""
+        job = self.job.replace("\\", "\\\\").replace('"', '\\"')
+        lines = [
+            "# HELP maple_crawl_requests_total HTTP requests by status",
+            "# TYPE maple_crawl_requests_total counter",
+        ]
+        with self._lock:
+            for status, n in sorted(self.statuses.items()):
+                lines.append(f'maple_crawl_requests_total{{job="{job}",status="{status}"}} {n}')
+            lines += [
+                "# HELP maple_crawl_bytes_total Response bytes received",
+                "# TYPE maple_crawl_bytes_total counter",
+                f'maple_crawl_bytes_total{{job="{job}"}} {self.bytes_received}',
+                "# HELP maple_crawl_retries_total Retried requests",
+                "# TYPE maple_crawl_retries_total counter",
+                f'maple_crawl_retries_total{{job="{job}"}} {self.retries}',
+                "# HELP maple_crawl_cache_total Cache lookups by result",
+                "# TYPE maple_crawl_cache_total counter",
+            ]
+            for name, c in sorted(self.cache.items()):
+                for result in ("hit", "miss"):
+                    lines.append(f'maple_crawl_cache_total{{job="{job}",cache="{name}",result="{result}"}} {c[result]}')
+            lines += [
+                "# HELP maple_crawl_items_total Job-specific item counters",
+                "# TYPE maple_crawl_items_total counter",
+            ]
+            for name, n in sorted(self.counters.items()):
+                lines.append(f'maple_crawl_items_total{{job="{job}",name="{name}"}} {n}')
+            lines += [
+                "# HELP maple_crawl_stage_seconds Pipeline stage duration",
+                "# TYPE maple_crawl_stage_seconds histogram",
+            ]
+            for stage, values in sorted(self.durations.items()):
+                for bound in LATENCY_BUCKETS:
+                    n = sum(1 for v in values if v <= bound)
+                    lines.append(f'maple_crawl_stage_seconds_bucket{{job="{job}",stage="{stage}",le="{bound}"}} {n}')
+                lines.append(f'maple_crawl_stage_seconds_bucket{{job="{job}",stage="{stage}",le="+Inf"}} {len(values)}')
+                lines.append(f'maple_crawl_stage_seconds_sum{{job="{job}",stage="{stage}"}} {sum(values):.6f}')
+                lines.append(f'maple_crawl_stage_seconds_count{{job="{job}",stage="{stage}"}} {len(values)}')
+            lines += [
+                "# HELP maple_crawl_last_run_timestamp_seconds Last run finish time",
+                "# TYPE maple_crawl_last_run_timestamp_seconds gauge",
+                f'maple_crawl_last_run_timestamp_seconds{{job="{job}"}} {time.time():.0f}',
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Optional[Path] = None) -> Optional[Path]:
+        """.prom 파일 저장. textfile collector가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 rename"""
+        if path is None:
+            if self.metrics_dir is None:
+                return None
+            path = self.metrics_dir / f"{self.job}.prom"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp, path)
+        return path
+
+    def print_summary(self) -> None:
+        s = self.summary()
+        print(f"\nMetrics ({s['job']}, {s['wallSeconds']}s wall)")
+        print(f"  - Requests: {s['requests']} {s['statuses']}, bytes {s['bytes']}, retries {s['retries']}")
+        for name, c in s["cache"].items():
+            print(f"  - Cache {name}: hit {c.get('hit', 0)} / miss {c.get('miss', 0)} (ratio {c['ratio']})")
+        for name, st in s["stages"].items():
+            print(f"  - {name:<7} n={st['count']:<6} total {st['total']:.2f}s  "
+                  f"p50 {st['p50']:.4f}s  p95 {st['p95']:.4f}s  p99 {st['p99']:.4f}s")
+
+    def finish(self, quiet: bool = False) -> Optional[Path]:
+        """트레이스 닫기 + .prom 저장 + 요약 출력"""
+        self._trace({"stage": "summary", **self.summary()})
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
+        path = self.write_textfile()
+        if not quiet:
+            self.print_summary()
+            if path:
+                print(f"  - Prometheus textfile: {path}")
+        return path
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+드랍 동선 계획기 (사냥할 몬스터/맵 최소 조합)
+
+아이템 목록(예: fix_featured_drops_and_item_names.py의 FEATURED_DROP_ITEM_NAMES)을 모으려면
+어떤 몬스터(또는 맵) 몇 곳을 사냥하면 되는지 monster_item_relations의 dropRate로 계산합니다.
+
+- 커버 비트셋: 목록의 아이템마다 비트 하나, 몬스터/맵마다 떨어뜨리는 아이템 비트를 OR한 정수
+  (맵은 출시된 몬스터를 고르게 잡는다고 보고 아이템별 확률을 평균)
+- 비용: 한 곳에서 맡은 아이템을 전부 얻을 때까지의 기대 처치 수 (기하분포 최댓값의 기댓값)
+  아이템이 적으면 포함-배제로 정확히, 많으면 sum_k P(max > k)를 적분으로 근사 (NumPy, 처치 수 k를 하나씩
+  더하면 0.008% 같은 확률에서는 수십만 번 반복). 같은 (곳, 맡은 아이템 비트셋)은 한 번만 계산
+- 탐색: 욕심쟁이 가중 집합 덮개로 첫 계획을 만들고, --exact면 분기 한정으로 더 싼 계획을 찾음
+  (한 곳을 고르면 그곳이 떨어뜨리는 남은 아이템을 모두 맡는 방식이라 비용이 더해지기만 하므로
+   "지금까지 비용 + 남은 아이템 중 가장 비싼 아이템의 최소 1/p"가 하한이 됨)
+  --exact 없이 --plans가 2 이상이면 분기 한정 대신 첫 선택을 바꾼 욕심쟁이 계획들을 대안으로 냄
+- 다른 곳보다 커버도 좁고 확률도 낮은 곳은 미리 제외 (비트셋 부분집합 검사)
+
+dropRate는 drop_simulation.normalize_drop_rate로 처치당 확률로 바꾸고(퍼센트라서 100으로 나눔),
+dropRate가 없는 관계는 기본으로 제외하고, --unknown-rate를 주면 그 확률로 계산합니다.
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/drop_planner.py --featured --by map --plans 3
+    python scripts/drop_planner.py --items "일비표창" "뇌전수리검" "장갑 공격력 주문서 60%"
+    python scripts/drop_planner.py --items 2070006 2040804 --by monster --exact --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import combinations
+from math import prod
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from drop_simulation import normalize_drop_rate
+from monster_analytics import np, require_numpy
+from utils import get_data_path
+
+# 이 개수 이하는 포함-배제(부분집합 2^n - 1개)로 정확히, 넘으면 적분으로 계산
+INCLUSION_EXCLUSION_MAX = 4
+# 적분: log t 구간을 이 폭의 조각으로 나눠 조각마다 Gauss-Legendre 점 QUADRATURE_ORDER개
+QUADRATURE_PANEL = 0.5
+QUADRATURE_ORDER = 8
+MAX_NODES_DEFAULT = 200_000
+# --exact 없이 대안 계획을 찾을 때 첫 선택으로 시도할 후보 수 (--plans의 배수)
+ALTERNATIVE_FIRST_PICKS = 4
+
+
+@dataclass
+class Source:
+    """사냥할 곳 하나 (몬스터 또는 맵)"""
+    id: str
+    name: str
+    mask: int                                             # 목록 아이템 비트셋
+    rates: Dict[int, float] = field(default_factory=dict)  # 비트 위치 -> 처치당 드랍 확률
+
+
+@dataclass
+class Plan:
+    sources: List[Tuple[Source, int]]   # (사냥할 곳, 그곳에서 얻을 아이템 비트셋)
+    cost: float
+
+    @property
+    def key(self) -> Tuple[str, ...]:
+        return tuple(sorted(s.id for s, _ in self.sources))
+
+
+@lru_cache(maxsize=65536)
+def expected_kills(rates: Tuple[float, ...]) -> float:
+    """확률 p_i 아이템을 모두 한 번 이상 얻을 때까지의 기대 처치 수 E[max Geom(p_i)]"""
+    if not rates:
+        return 0.0
+    if len(rates) == 1:
+        return 1.0 / rates[0]
+    if len(rates) <= INCLUSION_EXCLUSION_MAX:
+        # E[max] = sum_{T != 0} (-1)^{|T|+1} / (1 - prod_{i in T} (1 - p_i))
+        total = 0.0
+        for size in range(1, len(rates) + 1):
+            sign = 1.0 if size % 2 else -1.0
+            for subset in combinations(rates, size):
+                total += sign / (1.0 - prod(1.0 - p for p in subset))
+        return total
+    return _expected_kills_integral(rates)
+
+
+def _expected_kills_integral(rates: Tuple[float, ...]) -> float:
+    """E[max] = sum_{k>=0} f(k), f(t) = 1 - prod_i (1 - e^(-l_i t)), l_i = -ln(1 - p_i)
+
+    오일러-매클로린으로 sum ≈ integral_0^inf f(t) dt + f(0)/2 (f(0) = 1, f'(0) = 0, 나머지 항은 l^3 수준).
+    적분은 t = e^u로 바꿔 u 구간 [ln(1e-6 / l_max), ln((ln n + 40) / l_min)]을 조각별 Gauss-Legendre로 계산
+    (t < 1e-6 / l_max에서는 f ≈ 1). 포함-배제와의 상대 오차는 1e-5 이하.
+    """
+    require_numpy()
+    lam = np.array([-math.log1p(-p) for p in rates if p < 1.0])
+    if not len(lam):
+        return 1.0
+    lo = math.log(1e-6 / lam.max())
+    hi = math.log((math.log(len(lam)) + 40.0) / lam.min())
+    panels = max(1, math.ceil((hi - lo) / QUADRATURE_PANEL))
+    x, w = np.polynomial.legendre.leggauss(QUADRATURE_ORDER)
+    half = (hi - lo) / panels / 2.0
+    centers = lo + half * (2 * np.arange(panels) + 1)
+    u = (centers[:, None] + half * x[None, :]).ravel()
+    t = np.exp(u)
+    f = 1.0 - np.prod(-np.expm1(-np.outer(t, lam)), axis=1)
+    return math.exp(lo) + float((f * t).dot(np.tile(w * half, panels))) + 0.5
+
+
+def bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def compact(name: str) -> str:
+    return "".join(name.split())
+
+
+class DropPlanner:
+    """목록 아이템 비트셋 위에서 몬스터/맵 조합을 찾음"""
+
+    def __init__(self, monsters: List[dict], items: List[dict], relations: List[dict], maps: List[dict],
+                 unknown_rate: Optional[float] = None, released_only: bool = True):
+        self.monsters = {m["id"]: m for m in monsters if not released_only or m.get("isReleased")}
+        self.items = {i["id"]: i for i in items}
+        self.maps = [m for m in maps if not released_only or m.get("isReleased")]
+        self.rates_by_monster: Dict[str, Dict[str, float]] = {}
+        for r in relations:
+            if r["monsterId"] not in self.monsters:
+                continue
+            rate = r.get("dropRate")
+            rate = normalize_drop_rate(float(rate)) if rate is not None else unknown_rate
+            if not rate or rate <= 0:
+                continue
+            per_item = self.rates_by_monster.setdefault(r["monsterId"], {})
+            per_item[r["itemId"]] = max(per_item.get(r["itemId"], 0.0), min(1.0, rate))
+
+        self._costs: Dict[Tuple[str, int], float] = {}
+        self._ids_by_name: Dict[str, List[str]] = {}
+        for item in items:
+            self._ids_by_name.setdefault(compact(item.get("name", "")), []).append(item["id"])
+
+    def resolve_items(self, names_or_ids: Sequence[str]) -> Tuple[List[str], List[str]]:
+        """이름(공백 무시) 또는 ID -> 아이템 ID 목록, 찾지 못한 항목"""
+        found: Dict[str, None] = {}
+        missing = []
+        for value in names_or_ids:
+            if value in self.items:
+                found[value] = None
+                continue
+            ids = self._ids_by_name.get(compact(value))
+            if ids:
+                found.update(dict.fromkeys(ids))
+            else:
+                missing.append(value)
+        return list(found), missing
+
+    def sources(self, item_ids: List[str], by: str) -> List[Source]:
+        bit_of = {item_id: i for i, item_id in enumerate(item_ids)}
+        monster_sources: Dict[str, Source] = {}
+        for mid, per_item in self.rates_by_monster.items():
+            rates = {bit_of[iid]: p for iid, p in per_item.items() if iid in bit_of}
+            if rates:
+                monster_sources[mid] = Source(mid, self.monsters[mid].get("name", mid),
+                                              sum(1 << b for b in rates), rates)
+        if by == "monster":
+            return list(monster_sources.values())
+
+        result = []
+        for game_map in self.maps:
+            spawns = game_map.get("monsterSpawns") or {}
+            members = [mid for mid in dict.fromkeys(game_map.get("monsterIds") or []) if mid in self.monsters]
+            if not members:
+                continue
+            weights = {mid: spawns.get(mid, 1) for mid in members}
+            total = sum(weights.values())
+            rates: Dict[int, float] = {}
+            for mid in members:
+                src = monster_sources.get(mid)
+                if src is None:
+                    continue
+                for b, p in src.rates.items():
+                    rates[b] = rates.get(b, 0.0) + p * weights[mid] / total
+            if rates:
+                result.append(Source(game_map["id"], game_map.get("name", game_map["id"]),
+                                     sum(1 << b for b in rates), rates))
+        return result
+
+    @staticmethod
+    def prune_dominated(sources: List[Source]) -> List[Source]:
+        """커버가 다른 곳의 부분집합이고 모든 아이템 확률이 그 이하인 곳 제외"""
+        ordered = sorted(sources, key=lambda s: (-bin(s.mask).count("1"), s.id))
+        kept: List[Source] = []
+        for s in ordered:
+            if any(s.mask & ~k.mask == 0 and all(k.rates[b] >= p for b, p in s.rates.items()) for k in kept):
+                continue
+            kept.append(s)
+        return kept
+
+    def claim_cost(self, source: Source, claim: int) -> float:
+        """(곳, 맡은 아이템 비트셋)별 기대 처치 수 (plan 호출마다 비트 배치가 같으므로 그 안에서 캐시)"""
+        key = (source.id, claim)
+        cost = self._costs.get(key)
+        if cost is None:
+            cost = self._costs[key] = expected_kills(tuple(sorted(source.rates[b] for b in bits(claim))))
+        return cost
+
+    def greedy(self, sources: List[Source], universe: int, first: Optional[Source] = None) -> Plan:
+        """남은 아이템 수 / 기대 처치 수가 가장 큰 곳부터 고름 (first를 주면 그곳을 먼저 고름)"""
+        uncovered, chosen, cost = universe, [], 0.0
+        if first is not None and first.mask & uncovered:
+            chosen.append((first, first.mask & uncovered))
+            cost += self.claim_cost(first, first.mask & uncovered)
+            uncovered &= ~first.mask
+        while uncovered:
+            best, best_ratio, best_cost = None, -1.0, 0.0
+            for s in sources:
+                claim = s.mask & uncovered
+                if not claim:
+                    continue
+                c = self.claim_cost(s, claim)
+                ratio = bin(claim).count("1") / c
+                if ratio > best_ratio:
+                    best, best_ratio, best_cost = s, ratio, c
+            if best is None:
+                break
+            chosen.append((best, best.mask & uncovered))
+            cost += best_cost
+            uncovered &= ~best.mask
+        return Plan(chosen, cost)
+
+    def branch_and_bound(self, sources: List[Source], universe: int, incumbents: List[Plan], keep: int,
+                         max_nodes: int = MAX_NODES_DEFAULT) -> Tuple[List[Plan], int, bool]:
+        """가장 커버하는 곳이 적은 아이템부터 분기. 상위 keep개 계획, 탐색 노드 수, 전부 탐색했는지"""
+        covering: Dict[int, List[Source]] = {}
+        for s in sources:
+            for b in bits(s.mask):
+                covering.setdefault(b, []).append(s)
+        for b in covering:
+            covering[b].sort(key=lambda s: -s.rates[b])
+        single_cost = {b: 1.0 / covering[b][0].rates[b] for b in covering}
+
+        best: List[Tuple[float, int, Plan]] = []   # 비용이 큰 것이 위로 오는 최대 힙 (-cost)
+        seen = set()
+        counter = 0
+
+        def offer(plan: Plan) -> None:
+            nonlocal counter
+            if plan.key in seen:
+                return
+            seen.add(plan.key)
+            counter += 1
+            heapq.heappush(best, (-plan.cost, counter, plan))
+            if len(best) > keep:
+                seen.discard(heapq.heappop(best)[2].key)
+
+        def bound() -> float:
+            return -best[0][0] if len(best) >= keep else float("inf")
+
+        for plan in incumbents:
+            offer(plan)
+        nodes = 0
+        complete = True
+
+        def search(uncovered: int, chosen: List[Tuple[Source, int]], cost: float) -> None:
+            nonlocal nodes, complete
+            if not uncovered:
+                offer(Plan(list(chosen), cost))
+                return
+            if nodes >= max_nodes:
+                complete = False
+                return
+            nodes += 1
+            if cost + max(single_cost[b] for b in bits(uncovered)) >= bound():
+                return
+            pivot = min(bits(uncovered), key=lambda b: len(covering[b]))
+            for s in covering[pivot]:
+                claim = s.mask & uncovered
+                c = cost + self.claim_cost(s, claim)
+                if c >= bound():
+                    continue
+                chosen.append((s, claim))
+                search(uncovered & ~s.mask, chosen, c)
+                chosen.pop()
+
+        search(universe, [], 0.0)
+        plans = sorted((p for _, _, p in best), key=lambda p: p.cost)
+        return plans, nodes, complete
+
+    def alternatives(self, sources: List[Source], universe: int, incumbent: Plan, keep: int) -> List[Plan]:
+        """첫 선택을 비율 상위 후보로 바꿔 가며 만든 욕심쟁이 계획 중 싼 순서로 keep개 (분기 한정 없이)"""
+        ratio = {s.id: bin(s.mask & universe).count("1") / self.claim_cost(s, s.mask & universe)
+                 for s in sources if s.mask & universe}
+        firsts = sorted((s for s in sources if s.id in ratio), key=lambda s: -ratio[s.id])
+        plans = {incumbent.key: incumbent}
+        for s in firsts[: keep * ALTERNATIVE_FIRST_PICKS]:
+            plan = self.greedy(sources, universe, first=s)
+            plans.setdefault(plan.key, plan)
+        return sorted(plans.values(), key=lambda p: p.cost)[:keep]
+
+    def plan(self, item_ids: List[str], by: str = "monster", plans: int = 3, exact: bool = False,
+             max_nodes: int = MAX_NODES_DEFAULT) -> Dict[str, object]:
+        started = time.perf_counter()
+        self._costs = {}
+        sources = self.sources(item_ids, by)
+        coverable = 0
+        for s in sources:
+            coverable |= s.mask
+        uncoverable = [item_ids[b] for b in range(len(item_ids)) if not coverable >> b & 1]
+        candidates = self.prune_dominated(sources)
+
+        greedy = self.greedy(candidates, coverable)
+        greedy_ms = (time.perf_counter() - started) * 1000
+        nodes, complete = 0, True
+        if exact:
+            # 탐색은 피벗 순서로만 맡을 아이템을 나누므로, 첫 선택을 바꾼 욕심쟁이 계획도 초기 상한으로 넣음
+            ranked, nodes, complete = self.branch_and_bound(
+                candidates, coverable, self.alternatives(candidates, coverable, greedy, plans), plans, max_nodes)
+        elif plans > 1:
+            ranked = self.alternatives(candidates, coverable, greedy, plans)
+        else:
+            ranked = [greedy]
+
+        def describe(plan: Plan) -> Dict[str, object]:
+            steps = []
+            for s, claim in sorted(plan.sources, key=lambda x: -self.claim_cost(*x)):
+                steps.append({
+                    "id": s.id,
+                    "name": s.name,
+                    "expectedKills": round(self.claim_cost(s, claim), 1),
+                    "items": [{"id": item_ids[b], "name": self.items.get(item_ids[b], {}).get("name"),
+                               "dropRate": round(s.rates[b], 6)} for b in bits(claim)],
+                })
+            return {"expectedKills": round(plan.cost, 1), "sources": steps}
+
+        return {
+            "by": by,
+            "items": len(item_ids),
+            "uncoverable": [{"id": i, "name": self.items.get(i, {}).get("name")} for i in uncoverable],
+            "candidates": len(sources),
+            "afterPruning": len(candidates),
+            "greedyExpectedKills": round(greedy.cost, 1),
+            "searchNodes": nodes,
+            "searchComplete": complete,
+            "costEvaluations": len(self._costs),
+            "greedyMs": round(greedy_ms, 1),
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 1),
+            "plans": [describe(p) for p in ranked],
+        }
+
+
+def load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def featured_item_names() -> List[str]:
+    from fix.fix_featured_drops_and_item_names import FEATURED_DROP_ITEM_NAMES
+    return list(FEATURED_DROP_ITEM_NAMES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="아이템 목록을 모을 몬스터/맵 조합 계획")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--items", nargs="+", help="아이템 이름(공백 무시) 또는 ID")
+    target.add_argument("--featured", action="store_true", help="FEATURED_DROP_ITEM_NAMES 목록 사용")
+    parser.add_argument("--by", choices=["monster", "map"], default="monster", help="사냥 단위")
+    parser.add_argument("--plans", type=int, default=3, help="출력할 계획 수")
+    parser.add_argument("--exact", action="store_true", help="분기 한정으로 최소 기대 처치 수 계획 탐색")
+    parser.add_argument("--max-nodes", type=int, default=MAX_NODES_DEFAULT, help="분기 한정 탐색 노드 상한")
+    parser.add_argument("--unknown-rate", type=float, default=None, help="dropRate가 없는 관계에 쓸 확률 (기본: 제외)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    planner = DropPlanner(load_json(get_data_path("monster_data.json"), []),
+                          load_json(get_data_path("item_data.json"), []),
+                          load_json(get_data_path("monster_item_relations.json"), []),
+                          load_json(get_data_path("map_data.json"), []),
+                          unknown_rate=args.unknown_rate)
+    item_ids, missing = planner.resolve_items(featured_item_names() if args.featured else args.items)
+    if not item_ids:
+        print(f"아이템을 찾을 수 없습니다: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    result = planner.plan(item_ids, by=args.by, plans=args.plans, exact=args.exact, max_nodes=args.max_nodes)
+    result["missing"] = missing
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    for rank, plan in enumerate(result["plans"], 1):
+        print(f"\n[plan {rank}] {len(plan['sources'])} {args.by}s, expected kills {plan['expectedKills']:,.1f}")
+        for step in plan["sources"]:
+            names = ", ".join(f"{i['name']}({i['dropRate']:.2%})" for i in step["items"])
+            print(f"  - {step['id']:<11} {step['name']:<16} ~{step['expectedKills']:>10,.1f} kills  {names}")
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Items: {result['items']} (names not found: {len(missing)}, no {args.by} drops them: {len(result['uncoverable'])})")
+    print(f"  - Candidates: {result['candidates']} -> {result['afterPruning']} after dominance pruning")
+    print(f"  - Greedy: {result['greedyExpectedKills']:,.1f} kills; best: {result['plans'][0]['expectedKills']:,.1f} kills")
+    if args.exact:
+        print(f"  - Search: {result['searchNodes']} nodes "
+              f"({'complete' if result['searchComplete'] else 'node limit reached'})")
+    print(f"  - Elapsed: {result['elapsedMs']}ms (greedy {result['greedyMs']}ms, "
+          f"{result['costEvaluations']} cost evaluations)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+드랍 확률 -> 필요 처치 수 분포 (NumPy 벡터 난수 시뮬레이션 + 닫힌 식)
+
+monster_item_relations의 dropRate(퍼센트, 예: 0.16 = 0.16%)를 "X를 3개 얻으려면 몇 마리를 잡아야 하나"와
+신뢰 구간으로 바꿔 dropRate 값별 분위수 표를 만듭니다. 상세 모달은 관계의 dropRate를 normalize_drop_rate, rate_key로
+바꿔서 표를 찾기만 하면 됩니다.
+
+- 닫힌 식: 아이템 n개까지의 처치 수 K는 음이항분포 (n=1이면 기하분포)
+  평균 n/p, 분위수는 단조인 P(K <= k) = P(Binomial(k, p) >= n)을 이분 탐색해서 구함
+  (dropRate 0.0001% 같은 값은 분위수가 수천만 마리라 k 배열 전체를 만들지 않음)
+- 시뮬레이션: rng.negative_binomial로 수백만 번의 사냥을 한 번에 뽑음 (--method monte-carlo, --verify)
+  --verify는 닫힌 식 분위수 k에서 시뮬레이션의 경험적 P(K <= k)가 정확한 값과 표준오차 몇 배 안에 드는지 확인
+  여러 아이템을 모두 얻는 경우(닫힌 식이 없는 분위수)는 geometric 행렬의 행별 최댓값으로 계산 (--all-of)
+- dropRate는 항상 퍼센트 값이라 100으로 나눔 (예: 0.8 -> 0.008, 40.0 -> 0.4)
+- 캐시: 같은 dropRate는 한 번만 계산하고, 출력 파일이 같은 설정이면 이미 있는 값은 다시 계산하지 않음
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/drop_simulation.py
+    python scripts/drop_simulation.py --verify --draws 2000000
+    python scripts/drop_simulation.py --all-of 10 5 0.8   # dropRate와 같은 퍼센트 값
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from monster_analytics import np, require_numpy
+from utils import PROJECT_ROOT, get_data_path
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "drop_time_table.json"
+PERCENTILES = (50, 75, 90, 95, 99)
+COUNTS = (1, 2, 3)
+DRAWS_DEFAULT = 1_000_000
+CHUNK = 1_000_000
+# --verify 허용 범위 (표준오차의 배수)
+VERIFY_SIGMAS = 5.0
+# 출력 파일 settings에 기록. 이전 규칙(1 이하 값은 그대로 확률)으로 만든 표는 재사용하지 않음
+DROP_RATE_UNIT = "percent"
+
+
+def normalize_drop_rate(rate: Optional[float]) -> Optional[float]:
+    """dropRate -> 처치당 확률. dropRate는 1 이하 값(예: 0.8)도 포함해 모두 퍼센트라서 항상 100으로 나눔"""
+    if rate is None or rate <= 0:
+        return None
+    return min(1.0, rate / 100.0)
+
+
+def rate_key(rate: float) -> str:
+    return f"{rate:.6g}"
+
+
+def cdf(rate: float, count: int, k):
+    """P(K <= k) = 1 - P(Binomial(k, p) < count) (k는 정수 또는 배열)"""
+    require_numpy()
+    k = np.asarray(k, dtype=np.float64)
+    # sum_{j<count} C(k, j) p^j q^(k-j), j 항은 점화식으로
+    term = np.exp(k * math.log1p(-rate))
+    below = term.copy()
+    for j in range(1, count):
+        term = term * (k - j + 1) / j * (rate / (1.0 - rate))
+        below = below + term
+    return np.where(k >= count, 1.0 - below, 0.0)
+
+
+def quantile(rate: float, count: int, prob: float) -> int:
+    """P(K <= k) >= prob인 가장 작은 k"""
+    prob -= 1e-12
+    lo = hi = count
+    while cdf(rate, count, hi) < prob:
+        lo, hi = hi + 1, hi * 2
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if cdf(rate, count, mid) >= prob:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def closed_form(rate: float, count: int, percentiles: Sequence[int] = PERCENTILES) -> Dict[str, float]:
+    """음이항분포 K(처치 수, 성공 count번) 평균/분위수"""
+    require_numpy()
+    if rate >= 1.0:
+        return {"mean": float(count), **{f"p{q}": count for q in percentiles}}
+    return {"mean": count / rate, **{f"p{p}": quantile(rate, count, p / 100.0) for p in percentiles}}
+
+
+def draw(rate: float, count: int, draws: int, rng: "np.random.Generator") -> "np.ndarray":
+    """count개를 얻을 때까지의 처치 수 표본 draws개"""
+    require_numpy()
+    return np.concatenate([
+        rng.negative_binomial(count, rate, size=min(CHUNK, draws - start)) + count
+        for start in range(0, draws, CHUNK)
+    ])
+
+
+def simulate(rate: float, count: int, draws: int, rng: "np.random.Generator",
+             percentiles: Sequence[int] = PERCENTILES) -> Dict[str, float]:
+    """count개를 얻을 때까지의 처치 수를 draws번 뽑아서 평균/분위수"""
+    require_numpy()
+    if rate >= 1.0:
+        return {"mean": float(count), **{f"p{p}": count for p in percentiles}}
+    samples = draw(rate, count, draws, rng)
+    values = np.percentile(samples, percentiles, method="inverted_cdf")
+    return {"mean": float(samples.mean()), **{f"p{p}": int(v) for p, v in zip(percentiles, values)}}
+
+
+def simulate_all_of(rates: Sequence[float], draws: int, rng: "np.random.Generator",
+                    percentiles: Sequence[int] = PERCENTILES) -> Dict[str, float]:
+    """아이템 여러 개를 모두 한 번 이상 얻을 때까지의 처치 수 (같은 몬스터에서 독립 드랍)"""
+    require_numpy()
+    p = np.asarray(rates, dtype=np.float64)
+    samples = np.concatenate([
+        rng.geometric(p, size=(min(CHUNK, draws - start), len(p))).max(axis=1)
+        for start in range(0, draws, CHUNK)
+    ])
+    values = np.percentile(samples, percentiles, method="inverted_cdf")
+    return {"mean": float(samples.mean()), **{f"p{q}": int(v) for q, v in zip(percentiles, values)}}
+
+
+class DropTimeTable:
+    """dropRate 값 -> 개수별 평균/분위수 (값별로 한 번만 계산)"""
+
+    def __init__(self, method: str = "closed", draws: int = DRAWS_DEFAULT, seed: Optional[int] = None,
+                 counts: Sequence[int] = COUNTS, percentiles: Sequence[int] = PERCENTILES):
+        require_numpy()
+        self.method = method
+        self.draws = draws
+        self.counts = tuple(counts)
+        self.percentiles = tuple(percentiles)
+        self.rng = np.random.default_rng(seed)
+        self.by_rate: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self.computed = 0
+
+    def settings(self) -> Dict[str, object]:
+        return {"method": self.method, "draws": self.draws if self.method == "monte-carlo" else None,
+                "counts": list(self.counts), "percentiles": list(self.percentiles), "dropRateUnit": DROP_RATE_UNIT}
+
+    def preload(self, existing: dict) -> None:
+        """같은 설정으로 만든 출력 파일의 값 재사용"""
+        if existing.get("settings") == self.settings():
+            self.by_rate.update(existing.get("byRate", {}))
+
+    def get(self, rate: float) -> Dict[str, Dict[str, float]]:
+        key = rate_key(rate)
+        if key not in self.by_rate:
+            self.computed += 1
+            self.by_rate[key] = {
+                str(n): self._round(closed_form(rate, n, self.percentiles) if self.method == "closed"
+                                    else simulate(rate, n, self.draws, self.rng, self.percentiles))
+                for n in self.counts
+            }
+        return self.by_rate[key]
+
+    @staticmethod
+    def _round(stats: Dict[str, float]) -> Dict[str, float]:
+        return {k: round(v, 2) if isinstance(v, float) else v for k, v in stats.items()}
+
+
+def load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def verify(rates: List[float], draws: int, seed: Optional[int]) -> int:
+    """시뮬레이션과 닫힌 식 비교
+
+    분위수 값끼리 상대 오차로 비교하면 작은 값(p50 = 1~2마리)은 1마리 차이도 50%가 되어 실패하고,
+    큰 값은 표본 오차가 커서 아무 고정 비율로도 맞출 수 없습니다. 그래서 닫힌 식 분위수 k에서
+    경험적 P(K <= k)를 정확한 CDF와, 평균은 닫힌 식 평균과 비교하고 둘 다 표준오차의 VERIFY_SIGMAS배 안이면 통과.
+    """
+    rng = np.random.default_rng(seed)
+    failures = 0
+    for rate in rates:
+        for n in COUNTS:
+            exact = closed_form(rate, n)
+            samples = draw(rate, n, draws, rng)
+            # 평균: 음이항분포 표준편차 sqrt(n q) / p
+            mean_se = math.sqrt(n * (1.0 - rate)) / rate / math.sqrt(draws)
+            worst = abs(float(samples.mean()) - exact["mean"]) / mean_se
+            for p in PERCENTILES:
+                k = exact[f"p{p}"]
+                expected = float(cdf(rate, n, k))
+                observed = float(np.count_nonzero(samples <= k)) / draws
+                se = math.sqrt(expected * (1.0 - expected) / draws) + 1.0 / draws
+                worst = max(worst, abs(observed - expected) / se)
+            flag = "ok" if worst <= VERIFY_SIGMAS else "MISMATCH"
+            failures += flag != "ok"
+            print(f"  rate {rate_key(rate):>7} x{n}: mean {exact['mean']:>11.1f} vs {float(samples.mean()):>11.1f}, "
+                  f"p90 {exact['p90']:>8}, worst {worst:.1f} SE [{flag}]")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dropRate별 필요 처치 수 분위수 표 생성")
+    parser.add_argument("--method", choices=["closed", "monte-carlo"], default="closed",
+                        help="표 계산 방식 (closed: 음이항분포 닫힌 식)")
+    parser.add_argument("--draws", type=int, default=DRAWS_DEFAULT, help="시뮬레이션 횟수")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verify", action="store_true", help="dropRate 값 일부로 시뮬레이션과 닫힌 식 비교")
+    parser.add_argument("--all-of", type=float, nargs="+", metavar="RATE",
+                        help="같은 몬스터에서 이 확률의 아이템들을 모두 얻을 때까지 시뮬레이션")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    args = parser.parse_args()
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    if args.all_of:
+        stats = simulate_all_of([normalize_drop_rate(r) for r in args.all_of], args.draws, np.random.default_rng(args.seed))
+        print(json.dumps({k: round(v, 2) for k, v in stats.items()}, ensure_ascii=False))
+        return
+
+    relations = load_json(get_data_path("monster_item_relations.json"), [])
+    rates = sorted({normalize_drop_rate(float(r["dropRate"])) for r in relations if r.get("dropRate")})
+
+    if args.verify:
+        sample = [r for r in rates if r < 1.0][:: max(1, len(rates) // 8)]
+        failures = verify(sample, args.draws, args.seed)
+        print(f"\nVerify: {failures} mismatches in {len(sample) * len(COUNTS)} rate/count pairs")
+        sys.exit(1 if failures else 0)
+
+    table = DropTimeTable(args.method, args.draws, args.seed)
+    table.preload(load_json(args.output, {}))
+    started = time.perf_counter()
+    for rate in rates:
+        table.get(rate)
+    elapsed = time.perf_counter() - started
+
+    covered = sum(1 for r in relations if r.get("dropRate"))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "settings": table.settings(),
+            "byRate": {rate_key(r): table.by_rate[rate_key(r)] for r in rates},
+        }, f, ensure_ascii=False, indent=2)
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Relations with dropRate: {covered}/{len(relations)}")
+    print(f"  - Distinct dropRate values: {len(rates)} (computed {table.computed}, reused {len(rates) - table.computed})")
+    print(f"  - Method: {args.method}, {elapsed * 1000:.1f}ms")
+    example = rate_key(normalize_drop_rate(0.16))
+    if example in table.by_rate:
+        print(f"  - e.g. dropRate 0.16 (%), 3 items: {table.by_rate[example]['3']}")
+    print(f"  - Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
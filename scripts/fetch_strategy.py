@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 우선 수집 + 필요한 경우에만 브라우저로 재시도하는 수집 전략 레이어
+
+몬스터 스크립트는 urllib로, 아이템 스크립트는 항상 Selenium으로 페이지를 가져왔습니다.
+이 레이어는
+- 먼저 일반 HTTP GET(fetcher.Fetcher)으로 가져와서 기대하는 마커(item_detail 링크, drop-rate-box 등)가 있는지 확인하고
+- 마커가 없을 때만 브라우저 풀(browser_pool.BrowserPool)로 다시 가져오며
+- 그 결과를 URL 패턴(호스트 + 숫자 ID를 뺀 경로 + 쿼리 키)별로 기억해서
+  다음부터는 HTTP로 충분한 패턴은 브라우저를 띄우지 않고, JS 렌더링이 필요한 패턴은 바로 브라우저로 보냅니다.
+
+결정은 src/request/fetch_strategy.json에 저장되며 ttl_days가 지나면 다시 HTTP부터 확인합니다.
+브라우저는 처음 필요해지는 시점에만 띄웁니다. (selenium이 없으면 HTTP 결과를 그대로 반환)
+
+사용 예시:
+    from fetch_strategy import ITEM_LINK_MARKER, StrategyFetcher
+
+    with StrategyFetcher() as fetcher:
+        for page in fetcher.fetch_many(urls, markers=[ITEM_LINK_MARKER]):
+            if page.ok:
+                parse(page.html)
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from urllib.parse import parse_qsl, urlparse
+
+from fetcher import Fetcher, choose_decode
+from utils import PROJECT_ROOT
+
+STRATEGY_FILE = PROJECT_ROOT / "src" / "request" / "fetch_strategy.json"
+
+MODE_HTTP = "http"
+MODE_BROWSER = "browser"
+
+# 이 횟수만큼 같은 결과가 나와야 패턴의 수집 방식을 확정
+DEFAULT_CONFIRM = 2
+DEFAULT_TTL_DAYS = 7
+
+
+@dataclass(frozen=True)
+class PageMarker:
+    """
+    페이지가 제대로 렌더링되었는지 판단하는 표시 (HTML 정규식 + 브라우저 대기용 CSS selector)
+    requires가 있으면 그 패턴도 함께 있어야 합니다.
+    """
+
+    name: str
+    pattern: "re.Pattern[str]"
+    css: str
+    requires: Optional["re.Pattern[str]"] = None
+
+    def found(self, html_text: str) -> bool:
+        if self.pattern.search(html_text) is None:
+            return False
+        return self.requires is None or self.requires.search(html_text) is not None
+
+
+ITEM_LINK_MARKER = PageMarker("item_detail link", re.compile(r'href="[^"]*?/item_detail/\d+"'), "a[href*='item_detail']")
+MONSTER_LINK_MARKER = PageMarker("monster_detail link", re.compile(r'href="[^"]*?/monster_detail/\d+"'), "a[href*='monster_detail']")
+DROP_RATE_MARKER = PageMarker("drop-rate-box", re.compile(r'class="drop-rate-box"'), ".drop-rate-box")
+HEADING_MARKER = PageMarker("heading", re.compile(r"<h[12][^>]*>\s*[^<\s]"), "h1, h2")
+# 아이템 상세: 이름 heading만으로는 JS 셸(사이트 제목만 있는 빈 페이지)도 통과하므로,
+# parse_item_detail이 읽는 분류(대분류/중분류/소분류) 또는 설명 블록이 함께 있어야 렌더링된 것으로 봄
+ITEM_DETAIL_MARKER = PageMarker(
+    "item detail block",
+    re.compile(r'(?:대분류|중분류|소분류)[:\s]+[^\s<]|<div[^>]*class="[^"]*description'),
+    "[class*='description'], [class*='category']",
+    requires=HEADING_MARKER.pattern,
+)
+
+# 경로 첫 부분 -> 기본 마커 (markers를 넘기지 않았을 때)
+DEFAULT_MARKERS: Dict[str, List[PageMarker]] = {
+    "itemnote_search": [ITEM_LINK_MARKER],
+    "monsternote": [MONSTER_LINK_MARKER],
+    "monster_detail": [DROP_RATE_MARKER, ITEM_LINK_MARKER],
+    "item_detail": [ITEM_DETAIL_MARKER],
+    "map_detail": [MONSTER_LINK_MARKER],
+}
+
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+
+
+def url_pattern(url: str) -> str:
+    """
+    URL -> 패턴 키. 숫자 경로 조각은 {id}로, 쿼리는 키만 남깁니다.
+    예: https://host/item_detail/2070000 -> host/item_detail/{id}
+        https://host/itemnote_search?searchInput=표창 -> host/itemnote_search?searchInput
+    """
+    parsed = urlparse(url)
+    segments = ["{id}" if _NUMERIC_SEGMENT.match(seg) else seg for seg in parsed.path.split("/")]
+    pattern = parsed.netloc + "/".join(segments)
+    keys = sorted({k for k, _ in parse_qsl(parsed.query, keep_blank_values=True)})
+    if keys:
+        pattern += "?" + "&".join(keys)
+    return pattern
+
+
+def default_markers(url: str) -> List[PageMarker]:
+    path = urlparse(url).path.strip("/")
+    return DEFAULT_MARKERS.get(path.split("/")[0] if path else "", [])
+
+
+@dataclass
+class PageResult:
+    url: str
+    html: str
+    via: str
+    elapsed: float
+    marker_found: bool
+    timed_out: bool = False
+    status: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+class StrategyTable:
+    """URL 패턴별 HTTP/브라우저 결과 집계 및 결정"""
+
+    def __init__(self, path: Path = STRATEGY_FILE, confirm: int = DEFAULT_CONFIRM, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.path = path
+        self.confirm = confirm
+        self.ttl = timedelta(days=ttl_days)
+        self._lock = threading.Lock()
+        self.patterns: Dict[str, Dict[str, object]] = {}
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                self.patterns = json.load(f)
+
+    def mode(self, pattern: str, now: Optional[datetime] = None) -> Optional[str]:
+        """확정된 수집 방식. 아직 모르거나 TTL이 지났으면 None (HTTP로 확인 후 필요 시 브라우저)"""
+        with self._lock:
+            entry = self.patterns.get(pattern)
+            if not entry or not entry.get("mode"):
+                return None
+            decided_at = datetime.fromisoformat(entry["decidedAt"])
+            if (now or datetime.now(timezone.utc)) - decided_at > self.ttl:
+                return None
+            return entry["mode"]
+
+    def observe(self, pattern: str, mode: str, now: Optional[datetime] = None) -> None:
+        """
+        mode로 마커를 얻었다는 관측을 기록합니다.
+        (HTTP로 마커 확인 -> http, HTTP엔 없고 브라우저엔 있음 -> browser)
+        """
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            entry = self.patterns.setdefault(pattern, {MODE_HTTP: 0, MODE_BROWSER: 0, "mode": None})
+            if entry.get("mode") and now - datetime.fromisoformat(entry["decidedAt"]) > self.ttl:
+                # TTL 만료 후 다시 집계
+                entry.update({MODE_HTTP: 0, MODE_BROWSER: 0, "mode": None})
+            entry[mode] = entry.get(mode, 0) + 1
+            other = MODE_BROWSER if mode == MODE_HTTP else MODE_HTTP
+            if entry[mode] >= self.confirm and entry[mode] > entry.get(other, 0) and entry.get("mode") != mode:
+                entry["mode"] = mode
+                entry["decidedAt"] = now.isoformat(timespec="seconds")
+
+    def save(self) -> None:
+        with self._lock:
+            data = dict(sorted(self.patterns.items()))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+class StrategyFetcher:
+    """HTTP 우선, 마커가 없을 때만 브라우저로 재시도하는 수집기"""
+
+    def __init__(
+        self,
+        fetcher: Optional[Fetcher] = None,
+        table: Optional[StrategyTable] = None,
+        pool_factory: Optional[Callable[[], object]] = None,
+        workers: int = 8,
+        per_host_interval: float = 0.25,
+        browsers: int = 2,
+        tabs_per_browser: int = 4,
+        ready_timeout: float = 15.0,
+    ):
+        self.fetcher = fetcher or Fetcher(workers=workers, per_host_interval=per_host_interval)
+        self.table = table or StrategyTable()
+        self._pool_factory = pool_factory or (lambda: self._default_pool(
+            browsers, tabs_per_browser, ready_timeout, per_host_interval))
+        self._pool = None
+        self._browser_unavailable: Optional[str] = None
+        self.counts = {MODE_HTTP: 0, MODE_BROWSER: 0}
+
+    @staticmethod
+    def _default_pool(browsers: int, tabs: int, ready_timeout: float, interval: float):
+        from browser_pool import BrowserPool
+        return BrowserPool(browsers=browsers, tabs_per_browser=tabs, ready_timeout=ready_timeout,
+                           per_host_interval=interval)
+
+    def __enter__(self) -> "StrategyFetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        self.table.save()
+
+    def _get_pool(self):
+        if self._pool is None and self._browser_unavailable is None:
+            try:
+                self._pool = self._pool_factory()
+            except RuntimeError as e:
+                self._browser_unavailable = str(e)
+                print(f"Browser fallback disabled: {e}")
+        return self._pool
+
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        markers: Optional[Sequence[PageMarker]] = None,
+    ) -> Iterator[PageResult]:
+        """
+        URL들을 가져와 완료되는 순서대로 반환합니다. markers를 생략하면 경로별 기본 마커(DEFAULT_MARKERS)를 씁니다.
+        마커 중 하나라도 있으면 렌더링된 페이지로 봅니다.
+        """
+        url_list = list(dict.fromkeys(urls))
+        markers_by_url = {url: list(markers) if markers is not None else default_markers(url) for url in url_list}
+
+        http_urls: List[str] = []
+        browser_urls: List[str] = []
+        for url in url_list:
+            if markers_by_url[url] and self.table.mode(url_pattern(url)) == MODE_BROWSER:
+                browser_urls.append(url)
+            else:
+                http_urls.append(url)
+
+        # HTTP 결과 중 마커가 없는 페이지는 브라우저로 넘김 (HTTP로 충분하다고 확정된 패턴은 그대로 반환)
+        fallback: Dict[str, PageResult] = {}
+        for result in self.fetcher.fetch_many(http_urls):
+            url = result.url
+            pattern = url_pattern(url)
+            html_text = choose_decode(result.body) if result.body else ""
+            url_markers = markers_by_url[url]
+            found = not url_markers or any(m.found(html_text) for m in url_markers)
+            page = PageResult(url, html_text, MODE_HTTP, result.elapsed, found,
+                              status=result.status, error=result.error)
+            if result.ok and found:
+                if url_markers:
+                    self.table.observe(pattern, MODE_HTTP)
+                self.counts[MODE_HTTP] += 1
+                yield page
+            elif result.status == 404 or self.table.mode(pattern) == MODE_HTTP:
+                self.counts[MODE_HTTP] += 1
+                yield page
+            else:
+                fallback[url] = page
+                browser_urls.append(url)
+
+        if not browser_urls:
+            return
+        pool = self._get_pool()
+        if pool is None:
+            for url in browser_urls:
+                yield fallback.get(url) or PageResult(url, "", MODE_BROWSER, 0.0, False, error=self._browser_unavailable)
+            return
+
+        # 브라우저는 같은 마커 묶음끼리 ready_selector를 공유
+        groups: Dict[str, List[str]] = {}
+        for url in browser_urls:
+            selector = ", ".join(m.css for m in markers_by_url[url]) or None
+            groups.setdefault(selector or "", []).append(url)
+        for selector, group_urls in groups.items():
+            for result in pool.fetch_many(group_urls, ready_selector=selector or None):
+                url = result.url
+                url_markers = markers_by_url[url]
+                found = result.error is None and (not url_markers or any(m.found(result.html) for m in url_markers))
+                if found:
+                    # HTTP엔 없고 브라우저엔 있음 (또는 이미 브라우저로 확정된 패턴) -> JS 렌더링 필요
+                    self.table.observe(url_pattern(url), MODE_BROWSER)
+                elif url in fallback and not fallback[url].error and url_markers and not result.error:
+                    # 브라우저에서도 없음 -> 원래 비어 있는 페이지, HTTP로 충분
+                    self.table.observe(url_pattern(url), MODE_HTTP)
+                self.counts[MODE_BROWSER] += 1
+                elapsed = result.elapsed + (fallback[url].elapsed if url in fallback else 0.0)
+                yield PageResult(url, result.html, MODE_BROWSER, elapsed, found,
+                                 timed_out=result.timed_out, error=result.error)
+
+    def fetch(self, url: str, markers: Optional[Sequence[PageMarker]] = None) -> PageResult:
+        return next(iter(self.fetch_many([url], markers=markers)))
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공통 동시 HTTP 수집 레이어
+
+지역별 업데이트 스크립트의 fetch_bytes + time.sleep(delay) 순차 패턴을 대체합니다.
+- 스레드 풀로 여러 URL을 동시에 요청
+- 호스트별 최소 요청 간격(rate limit)을 모든 워커가 공유
+- 429/5xx/네트워크 오류는 지수 백오프로 재시도 (429의 Retry-After 존중)
+
+사용 예시:
+    from fetcher import Fetcher, choose_decode
+
+    fetcher = Fetcher(workers=8, per_host_interval=0.25)
+    for result in fetcher.fetch_many(urls):
+        if result.ok:
+            html = choose_decode(result.body)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlparse, urlsplit, urlunsplit
+from urllib.request import Request, urlopen
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# 설정하면 maplenote/mapledb.kr 요청을 이 주소로 보냄 (예: http://127.0.0.1:8800, standin_server.py)
+SITE_OVERRIDE_ENV = "MAPLE_SITE_OVERRIDE"
+OVERRIDE_HOSTS = {"xn--o80b01o9mlw3kdzc.com", "mapledb.kr", "www.mapledb.kr"}
+
+
+def rewrite_url(url: str) -> str:
+    """MAPLE_SITE_OVERRIDE가 설정되어 있으면 대상 사이트 URL의 scheme/host를 바꿉니다. (경로/쿼리 유지)"""
+    override = os.environ.get(SITE_OVERRIDE_ENV)
+    if not override:
+        return url
+    parts = urlsplit(url)
+    if parts.netloc not in OVERRIDE_HOSTS:
+        return url
+    target = urlsplit(override)
+    return urlunsplit((target.scheme, target.netloc, parts.path, parts.query, parts.fragment))
+
+
+def choose_decode(raw: bytes) -> str:
+    """utf-8/cp949 중 한글이 더 많이 살아남는 쪽으로 디코딩 (지역별 스크립트와 동일)"""
+    candidates = []
+    for enc in ("utf-8", "cp949"):
+        s = raw.decode(enc, "ignore")
+        hangul = sum(1 for ch in s if "가" <= ch <= "힣")
+        candidates.append((hangul, enc, s))
+    candidates.sort(reverse=True)
+    return candidates[0][2]
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: Optional[int]
+    body: bytes
+    elapsed: float
+    attempts: int
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and 200 <= self.status < 300
+
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격을 스레드 간에 공유"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at: Dict[str, float] = {}
+
+    def wait(self, host: str) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next_at.get(host, 0.0))
+            self._next_at[host] = at + self.interval
+        delay = at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def penalize(self, host: str, seconds: float) -> None:
+        """429 응답 시 해당 호스트의 다음 요청을 seconds 뒤로 미룹니다."""
+        with self._lock:
+            self._next_at[host] = max(self._next_at.get(host, 0.0), time.monotonic() + seconds)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except Exception:
+        return None
+
+
+class Fetcher:
+    """동시 HTTP GET 수집기"""
+
+    def __init__(
+        self,
+        workers: int = 8,
+        per_host_interval: float = 0.25,
+        timeout: float = 30,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        headers: Optional[Dict[str, str]] = None,
+        on_result: Optional[Callable[[FetchResult], None]] = None,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.headers = {"User-Agent": USER_AGENT, **(headers or {})}
+        self.limiter = HostRateLimiter(per_host_interval)
+        self.on_result = on_result
+        self._ssl_context = ssl.create_default_context()
+
+    def fetch(self, url: str) -> FetchResult:
+        """URL 하나를 재시도 포함하여 가져옵니다. 예외를 던지지 않고 FetchResult.error에 기록합니다."""
+        host = urlparse(url).netloc
+        started = time.monotonic()
+        attempts = 0
+        status: Optional[int] = None
+        error: Optional[str] = None
+
+        while True:
+            attempts += 1
+            self.limiter.wait(host)
+            retry_after: Optional[float] = None
+            try:
+                req = Request(rewrite_url(url), headers=self.headers)
+                with urlopen(req, context=self._ssl_context, timeout=self.timeout) as resp:
+                    body = resp.read()
+                    result = FetchResult(url, resp.status, body, time.monotonic() - started, attempts)
+                    break
+            except HTTPError as e:
+                status = e.code
+                error = f"HTTP {e.code}"
+                if e.code not in RETRY_STATUSES:
+                    result = FetchResult(url, status, b"", time.monotonic() - started, attempts, error)
+                    break
+                retry_after = _retry_after_seconds(e.headers.get("Retry-After") if e.headers else None)
+                if e.code == 429:
+                    self.limiter.penalize(host, retry_after if retry_after is not None else self.backoff_base)
+            except (URLError, TimeoutError, ConnectionError, OSError) as e:
+                status = None
+                error = f"{type(e).__name__}: {e}"
+
+            if attempts > self.max_retries:
+                result = FetchResult(url, status, b"", time.monotonic() - started, attempts, error)
+                break
+            backoff = self.backoff_base * (2 ** (attempts - 1)) * (0.5 + random.random())
+            time.sleep(max(backoff, retry_after or 0.0))
+
+        if self.on_result:
+            self.on_result(result)
+        return result
+
+    def fetch_many(self, urls: Iterable[str]) -> Iterator[FetchResult]:
+        """여러 URL을 동시에 가져와 완료되는 순서대로 반환합니다."""
+        url_list: List[str] = list(dict.fromkeys(urls))
+        if not url_list:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(url_list))) as pool:
+            futures = [pool.submit(self.fetch, url) for url in url_list]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def fetch_all(self, urls: Iterable[str]) -> Dict[str, FetchResult]:
+        """fetch_many 결과를 URL -> FetchResult dict로 모아 반환합니다."""
+        return {r.url: r for r in self.fetch_many(urls)}
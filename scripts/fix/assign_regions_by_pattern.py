@@ -3,9 +3,15 @@
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 
 def assign_regions_by_pattern(monster_data_file: str, output_file: str = None):
     """
@@ -90,8 +96,7 @@ def assign_regions_by_pattern(monster_data_file: str, output_file: str = None):
     
     # 파일에 저장
     print(f"\n파일 저장 중: {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, monsters, source=Path(__file__).stem)
     
     print(f"[완료]")
     print(f"  - {assigned_count}개의 몬스터에 지역이 할당되었습니다.")
@@ -103,8 +108,7 @@ def assign_regions_by_pattern(monster_data_file: str, output_file: str = None):
 
 def main():
     """메인 함수"""
-    script_dir = Path(__file__).parent
-    monster_file = script_dir / 'src' / 'data' / 'monster_data.json'
+    monster_file = get_data_path('monster_data.json')
     
     assign_regions_by_pattern(str(monster_file))
 
@@ -11,11 +11,19 @@ import json
 import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_with_history
+from utils import get_data_path
+
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
-MONSTER_DATA_PATH = ROOT_DIR / 'src' / 'data' / 'monster_data.json'
-ITEM_DATA_PATH = ROOT_DIR / 'src' / 'data' / 'item_data.json'
-MONSTER_ITEM_RELATIONS_PATH = ROOT_DIR / 'src' / 'data' / 'monster_item_relations.json'
+MONSTER_DATA_PATH = get_data_path('monster_data.json')
+ITEM_DATA_PATH = get_data_path('item_data.json')
+MONSTER_ITEM_RELATIONS_PATH = get_data_path('monster_item_relations.json')
+
+# 변경 이력(src/data/history)에 남길 태그
+HISTORY_TAG = 'featured-drops-reset'
 
 # 주요 드랍 아이템 목록 (사용자 제공)
 FEATURED_DROP_ITEM_NAMES = [
@@ -244,12 +252,10 @@ def main():
     
     # 데이터 저장
     print("데이터 저장 중...")
-    with open(ITEM_DATA_PATH, 'w', encoding='utf-8') as f:
-        json.dump(items, f, ensure_ascii=False, indent=2)
+    save_with_history(ITEM_DATA_PATH.name, items, tag=HISTORY_TAG, source='fix_featured_drops_and_item_names')
     print(f"  아이템 데이터 저장 완료: {ITEM_DATA_PATH}")
     
-    with open(MONSTER_DATA_PATH, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_with_history(MONSTER_DATA_PATH.name, monsters, tag=HISTORY_TAG, source='fix_featured_drops_and_item_names')
     print(f"  몬스터 데이터 저장 완료: {MONSTER_DATA_PATH}")
     
     print("\n데이터 정리 작업 완료!")
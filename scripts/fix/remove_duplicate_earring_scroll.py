@@ -8,10 +8,16 @@ monster_item_relations.json에서 해당 아이템 ID를 "귀장식 지력 주
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_dir
+
 ROOT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / "src" / "data"
+DATA_DIR = get_data_dir()
 ITEM_DATA_FILE = DATA_DIR / "item_data.json"
 RELATIONS_FILE = DATA_DIR / "monster_item_relations.json"
 
@@ -45,8 +51,7 @@ def main():
         print(f"  Removed item: {items_before[0].get('name')} (ID: {OLD_ITEM_ID})")
     
     # 아이템 저장
-    with open(ITEM_DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(items_after, f, ensure_ascii=False, indent=2)
+    save_json_file(ITEM_DATA_FILE, items_after, source=Path(__file__).stem)
     print(f"  [OK] Saved {ITEM_DATA_FILE}")
     
     # 2. monster_item_relations.json에서 아이템 ID 교체
@@ -98,8 +103,7 @@ def main():
     print(f"  Final relations: {len(new_relations)}")
     
     # 관계 저장
-    with open(RELATIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump(new_relations, f, ensure_ascii=False, indent=2)
+    save_json_file(RELATIONS_FILE, new_relations, source=Path(__file__).stem)
     print(f"  [OK] Saved {RELATIONS_FILE}")
     
     # 결과 요약
@@ -1,7 +1,13 @@
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 def remove_duplicate_monsters(input_file, output_file=None):
     """
     exp가 0보다 크고 이름이 겹치는 몬스터는 1건만 남기고 나머지를 제거합니다.
@@ -85,8 +91,7 @@ def remove_duplicate_monsters(input_file, output_file=None):
     filtered_monsters.sort(key=lambda x: (x.get('level', 0), x.get('name', '')))
     
     # 파일에 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(filtered_monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, filtered_monsters, source=Path(__file__).stem)
     
     print(f"\n총 {removed_count}개의 중복 몬스터가 제거되었습니다.")
     print(f"최종 몬스터 수: {len(filtered_monsters)}개 (기존: {len(monsters)}개)")
@@ -97,7 +102,7 @@ def remove_duplicate_monsters(input_file, output_file=None):
 if __name__ == "__main__":
     # 프로젝트 루트와 src/data 모두 업데이트
     root_file = Path(__file__).parent / "monster_data.json"
-    src_file = Path(__file__).parent / "src" / "data" / "monster_data.json"
+    src_file = get_data_path("monster_data.json")
     
     if root_file.exists():
         print("루트 monster_data.json 업데이트 중...")
@@ -8,10 +8,16 @@ monster_item_relations.json에서 모든 관계를 제거합니다.
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 ROOT_DIR = Path(__file__).parent.parent.parent
-RELATIONS_FILE = ROOT_DIR / "src" / "data" / "monster_item_relations.json"
+RELATIONS_FILE = get_data_path("monster_item_relations.json")
 
 # 메이플 이어링 아이템 ID 목록
 MAPLE_EARRING_IDS = ["1032040", "1032041", "1032042"]
@@ -45,8 +51,7 @@ def main():
 
     # JSON 저장 (정렬 유지)
     print(f"\nSaving to {RELATIONS_FILE}...")
-    with open(RELATIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump(filtered_relations, f, ensure_ascii=False, indent=2)
+    save_json_file(RELATIONS_FILE, filtered_relations, source=Path(__file__).stem)
 
     print("Done!")
 
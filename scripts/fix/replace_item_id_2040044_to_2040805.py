@@ -8,10 +8,19 @@
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_with_history
+from utils import get_data_dir
+
 ROOT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / "src" / "data"
+DATA_DIR = get_data_dir()
+
+# 변경 이력(src/data/history)에 남길 태그
+HISTORY_TAG = "replace-item-2040044-to-2040805"
 
 OLD_ITEM_ID = "2040044"
 NEW_ITEM_ID = "2040805"
@@ -23,8 +32,7 @@ def load_json(path: Path):
 
 
 def save_json(path: Path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_with_history(path.name, data, tag=HISTORY_TAG, source=Path(__file__).stem)
 
 
 def sort_key_id(id_value: str):
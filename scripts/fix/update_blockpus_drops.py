@@ -8,11 +8,16 @@ import json
 import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
-MONSTER_DATA_PATH = ROOT_DIR / 'src' / 'data' / 'monster_data.json'
-ITEM_DATA_PATH = ROOT_DIR / 'src' / 'data' / 'item_data.json'
-MONSTER_ITEM_RELATIONS_PATH = ROOT_DIR / 'src' / 'data' / 'monster_item_relations.json'
+MONSTER_DATA_PATH = get_data_path('monster_data.json')
+ITEM_DATA_PATH = get_data_path('item_data.json')
+MONSTER_ITEM_RELATIONS_PATH = get_data_path('monster_item_relations.json')
 
 # 웹사이트에서 확인한 블록퍼스 드랍 아이템 목록 (이름 기준)
 BLOCKPUS_DROP_ITEMS = [
@@ -152,12 +157,10 @@ def main():
     
     # 데이터 저장
     print("\n데이터 저장 중...")
-    with open(MONSTER_DATA_PATH, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(MONSTER_DATA_PATH, monsters, source=Path(__file__).stem)
     print(f"  몬스터 데이터 저장 완료: {MONSTER_DATA_PATH}")
     
-    with open(MONSTER_ITEM_RELATIONS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(relations, f, ensure_ascii=False, indent=2)
+    save_json_file(MONSTER_ITEM_RELATIONS_PATH, relations, source=Path(__file__).stem)
     print(f"  관계 데이터 저장 완료: {MONSTER_ITEM_RELATIONS_PATH}")
     
     print("\n블록퍼스 드랍 테이블 업데이트 완료!")
@@ -1,15 +1,39 @@
 """
 마스터리북 데이터 생성 스크립트
+
+MASTERY_BOOK_DATA 정의로 마스터리북 아이템을 만들고 몬스터 드랍 정보에 반영합니다.
+여러 번 실행해도 결과가 같습니다 (두 번째 실행부터는 저장할 변경이 없음).
+
+- item_data.json: 마스터리북(mb_ 접두사 ID)을 ID 기준으로 upsert. 기존 행은 자리 그대로 갱신하고,
+  중복 행이나 정의에서 빠진 마스터리북은 제거
+- monster_item_relations.json: 마스터리북 드랍 관계 행(dropRate 없음)을 정의 순서대로 다시 생성
+- monster_data.json: 관계에서 몬스터별 마스터리북 목록을 만든 뒤 한 번의 순회로
+  dropItemIds(전체)/featuredDropItemIds(인기 마스터리북)의 mb_ 항목만 교체. 다른 드랍 항목은 그대로
+- 드랍 몬스터 이름은 이름 -> 출시 몬스터 인덱스로 찾음 (같은 이름이 여러 개면 데이터 순서상 첫 번째)
+- 변경된 파일만 changelog.save_with_history로 저장
+
+사용 예시:
+    python scripts/generate/generate_mastery_books.py
+    python scripts/generate/generate_mastery_books.py --dry-run
 """
+import argparse
+import hashlib
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List
 import sys
 
 # scripts/utils.py import를 위한 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_with_history
 from utils import get_data_path
 
+MASTERY_BOOK_ID_PREFIX = "mb_"
+MASTERY_BOOK_ICON_URL = "https://maplestory.io/api/gms/200/item/2290001/icon?resize=2"  # 기본 마스터리북 아이콘
+
+# 변경 이력(src/data/history)에 남길 태그
+HISTORY_TAG = "mastery-books"
+
 # 인기 마스터리북 목록
 POPULAR_MASTERY_BOOKS = [
     "샤프아이즈 20", "샤프아이즈 30", 
@@ -302,30 +326,29 @@ MASTERY_BOOK_DATA = [
 ]
 
 
-def load_monster_data():
-    """몬스터 데이터 로드"""
-    with open(get_data_path('monster_data.json'), 'r', encoding='utf-8') as f:
-        return json.load(f)
 
 
-def load_item_data():
-    """아이템 데이터 로드"""
-    with open(get_data_path('item_data.json'), 'r', encoding='utf-8') as f:
+def load_data(filename):
+    with open(get_data_path(filename), 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
-def find_monster_by_name(monsters, name):
-    """이름으로 몬스터 찾기 (출시된 몬스터만)"""
+def is_mastery_book_id(item_id):
+    return str(item_id).startswith(MASTERY_BOOK_ID_PREFIX)
+
+
+def build_monster_name_index(monsters):
+    """이름 -> 출시 몬스터 (같은 이름이 여러 개면 데이터 순서상 첫 번째)"""
+    index = {}
     for monster in monsters:
-        if monster.get('name') == name and monster.get('isReleased', False):
-            return monster
-    return None
+        if monster.get('isReleased', False):
+            index.setdefault(monster.get('name'), monster)
+    return index
 
 
 def generate_mastery_book_id(skill_name, skill_level):
     """마스터리북 ID 생성"""
     # 스킬 이름을 기반으로 고유 ID 생성
-    import hashlib
     base = f"mb_{skill_name}_{skill_level}"
     hash_suffix = hashlib.md5(base.encode()).hexdigest()[:6]
     return f"mb_{hash_suffix}"
@@ -337,23 +360,19 @@ def is_popular_mastery_book(skill_name, skill_level):
     return book_name in POPULAR_MASTERY_BOOKS
 
 
-def main():
-    monsters = load_monster_data()
-    existing_items = load_item_data()
-    
-    # 마스터리북 아이템 생성
-    mastery_books = []
-    monster_to_books = {}  # 몬스터ID -> 마스터리북ID 리스트
-    
+def build_mastery_books(monster_by_name):
+    """정의 -> (마스터리북 목록, 드랍 관계 행, 찾지 못한 몬스터 경고)"""
+    books: List[dict] = []
+    relations: List[dict] = []
+    warnings: List[str] = []
     for skill_name, skill_level, job_category, job_sub_category, drop_monsters in MASTERY_BOOK_DATA:
         book_id = generate_mastery_book_id(skill_name, skill_level)
         display_name = f"[마스터리북] {skill_name} {skill_level}"
-        is_popular = is_popular_mastery_book(skill_name, skill_level)
-        
+
         book = {
             "id": book_id,
             "name": display_name,
-            "imageUrl": "https://maplestory.io/api/gms/200/item/2290001/icon?resize=2",  # 기본 마스터리북 아이콘
+            "imageUrl": MASTERY_BOOK_ICON_URL,
             "majorCategory": "consumable",
             "mediumCategory": "mastery-book",
             "isReleased": True,
@@ -361,73 +380,109 @@ def main():
             "skillLevel": skill_level,
             "jobCategory": job_category
         }
-        
         if job_sub_category:
             book["jobSubCategory"] = job_sub_category
-            
-        if is_popular:
+        if is_popular_mastery_book(skill_name, skill_level):
             book["isPopularMasteryBook"] = True
-            
-        mastery_books.append(book)
-        
-        # 몬스터-마스터리북 관계 설정
-        for monster_name in drop_monsters:
-            monster = find_monster_by_name(monsters, monster_name)
+        books.append(book)
+
+        for monster_name in dict.fromkeys(drop_monsters):
+            monster = monster_by_name.get(monster_name)
             if monster:
-                monster_id = monster['id']
-                if monster_id not in monster_to_books:
-                    monster_to_books[monster_id] = []
-                monster_to_books[monster_id].append(book_id)
+                relations.append({"monsterId": monster['id'], "itemId": book_id})
             else:
-                print(f"[WARN] 몬스터를 찾을 수 없음: {monster_name} (마스터리북: {display_name})")
-    
-    # 기존 아이템에 마스터리북 추가
-    all_items = existing_items + mastery_books
-    
-    # 아이템 데이터 저장
-    with open(get_data_path('item_data.json'), 'w', encoding='utf-8') as f:
-        json.dump(all_items, f, ensure_ascii=False, indent=2)
-    
-    print(f"[OK] 마스터리북 {len(mastery_books)}개 추가됨")
-    print(f"[OK] 총 아이템 수: {len(all_items)}개")
-    
-    # 몬스터 데이터 업데이트 (featuredDropItemIds에 인기 마스터리북 추가)
-    updated_count = 0
+                warnings.append(f"몬스터를 찾을 수 없음: {monster_name} (마스터리북: {display_name})")
+    return books, relations, warnings
+
+
+def upsert_mastery_books(items, books):
+    """mb_ 아이템을 ID 기준으로 갱신 (기존 위치 유지, 새 항목은 뒤에 추가, 중복/정의에 없는 항목 제거)"""
+    by_id = {book['id']: book for book in books}
+    result, placed = [], set()
+    for item in items:
+        item_id = item.get('id')
+        if not is_mastery_book_id(item_id):
+            result.append(item)
+        elif item_id in by_id and item_id not in placed:
+            result.append(by_id[item_id])
+            placed.add(item_id)
+    result.extend(book for book in books if book['id'] not in placed)
+    return result
+
+
+def replace_mastery_book_relations(relations, book_relations):
+    """기존 마스터리북 관계 행을 빼고 새 관계 행을 뒤에 붙임"""
+    kept = [r for r in relations if not is_mastery_book_id(r.get('itemId'))]
+    return kept + book_relations
+
+
+def apply_monster_drops(monsters, book_relations, popular_ids):
+    """관계에서 몬스터별 마스터리북 목록을 만든 뒤 한 번 순회로 dropItemIds/featuredDropItemIds 교체.
+    바뀐 몬스터 수를 반환"""
+    books_by_monster: Dict[str, List[str]] = {}
+    for relation in book_relations:
+        books_by_monster.setdefault(relation['monsterId'], []).append(relation['itemId'])
+
+    changed = 0
     for monster in monsters:
-        monster_id = monster['id']
-        if monster_id in monster_to_books:
-            # 기존 드랍 아이템 ID 가져오기
-            if 'dropItemIds' not in monster:
-                monster['dropItemIds'] = []
-            if 'featuredDropItemIds' not in monster:
-                monster['featuredDropItemIds'] = []
-                
-            for book_id in monster_to_books[monster_id]:
-                if book_id not in monster['dropItemIds']:
-                    monster['dropItemIds'].append(book_id)
-                    
-                # 인기 마스터리북인 경우 featuredDropItemIds에도 추가
-                book = next((b for b in mastery_books if b['id'] == book_id), None)
-                if book and book.get('isPopularMasteryBook') and book_id not in monster['featuredDropItemIds']:
-                    monster['featuredDropItemIds'].append(book_id)
-            
-            updated_count += 1
-    
-    # 몬스터 데이터 저장
-    with open(get_data_path('monster_data.json'), 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
-    
-    print(f"[OK] 몬스터 {updated_count}개 업데이트됨")
-    
-    # 통계 출력
-    popular_count = sum(1 for b in mastery_books if b.get('isPopularMasteryBook'))
-    print(f"\n=== 통계 ===")
-    print(f"총 마스터리북: {len(mastery_books)}개")
-    print(f"인기 마스터리북: {popular_count}개")
-    print(f"몬스터 드랍 테이블 업데이트: {updated_count}개")
+        book_ids = books_by_monster.get(monster['id'], [])
+        featured_ids = [book_id for book_id in book_ids if book_id in popular_ids]
+        before = (monster.get('dropItemIds'), monster.get('featuredDropItemIds'))
+        for field, ids in (('dropItemIds', book_ids), ('featuredDropItemIds', featured_ids)):
+            if field not in monster and not book_ids:
+                continue
+            current = [item_id for item_id in monster.get(field, []) if not is_mastery_book_id(item_id)]
+            monster[field] = current + [item_id for item_id in ids if item_id not in current]
+        if before != (monster.get('dropItemIds'), monster.get('featuredDropItemIds')):
+            changed += 1
+    return changed
 
 
-if __name__ == "__main__":
-    main()
+def main():
+    parser = argparse.ArgumentParser(description="마스터리북 아이템/드랍 관계 생성 (ID 기준 upsert)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 바뀔 내용만 출력")
+    args = parser.parse_args()
+
+    monsters = load_data('monster_data.json')
+    items = load_data('item_data.json')
+    relations = load_data('monster_item_relations.json')
+
+    books, book_relations, warnings = build_mastery_books(build_monster_name_index(monsters))
+    for warning in warnings:
+        print(f"[WARN] {warning}")
+
+    new_items = upsert_mastery_books(items, books)
+    new_relations = replace_mastery_book_relations(relations, book_relations)
+    new_monsters = json.loads(json.dumps(monsters))
+    popular_ids = {book['id'] for book in books if book.get('isPopularMasteryBook')}
+    monsters_changed = apply_monster_drops(new_monsters, book_relations, popular_ids)
 
+    existing_books = sum(1 for item in items if is_mastery_book_id(item.get('id')))
+    datasets = [
+        ('item_data.json', items, new_items),
+        ('monster_item_relations.json', relations, new_relations),
+        ('monster_data.json', monsters, new_monsters),
+    ]
+    saved = []
+    for filename, before, after in datasets:
+        if before == after:
+            continue
+        saved.append(filename)
+        if not args.dry_run:
+            save_with_history(filename, after, tag=HISTORY_TAG, source='generate_mastery_books')
 
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Mastery books: {len(books)} (popular: {len(popular_ids)}, "
+          f"rows before: {existing_books}, items: {len(items)} -> {len(new_items)})")
+    print(f"  - Book relations: {len(book_relations)} (relations: {len(relations)} -> {len(new_relations)})")
+    print(f"  - Monsters updated: {monsters_changed}")
+    print(f"  - Missing monsters: {len(warnings)}")
+    if not saved:
+        print("  - 변경 없음 (저장하지 않음)")
+    else:
+        print(f"  - {'Would save' if args.dry_run else 'Saved'}: {', '.join(saved)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+부하 테스트용 합성 데이터셋 생성 (10배/100배 규모)
+
+실제 src/data를 템플릿으로 몬스터/아이템/맵/드랍 관계를 복제해서 같은 스키마의 N배 데이터셋을 만듭니다.
+- ID: 템플릿 ID 뒤에 세대 번호를 붙임 (100100 -> 100100001). 접두사가 유지되므로 ID 기반 분류 로직이 그대로 동작
+- 이름: 실제 이름의 음절 bigram 마르코프 체인으로 만든 단어로 템플릿 이름의 한 단어를 교체 (중복 없음)
+- 레벨/HP/EXP/스탯: 템플릿 값에 레벨 +-2, 로그정규 잡음(sigma 0.15)
+- 드랍 관계: 템플릿 몬스터의 드랍 구성을 따르되 일부 누락/추가, 드랍률은 같은 아이템 중분류의 실제 드랍률 분포에서 재추출
+- 참조(monsterIds, portalMapIds, 드랍 itemId 등)는 참조 대상의 임의 세대로 연결 (실제 데이터의 누락 참조 비율도 유지)
+region_data/job_data는 그대로 복사합니다.
+
+결과 디렉토리를 MAPLE_DATA_DIR로 지정하면 데이터 경로를 utils.get_data_path/get_data_dir로 정하는 모든 스크립트가 합성 데이터를 대상으로 실행됩니다.
+
+사용 예시:
+    python scripts/generate/generate_synthetic_dataset.py --scale 10
+    python scripts/generate/generate_synthetic_dataset.py --scale 100 --seed 42 --output-dir /tmp/maple_x100
+    MAPLE_DATA_DIR=src/request/synthetic/x100 python scripts/validate/check_data.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import shutil
+import statistics
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import PROJECT_ROOT
+
+SOURCE_DIR_DEFAULT = PROJECT_ROOT / "src" / "data"
+OUTPUT_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "synthetic"
+
+# 세대 번호를 ID 뒤 3자리에 붙이므로 최대 배수는 1000
+MAX_SCALE = 1000
+COPIED_FILES = ("region_data.json", "job_data.json")
+
+NOISE_SIGMA = 0.15
+LEVEL_JITTER = 2
+KEEP_DROP_RATE = 0.7     # 템플릿 드랍률을 유지할 확률 (나머지는 같은 중분류 분포에서 재추출)
+DROP_OMIT = 0.1          # 템플릿 드랍 하나를 빼먹을 확률
+DROP_EXTRA = 0.1         # 같은 중분류 아이템 하나를 추가할 확률
+
+
+def clone_id(entity_id: str, generation: int) -> str:
+    """세대 0은 원본 ID. 숫자 ID는 뒤에 3자리 세대 번호, 그 외(mb_xxx)는 -세대"""
+    if generation == 0:
+        return entity_id
+    if entity_id.isdigit():
+        return f"{entity_id}{generation:03d}"
+    return f"{entity_id}-{generation}"
+
+
+class NameModel:
+    """음절 bigram 마르코프 체인 (단어 단위)"""
+
+    def __init__(self, names: Sequence[str], rng: random.Random):
+        self.rng = rng
+        self.next: Dict[str, Counter] = defaultdict(Counter)
+        self.unigram: Counter = Counter()
+        for name in names:
+            for word in name.split():
+                if not all("가" <= ch <= "힣" for ch in word):
+                    continue
+                prev = "^"
+                for ch in word:
+                    self.next[prev][ch] += 1
+                    self.unigram[ch] += 1
+                    prev = ch
+        self._unigram = (list(self.unigram), list(self.unigram.values()))
+
+    def _pick(self, counter: Optional[Counter]) -> str:
+        if not counter:
+            population, weights = self._unigram
+        else:
+            population, weights = list(counter), list(counter.values())
+        return self.rng.choices(population, weights)[0]
+
+    def word(self, length: int) -> str:
+        out, prev = [], "^"
+        for _ in range(max(1, length)):
+            prev = self._pick(self.next.get(prev))
+            out.append(prev)
+        return "".join(out)
+
+    def variant(self, name: str, used: set) -> str:
+        """템플릿 이름에서 한글 단어 하나를 같은 길이의 생성 단어로 교체"""
+        words = name.split()
+        hangul = [i for i, w in enumerate(words) if w and all("가" <= ch <= "힣" for ch in w)]
+        for _ in range(20):
+            if hangul and self.unigram:
+                i = self.rng.choice(hangul)
+                candidate = " ".join(words[:i] + [self.word(len(words[i]))] + words[i + 1:])
+            else:
+                candidate = f"{name} {self.word(2)}" if self.unigram else name
+            if candidate not in used:
+                used.add(candidate)
+                return candidate
+        candidate = f"{name} {len(used)}"
+        used.add(candidate)
+        return candidate
+
+
+class Synthesizer:
+    def __init__(self, data: Dict[str, list], scale: int, seed: int):
+        self.data = data
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.monsters = data["monster_data.json"]
+        self.items = data["item_data.json"]
+        self.maps = data["map_data.json"]
+        self.relations = data["monster_item_relations.json"]
+        self.item_by_id = {i["id"]: i for i in self.items}
+        self.names = {
+            "monster": NameModel([m["name"] for m in self.monsters], self.rng),
+            "item": NameModel([i["name"] for i in self.items], self.rng),
+            "map": NameModel([m["name"] for m in self.maps], self.rng),
+        }
+        self.used_names = {
+            "monster": {m["name"] for m in self.monsters},
+            "item": {i["name"] for i in self.items},
+            "map": {m["name"] for m in self.maps},
+        }
+        # 중분류별 실제 드랍률 분포 (드랍률 없는 관계는 None으로 함께 유지)
+        self.rates_by_category: Dict[str, List[Optional[float]]] = defaultdict(list)
+        for r in self.relations:
+            self.rates_by_category[self._category(r["itemId"])].append(r.get("dropRate"))
+        self.items_by_category: Dict[str, List[str]] = defaultdict(list)
+        for i in self.items:
+            self.items_by_category[i.get("mediumCategory", "")].append(i["id"])
+        self.relations_by_monster: Dict[str, List[dict]] = defaultdict(list)
+        for r in self.relations:
+            self.relations_by_monster[r["monsterId"]].append(r)
+
+    def _category(self, item_id: str) -> str:
+        item = self.item_by_id.get(item_id)
+        return item.get("mediumCategory", "") if item else ""
+
+    # ---------- 값 생성 ----------
+
+    def ref(self, entity_id: str) -> str:
+        """참조 대상의 임의 세대"""
+        return clone_id(entity_id, self.rng.randrange(self.scale))
+
+    def noisy(self, value, minimum=0):
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return value
+        result = value * math.exp(self.rng.gauss(0, NOISE_SIGMA))
+        if isinstance(value, int):
+            return max(minimum, int(round(result)))
+        return max(minimum, round(result, 3))
+
+    def drop_rate(self, template_rate: Optional[float], item_id: str) -> Optional[float]:
+        if self.rng.random() < KEEP_DROP_RATE:
+            return template_rate
+        pool = self.rates_by_category.get(self._category(item_id))
+        return self.rng.choice(pool) if pool else template_rate
+
+    # ---------- 엔티티 복제 ----------
+
+    def monster(self, m: dict, g: int) -> dict:
+        out = dict(m)
+        out["id"] = clone_id(m["id"], g)
+        out["name"] = self.names["monster"].variant(m["name"], self.used_names["monster"])
+        out["level"] = min(200, max(1, m["level"] + self.rng.randint(-LEVEL_JITTER, LEVEL_JITTER)))
+        out["hp"] = self.noisy(m["hp"], 1)
+        out["exp"] = self.noisy(m["exp"])
+        if isinstance(m.get("stats"), dict):
+            out["stats"] = {k: self.noisy(v) if k != "speed" else v for k, v in m["stats"].items()}
+        if m.get("transformsFromMonsterId"):
+            out["transformsFromMonsterId"] = clone_id(m["transformsFromMonsterId"], g)
+        return out
+
+    def monster_relations(self, m: dict, g: int) -> List[Tuple[str, dict]]:
+        """(템플릿 아이템 ID, 관계 행) 목록"""
+        mid = clone_id(m["id"], g)
+        rows: List[Tuple[str, dict]] = []
+        for r in self.relations_by_monster.get(m["id"], []):
+            if self.rng.random() < DROP_OMIT:
+                continue
+            row = {"monsterId": mid, "itemId": self.ref(r["itemId"])}
+            if "dropRate" in r:
+                row["dropRate"] = self.drop_rate(r["dropRate"], r["itemId"])
+            rows.append((r["itemId"], row))
+            if self.rng.random() < DROP_EXTRA:
+                candidates = self.items_by_category.get(self._category(r["itemId"]))
+                if candidates:
+                    extra = self.rng.choice(candidates)
+                    rows.append((extra, {"monsterId": mid, "itemId": self.ref(extra),
+                                         "dropRate": self.drop_rate(r.get("dropRate"), extra)}))
+        # 같은 아이템 중복 제거 (먼저 나온 관계 유지)
+        seen, unique = set(), []
+        for template_id, row in rows:
+            if row["itemId"] not in seen:
+                seen.add(row["itemId"])
+                unique.append((template_id, row))
+        return unique
+
+    def item(self, i: dict, g: int) -> dict:
+        out = dict(i)
+        out["id"] = clone_id(i["id"], g)
+        out["name"] = self.names["item"].variant(i["name"], self.used_names["item"])
+        for key in ("shopPrice", "attackPower", "magicPower", "magicDefense", "maxHP", "maxMP"):
+            if key in i:
+                out[key] = self.noisy(i[key])
+        return out
+
+    def game_map(self, m: dict, g: int) -> dict:
+        out = dict(m)
+        out["id"] = clone_id(m["id"], g)
+        out["name"] = self.names["map"].variant(m["name"], self.used_names["map"])
+        out["monsterIds"] = sorted({self.ref(mid) for mid in m.get("monsterIds") or []})
+        if m.get("monsterSpawns"):
+            spawns = {}
+            for mid, count in m["monsterSpawns"].items():
+                spawns[self.ref(mid)] = self.noisy(count, 1)
+            out["monsterSpawns"] = spawns
+            out["monsterIds"] = sorted(set(out["monsterIds"]) | set(spawns))
+        if m.get("portalMapIds"):
+            out["portalMapIds"] = [self.ref(p) for p in m["portalMapIds"]]
+        return out
+
+    def build(self) -> Dict[str, list]:
+        monsters = list(self.monsters)
+        items = list(self.items)
+        maps = list(self.maps)
+        relations = list(self.relations)
+        for g in range(1, self.scale):
+            for m in self.monsters:
+                clone = self.monster(m, g)
+                rows = self.monster_relations(m, g)
+                if m.get("dropItemIds") is not None:
+                    clone["dropItemIds"] = [row["itemId"] for _, row in rows]
+                if m.get("featuredDropItemIds"):
+                    featured = set(m["featuredDropItemIds"])
+                    clone["featuredDropItemIds"] = [row["itemId"] for t, row in rows if t in featured][:3]
+                monsters.append(clone)
+                relations.extend(row for _, row in rows)
+            items.extend(self.item(i, g) for i in self.items)
+            maps.extend(self.game_map(m, g) for m in self.maps)
+        out = {
+            "monster_data.json": monsters,
+            "item_data.json": items,
+            "map_data.json": maps,
+            "monster_item_relations.json": relations,
+        }
+        for name in COPIED_FILES:
+            out[name] = self.data[name]
+        return out
+
+
+# ---------- 분포 비교 ----------
+
+def quantiles(values: List[float]) -> str:
+    values = [v for v in values if v is not None]
+    if len(values) < 2:
+        return "-"
+    q = statistics.quantiles(values, n=10)
+    return f"p10 {q[0]:g} / p50 {statistics.median(values):g} / p90 {q[-1]:g}"
+
+
+def profile(data: Dict[str, list]) -> Dict[str, str]:
+    monsters = data["monster_data.json"]
+    relations = data["monster_item_relations.json"]
+    monster_ids = {m["id"] for m in monsters}
+    item_ids = {i["id"] for i in data["item_data.json"]}
+    per_monster = Counter(r["monsterId"] for r in relations)
+    dangling = sum(1 for r in relations if r["monsterId"] not in monster_ids or r["itemId"] not in item_ids)
+    return {
+        "level": quantiles([m["level"] for m in monsters]),
+        "hp": quantiles([m["hp"] for m in monsters]),
+        "exp": quantiles([m["exp"] for m in monsters]),
+        "drops/monster": quantiles(list(per_monster.values())),
+        "dropRate": quantiles([r.get("dropRate") for r in relations]),
+        "dangling relations": f"{dangling / max(1, len(relations)):.1%}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 합성 데이터셋 생성")
+    parser.add_argument("--scale", type=int, default=10, help=f"원본 대비 배수 (2~{MAX_SCALE})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--source-dir", type=Path, default=SOURCE_DIR_DEFAULT)
+    parser.add_argument("--output-dir", type=Path, default=None, help="기본: src/request/synthetic/x{scale}")
+    args = parser.parse_args()
+
+    if not 2 <= args.scale <= MAX_SCALE:
+        parser.error(f"--scale must be between 2 and {MAX_SCALE}")
+    output_dir = args.output_dir or OUTPUT_DIR_DEFAULT / f"x{args.scale}"
+    if output_dir.resolve() == SOURCE_DIR_DEFAULT.resolve():
+        parser.error("refusing to overwrite src/data")
+
+    data = {}
+    for name in ("monster_data.json", "item_data.json", "map_data.json", "monster_item_relations.json") + COPIED_FILES:
+        with open(args.source_dir / name, "r", encoding="utf-8") as f:
+            data[name] = json.load(f)
+
+    print(f"Generating x{args.scale} dataset (seed {args.seed})...")
+    synthetic = Synthesizer(data, args.scale, args.seed).build()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, rows in synthetic.items():
+        with open(output_dir / name, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+    for dts in args.source_dir.glob("*.d.ts"):
+        shutil.copyfile(dts, output_dir / dts.name)
+    with open(output_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump({"scale": args.scale, "seed": args.seed, "source": str(args.source_dir),
+                   "counts": {name: len(rows) for name, rows in synthetic.items()}}, f, ensure_ascii=False, indent=2)
+
+    real, fake = profile(data), profile(synthetic)
+    print("\n" + "=" * 60)
+    print("Summary")
+    for name, rows in synthetic.items():
+        print(f"  - {name}: {len(data[name])} -> {len(rows)}")
+    print("\n  Distribution (source vs synthetic)")
+    for key in real:
+        print(f"  - {key:<19} {real[key]:<36} | {fake[key]}")
+    print(f"\n  - Output: {output_dir}")
+    print(f"  - Use: MAPLE_DATA_DIR={output_dir} python scripts/...")
+
+
+if __name__ == "__main__":
+    main()
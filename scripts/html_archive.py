@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수집한 HTML을 하나의 압축 팩 파일로 보관하는 아카이브 (+ URL/수집 시각 인덱스)
+
+지역별 스크립트는 src/request/ 아래에 monster_<id>.html / item_<id>.html을 수천 개씩 저장하고,
+재파싱 스크립트는 매번 glob 후 하나씩 엽니다. 이 아카이브는
+- 페이지마다 gzip(또는 zstandard가 설치되어 있으면 zstd)으로 압축한 멤버를 팩 파일 끝에 추가하고
+- 오프셋 인덱스(<팩>.idx.jsonl)로 URL + 수집 시각 기준 임의 접근을 지원하며
+- 전체 재파싱은 팩 파일 하나를 순차로 읽도록 합니다.
+
+팩 파일 형식 (멤버 반복):
+    MAGIC(4) | 헤더 길이(uint32, big endian) | 헤더 JSON(url, fetchedAt, codec, size, sha1, payloadSize) | 압축 본문
+각 멤버에 헤더가 있으므로 인덱스 파일이 없어지거나 어긋나도 팩을 스캔해서 다시 만들 수 있습니다.
+
+사용 예시:
+    # 기존 디렉토리 가져오기
+    python scripts/html_archive.py import src/request/scraped_monsters/ripa src/request/scraped
+    python scripts/html_archive.py import src/request/scraped_monsters/mapledb --url-template "https://mapledb.kr/search.php?q={id}&t=mob"
+    # 목록 / 내용 / 통계 (기본 아카이브: src/request/corpus.pack, --archive로 변경)
+    python scripts/html_archive.py ls
+    python scripts/html_archive.py cat https://xn--o80b01o9mlw3kdzc.com/monster_detail/100100
+    python scripts/html_archive.py stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import struct
+import sys
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from crawl_frontier import URL_TEMPLATES
+from utils import PROJECT_ROOT
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_ARCHIVE = PROJECT_ROOT / "src" / "request" / "corpus.pack"
+
+MAGIC = b"HPK1"
+_HEADER_LEN = struct.Struct(">I")
+
+CODEC_GZIP = "gzip"
+CODEC_ZSTD = "zstd"
+
+# 저장 파일명 접두어 -> 상세 페이지 종류 (지역별 스크립트 저장 규칙)
+FILENAME_PATTERN = re.compile(r"^(monster|map|item)_(\d+)\.html$")
+
+
+def default_codec() -> str:
+    return CODEC_ZSTD if zstandard is not None else CODEC_GZIP
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed. Please install it with: pip install zstandard")
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed. Please install it with: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def index_path_for(pack_path: Path) -> Path:
+    return pack_path.with_name(pack_path.name + ".idx.jsonl")
+
+
+def url_for_filename(name: str) -> Optional[str]:
+    """monster_100100.html -> monster_detail URL. 규칙에 맞지 않으면 None"""
+    m = FILENAME_PATTERN.match(name)
+    if not m:
+        return None
+    return URL_TEMPLATES[m.group(1)].format(id=m.group(2))
+
+
+@dataclass
+class ArchiveEntry:
+    url: str
+    fetchedAt: str
+    offset: int  # 멤버 시작 위치 (MAGIC 포함)
+    length: int  # 멤버 전체 길이
+    codec: str
+    size: int  # 압축 전 바이트 수
+    sha1: str
+
+
+class ArchiveWriter:
+    """팩 파일 끝에 멤버를 추가하는 writer (스레드 안전)"""
+
+    def __init__(self, path: Path = DEFAULT_ARCHIVE, codec: Optional[str] = None, dedupe: bool = True):
+        self.path = Path(path)
+        self.codec = codec or default_codec()
+        self.dedupe = dedupe
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._latest_sha1: Dict[str, str] = {}
+        if self.path.exists():
+            reader = ArchiveReader(self.path)
+            if not reader.index_complete:
+                reader.rebuild_index()
+            if self.path.stat().st_size > reader.valid_end:
+                # 쓰다가 중단된 마지막 멤버 제거 (뒤에 추가되는 멤버가 스캔 가능하도록)
+                with open(self.path, "r+b") as f:
+                    f.truncate(reader.valid_end)
+            if dedupe:
+                for entry in sorted(reader.entries(), key=lambda e: (e.fetchedAt, e.offset)):
+                    self._latest_sha1[entry.url] = entry.sha1
+        self._pack = open(self.path, "ab")
+        self._index = open(index_path_for(self.path), "a", encoding="utf-8")
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, url: str, body: bytes, fetched_at: Optional[datetime] = None) -> Optional[ArchiveEntry]:
+        """
+        페이지 하나를 추가합니다. dedupe=True이고 같은 URL의 마지막 내용과 같으면 추가하지 않고 None.
+        """
+        sha1 = hashlib.sha1(body).hexdigest()
+        fetched = (fetched_at or datetime.now(timezone.utc)).isoformat(timespec="seconds")
+        payload = compress(body, self.codec)
+        header = json.dumps(
+            {"url": url, "fetchedAt": fetched, "codec": self.codec, "size": len(body), "sha1": sha1,
+             "payloadSize": len(payload)},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        member = MAGIC + _HEADER_LEN.pack(len(header)) + header + payload
+        with self._lock:
+            if self.dedupe and self._latest_sha1.get(url) == sha1:
+                return None
+            offset = self._pack.seek(0, 2)
+            self._pack.write(member)
+            self._pack.flush()
+            entry = ArchiveEntry(url, fetched, offset, len(member), self.codec, len(body), sha1)
+            # 본문을 먼저 쓰고 인덱스를 나중에 써야 중단돼도 인덱스가 없는 멤버를 가리키지 않음
+            self._index.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+            self._index.flush()
+            self._latest_sha1[url] = sha1
+        return entry
+
+    def close(self) -> None:
+        self._pack.close()
+        self._index.close()
+
+
+class ArchiveReader:
+    """URL/수집 시각 기준 임의 접근 + 전체 순차 읽기"""
+
+    def __init__(self, path: Path = DEFAULT_ARCHIVE):
+        self.path = Path(path)
+        self._by_url: Dict[str, List[ArchiveEntry]] = {}
+        self._entries: List[ArchiveEntry] = []
+        self._load_index()
+
+    def _load_index(self) -> None:
+        index_path = index_path_for(self.path)
+        pack_size = self.path.stat().st_size if self.path.exists() else 0
+        entries: List[ArchiveEntry] = []
+        if index_path.exists():
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = ArchiveEntry(**json.loads(line))
+                    except (ValueError, TypeError):
+                        continue  # 중단으로 잘린 마지막 줄
+                    if entry.offset + entry.length <= pack_size:
+                        entries.append(entry)
+        # 인덱스가 팩 앞부분을 빈틈없이 덮는 범위까지만 믿고, 나머지는 팩을 스캔해서 보충
+        entries.sort(key=lambda e: e.offset)
+        covered = 0
+        for i, entry in enumerate(entries):
+            if entry.offset != covered:
+                entries = entries[:i]
+                break
+            covered += entry.length
+        self.index_complete = covered >= pack_size
+        if not self.index_complete:
+            entries.extend(self._scan(covered))
+        self._entries = entries
+        self.valid_end = max((e.offset + e.length for e in entries), default=0)
+        self._by_url = {}
+        for entry in entries:
+            self._by_url.setdefault(entry.url, []).append(entry)
+        for versions in self._by_url.values():
+            versions.sort(key=lambda e: (e.fetchedAt, e.offset))
+
+    def _scan(self, start: int = 0) -> List[ArchiveEntry]:
+        """팩 파일을 멤버 헤더 단위로 읽어 인덱스 항목을 만듭니다. 잘린 마지막 멤버는 무시합니다."""
+        found = []
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            while True:
+                prefix = f.read(len(MAGIC) + _HEADER_LEN.size)
+                if len(prefix) < len(MAGIC) + _HEADER_LEN.size or prefix[:4] != MAGIC:
+                    break
+                (header_len,) = _HEADER_LEN.unpack(prefix[4:])
+                header_bytes = f.read(header_len)
+                if len(header_bytes) < header_len:
+                    break
+                header = json.loads(header_bytes.decode("utf-8"))
+                payload_size = header["payloadSize"]
+                if len(f.read(payload_size)) < payload_size:
+                    break
+                length = len(prefix) + header_len + payload_size
+                found.append(ArchiveEntry(header["url"], header["fetchedAt"], offset, length,
+                                          header["codec"], header["size"], header["sha1"]))
+                offset += length
+        return found
+
+    def rebuild_index(self) -> int:
+        """팩 전체를 스캔해서 인덱스 파일을 다시 씁니다."""
+        entries = self._scan(0)
+        with open(index_path_for(self.path), "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+        self._load_index()
+        return len(entries)
+
+    # ---------- 조회 ----------
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._by_url
+
+    def __len__(self) -> int:
+        return len(self._by_url)
+
+    def urls(self) -> List[str]:
+        return list(self._by_url)
+
+    def entries(self) -> List[ArchiveEntry]:
+        return list(self._entries)
+
+    def versions(self, url: str) -> List[ArchiveEntry]:
+        return list(self._by_url.get(url, []))
+
+    def lookup(self, url: str, at: Optional[str] = None) -> Optional[ArchiveEntry]:
+        """URL의 최신 버전 (at이 주어지면 그 시각 이전에 수집된 마지막 버전)"""
+        versions = self._by_url.get(url)
+        if not versions:
+            return None
+        if at is None:
+            return versions[-1]
+        eligible = [e for e in versions if e.fetchedAt <= at]
+        return eligible[-1] if eligible else None
+
+    def read_entry(self, entry: ArchiveEntry, f=None) -> bytes:
+        own = f is None
+        if own:
+            f = open(self.path, "rb")
+        try:
+            f.seek(entry.offset)
+            member = f.read(entry.length)
+        finally:
+            if own:
+                f.close()
+        (header_len,) = _HEADER_LEN.unpack(member[len(MAGIC):len(MAGIC) + _HEADER_LEN.size])
+        return decompress(member[len(MAGIC) + _HEADER_LEN.size + header_len:], entry.codec)
+
+    def get(self, url: str, at: Optional[str] = None) -> Optional[bytes]:
+        entry = self.lookup(url, at)
+        return self.read_entry(entry) if entry else None
+
+    def latest_entries(self) -> List[ArchiveEntry]:
+        """URL별 최신 버전 (팩 파일 순서)"""
+        return sorted((versions[-1] for versions in self._by_url.values()), key=lambda e: e.offset)
+
+    def iter_latest(self) -> Iterator[Tuple[ArchiveEntry, bytes]]:
+        """URL별 최신 버전을 팩 파일 순서대로(순차 읽기) 반환합니다."""
+        with open(self.path, "rb") as f:
+            for entry in self.latest_entries():
+                yield entry, self.read_entry(entry, f)
+
+    def stats(self) -> Dict[str, object]:
+        raw = sum(e.size for e in self._entries)
+        packed = self.path.stat().st_size if self.path.exists() else 0
+        return {
+            "urls": len(self._by_url),
+            "members": len(self._entries),
+            "rawBytes": raw,
+            "packedBytes": packed,
+            "ratio": round(raw / packed, 2) if packed else None,
+        }
+
+
+def import_directory(
+    writer: ArchiveWriter,
+    directory: Path,
+    url_template: Optional[str] = None,
+    pattern: str = "*.html",
+) -> Tuple[int, int]:
+    """
+    기존 HTML 디렉토리를 아카이브로 가져옵니다. 수집 시각은 파일 수정 시각을 씁니다.
+    URL은 파일명 규칙(monster_/map_/item_<id>.html)으로 만들고,
+    url_template("{id}" 포함)이 주어지면 파일명의 숫자 ID로 대신 만듭니다. (예: mapledb 저장 디렉토리)
+    Returns: (추가, 건너뜀)
+    """
+    added = skipped = 0
+    for html_file in sorted(Path(directory).rglob(pattern)):
+        if url_template:
+            m = re.search(r"(\d+)", html_file.stem)
+            url = url_template.format(id=m.group(1)) if m else None
+        else:
+            url = url_for_filename(html_file.name)
+        if url is None:
+            skipped += 1
+            continue
+        fetched_at = datetime.fromtimestamp(html_file.stat().st_mtime, tz=timezone.utc)
+        if writer.append(url, html_file.read_bytes(), fetched_at=fetched_at) is None:
+            skipped += 1
+        else:
+            added += 1
+    return added, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 코퍼스 팩 아카이브")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="HTML 디렉토리 가져오기")
+    p_import.add_argument("directory", type=Path, nargs="+")
+    p_import.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE)
+    p_import.add_argument("--url-template", default=None, help='파일명 ID로 URL 생성 (예: "https://mapledb.kr/search.php?q={id}&t=mob")')
+    p_import.add_argument("--codec", choices=[CODEC_GZIP, CODEC_ZSTD], default=None)
+
+    p_ls = sub.add_parser("ls", help="URL 목록")
+    p_ls.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE)
+    p_ls.add_argument("--all-versions", action="store_true")
+
+    p_cat = sub.add_parser("cat", help="페이지 내용 출력")
+    p_cat.add_argument("url")
+    p_cat.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE)
+    p_cat.add_argument("--at", default=None, help="이 시각(ISO) 이전에 수집된 마지막 버전")
+
+    p_stats = sub.add_parser("stats", help="압축률 등 통계")
+    p_stats.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE)
+
+    p_reindex = sub.add_parser("reindex", help="팩 파일을 스캔해서 인덱스 재생성")
+    p_reindex.add_argument("--archive", type=Path, default=DEFAULT_ARCHIVE)
+
+    args = parser.parse_args()
+
+    if args.command == "import":
+        with ArchiveWriter(args.archive, codec=args.codec) as writer:
+            for directory in args.directory:
+                added, skipped = import_directory(writer, directory, url_template=args.url_template)
+                print(f"{directory}: added {added}, skipped {skipped}")
+        print(json.dumps(ArchiveReader(args.archive).stats(), ensure_ascii=False))
+    elif args.command == "ls":
+        reader = ArchiveReader(args.archive)
+        for url in sorted(reader.urls()):
+            versions = reader.versions(url) if args.all_versions else [reader.lookup(url)]
+            for entry in versions:
+                print(f"{entry.fetchedAt}  {entry.size:>8}  {url}")
+    elif args.command == "cat":
+        body = ArchiveReader(args.archive).get(args.url, at=args.at)
+        if body is None:
+            print(f"Not found: {args.url}", file=sys.stderr)
+            sys.exit(1)
+        sys.stdout.buffer.write(body)
+    elif args.command == "stats":
+        print(json.dumps(ArchiveReader(args.archive).stats(), ensure_ascii=False, indent=2))
+    elif args.command == "reindex":
+        print(f"Indexed {ArchiveReader(args.archive).rebuild_index()} members")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+레벨별 사냥터 순위 (맵 스폰 x 몬스터 exp/hp x 레벨 범위)
+
+맵 점수 = 레벨 범위 안 몬스터들의 합 (exp x 스폰 수 / hp)
+- exp / hp : 데미지 1당 경험치 (사냥 시간 대비 경험치의 근사)
+- 스폰 수  : map_data.monsterSpawns (없으면 --default-spawns로 추정하고 결과에 표시)
+- 레벨 범위: MonsterSearch.tsx와 같은 유저 레벨 -하한/+상한 (레범몬 모드는 +-10, 80 이상이면 70레벨 이상)
+
+맵마다 몬스터 기여도를 몬스터 레벨 칸(0~200)에 모아 누적합 행렬(맵 x 201)을 만들어 두므로
+유저 레벨별 점수는 열 두 개의 차이로 바로 구하고, 상위 N개는 argpartition으로 고릅니다.
+맵별 몬스터 목록은 레벨순으로 정렬해 두고 상위 맵의 기여 몬스터만 잘라서 보여 줍니다.
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/hunting_grounds.py --top 10
+    python scripts/hunting_grounds.py --level 55 --top 5
+    python scripts/hunting_grounds.py --mode rebemon --output src/request/analytics/hunting_grounds_rebemon.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from monster_analytics import MAX_LEVEL, REBEMON_HIGH_MONSTER, REBEMON_HIGH_PLAYER, REBEMON_OFFSET, np, require_numpy
+from utils import PROJECT_ROOT, get_data_path
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "hunting_grounds.json"
+DEFAULT_SPAWNS = 10
+TOP_N_DEFAULT = 10
+
+
+@dataclass
+class MapEntry:
+    monster_id: str
+    level: int
+    spawns: int
+    estimated: bool
+    score: float       # exp x spawns / hp
+
+
+class HuntingGroundIndex:
+    """맵별 레벨 누적합 행렬 + 레벨순 몬스터 목록"""
+
+    def __init__(self, maps: List[dict], monsters: List[dict], default_spawns: int = DEFAULT_SPAWNS,
+                 released_only: bool = True):
+        require_numpy()
+        by_id: Dict[str, dict] = {}
+        for m in monsters:
+            if released_only and not m.get("isReleased"):
+                continue
+            by_id.setdefault(m["id"], m)
+
+        self.maps: List[dict] = []
+        self.entries: List[List[MapEntry]] = []
+        self.entry_levels: List[List[int]] = []
+        for game_map in maps:
+            if released_only and not game_map.get("isReleased"):
+                continue
+            spawns = game_map.get("monsterSpawns") or {}
+            entries = []
+            for mid in dict.fromkeys(list(game_map.get("monsterIds") or []) + list(spawns)):
+                m = by_id.get(mid)
+                if m is None or not m.get("hp"):
+                    continue
+                count = spawns.get(mid)
+                entries.append(MapEntry(mid, int(m.get("level", 0)), int(count or default_spawns), count is None,
+                                        m.get("exp", 0) * (count or default_spawns) / m["hp"]))
+            if not entries:
+                continue
+            entries.sort(key=lambda e: e.level)
+            self.maps.append(game_map)
+            self.entries.append(entries)
+            self.entry_levels.append([e.level for e in entries])
+
+        # (맵, 몬스터 레벨 0..MAX) 기여도 -> 레벨 방향 누적합. cumulative[:, 0]은 레벨 -1 (0)
+        contrib = np.zeros((len(self.maps), MAX_LEVEL + 1), dtype=np.float64)
+        rows = [i for i, entries in enumerate(self.entries) for _ in entries]
+        levels = [min(MAX_LEVEL, max(0, e.level)) for entries in self.entries for e in entries]
+        scores = [e.score for entries in self.entries for e in entries]
+        np.add.at(contrib, (np.array(rows, dtype=np.int64), np.array(levels, dtype=np.int64)), np.array(scores))
+        self.cumulative = np.concatenate([np.zeros((len(self.maps), 1)), np.cumsum(contrib, axis=1)], axis=1)
+
+    @staticmethod
+    def window_bounds(lower: int, upper: int, rebemon: bool) -> Tuple["np.ndarray", "np.ndarray"]:
+        """유저 레벨 1..MAX별 포함 몬스터 레벨 [lo, hi]"""
+        players = np.arange(1, MAX_LEVEL + 1)
+        if rebemon:
+            lo = np.where(players >= REBEMON_HIGH_PLAYER, REBEMON_HIGH_MONSTER, players - REBEMON_OFFSET)
+            hi = np.where(players >= REBEMON_HIGH_PLAYER, MAX_LEVEL, players + REBEMON_OFFSET)
+        else:
+            lo, hi = players - lower, players + upper
+        return np.clip(lo, 0, MAX_LEVEL), np.clip(hi, 0, MAX_LEVEL)
+
+    def score_matrix(self, lower: int = 10, upper: int = 10, rebemon: bool = False) -> "np.ndarray":
+        """(MAX_LEVEL, 맵 수) 유저 레벨별 맵 점수"""
+        lo, hi = self.window_bounds(lower, upper, rebemon)
+        return (self.cumulative[:, hi + 1] - self.cumulative[:, lo]).T
+
+    def contributors(self, map_index: int, lo: int, hi: int) -> List[MapEntry]:
+        levels = self.entry_levels[map_index]
+        return self.entries[map_index][bisect.bisect_left(levels, lo):bisect.bisect_right(levels, hi)]
+
+    def top(self, scores: "np.ndarray", lo: int, hi: int, n: int) -> List[Dict[str, object]]:
+        """점수 한 줄(맵 수)에서 상위 n개 (점수 0 제외)"""
+        k = min(n, int((scores > 0).sum()))
+        if k == 0:
+            return []
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        result = []
+        for i in ranked:
+            game_map = self.maps[i]
+            contributors = self.contributors(int(i), lo, hi)
+            result.append({
+                "mapId": game_map["id"],
+                "name": game_map.get("name"),
+                "regionId": game_map.get("regionId"),
+                "score": round(float(scores[i]), 4),
+                "spawnsEstimated": any(e.estimated for e in contributors),
+                "monsters": [{"id": e.monster_id, "level": e.level, "spawns": e.spawns, "score": round(e.score, 4)}
+                             for e in sorted(contributors, key=lambda e: -e.score)],
+            })
+        return result
+
+    def table(self, n: int, lower: int = 10, upper: int = 10, rebemon: bool = False) -> Dict[str, List[dict]]:
+        matrix = self.score_matrix(lower, upper, rebemon)
+        lo, hi = self.window_bounds(lower, upper, rebemon)
+        return {str(p): self.top(matrix[p - 1], int(lo[p - 1]), int(hi[p - 1]), n) for p in range(1, MAX_LEVEL + 1)}
+
+
+def load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레벨별 사냥터 순위표 생성")
+    parser.add_argument("--top", type=int, default=TOP_N_DEFAULT, help="레벨별 상위 맵 수")
+    parser.add_argument("--lower", type=int, default=10, help="레벨 범위 하한 (유저 레벨 - lower)")
+    parser.add_argument("--upper", type=int, default=10, help="레벨 범위 상한 (유저 레벨 + upper)")
+    parser.add_argument("--mode", choices=["range", "rebemon"], default="range")
+    parser.add_argument("--default-spawns", type=int, default=DEFAULT_SPAWNS, help="monsterSpawns가 없을 때 몬스터당 스폰 수")
+    parser.add_argument("--level", type=int, default=None, help="이 레벨의 순위만 출력 (파일 저장 안 함)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    args = parser.parse_args()
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    started = time.perf_counter()
+    index = HuntingGroundIndex(load_json(get_data_path("map_data.json"), []),
+                               load_json(get_data_path("monster_data.json"), []),
+                               default_spawns=args.default_spawns)
+    indexed = time.perf_counter()
+    rebemon = args.mode == "rebemon"
+
+    if args.level is not None:
+        level = min(MAX_LEVEL, max(1, args.level))
+        scores = index.score_matrix(args.lower, args.upper, rebemon)[level - 1]
+        lo, hi = index.window_bounds(args.lower, args.upper, rebemon)
+        for rank, row in enumerate(index.top(scores, int(lo[level - 1]), int(hi[level - 1]), args.top), 1):
+            names = ", ".join(m["id"] for m in row["monsters"][:5])
+            est = " (spawns estimated)" if row["spawnsEstimated"] else ""
+            print(f"{rank:>3}. {row['mapId']:<11} {row['name']:<20} score {row['score']:>10.3f}  [{names}]{est}")
+        return
+
+    levels = index.table(args.top, args.lower, args.upper, rebemon)
+    built = time.perf_counter()
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "mode": "rebemon" if rebemon else "range",
+            "lowerOffset": REBEMON_OFFSET if rebemon else args.lower,
+            "upperOffset": REBEMON_OFFSET if rebemon else args.upper,
+            "defaultSpawns": args.default_spawns,
+            "top": args.top,
+            "levels": levels,
+        }, f, ensure_ascii=False, indent=2)
+
+    estimated = sum(1 for entries in index.entries for e in entries if e.estimated)
+    total = sum(len(entries) for entries in index.entries)
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Maps with released monsters: {len(index.maps)} ({total} map-monster pairs, spawns estimated for {estimated})")
+    print(f"  - Index: {(indexed - started) * 1000:.1f}ms, top-{args.top} for 200 levels: {(built - indexed) * 1000:.1f}ms")
+    for p in (10, 30, 50, 70, 100):
+        best = levels[str(p)][0] if levels[str(p)] else None
+        print(f"  - Lv{p}: {best['mapId'] + ' ' + str(best['name']) if best else '-'}")
+    print(f"  - Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
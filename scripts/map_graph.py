@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+맵 포탈 연결 그래프 + 지역별 최단 이동 거리
+
+map_data.json의 portalMapIds로 맵 연결 그래프를 만들고, 최상위 지역(RegionClosure 루트, 예: victoria)마다
+그 지역 안의 이동 횟수(hop)를 포탈 BFS로 미리 계산합니다.
+"마을 T에서 몬스터 M이 나오는 가장 가까운 맵"은 미리 만든 (출발 맵, 몬스터) 표에서 바로 찾습니다.
+
+- 인접 구조: CSR (indptr, indices) 정수 배열. 포탈은 양방향으로 보고 자기 자신으로 가는 포탈은 제외
+  (--directed면 적힌 방향만)
+- 거리 행렬: 포탈로 이어진 컴포넌트마다 (맵 수 x 맵 수) uint8, 도달 불가는 UNREACHABLE(255).
+  포탈이 있는 맵은 일부뿐이라 지역 전체 n x n 대신 컴포넌트만 만들고, 포탈 없는 맵은 자기 자신(0 hop)만 가짐.
+  맵마다 (컴포넌트 번호, 행 번호)를 배열로 두어 조회는 O(1). BFS는 다른 지역을 거쳐 가는 길도 쓰지만
+  거리/가장 가까운 스폰 맵은 같은 최상위 지역 안의 맵끼리만 냄
+- 가장 가까운 스폰 맵: 컴포넌트 행렬에서 같은 지역의 스폰 맵 열의 최솟값/위치 (출발 맵 자신에서 나오면 0 hop)
+- --from T --level L: hunting_grounds 점수와 이동 거리를 같이 보여 주는 이동 고려 사냥터 추천
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/map_graph.py
+    python scripts/map_graph.py --from 100000000 --monster 9300060
+    python scripts/map_graph.py --from 100000000 --level 20 --top 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from monster_analytics import np, require_numpy
+from region_index import RegionClosure, load_json
+from utils import PROJECT_ROOT, get_data_path
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "map_graph.npz"
+UNREACHABLE = 255
+
+
+class MapGraph:
+    """CSR 인접 구조 + 컴포넌트별 hop 행렬 + (출발 맵, 몬스터) 가장 가까운 스폰 맵 표"""
+
+    def __init__(self, maps: List[dict], regions: List[dict], directed: bool = False):
+        require_numpy()
+        closure = RegionClosure(regions)
+        self.maps = {m["id"]: m for m in maps}
+        self.ids: List[str] = list(self.maps)
+        for m in maps:
+            for target in m.get("portalMapIds") or []:
+                if target not in self.maps and target not in self.ids:
+                    self.ids.append(target)        # 데이터에 없는 포탈 목적지도 경유지로 둠
+        self.index = {mid: i for i, mid in enumerate(self.ids)}
+
+        edges = set()
+        for m in maps:
+            source = self.index[m["id"]]
+            for target in m.get("portalMapIds") or []:
+                if target == m["id"]:
+                    continue
+                edges.add((source, self.index[target]))
+                if not directed:
+                    edges.add((self.index[target], source))
+        ordered = sorted(edges)
+        self.indptr = np.zeros(len(self.ids) + 1, dtype=np.int32)
+        np.add.at(self.indptr, np.array([s + 1 for s, _ in ordered], dtype=np.int64), 1)
+        self.indptr = np.cumsum(self.indptr).astype(np.int32)
+        self.indices = np.array([t for _, t in ordered], dtype=np.int32)
+
+        # 최상위 지역별 맵 묶음 (region_data에 없는 regionId는 그 이름 그대로)
+        self.group_of: Dict[str, str] = {}
+        for mid in self.ids:
+            region_id = (self.maps.get(mid) or {}).get("regionId") or "unknown"
+            chain = closure.ancestors.get(region_id)
+            self.group_of[mid] = chain[-1] if chain else region_id
+        self.groups: Dict[str, List[str]] = {}
+        for mid in self.ids:
+            self.groups.setdefault(self.group_of[mid], []).append(mid)
+
+        # 맵 -> 컴포넌트 번호(포탈 없으면 -1), 컴포넌트 행렬 안의 행 번호
+        self.components: List[List[int]] = self._components(ordered)
+        self.component_of = np.full(len(self.ids), -1, dtype=np.int32)
+        self.row_of = np.zeros(len(self.ids), dtype=np.int32)
+        for c, nodes in enumerate(self.components):
+            self.component_of[nodes] = c
+            self.row_of[nodes] = np.arange(len(nodes), dtype=np.int32)
+        self.distances: List["np.ndarray"] = [self._component_matrix(nodes) for nodes in self.components]
+        self.nearest: Dict[Tuple[str, str], Tuple[str, int]] = self._nearest_spawns()
+
+    def neighbours(self, i: int) -> "np.ndarray":
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def bfs(self, source: int) -> "np.ndarray":
+        """전체 그래프 hop 거리 (도달 불가 UNREACHABLE)"""
+        dist = np.full(len(self.ids), UNREACHABLE, dtype=np.uint8)
+        dist[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            step = int(dist[node]) + 1
+            if step >= UNREACHABLE:
+                continue
+            for nxt in self.neighbours(node):
+                if dist[nxt] == UNREACHABLE:
+                    dist[nxt] = step
+                    queue.append(int(nxt))
+        return dist
+
+    def _components(self, edges: List[Tuple[int, int]]) -> List[List[int]]:
+        """포탈로 이어진 맵 묶음 (방향 무시, union-find). 각 묶음은 맵 번호 오름차순"""
+        parent = list(range(len(self.ids)))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for s, t in edges:
+            parent[find(s)] = find(t)
+        members: Dict[int, List[int]] = {}
+        for node in sorted({n for edge in edges for n in edge}):
+            members.setdefault(find(node), []).append(node)
+        return list(members.values())
+
+    def _component_matrix(self, nodes: List[int]) -> "np.ndarray":
+        columns = np.array(nodes, dtype=np.int64)
+        return np.stack([self.bfs(i)[columns] for i in nodes])
+
+    def _nearest_spawns(self) -> Dict[Tuple[str, str], Tuple[str, int]]:
+        table: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        # 출발 맵 자신에서 나오면 0 hop (포탈 없는 맵은 이것만)
+        for mid, game_map in self.maps.items():
+            for monster_id in dict.fromkeys(game_map.get("monsterIds") or []):
+                table[(mid, monster_id)] = (mid, 0)
+        for nodes, matrix in zip(self.components, self.distances):
+            groups = np.array([self.group_of[self.ids[i]] for i in nodes])
+            spawn_columns: Dict[str, List[int]] = {}
+            for col, i in enumerate(nodes):
+                for monster_id in dict.fromkeys((self.maps.get(self.ids[i]) or {}).get("monsterIds") or []):
+                    spawn_columns.setdefault(monster_id, []).append(col)
+            for monster_id, cols in spawn_columns.items():
+                sub = matrix[:, cols].copy()
+                sub[groups[:, None] != groups[cols][None, :]] = UNREACHABLE     # 다른 지역 스폰 맵 제외
+                best = sub.argmin(axis=1)
+                hops = sub[np.arange(len(nodes)), best]
+                for row in np.flatnonzero(hops != UNREACHABLE):
+                    table[(self.ids[nodes[row]], monster_id)] = (self.ids[nodes[cols[best[row]]]], int(hops[row]))
+        return table
+
+    def distance(self, source: str, target: str) -> Optional[int]:
+        group = self.group_of.get(source)
+        if group is None or self.group_of.get(target) != group:
+            return None
+        if source == target:
+            return 0
+        i, j = self.index[source], self.index[target]
+        component = self.component_of[i]
+        if component < 0 or component != self.component_of[j]:
+            return None
+        value = int(self.distances[component][self.row_of[i], self.row_of[j]])
+        return None if value == UNREACHABLE else value
+
+    def nearest_spawn(self, source: str, monster_id: str) -> Optional[Tuple[str, int]]:
+        """출발 맵에서 몬스터가 나오는 가장 가까운 맵 (맵 ID, hop)"""
+        return self.nearest.get((source, monster_id))
+
+    def save(self, path: Path = OUTPUT_DEFAULT) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {"ids": np.array(self.ids), "groups": np.array([self.group_of[mid] for mid in self.ids]),
+                  "indptr": self.indptr, "indices": self.indices,
+                  "component": self.component_of, "row": self.row_of}
+        for c, matrix in enumerate(self.distances):
+            arrays[f"hops/{c}"] = matrix
+        np.savez_compressed(path, **arrays)
+
+
+def travel_recommendations(graph: MapGraph, source: str, level: int, top: int) -> List[dict]:
+    """hunting_grounds 점수가 있는 맵 중 출발 맵에서 갈 수 있는 곳 (점수 / (1 + hop) 순)"""
+    from hunting_grounds import HuntingGroundIndex
+
+    index = HuntingGroundIndex(list(graph.maps.values()), load_json(get_data_path("monster_data.json"), []))
+    scores = index.score_matrix()[min(200, max(1, level)) - 1]
+    rows = []
+    for i, game_map in enumerate(index.maps):
+        hops = graph.distance(source, game_map["id"])
+        if hops is None or scores[i] <= 0:
+            continue
+        rows.append({"mapId": game_map["id"], "name": game_map.get("name"), "hops": hops,
+                     "score": float(scores[i]), "travelScore": float(scores[i]) / (1 + hops)})
+    rows.sort(key=lambda r: -r["travelScore"])
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="맵 포탈 그래프와 지역별 최단 이동 거리")
+    parser.add_argument("--directed", action="store_true", help="포탈을 적힌 방향으로만 사용")
+    parser.add_argument("--from", dest="source", metavar="MAP_ID", help="출발 맵")
+    parser.add_argument("--monster", metavar="MONSTER_ID", help="--from에서 이 몬스터가 나오는 가장 가까운 맵")
+    parser.add_argument("--level", type=int, help="--from에서 갈 수 있는 이 레벨 사냥터 (hunting_grounds 점수)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    args = parser.parse_args()
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    started = time.perf_counter()
+    graph = MapGraph(load_json(get_data_path("map_data.json"), []),
+                     load_json(get_data_path("region_data.json"), []),
+                     directed=args.directed)
+    elapsed = time.perf_counter() - started
+
+    if args.source and args.monster:
+        found = graph.nearest_spawn(args.source, args.monster)
+        print(f"  {found[0]} ({found[1]} hops)" if found else "  도달 가능한 스폰 맵 없음")
+        return
+    if args.source and args.level:
+        for row in travel_recommendations(graph, args.source, args.level, args.top):
+            print(f"  {row['mapId']:<11} {row['name']:<20} {row['hops']:>3} hops  score {row['score']:.3f}")
+        return
+
+    graph.save(args.output)
+    connected = int((np.diff(graph.indptr) > 0).sum())
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Maps: {len(graph.ids)} (with portals: {connected}, edges: {len(graph.indices)})")
+    print(f"  - Region groups: {len(graph.groups)} "
+          f"(largest: {max((len(n) for n in graph.groups.values()), default=0)} maps)")
+    print(f"  - Portal components: {len(graph.components)} "
+          f"(hop matrix cells: {sum(m.size for m in graph.distances):,})")
+    print(f"  - Nearest-spawn entries: {len(graph.nearest)}")
+    print(f"  - Build: {elapsed * 1000:.1f}ms")
+    print(f"  - Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
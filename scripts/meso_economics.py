@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+처치당 기대 메소 표 (stats.mesos + 드랍 x shopPrice)
+
+몬스터별 처치당 기대 가치 = stats.mesos + sum(dropRate x shopPrice) 를 관계 배열 전체에 대해 한 번에 계산하고,
+맵별로 출시 몬스터 평균(monsterSpawns가 있으면 스폰 수 가중)을 냅니다.
+클라이언트가 몬스터/아이템/관계 세 데이터를 합치지 않고 수익성 정렬을 할 수 있습니다.
+
+- 관계를 (몬스터 번호, 아이템 번호, 확률) 배열로 만들고 np.bincount로 몬스터별 합을 구함
+- dropRate는 drop_simulation.normalize_drop_rate와 같은 규칙 (퍼센트라서 100으로 나눔)
+- 증분 계산: 몬스터마다 mesos와 (아이템, 확률, 가격) 해시를 더한 지문을 출력에 남기고,
+  다음 실행에서 지문이 바뀐 몬스터의 관계만 골라 다시 계산 (맵 집계는 매번 다시 계산)
+  이름은 계산에 쓰지 않으므로 지문에 넣지 않고, 재사용하는 행도 매번 현재 monster_data의 이름으로 씀
+- mesos나 가격이 없는 값은 0으로 보고 결과에 알려진 값 수를 함께 남김
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/meso_economics.py
+    python scripts/meso_economics.py --full --top 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from drop_simulation import normalize_drop_rate
+from monster_analytics import MonsterColumns, np, require_numpy
+from utils import PROJECT_ROOT, get_data_path
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "meso_table.json"
+# 2: dropRate를 항상 퍼센트로 해석 (이전 결과는 재사용하지 않음)
+FORMAT_VERSION = 2
+
+
+def splitmix64(x: "np.ndarray") -> "np.ndarray":
+    """uint64 배열 해시 (오버플로는 2^64로 감김)"""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def id_code(value: str) -> int:
+    return int(value) if value.isdigit() else zlib.crc32(value.encode("utf-8"))
+
+
+class MesoTable:
+    """관계 배열 + 몬스터별 지문/기대 가치"""
+
+    def __init__(self, cols: MonsterColumns, items: List[dict], relations: List[dict]):
+        require_numpy()
+        self.cols = cols
+        index = {mid: i for i, mid in enumerate(cols.ids)}
+        item_index = {item["id"]: i for i, item in enumerate(items)}
+        self.price = np.array([item.get("shopPrice") or 0 for item in items], dtype=np.float64)
+        self.item_codes = np.array([id_code(item["id"]) for item in items], dtype=np.uint64)
+
+        rows = [(index[r["monsterId"]], item_index[r["itemId"]], normalize_drop_rate(r.get("dropRate")))
+                for r in relations if r["monsterId"] in index and r["itemId"] in item_index]
+        self.rel_monster = np.array([m for m, _, _ in rows], dtype=np.int64)
+        self.rel_item = np.array([i for _, i, _ in rows], dtype=np.int64)
+        self.rel_rate = np.array([p or 0.0 for _, _, p in rows], dtype=np.float64)
+
+        mesos = cols.stats["mesos"]
+        self.mesos_known = ~np.isnan(mesos)
+        self.mesos = np.where(self.mesos_known, mesos, 0.0)
+
+    def fingerprints(self) -> "np.ndarray":
+        """몬스터별 uint64 지문 (관계 순서와 무관하도록 관계 해시의 합)"""
+        n = len(self.cols)
+        rel_hash = splitmix64(
+            self.item_codes[self.rel_item]
+            ^ splitmix64(self.rel_rate.view(np.uint64))
+            ^ splitmix64(self.price[self.rel_item].view(np.uint64) + np.uint64(1))
+        )
+        acc = np.zeros(n, dtype=np.uint64)
+        np.add.at(acc, self.rel_monster, rel_hash)
+        return splitmix64(acc ^ splitmix64(self.mesos.view(np.uint64)) ^ self.mesos_known.astype(np.uint64))
+
+    def compute(self, mask: "np.ndarray") -> Dict[str, "np.ndarray"]:
+        """mask가 True인 몬스터만 드랍 가치/가격 있는 드랍 수 계산 (나머지는 0)"""
+        n = len(self.cols)
+        selected = mask[self.rel_monster]
+        rel_monster = self.rel_monster[selected]
+        value = self.rel_rate[selected] * self.price[self.rel_item[selected]]
+        priced = (self.price[self.rel_item[selected]] > 0) & (self.rel_rate[selected] > 0)
+        drop_value = np.bincount(rel_monster, weights=value, minlength=n)
+        priced_drops = np.bincount(rel_monster, weights=priced, minlength=n).astype(np.int64)
+        return {"dropValue": drop_value, "pricedDrops": priced_drops, "expected": self.mesos + drop_value}
+
+
+def map_aggregates(maps: List[dict], expected: Dict[str, float]) -> Dict[str, dict]:
+    result = {}
+    for game_map in maps:
+        if not game_map.get("isReleased"):
+            continue
+        spawns = game_map.get("monsterSpawns") or {}
+        members = [mid for mid in dict.fromkeys(game_map.get("monsterIds") or []) if mid in expected]
+        if not members:
+            continue
+        weights = np.array([spawns.get(mid, 1) for mid in members], dtype=np.float64)
+        values = np.array([expected[mid] for mid in members], dtype=np.float64)
+        best = members[int(values.argmax())]
+        result[game_map["id"]] = {
+            "name": game_map.get("name"),
+            "expectedPerKill": round(float((weights * values).sum() / weights.sum()), 2),
+            "bestMonsterId": best,
+            "bestExpectedPerKill": round(expected[best], 2),
+        }
+    return result
+
+
+def load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="몬스터/맵별 처치당 기대 메소 표 생성")
+    parser.add_argument("--full", action="store_true", help="이전 결과를 무시하고 전부 다시 계산")
+    parser.add_argument("--top", type=int, default=10, help="요약에 출력할 상위 몬스터 수")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    args = parser.parse_args()
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    started = time.perf_counter()
+    cols = MonsterColumns.load()
+    table = MesoTable(cols,
+                      load_json(get_data_path("item_data.json"), []),
+                      load_json(get_data_path("monster_item_relations.json"), []))
+    fingerprints = table.fingerprints()
+
+    previous = {} if args.full else load_json(args.output, {})
+    if previous.get("version") != FORMAT_VERSION:
+        previous = {}
+    old = previous.get("monsters", {})
+    hex_prints = [format(int(f), "016x") for f in fingerprints]
+    changed = np.array([old.get(mid, {}).get("fingerprint") != fp for mid, fp in zip(cols.ids, hex_prints)], dtype=bool)
+    values = table.compute(changed)
+
+    monsters: Dict[str, dict] = {}
+    for i, mid in enumerate(cols.ids):
+        if not changed[i]:
+            monsters[mid] = {**old[mid], "name": cols.names[i]}
+            continue
+        monsters[mid] = {
+            "name": cols.names[i],
+            "mesos": round(float(table.mesos[i]), 2) if table.mesos_known[i] else None,
+            "dropValue": round(float(values["dropValue"][i]), 2),
+            "expectedPerKill": round(float(values["expected"][i]), 2),
+            "pricedDrops": int(values["pricedDrops"][i]),
+            "fingerprint": hex_prints[i],
+        }
+    monsters = dict(sorted(monsters.items(), key=lambda kv: -kv[1]["expectedPerKill"]))
+    maps = map_aggregates(load_json(get_data_path("map_data.json"), []),
+                          {mid: row["expectedPerKill"] for mid, row in monsters.items()})
+    elapsed = time.perf_counter() - started
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": FORMAT_VERSION,
+            "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "monsters": monsters,
+            "maps": dict(sorted(maps.items(), key=lambda kv: -kv[1]["expectedPerKill"])),
+        }, f, ensure_ascii=False, indent=2)
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Monsters: {len(cols)} (recomputed {int(changed.sum())}, reused {len(cols) - int(changed.sum())})")
+    print(f"  - Known mesos: {int(table.mesos_known.sum())}, priced items: {int((table.price > 0).sum())}, "
+          f"relations: {len(table.rel_rate)}")
+    print(f"  - Maps: {len(maps)}")
+    print(f"  - Elapsed: {elapsed * 1000:.1f}ms")
+    for mid, row in list(monsters.items())[: args.top]:
+        print(f"    {mid:<9} {row['name']:<16} {row['expectedPerKill']:>10,.1f} meso/kill "
+              f"(mesos {row['mesos'] or 0:,.0f} + drops {row['dropValue']:,.1f})")
+    print(f"  - Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
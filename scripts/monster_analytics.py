@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+몬스터 분석 엔진 (NumPy 열 기반)
+
+monster_data.json을 열(level, hp, exp, mp, 방어력, requiredAccuracy, mesos, 주요 드랍 수 등) 배열로 올리고,
+MonsterSearch.tsx의 "인기 몬스터" 규칙을 몬스터 전체에 대해 한 번에 계산합니다.
+유저 레벨 1~200 x 몬스터 행렬로 레벨 범위(일반 모드 -하한/+상한, 레범몬 모드 +-10, 80 이상이면 70레벨 이상 포함)를
+만들어 레벨별 추천 몬스터 표를 미리 계산해 두므로 UI는 레벨로 바로 찾기만 하면 됩니다.
+
+인기 규칙 (MonsterSearch.tsx isRecommendedMonster와 같은 순서):
+1. 항상 인기 몬스터(하프, 블러드 하프) / 인기 마스터리북 드랍 / 일비 표창 드랍 -> 인기
+2. 레벨 20 미만 -> 제외
+3. 뇌전 수리검 드랍 + 체경비 < 35 -> 인기
+4. 레벨 30 미만: 예외 몬스터(하급닌자, 뿔버섯)는 체경비 < 10이면 인기, 그 외는 주요 드랍이 있어야 하고 아래 5와 같은 조건
+5. 체경비 < 10, 또는 체경비 < 15 + 주요 드랍 1개 이상, 또는 체경비 18~22 + 주요 드랍 2개 이상 -> 인기
+
+일비/뇌전 ID는 item_data 기준(일비 표창 2070006, 뇌전 수리검 2070005)을 씁니다.
+(MonsterSearch.tsx 인기 필터 쪽의 2070001/2070000은 item_data에서 월비/수비 표창입니다)
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/monster_analytics.py --verify
+    python scripts/monster_analytics.py --mode rebemon --output src/request/analytics/recommendation_table.json
+
+    from monster_analytics import MonsterColumns, recommendation_matrix
+    cols = MonsterColumns.load()
+    table = recommendation_matrix(cols, lower=10, upper=10)   # (200, n) bool
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from utils import PROJECT_ROOT, get_data_path
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "recommendation_table.json"
+
+MAX_LEVEL = 200
+PLAYER_LEVELS = range(1, MAX_LEVEL + 1)
+
+# MonsterSearch.tsx 규칙 상수
+EXCEPTION_MONSTER_IDS = frozenset({"9400400", "2110200"})      # 하급닌자, 뿔버섯
+ALWAYS_POPULAR_MONSTER_IDS = frozenset({"8140001", "8140002"})  # 하프, 블러드 하프
+ILBI_ID = "2070006"   # 일비 표창
+HWABI_ID = "2070005"  # 뇌전 수리검
+MIN_LEVEL = 20
+FEATURED_REQUIRED_BELOW = 30
+HWABI_HP_PER_EXP = 35
+HP_PER_EXP_ALWAYS = 10
+HP_PER_EXP_ONE_DROP = 15
+HP_PER_EXP_TWO_DROPS = (18, 22)
+
+# 레범몬 모드 범위
+REBEMON_OFFSET = 10
+REBEMON_HIGH_PLAYER = 80
+REBEMON_HIGH_MONSTER = 70
+
+STAT_COLUMNS = ("mp", "physicalDefense", "magicDefense", "requiredAccuracy", "evasion", "mesos")
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required: pip install numpy")
+
+
+@dataclass
+class MonsterColumns:
+    """출시 몬스터의 열 배열 (ID 중복은 첫 항목만, 원본 순서 유지)"""
+
+    ids: List[str]
+    names: List[str]
+    level: "np.ndarray"
+    hp: "np.ndarray"
+    exp: "np.ndarray"
+    stats: Dict[str, "np.ndarray"]      # STAT_COLUMNS, 값 없으면 NaN
+    featured_count: "np.ndarray"
+    popular_book: "np.ndarray"          # 인기 마스터리북을 주요 드랍으로 가짐
+    has_ilbi: "np.ndarray"
+    has_hwabi: "np.ndarray"
+
+    @classmethod
+    def from_data(cls, monsters: List[dict], items: List[dict], released_only: bool = True) -> "MonsterColumns":
+        require_numpy()
+        popular_books = {i["id"] for i in items if i.get("isPopularMasteryBook") is True}
+        seen = set()
+        rows = []
+        for m in monsters:
+            if released_only and not m.get("isReleased"):
+                continue
+            if m["id"] in seen:
+                continue
+            seen.add(m["id"])
+            rows.append(m)
+
+        featured = [m.get("featuredDropItemIds") or [] for m in rows]
+        drops = [m.get("dropItemIds") or [] for m in rows]
+        stats = {
+            name: np.array([(m.get("stats") or {}).get(name, np.nan) for m in rows], dtype=np.float64)
+            for name in STAT_COLUMNS
+        }
+        return cls(
+            ids=[m["id"] for m in rows],
+            names=[m.get("name", "") for m in rows],
+            level=np.array([m.get("level", 0) for m in rows], dtype=np.int32),
+            hp=np.array([m.get("hp", 0) for m in rows], dtype=np.float64),
+            exp=np.array([m.get("exp", 0) for m in rows], dtype=np.float64),
+            stats=stats,
+            featured_count=np.array([len(f) for f in featured], dtype=np.int32),
+            popular_book=np.array([any(i in popular_books for i in f) for f in featured], dtype=bool),
+            has_ilbi=np.array([ILBI_ID in f or ILBI_ID in d for f, d in zip(featured, drops)], dtype=bool),
+            has_hwabi=np.array([HWABI_ID in f or HWABI_ID in d for f, d in zip(featured, drops)], dtype=bool),
+        )
+
+    @classmethod
+    def load(cls, released_only: bool = True) -> "MonsterColumns":
+        with open(get_data_path("monster_data.json"), "r", encoding="utf-8") as f:
+            monsters = json.load(f)
+        with open(get_data_path("item_data.json"), "r", encoding="utf-8") as f:
+            items = json.load(f)
+        return cls.from_data(monsters, items, released_only=released_only)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def id_mask(self, ids) -> "np.ndarray":
+        return np.isin(np.array(self.ids, dtype=object), list(ids))
+
+    @property
+    def hp_per_exp(self) -> "np.ndarray":
+        """체경비 (exp 0이면 inf)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.exp == 0, np.inf, self.hp / np.where(self.exp == 0, 1, self.exp))
+
+
+def recommended_mask(cols: MonsterColumns) -> "np.ndarray":
+    """몬스터별 인기 여부 (유저 레벨과 무관)"""
+    hpe = cols.hp_per_exp
+    fc = cols.featured_count
+    base = (
+        (hpe < HP_PER_EXP_ALWAYS)
+        | ((hpe < HP_PER_EXP_ONE_DROP) & (fc >= 1))
+        | ((hpe >= HP_PER_EXP_TWO_DROPS[0]) & (hpe <= HP_PER_EXP_TWO_DROPS[1]) & (fc >= 2))
+    )
+    below_30 = cols.level < FEATURED_REQUIRED_BELOW
+    exception = cols.id_mask(EXCEPTION_MONSTER_IDS) & (hpe < HP_PER_EXP_ALWAYS)
+    gated = np.where(below_30, exception | ((fc > 0) & base), base)
+    unconditional = cols.id_mask(ALWAYS_POPULAR_MONSTER_IDS) | cols.popular_book | cols.has_ilbi
+    return unconditional | ((cols.level >= MIN_LEVEL) & ((cols.has_hwabi & (hpe < HWABI_HP_PER_EXP)) | gated))
+
+
+def window_matrix(cols: MonsterColumns, lower: int = 10, upper: int = 10, rebemon: bool = False) -> "np.ndarray":
+    """(200, n) 유저 레벨별 레벨 범위 포함 여부"""
+    players = np.arange(1, MAX_LEVEL + 1, dtype=np.int32)[:, None]
+    level = cols.level[None, :]
+    if rebemon:
+        lower = upper = REBEMON_OFFSET
+    inside = (level >= players - lower) & (level <= players + upper)
+    if rebemon:
+        inside |= (players >= REBEMON_HIGH_PLAYER) & (level >= REBEMON_HIGH_MONSTER)
+    return inside
+
+
+def recommendation_matrix(cols: MonsterColumns, lower: int = 10, upper: int = 10, rebemon: bool = False) -> "np.ndarray":
+    return window_matrix(cols, lower, upper, rebemon) & recommended_mask(cols)[None, :]
+
+
+def is_recommended_scalar(monster: dict, popular_books: set) -> bool:
+    """MonsterSearch.tsx isRecommendedMonster를 몬스터 하나씩 그대로 옮긴 기준 구현 (--verify용)"""
+    featured = monster.get("featuredDropItemIds") or []
+    drops = monster.get("dropItemIds") or []
+    if monster["id"] in ALWAYS_POPULAR_MONSTER_IDS:
+        return True
+    if any(i in popular_books for i in featured):
+        return True
+    if ILBI_ID in featured or ILBI_ID in drops:
+        return True
+    if monster.get("level", 0) < MIN_LEVEL:
+        return False
+    exp = monster.get("exp", 0)
+    hpe = float("inf") if exp == 0 else monster.get("hp", 0) / exp
+    count = len(featured)
+    if (HWABI_ID in featured or HWABI_ID in drops) and hpe < HWABI_HP_PER_EXP:
+        return True
+    if monster.get("level", 0) < FEATURED_REQUIRED_BELOW:
+        if monster["id"] in EXCEPTION_MONSTER_IDS and hpe < HP_PER_EXP_ALWAYS:
+            return True
+        if count == 0:
+            return False
+    if hpe < HP_PER_EXP_ALWAYS:
+        return True
+    if hpe < HP_PER_EXP_ONE_DROP and count >= 1:
+        return True
+    return HP_PER_EXP_TWO_DROPS[0] <= hpe <= HP_PER_EXP_TWO_DROPS[1] and count >= 2
+
+
+def build_table(cols: MonsterColumns, lower: int, upper: int, rebemon: bool) -> Dict[str, object]:
+    matrix = recommendation_matrix(cols, lower, upper, rebemon)
+    window = window_matrix(cols, lower, upper, rebemon)
+    # UI 기본 정렬(level-asc, 같은 레벨은 원본 순서)로 열 순서를 맞춘 뒤 행마다 True 위치만 꺼냄
+    order = np.argsort(cols.level, kind="stable")
+    ids = np.array(cols.ids, dtype=object)[order]
+    sorted_matrix = matrix[:, order]
+    levels = {str(p): ids[sorted_matrix[p - 1]].tolist() for p in PLAYER_LEVELS}
+    return {
+        "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mode": "rebemon" if rebemon else "range",
+        "lowerOffset": REBEMON_OFFSET if rebemon else lower,
+        "upperOffset": REBEMON_OFFSET if rebemon else upper,
+        "monsterCount": len(cols),
+        "recommendedCount": int(recommended_mask(cols).sum()),
+        "levelHistogram": np.bincount(cols.level, minlength=MAX_LEVEL + 1)[1:].tolist(),
+        "windowCounts": window.sum(axis=1).tolist(),
+        "levels": levels,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레벨별 인기 몬스터 표 생성 (NumPy)")
+    parser.add_argument("--lower", type=int, default=10, help="레벨 범위 하한 (유저 레벨 - lower)")
+    parser.add_argument("--upper", type=int, default=10, help="레벨 범위 상한 (유저 레벨 + upper)")
+    parser.add_argument("--mode", choices=["range", "rebemon"], default="range")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    parser.add_argument("--verify", action="store_true", help="몬스터별 기준 구현과 결과 비교")
+    args = parser.parse_args()
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    with open(get_data_path("monster_data.json"), "r", encoding="utf-8") as f:
+        monsters = json.load(f)
+    with open(get_data_path("item_data.json"), "r", encoding="utf-8") as f:
+        items = json.load(f)
+
+    started = time.perf_counter()
+    cols = MonsterColumns.from_data(monsters, items)
+    loaded = time.perf_counter()
+    table = build_table(cols, args.lower, args.upper, args.mode == "rebemon")
+    built = time.perf_counter()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, indent=2)
+
+    mismatches: Optional[List[str]] = None
+    if args.verify:
+        popular_books = {i["id"] for i in items if i.get("isPopularMasteryBook") is True}
+        by_id = {m["id"]: m for m in reversed(monsters)}  # 중복 ID는 첫 항목 기준
+        vector = recommended_mask(cols)
+        mismatches = [mid for mid, v in zip(cols.ids, vector) if bool(v) != is_recommended_scalar(by_id[mid], popular_books)]
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Monsters (released): {len(cols)}, recommended: {table['recommendedCount']}")
+    print(f"  - Mode: {table['mode']} (-{table['lowerOffset']}/+{table['upperOffset']})")
+    print(f"  - Columns: {(loaded - started) * 1000:.1f}ms, table (200 levels): {(built - loaded) * 1000:.1f}ms")
+    sample = [1, 20, 30, 50, 80, 120]
+    print("  - Recommended per level: " + ", ".join(f"Lv{p}={len(table['levels'][str(p)])}" for p in sample))
+    if mismatches is not None:
+        print(f"  - Verify against per-monster rules: {'OK' if not mismatches else f'{len(mismatches)} mismatches {mismatches[:10]}'}")
+    print(f"  - Output: {args.output}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,15 @@
 """
 
 import json
+import sys
 from collections import defaultdict
+from pathlib import Path
 from typing import Dict, List, Set
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import get_data_path
+
 # 표에서 추출한 알파벳별 몬스터 목록
 ALPHABET_MONSTERS = {
     'H': [
@@ -103,10 +109,10 @@ def find_monster_by_name(monsters: List[Dict], target_name: str) -> List[Dict]:
 
 def main():
     # 데이터 로드
-    with open('src/data/monster_data.json', 'r', encoding='utf-8') as f:
+    with open(get_data_path('monster_data.json'), 'r', encoding='utf-8') as f:
         monsters = json.load(f)
     
-    with open('src/data/region_data.json', 'r', encoding='utf-8') as f:
+    with open(get_data_path('region_data.json'), 'r', encoding='utf-8') as f:
         regions = json.load(f)
     
     # 지역 ID -> 이름 매핑
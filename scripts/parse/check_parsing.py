@@ -8,7 +8,9 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 from parse_item_detail import parse_item_detail_from_html
+from utils import get_data_path
 
 # 샘플 HTML 파일 확인
 sample_files = [
@@ -36,7 +38,7 @@ for html_file in sample_files:
             print(f"\n{item_id}: Failed to parse")
 
 # JSON 파일 확인
-json_file = Path(__file__).parent.parent.parent / 'src' / 'data' / 'item_data.json'
+json_file = get_data_path('item_data.json')
 with open(json_file, 'r', encoding='utf-8') as f:
     data = json.load(f)
 
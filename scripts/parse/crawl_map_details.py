@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+map_detail/{mapId} 페이지를 동시 수집하여 map_data.json의 monsterSpawns / portalMapIds를 채웁니다.
+
+지역별 스크립트는 몬스터 페이지의 SPAWN 목록으로 맵 소속만 추정하므로 맵별 스폰 수와 포탈 정보가 없습니다.
+- 몬스터 섹션: monster_detail 링크 + 스폰 수("12마리", "x 12", "× 12") -> monsterIds, monsterSpawns
+  스폰 수는 각 몬스터 링크 뒤 텍스트에서만 찾고, x/×는 단어 앞머리일 때만 인정 ("EXP 12"를 12마리로 읽지 않도록)
+- 포탈 섹션: map_detail 링크 -> portalMapIds
+- recommendedLevel은 사이트 값이 아니므로 쓰지 않음 (스폰 몬스터 레벨로 추정하지 않음)
+- provenance(map: spawns/portals) TTL 기준으로 오래된 맵만 수집, --checkpoint개마다 중간 저장
+
+사용 예시:
+    python scripts/parse/crawl_map_details.py --budget 200
+    python scripts/parse/crawl_map_details.py --map-ids 100000004,100000005
+    python scripts/parse/crawl_map_details.py --all --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import html as html_lib
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_with_history
+from crawl_metrics import METRICS_DIR_DEFAULT, CrawlMetrics
+from crawl_frontier import KIND_MAP, URL_TEMPLATES
+from fetcher import Fetcher, choose_decode
+from html_archive import ArchiveWriter
+from provenance import SOURCE_MAPLENOTE, ProvenanceTable, plan_refresh
+from regex_guard import BoundedRunner, ParseTimeout
+from utils import PROJECT_ROOT, get_data_path
+
+SCRAPED_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "scraped_maps"
+
+# 섹션 제목 키워드 (대소문자 무시)
+MONSTER_SECTION_KEYWORDS = ("monster", "mob", "몬스터", "출현")
+PORTAL_SECTION_KEYWORDS = ("portal", "포탈", "이동", "연결")
+
+SECTION_PATTERN = re.compile(r"<h2[^>]*>([\s\S]*?)</h2>", re.IGNORECASE)
+MONSTER_LINK_PATTERN = re.compile(r'href="[^"]*?/monster_detail/(\d+)"', re.IGNORECASE)
+MAP_LINK_PATTERN = re.compile(r'href="[^"]*?/map_detail/(\d+)"', re.IGNORECASE)
+SPAWN_COUNT_PATTERNS = (
+    re.compile(r"(\d+)\s*마리"),
+    re.compile(r"(?<![0-9A-Za-z])[x×X]\s*(\d+)(?!\d)"),
+    re.compile(r"(?:스폰|리젠|spawn)\s*(?:수)?\s*:?\s*(\d+)", re.IGNORECASE),
+)
+TITLE_PATTERN = re.compile(r"<h1[^>]*>([\s\S]*?)</h1>", re.IGNORECASE)
+
+
+def sort_key_id(id_value: str):
+    try:
+        return (0, int(id_value))
+    except Exception:
+        return (1, id_value)
+
+
+def strip_tags(s: str) -> str:
+    s = re.sub(r"<[^>]+>", " ", s)
+    s = html_lib.unescape(s)
+    return re.sub(r"\s+", " ", s).strip()
+
+
+@dataclass
+class ParsedMapDetail:
+    map_id: str
+    name: Optional[str]
+    monster_ids: List[str] = field(default_factory=list)
+    monster_spawns: Dict[str, int] = field(default_factory=dict)
+    portal_map_ids: List[str] = field(default_factory=list)
+    has_portal_section: bool = False
+
+
+def split_sections(html_text: str) -> List[Tuple[str, str]]:
+    """<h2> 제목 기준으로 (제목 텍스트, 본문 HTML) 목록으로 나눕니다."""
+    headings = list(SECTION_PATTERN.finditer(html_text))
+    sections = []
+    for i, m in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(html_text)
+        sections.append((strip_tags(m.group(1)).lower(), html_text[m.end():end]))
+    return sections
+
+
+def parse_spawn_count(block_text: str) -> Optional[int]:
+    for pattern in SPAWN_COUNT_PATTERNS:
+        m = pattern.search(block_text)
+        if m:
+            return int(m.group(1))
+    return None
+
+
+def parse_monster_block(section_html: str) -> Tuple[List[str], Dict[str, int]]:
+    """
+    몬스터 섹션에서 (몬스터 ID 목록, 스폰 수)를 추출합니다.
+    스폰 수는 해당 링크부터 다음 monster_detail 링크 전까지의 텍스트에서 찾습니다.
+    """
+    links = list(MONSTER_LINK_PATTERN.finditer(section_html))
+    monster_ids: List[str] = []
+    spawns: Dict[str, int] = {}
+    for i, m in enumerate(links):
+        monster_id = m.group(1)
+        if monster_id not in monster_ids:
+            monster_ids.append(monster_id)
+        end = links[i + 1].start() if i + 1 < len(links) else len(section_html)
+        count = parse_spawn_count(strip_tags(section_html[m.end():end]))
+        if count is not None:
+            spawns[monster_id] = max(spawns.get(monster_id, 0), count)
+    return monster_ids, spawns
+
+
+def parse_map_detail_html(html_text: str, map_id: str) -> ParsedMapDetail:
+    title = TITLE_PATTERN.search(html_text)
+    parsed = ParsedMapDetail(map_id=map_id, name=strip_tags(title.group(1)) if title else None)
+
+    sections = split_sections(html_text)
+    monster_sections = [body for heading, body in sections if any(k in heading for k in MONSTER_SECTION_KEYWORDS)]
+    portal_sections = [body for heading, body in sections if any(k in heading for k in PORTAL_SECTION_KEYWORDS)]
+
+    # 몬스터 섹션 제목이 없으면 페이지 전체의 monster_detail 링크를 사용
+    for body in monster_sections or [html_text]:
+        ids, spawns = parse_monster_block(body)
+        for monster_id in ids:
+            if monster_id not in parsed.monster_ids:
+                parsed.monster_ids.append(monster_id)
+        for monster_id, count in spawns.items():
+            parsed.monster_spawns[monster_id] = max(parsed.monster_spawns.get(monster_id, 0), count)
+
+    # 포탈은 섹션이 명시된 경우에만 (페이지 곳곳의 맵 링크를 포탈로 오인하지 않도록)
+    parsed.has_portal_section = bool(portal_sections)
+    for body in portal_sections:
+        for target in MAP_LINK_PATTERN.findall(body):
+            if target != map_id and target not in parsed.portal_map_ids:
+                parsed.portal_map_ids.append(target)
+
+    return parsed
+
+
+def merge_map_detail(game_map: dict, parsed: ParsedMapDetail) -> List[str]:
+    """맵 상세 파싱 결과를 맵에 반영하고 변경된 필드 이름 목록을 반환합니다."""
+    changed = []
+
+    monster_ids = sorted(set(game_map.get("monsterIds") or []) | set(parsed.monster_ids), key=sort_key_id)
+    if monster_ids != (game_map.get("monsterIds") or []):
+        game_map["monsterIds"] = monster_ids
+        changed.append("monsterIds")
+
+    if parsed.monster_spawns:
+        spawns = dict(game_map.get("monsterSpawns") or {})
+        spawns.update(parsed.monster_spawns)
+        spawns = {k: spawns[k] for k in sorted(spawns, key=sort_key_id)}
+        if spawns != game_map.get("monsterSpawns"):
+            game_map["monsterSpawns"] = spawns
+            changed.append("monsterSpawns")
+
+    if parsed.has_portal_section and parsed.portal_map_ids != game_map.get("portalMapIds"):
+        game_map["portalMapIds"] = parsed.portal_map_ids
+        changed.append("portalMapIds")
+
+    return changed
+
+
+def load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="map_detail 페이지로 맵 스폰/포탈 정보 수집")
+    parser.add_argument("--map-ids", type=str, default=None, help="쉼표로 구분된 맵 ID 목록")
+    parser.add_argument("--all", action="store_true", help="TTL과 무관하게 모든 출시 맵 수집")
+    parser.add_argument("--budget", type=int, default=200, help="TTL 기준 선정 시 최대 요청 수")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--interval", type=float, default=0.25, help="호스트별 최소 요청 간격 (초)")
+    parser.add_argument("--checkpoint", type=int, default=50, help="이 개수만큼 처리할 때마다 map_data.json 중간 저장")
+    parser.add_argument("--output-dir", type=Path, default=SCRAPED_DIR_DEFAULT)
+    parser.add_argument("--skip-save-html", action="store_true")
+    parser.add_argument("--archive", type=Path, default=None, help="HTML을 개별 파일 대신 팩 아카이브에 추가 (html_archive)")
+    parser.add_argument("--metrics-dir", type=Path, default=METRICS_DIR_DEFAULT, help="트레이스/.prom 저장 위치 (node exporter textfile 디렉토리)")
+    parser.add_argument("--parse-timeout", type=float, default=None,
+                        help="페이지당 파싱 시간 제한 (초). 넘기면 오류로 기록하고 입력을 src/request/pathological/에 저장")
+    args = parser.parse_args()
+
+    map_file = get_data_path("map_data.json")
+    maps = load_json(map_file, [])
+    maps_by_id = {m["id"]: m for m in maps}
+    provenance = ProvenanceTable()
+
+    if args.map_ids:
+        targets = [mid.strip() for mid in args.map_ids.split(",") if mid.strip() in maps_by_id]
+    elif args.all:
+        targets = [m["id"] for m in maps if m.get("isReleased", False)]
+    else:
+        candidates = plan_refresh(
+            provenance, "map", [m["id"] for m in maps if m.get("isReleased", False)], budget=args.budget
+        )
+        targets = [c.entity_id for c in candidates]
+    print(f"Fetching {len(targets)} map_detail pages ({args.workers} workers)...")
+    if not targets:
+        return
+
+    archive = ArchiveWriter(args.archive) if args.archive and not args.skip_save_html else None
+    if not args.skip_save_html and archive is None:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    url_to_map = {URL_TEMPLATES[KIND_MAP].format(id=map_id): map_id for map_id in targets}
+    tag = f"map-details-{datetime.now(timezone.utc).strftime('%Y%m%d')}"
+    metrics = CrawlMetrics("crawl_map_details", metrics_dir=args.metrics_dir)
+    fetcher = Fetcher(workers=args.workers, per_host_interval=args.interval, on_result=metrics.on_fetch)
+
+    runner = BoundedRunner(args.parse_timeout) if args.parse_timeout else None
+
+    spawns_filled = portals_filled = maps_changed = errors = 0
+    unknown_portal_targets = set()
+    pending = 0
+
+    for done, result in enumerate(fetcher.fetch_many(url_to_map), 1):
+        map_id = url_to_map[result.url]
+        if not result.ok:
+            errors += 1
+            print(f"  [{done}/{len(targets)}] {map_id}: {result.error}")
+            continue
+        with metrics.stage("save", kind="html"):
+            if archive is not None:
+                metrics.cache_hit("archive", archive.append(result.url, result.body) is None)
+            elif not args.skip_save_html:
+                (args.output_dir / f"map_{map_id}.html").write_bytes(result.body)
+
+        with metrics.stage("decode"):
+            html_text = choose_decode(result.body)
+        try:
+            with metrics.stage("parse"):
+                if runner is not None:
+                    parsed = runner.call(parse_map_detail_html, html_text, map_id)
+                else:
+                    parsed = parse_map_detail_html(html_text, map_id)
+        except ParseTimeout as e:
+            errors += 1
+            metrics.count("parse_timeouts")
+            print(f"  [{done}/{len(targets)}] {map_id}: {e}")
+            continue
+        game_map = maps_by_id[map_id]
+        had_spawns = bool(game_map.get("monsterSpawns"))
+        had_portals = bool(game_map.get("portalMapIds"))
+        with metrics.stage("merge"):
+            changed = merge_map_detail(game_map, parsed)
+        if changed:
+            maps_changed += 1
+            pending += 1
+        spawns_filled += int(not had_spawns and bool(game_map.get("monsterSpawns")))
+        portals_filled += int(not had_portals and bool(game_map.get("portalMapIds")))
+        unknown_portal_targets.update(p for p in parsed.portal_map_ids if p not in maps_by_id)
+
+        with metrics.stage("merge", kind="provenance"):
+            provenance.record("map", map_id, "spawns", SOURCE_MAPLENOTE,
+                              {"monsterIds": parsed.monster_ids, "monsterSpawns": parsed.monster_spawns})
+            if parsed.has_portal_section:
+                provenance.record("map", map_id, "portals", SOURCE_MAPLENOTE, parsed.portal_map_ids)
+
+        print(f"  [{done}/{len(targets)}] {map_id} {parsed.name or game_map.get('name')}: "
+              f"monsters {len(parsed.monster_ids)}, spawns {len(parsed.monster_spawns)}, "
+              f"portals {len(parsed.portal_map_ids)}{' -> ' + ','.join(changed) if changed else ''}")
+
+        if pending >= args.checkpoint:
+            with metrics.stage("save", kind="checkpoint"):
+                save_with_history("map_data.json", maps, tag=tag, source="crawl_map_details")
+                provenance.save()
+            pending = 0
+
+    with metrics.stage("save"):
+        save_with_history("map_data.json", maps, tag=tag, source="crawl_map_details")
+        provenance.save()
+    metrics.count("maps_changed", maps_changed)
+    metrics.count("fetch_errors", errors)
+    if archive is not None:
+        archive.close()
+    if runner is not None:
+        runner.close()
+
+    total_spawns = sum(1 for m in maps if m.get("monsterSpawns"))
+    total_portals = sum(1 for m in maps if m.get("portalMapIds"))
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Pages: {len(targets)} (errors {errors})")
+    print(f"  - Maps changed: {maps_changed}")
+    print(f"  - monsterSpawns newly filled: {spawns_filled} (total {total_spawns}/{len(maps)})")
+    print(f"  - portalMapIds newly filled: {portals_filled} (total {total_portals}/{len(maps)})")
+    if unknown_portal_targets:
+        print(f"  - Portal targets not in map_data.json: {sorted(unknown_portal_targets, key=sort_key_id)}")
+    print(f"  - map_data.json: {map_file}")
+    metrics.finish()
+
+
+if __name__ == "__main__":
+    main()
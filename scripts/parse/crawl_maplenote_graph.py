@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+maplenote 상세 페이지 링크 그래프를 한 번에 크롤링합니다. (crawl_frontier.CrawlFrontier)
+
+지역별 스크립트는 monsternote?foundAt=... 목록 페이지의 몬스터만 보기 때문에
+map_detail 페이지에서만 보이는 몬스터나 SPAWN 섹션으로만 연결되는 맵을 놓칩니다.
+이 스크립트는 기존 몬스터/맵 ID(+선택적 목록 페이지)를 시드로 monster_detail <-> map_detail <-> item_detail
+링크를 따라가며, 여러 워커가 하나의 프론티어를 공유해 그래프가 수렴할 때까지 수집합니다.
+
+- 발견한 신규 몬스터/맵 ID는 리포트(src/request/crawl/graph_report.json)에 기록
+- --apply: 몬스터 페이지의 드랍(GET)과 기존 맵의 SPAWN 관계를 데이터에 반영
+- --state: 프론티어 상태 저장/재개
+
+사용 예시:
+    python scripts/parse/crawl_maplenote_graph.py --budget 500 --workers 8
+    python scripts/parse/crawl_maplenote_graph.py --list-url "https://xn--o80b01o9mlw3kdzc.com/monsternote?foundAt=2200" --no-seed-known
+    python scripts/parse/crawl_maplenote_graph.py --state src/request/crawl/frontier.json --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_with_history
+from crawl_frontier import KIND_ITEM, KIND_MAP, KIND_MONSTER, CrawlFrontier, CrawlTask, extract_links
+from fetcher import Fetcher, choose_decode
+from html_archive import ArchiveWriter
+from regex_guard import bounded_call, close_all
+from update_crimsonwood_monsters_from_site import (
+    ParsedMonsterDetail,
+    load_json,
+    merge_monster_item_relations,
+    parse_monster_detail_html,
+    sort_key_id,
+)
+from utils import PROJECT_ROOT, get_data_path
+
+CRAWL_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "crawl"
+
+# 상태 파일 중간 저장 주기 (완료 작업 수)
+CHECKPOINT_EVERY = 100
+
+
+def seed_from_list_pages(frontier: CrawlFrontier, fetcher: Fetcher, list_urls: List[str]) -> int:
+    added = 0
+    for result in fetcher.fetch_many(list_urls):
+        if not result.ok:
+            print(f"  List page failed: {result.url} ({result.error})")
+            continue
+        for kind, entity_id in extract_links(choose_decode(result.body)):
+            if kind == KIND_MONSTER and frontier.add(kind, entity_id, depth=0, parent="list"):
+                added += 1
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="maplenote 링크 그래프 크롤링")
+    parser.add_argument("--list-url", action="append", default=[], help="시드로 쓸 monsternote 목록 페이지 (여러 번 지정 가능)")
+    parser.add_argument("--no-seed-known", action="store_true", help="기존 monster_data/map_data ID를 시드로 쓰지 않음")
+    parser.add_argument("--max-depth", type=int, default=3)
+    parser.add_argument("--budget", type=int, default=None, help="최대 요청 수 (기본: 무제한)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--interval", type=float, default=0.25, help="호스트별 최소 요청 간격 (초)")
+    parser.add_argument("--no-items", action="store_true", help="item_detail 페이지는 방문하지 않음 (간선만 기록)")
+    parser.add_argument("--state", type=Path, default=None, help="프론티어 상태 파일 (있으면 이어서 진행)")
+    parser.add_argument("--output-dir", type=Path, default=CRAWL_DIR_DEFAULT)
+    parser.add_argument("--skip-save-html", action="store_true")
+    parser.add_argument("--archive", type=Path, default=None, help="HTML을 개별 파일 대신 팩 아카이브에 추가 (html_archive)")
+    parser.add_argument("--apply", action="store_true", help="드랍/스폰 관계를 데이터 파일에 반영")
+    parser.add_argument("--parse-timeout", type=float, default=None,
+                        help="페이지당 파싱 시간 제한 (초). 넘기면 실패로 기록하고 입력을 src/request/pathological/에 저장")
+    args = parser.parse_args()
+
+    monsters = load_json(get_data_path("monster_data.json"), [])
+    maps = load_json(get_data_path("map_data.json"), [])
+    known_monsters = {m["id"] for m in monsters}
+    known_maps = {m["id"] for m in maps}
+
+    kinds = {KIND_MONSTER, KIND_MAP} if args.no_items else {KIND_MONSTER, KIND_MAP, KIND_ITEM}
+    frontier = CrawlFrontier(max_depth=args.max_depth, budget=args.budget, kinds=kinds)
+    fetcher = Fetcher(workers=args.workers, per_host_interval=args.interval)
+
+    if args.state and args.state.exists():
+        frontier.load(args.state)
+        print(f"Resumed frontier: {frontier.stats}")
+    else:
+        if not args.no_seed_known:
+            for mid in sorted(known_monsters, key=sort_key_id):
+                frontier.add(KIND_MONSTER, mid)
+            for map_id in sorted(known_maps, key=sort_key_id):
+                frontier.add(KIND_MAP, map_id)
+        if args.list_url:
+            print(f"Seeded {seed_from_list_pages(frontier, fetcher, args.list_url)} monsters from list pages")
+    print(f"Frontier: {frontier.stats}")
+
+    html_dir = args.output_dir / "html"
+    archive = ArchiveWriter(args.archive) if args.archive and not args.skip_save_html else None
+    if not args.skip_save_html and archive is None:
+        html_dir.mkdir(parents=True, exist_ok=True)
+
+    parsed_monsters: Dict[str, ParsedMonsterDetail] = {}
+    failures: Dict[str, str] = {}
+    lock = threading.Lock()
+    completed = [0]
+
+    def worker():
+        while True:
+            task: CrawlTask = frontier.pop()
+            if task is None:
+                return
+            html_text = None
+            try:
+                result = fetcher.fetch(task.url)
+                if not result.ok:
+                    with lock:
+                        failures[task.key] = result.error or f"HTTP {result.status}"
+                    continue
+                html_text = choose_decode(result.body)
+                if archive is not None:
+                    archive.append(task.url, result.body)
+                elif not args.skip_save_html:
+                    (html_dir / f"{task.kind}_{task.id}.html").write_bytes(result.body)
+                if task.kind == KIND_MONSTER:
+                    if args.parse_timeout:
+                        parsed = bounded_call(parse_monster_detail_html, html_text,
+                                              monster_id=task.id, timeout=args.parse_timeout)
+                    else:
+                        parsed = parse_monster_detail_html(html_text, monster_id=task.id)
+                    with lock:
+                        parsed_monsters[task.id] = parsed
+            except Exception as e:
+                with lock:
+                    failures[task.key] = f"{type(e).__name__}: {e}"
+                html_text = None
+                continue
+            finally:
+                # 예외가 나도 반드시 완료 처리해야 다른 워커가 무한 대기하지 않음
+                added = frontier.done(task, html_text)
+            with lock:
+                completed[0] += 1
+                count = completed[0]
+            print(f"  [{count}] {task.kind:<7} {task.id:<10} depth {task.depth} +{added} links ({result.elapsed:.2f}s)")
+            if args.state and count % CHECKPOINT_EVERY == 0:
+                frontier.save(args.state)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(args.workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    close_all()
+
+    if args.state:
+        frontier.save(args.state)
+    if archive is not None:
+        archive.close()
+
+    new_monsters = sorted(frontier.discovered(KIND_MONSTER) - known_monsters, key=sort_key_id)
+    new_maps = sorted(frontier.discovered(KIND_MAP) - known_maps, key=sort_key_id)
+    report_file = args.output_dir / "graph_report.json"
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_file, "w", encoding="utf-8") as f:
+        json.dump({
+            "crawledAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "stats": frontier.stats,
+            "newMonsterIds": new_monsters,
+            "newMapIds": new_maps,
+            "failures": failures,
+            "edges": sorted(frontier.edges),
+        }, f, ensure_ascii=False, indent=2)
+
+    if args.apply and parsed_monsters:
+        relations = load_json(get_data_path("monster_item_relations.json"), [])
+        maps_by_id = {m["id"]: m for m in maps}
+        rel_added = rel_updated = maps_updated = 0
+        for mid, parsed in sorted(parsed_monsters.items(), key=lambda kv: sort_key_id(kv[0])):
+            if mid not in known_monsters:
+                continue
+            relations, added, updated = merge_monster_item_relations(relations, mid, parsed.drops)
+            rel_added += added
+            rel_updated += updated
+            for map_id, _ in parsed.spawn_maps:
+                m = maps_by_id.get(map_id)
+                if m is not None and mid not in (m.get("monsterIds") or []):
+                    m["monsterIds"] = sorted(set(m.get("monsterIds") or []) | {mid}, key=sort_key_id)
+                    maps_updated += 1
+        tag = f"crawl-graph-{datetime.now(timezone.utc).strftime('%Y%m%d')}"
+        save_with_history("monster_item_relations.json", relations, tag=tag, source="crawl_maplenote_graph")
+        save_with_history("map_data.json", maps, tag=tag, source="crawl_maplenote_graph")
+        print(f"\nApplied: relations +{rel_added}/~{rel_updated}, maps updated {maps_updated}")
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Frontier: {frontier.stats}")
+    print(f"  - Failures: {len(failures)}")
+    print(f"  - New monster IDs (not in monster_data.json): {len(new_monsters)}")
+    print(f"  - New map IDs (not in map_data.json): {len(new_maps)}")
+    print(f"  - Report: {report_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,11 @@ import json
 import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
 
@@ -38,6 +43,12 @@ JOB_CATEGORY_MAP = {
     '해적': 'pirate',
 }
 
+# HTML 주석 카테고리 구분 + 테이블 행 패턴
+CATEGORY_START_V1_PATTERN = re.compile(r'<!--\s*```\s*([^-]+?)\s*-->')
+CATEGORY_END_V1_PATTERN = re.compile(r'<!--\s*```\s*-->')
+CATEGORY_START_V2_PATTERN = re.compile(r'<!--\s*([^-]+?)\s*-->')
+ROW_PATTERN = re.compile(r'<tr>\s*<td>(\d*)</td>.*?item_detail/(\d+)".*?<td>([^<]+)</td>', re.DOTALL)
+
 
 def parse_equipment_table_html(html_text, job_category='common'):
     """HTML 테이블에서 장비 아이템 파싱"""
@@ -48,10 +59,7 @@ def parse_equipment_table_html(html_text, job_category='common'):
     # 형식 2: <!-- 카테고리명 --> ... <!-- 카테고리명 끝 -->
     
     # 먼저 형식 1 시도 (``` 포함 형식)
-    pattern_category_start_v1 = r'<!--\s*```\s*([^-]+?)\s*-->'
-    pattern_category_end_v1 = r'<!--\s*```\s*-->'
-    
-    category_starts_v1 = list(re.finditer(pattern_category_start_v1, html_text))
+    category_starts_v1 = list(CATEGORY_START_V1_PATTERN.finditer(html_text))
     
     if category_starts_v1:
         # 형식 1 사용
@@ -63,13 +71,13 @@ def parse_equipment_table_html(html_text, job_category='common'):
             
             start_pos = match_start.end()
             if i + 1 < len(category_starts_v1):
-                end_match = re.search(pattern_category_end_v1, html_text[start_pos:category_starts_v1[i+1].start()])
+                end_match = CATEGORY_END_V1_PATTERN.search(html_text[start_pos:category_starts_v1[i+1].start()])
                 if end_match:
                     end_pos = start_pos + end_match.start()
                 else:
                     end_pos = category_starts_v1[i+1].start()
             else:
-                end_match = re.search(pattern_category_end_v1, html_text[start_pos:])
+                end_match = CATEGORY_END_V1_PATTERN.search(html_text[start_pos:])
                 if end_match:
                     end_pos = start_pos + end_match.start()
                 else:
@@ -87,8 +95,7 @@ def parse_equipment_table_html(html_text, job_category='common'):
                 continue
             
             # 테이블 행 파싱
-            row_pattern = r'<tr>\s*<td>(\d*)</td>.*?item_detail/(\d+)".*?<td>([^<]+)</td>'
-            rows = re.findall(row_pattern, table_html, re.DOTALL)
+            rows = ROW_PATTERN.findall(table_html)
             
             for level_str, item_id, name in rows:
                 level = int(level_str) if level_str.strip() else None
@@ -109,8 +116,7 @@ def parse_equipment_table_html(html_text, job_category='common'):
                 items.append(item)
     else:
         # 형식 2 사용: <!-- 카테고리명 --> ... <!-- 카테고리명 끝 -->
-        pattern_category_start_v2 = r'<!--\s*([^-]+?)\s*-->'
-        category_starts_v2 = list(re.finditer(pattern_category_start_v2, html_text))
+        category_starts_v2 = list(CATEGORY_START_V2_PATTERN.finditer(html_text))
         
         for i, match_start in enumerate(category_starts_v2):
             category_key = match_start.group(1).strip()
@@ -150,8 +156,7 @@ def parse_equipment_table_html(html_text, job_category='common'):
                 continue
             
             # 테이블 행 파싱
-            row_pattern = r'<tr>\s*<td>(\d*)</td>.*?item_detail/(\d+)".*?<td>([^<]+)</td>'
-            rows = re.findall(row_pattern, table_html, re.DOTALL)
+            rows = ROW_PATTERN.findall(table_html)
             
             for level_str, item_id, name in rows:
                 level = int(level_str) if level_str.strip() else None
@@ -234,15 +239,14 @@ def main():
         print("No items found. Please check the HTML structure.")
         sys.exit(1)
     
-    output_file = ROOT_DIR / 'src' / 'data' / 'item_data.json'
+    output_file = get_data_path('item_data.json')
     
     # 기존 데이터와 병합
     print(f"Merging with existing data: {output_file}")
     merged_items, added_count, updated_count = merge_with_existing_data(items, output_file)
     
     # 결과 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_items, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, merged_items, source=Path(__file__).stem)
     
     print(f"\nResults:")
     print(f"  - Total items: {len(merged_items)}")
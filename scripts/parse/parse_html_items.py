@@ -8,6 +8,11 @@ import json
 import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
 
@@ -126,7 +131,7 @@ def merge_with_existing_data(new_items, existing_file_path):
 
 def main():
     html_file = ROOT_DIR / 'src' / 'request' / 'scroll.html'
-    output_file = ROOT_DIR / 'src' / 'data' / 'item_data.json'
+    output_file = get_data_path('item_data.json')
     
     if not html_file.exists():
         print(f"Error: HTML file not found: {html_file}")
@@ -145,8 +150,7 @@ def main():
     merged_items, added_count, updated_count = merge_with_existing_data(items, output_file)
     
     # 결과 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_items, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, merged_items, source=Path(__file__).stem)
     
     print(f"\nResults:")
     print(f"  - Total items: {len(merged_items)}")
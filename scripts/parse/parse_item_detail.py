@@ -8,9 +8,22 @@ import json
 import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from regex_guard import bounded_call
+from utils import get_data_path
+
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
 
+# 상세 페이지 추출 패턴
+CATEGORY_PATTERN = re.compile(r'대분류[:\s]+([^\n<]+)|중분류[:\s]+([^\n<]+)|소분류[:\s]+([^\n<]+)')
+ID_PATTERN = re.compile(r'item_detail/(\d+)')
+NAME_PATTERN = re.compile(r'<h[12][^>]*>([^<]+)</h[12]>')
+TITLE_PATTERN = re.compile(r'<title>([^<]+)</title>')
+DESCRIPTION_PATTERN = re.compile(r'<div[^>]*class="[^"]*description[^"]*"[^>]*>.*?([^<]+)</div>', re.DOTALL)
+
 
 def parse_minor_category(name, medium_category):
     """아이템 이름에서 minorCategory 추출"""
@@ -43,8 +56,7 @@ def parse_minor_category(name, medium_category):
 def parse_category_from_html(html_text):
     """HTML에서 카테고리 정보 추출"""
     # 카테고리 정보 찾기 (CATEGORY 섹션)
-    category_pattern = r'대분류[:\s]+([^\n<]+)|중분류[:\s]+([^\n<]+)|소분류[:\s]+([^\n<]+)'
-    matches = re.findall(category_pattern, html_text)
+    matches = CATEGORY_PATTERN.findall(html_text)
     
     major_category = None
     medium_category = None
@@ -86,22 +98,19 @@ def parse_item_detail_from_html(html_text, item_id=None):
     if item_id:
         item['id'] = item_id
     else:
-        id_pattern = r'item_detail/(\d+)'
-        id_match = re.search(id_pattern, html_text)
+        id_match = ID_PATTERN.search(html_text)
         if id_match:
             item['id'] = id_match.group(1)
         else:
             return None
     
     # 아이템 이름 추출 (<h1> 또는 <h2> 태그에서)
-    name_pattern = r'<h[12][^>]*>([^<]+)</h[12]>'
-    name_match = re.search(name_pattern, html_text)
+    name_match = NAME_PATTERN.search(html_text)
     if name_match:
         item['name'] = name_match.group(1).strip()
     else:
         # 대안: <title> 태그에서 추출
-        title_pattern = r'<title>([^<]+)</title>'
-        title_match = re.search(title_pattern, html_text)
+        title_match = TITLE_PATTERN.search(html_text)
         if title_match:
             title = title_match.group(1).strip()
             # "메이플노트 클래식 - " 제거
@@ -124,8 +133,7 @@ def parse_item_detail_from_html(html_text, item_id=None):
         item['minorCategory'] = minor_cat
     
     # 설명 추출 (선택적)
-    desc_pattern = r'<div[^>]*class="[^"]*description[^"]*"[^>]*>.*?([^<]+)</div>'
-    desc_match = re.search(desc_pattern, html_text, re.DOTALL)
+    desc_match = DESCRIPTION_PATTERN.search(html_text)
     if desc_match:
         description = desc_match.group(1).strip()
         # #c 태그 제거
@@ -138,6 +146,16 @@ def parse_item_detail_from_html(html_text, item_id=None):
     return item
 
 
+def parse_item_detail_bounded(html_text, item_id=None, timeout=None):
+    """
+    parse_item_detail_from_html을 시간 제한 모드(regex_guard)로 실행
+    timeout(초)이 없으면 그대로 호출하고, 넘기면 ParseTimeout을 던집니다. (입력은 src/request/pathological/에 저장)
+    """
+    if not timeout:
+        return parse_item_detail_from_html(html_text, item_id)
+    return bounded_call(parse_item_detail_from_html, html_text, item_id, timeout=timeout)
+
+
 def merge_with_existing_data(new_item, existing_file_path):
     """기존 item_data.json과 병합"""
     # 기존 데이터 로드
@@ -171,24 +189,32 @@ def merge_with_existing_data(new_item, existing_file_path):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python parse_item_detail.py <html_file_path> [item_id]")
+    argv = sys.argv[1:]
+    parse_timeout = None
+    if '--parse-timeout' in argv:
+        idx = argv.index('--parse-timeout')
+        if idx + 1 < len(argv):
+            parse_timeout = float(argv[idx + 1])
+        del argv[idx:idx + 2]
+    
+    if len(argv) < 1:
+        print("Usage: python parse_item_detail.py <html_file_path> [item_id] [--parse-timeout <seconds>]")
         sys.exit(1)
     
-    html_file = Path(sys.argv[1])
-    item_id = sys.argv[2] if len(sys.argv) > 2 else None
+    html_file = Path(argv[0])
+    item_id = argv[1] if len(argv) > 1 else None
     
     if not html_file.exists():
         print(f"Error: HTML file not found: {html_file}")
         sys.exit(1)
     
-    output_file = ROOT_DIR / 'src' / 'data' / 'item_data.json'
+    output_file = get_data_path('item_data.json')
     
     print(f"Parsing HTML file: {html_file}")
     with open(html_file, 'r', encoding='utf-8') as f:
         html_text = f.read()
     
-    item = parse_item_detail_from_html(html_text, item_id)
+    item = parse_item_detail_bounded(html_text, item_id, parse_timeout)
     
     if not item:
         print("Error: Failed to parse item data from HTML")
@@ -201,8 +227,7 @@ def main():
     merged_items, added_count, updated_count = merge_with_existing_data(item, output_file)
     
     # 결과 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_items, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, merged_items, source=Path(__file__).stem)
     
     print(f"\nResults:")
     print(f"  - Total items: {len(merged_items)}")
@@ -9,6 +9,11 @@ import sys
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
 
@@ -145,8 +150,7 @@ def parse_html_directory(html_dir, output_file):
             continue
     
     # 결과 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_relations, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, all_relations, source=Path(__file__).stem)
     
     print(f"\n{'='*60}")
     print(f"Summary:")
@@ -171,7 +175,7 @@ def main():
     input_path = Path(sys.argv[1])
     item_id = sys.argv[2] if len(sys.argv) > 2 else None
     
-    output_file = ROOT_DIR / 'src' / 'data' / 'monster_item_relations.json'
+    output_file = get_data_path('monster_item_relations.json')
     
     if input_path.is_dir():
         # 디렉토리 처리
@@ -185,8 +189,7 @@ def main():
             merged_relations, added_count = merge_relations(relations, output_file)
             
             # 결과 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(merged_relations, f, ensure_ascii=False, indent=2)
+            save_json_file(output_file, merged_relations, source=Path(__file__).stem)
             
             print(f"\nFound {len(relations)} monster relations")
             print(f"Added {added_count} new relations")
@@ -1,7 +1,14 @@
+import argparse
 import re
 import json
+import sys
 from pathlib import Path
 
+# scripts/utils.py import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import PROJECT_ROOT
+
 def parse_monster_data(file_path):
     """
     HTML 파일에서 몬스터 정보를 추출하여 JSON으로 변환
@@ -75,11 +82,13 @@ def parse_monster_data(file_path):
     return monsters
 
 def main():
-    # 입력 파일 경로
-    input_file = r"c:\Users\tbrk7\OneDrive\문서\메랜 몬스터 db.txt"
-    
-    # 출력 파일 경로 (프로젝트 루트에 저장)
-    output_file = Path(__file__).parent / "monster_data.json"
+    parser = argparse.ArgumentParser(description="몬스터 DB 검색 결과 HTML(텍스트) 파싱")
+    parser.add_argument("input_file", type=Path, help="몬스터 DB 페이지를 저장한 파일 (예: 메랜 몬스터 db.txt)")
+    parser.add_argument("--output", type=Path, default=PROJECT_ROOT / "monster_data.json",
+                        help="출력 파일 (기본: 프로젝트 루트의 monster_data.json)")
+    args = parser.parse_args()
+    input_file = args.input_file
+    output_file = args.output
     
     print("몬스터 데이터 파싱 시작...")
     monsters = parse_monster_data(input_file)
@@ -87,8 +96,7 @@ def main():
     print(f"\n총 {len(monsters)}개의 몬스터 데이터 추출 완료!")
     
     # JSON 파일로 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, monsters, source=Path(__file__).stem)
     
     print(f"데이터가 {output_file}에 저장되었습니다.")
     
@@ -8,6 +8,11 @@ import json
 import sys
 from pathlib import Path
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
 
@@ -31,6 +36,11 @@ WEAPON_CATEGORY_MAP = {
     '총': 'gun',
 }
 
+# 카테고리 블록(코드 블록 / HTML 주석) + 테이블 행 패턴
+CODE_BLOCK_PATTERN = re.compile(r'```\s*([^\n]+)\s*\n(.*?)```', re.DOTALL)
+COMMENT_BLOCK_PATTERN = re.compile(r'<!--\s*([^-]+?)\s*-->\s*\n(.*?)(?=<!--\s*[^-]|\Z)', re.DOTALL)
+ROW_PATTERN = re.compile(r'<tr>\s*<td>(\d+)</td>.*?item_detail/(\d+)".*?<td>([^<]+)</td>', re.DOTALL)
+
 
 def parse_weapon_table_html(html_text):
     """HTML 테이블에서 무기 아이템 파싱"""
@@ -41,8 +51,7 @@ def parse_weapon_table_html(html_text):
     # 형식 2: <!-- 카테고리명 --> ... <!-- 카테고리명 끝 --> (HTML 주석 형식)
     
     # 먼저 코드 블록 형식 시도 (기존 형식)
-    pattern_code_block = r'```\s*([^\n]+)\s*\n(.*?)```'
-    matches_code_block = re.findall(pattern_code_block, html_text, re.DOTALL)
+    matches_code_block = CODE_BLOCK_PATTERN.findall(html_text)
     
     if matches_code_block:
         # 코드 블록 형식
@@ -55,8 +64,7 @@ def parse_weapon_table_html(html_text):
                 continue
             
             # 테이블 행 파싱
-            row_pattern = r'<tr>\s*<td>(\d+)</td>.*?item_detail/(\d+)".*?<td>([^<]+)</td>'
-            rows = re.findall(row_pattern, table_html, re.DOTALL)
+            rows = ROW_PATTERN.findall(table_html)
             
             for level, item_id, name in rows:
                 level = int(level)
@@ -76,8 +84,7 @@ def parse_weapon_table_html(html_text):
     else:
         # HTML 주석 형식
         # <!-- 카테고리명 --> ... <!-- 카테고리명 끝 --> 또는 <!--  --> (다음 카테고리 전까지)
-        pattern_html_comment = r'<!--\s*([^-]+?)\s*-->\s*\n(.*?)(?=<!--\s*[^-]|\Z)'
-        matches_html_comment = re.findall(pattern_html_comment, html_text, re.DOTALL)
+        matches_html_comment = COMMENT_BLOCK_PATTERN.findall(html_text)
         
         for category_name, table_html in matches_html_comment:
             category_key = category_name.strip()
@@ -93,8 +100,7 @@ def parse_weapon_table_html(html_text):
                 continue
             
             # 테이블 행 파싱
-            row_pattern = r'<tr>\s*<td>(\d+)</td>.*?item_detail/(\d+)".*?<td>([^<]+)</td>'
-            rows = re.findall(row_pattern, table_html, re.DOTALL)
+            rows = ROW_PATTERN.findall(table_html)
             
             for level, item_id, name in rows:
                 level = int(level)
@@ -172,15 +178,14 @@ def main():
         print("No items found. Please check the HTML structure.")
         sys.exit(1)
     
-    output_file = ROOT_DIR / 'src' / 'data' / 'item_data.json'
+    output_file = get_data_path('item_data.json')
     
     # 기존 데이터와 병합
     print(f"Merging with existing data: {output_file}")
     merged_items, added_count, updated_count = merge_with_existing_data(items, output_file)
     
     # 결과 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_items, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, merged_items, source=Path(__file__).stem)
     
     print(f"\nResults:")
     print(f"  - Total items: {len(merged_items)}")
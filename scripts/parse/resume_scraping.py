@@ -6,26 +6,22 @@
 import re
 import json
 import sys
-import time
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-except ImportError:
-    print("Error: selenium is not installed. Please install it with: pip install selenium")
-    sys.exit(1)
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
 
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
 
 # 상세 페이지 파싱 함수 임포트
 sys.path.insert(0, str(ROOT_DIR / 'scripts' / 'parse'))
-from parse_item_detail import parse_item_detail_from_html
+sys.path.insert(0, str(ROOT_DIR / 'scripts'))
+from parse_item_detail import parse_item_detail_bounded
+from scrape_item_details import SEARCH_MARKERS, DETAIL_MARKERS
 
 
 def extract_item_urls_from_search_page(html_text, base_url):
@@ -50,8 +46,25 @@ def extract_item_urls_from_search_page(html_text, base_url):
     return urls
 
 
-def parse_saved_html_files(html_dir, output_file, skip_existing=True):
-    """저장된 HTML 파일들을 파싱하여 데이터 업데이트"""
+def iter_saved_html(html_dir):
+    """
+    (이름, 아이템 ID, HTML 읽기 함수) 목록
+    html_dir이 팩 파일(html_archive)이면 item_detail 페이지의 최신 버전을 팩 순서대로 반환
+    """
+    if html_dir.is_file():
+        from html_archive import ArchiveReader
+        reader = ArchiveReader(html_dir)
+        for entry in reader.latest_entries():
+            m = re.search(r'/item_detail/(\d+)', entry.url)
+            if m:
+                yield entry.url, m.group(1), lambda entry=entry: reader.read_entry(entry).decode('utf-8', 'ignore')
+        return
+    for html_file in sorted(html_dir.glob('item_*.html')):
+        yield html_file.name, html_file.stem.replace('item_', ''), lambda html_file=html_file: html_file.read_text(encoding='utf-8')
+
+
+def parse_saved_html_files(html_dir, output_file, skip_existing=True, parse_timeout=None):
+    """저장된 HTML 파일들(디렉토리 또는 팩 파일)을 파싱하여 데이터 업데이트 (parse_timeout: 파일당 파싱 시간 제한, 초)"""
     html_dir = Path(html_dir)
     if not html_dir.exists():
         print(f"Error: HTML directory not found: {html_dir}")
@@ -67,17 +80,15 @@ def parse_saved_html_files(html_dir, output_file, skip_existing=True):
     items_dict = {item['id']: item for item in existing_items}
     
     # HTML 파일 찾기
-    html_files = sorted(html_dir.glob('item_*.html'))
+    html_files = list(iter_saved_html(html_dir))
     print(f"Found {len(html_files)} HTML files to parse")
     
     processed = 0
     updated = 0
     failed = 0
     
-    for html_file in html_files:
+    for name, item_id, read_html in html_files:
         try:
-            # 아이템 ID 추출
-            item_id = html_file.stem.replace('item_', '')
             
             # 기존 데이터 확인 (skip_existing 옵션)
             if skip_existing and item_id in items_dict:
@@ -87,14 +98,13 @@ def parse_saved_html_files(html_dir, output_file, skip_existing=True):
                     continue
             
             # HTML 파일 읽기
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_text = f.read()
+            html_text = read_html()
             
             # HTML 파싱
-            item = parse_item_detail_from_html(html_text, item_id)
+            item = parse_item_detail_bounded(html_text, item_id, parse_timeout)
             
             if not item:
-                print(f"  Warning: Failed to parse {html_file.name}")
+                print(f"  Warning: Failed to parse {name}")
                 failed += 1
                 continue
             
@@ -107,7 +117,7 @@ def parse_saved_html_files(html_dir, output_file, skip_existing=True):
                 print(f"  Processed {processed}/{len(html_files)} files...")
                 
         except Exception as e:
-            print(f"  Error processing {html_file.name}: {e}")
+            print(f"  Error processing {name}: {e}")
             failed += 1
             continue
     
@@ -124,8 +134,7 @@ def parse_saved_html_files(html_dir, output_file, skip_existing=True):
     
     merged_items.sort(key=sort_key)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_items, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, merged_items, source=Path(__file__).stem)
     
     print(f"\n{'='*60}")
     print(f"Summary:")
@@ -135,7 +144,8 @@ def parse_saved_html_files(html_dir, output_file, skip_existing=True):
     print(f"  - Output file: {output_file}")
 
 
-def resume_scraping_from_checkpoint(search_url, html_dir, output_file, delay=2):
+def resume_scraping_from_checkpoint(search_url, html_dir, output_file, interval=0.5, browsers=2, tabs=4, ready_timeout=15,
+                                    parse_timeout=None):
     """크롤링을 재개 (저장된 HTML 파일과 비교하여 누락된 것만 크롤링)"""
     html_dir = Path(html_dir)
     output_file = Path(output_file)
@@ -148,24 +158,20 @@ def resume_scraping_from_checkpoint(search_url, html_dir, output_file, delay=2):
             existing_html_ids.add(item_id)
         print(f"Found {len(existing_html_ids)} existing HTML files")
     
-    # 검색 페이지에서 전체 아이템 목록 가져오기
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    # 검색 페이지에서 전체 아이템 목록 가져오기 (HTTP 우선, 필요할 때만 브라우저)
+    from fetch_strategy import StrategyFetcher
+    
+    fetcher = StrategyFetcher(per_host_interval=interval, browsers=browsers, tabs_per_browser=tabs,
+                              ready_timeout=ready_timeout)
     
-    driver = None
     try:
-        driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(10)
-        
         print(f"Visiting search page: {search_url}")
-        driver.get(search_url)
-        time.sleep(3)
+        search_result = fetcher.fetch(search_url, markers=SEARCH_MARKERS)
+        if search_result.error:
+            print(f"Error visiting search page: {search_result.error}")
+            return
         
-        search_html = driver.page_source
+        search_html = search_result.html
         base_url = f"{urlparse(search_url).scheme}://{urlparse(search_url).netloc}"
         item_urls = extract_item_urls_from_search_page(search_html, base_url)
         
@@ -195,14 +201,17 @@ def resume_scraping_from_checkpoint(search_url, html_dir, output_file, delay=2):
         added = 0
         updated = 0
         
-        for i, (item_url, item_id) in enumerate(missing_items, 1):
+        url_to_id = {item_url: item_id for item_url, item_id in missing_items}
+        for i, result in enumerate(fetcher.fetch_many(url_to_id, markers=DETAIL_MARKERS), 1):
+            item_id = url_to_id[result.url]
             try:
-                print(f"\n[{i}/{len(missing_items)}] Processing item {item_id}...")
+                print(f"\n[{i}/{len(missing_items)}] Processing item {item_id} ({result.via}, {result.elapsed:.2f}s)...")
                 
-                driver.get(item_url)
-                time.sleep(delay)
+                if result.error:
+                    print(f"  Error loading item {item_id}: {result.error}")
+                    continue
                 
-                detail_html = driver.page_source
+                detail_html = result.html
                 
                 # HTML 파일 저장
                 html_file = html_dir / f"item_{item_id}.html"
@@ -211,7 +220,7 @@ def resume_scraping_from_checkpoint(search_url, html_dir, output_file, delay=2):
                 print(f"  Saved HTML to: {html_file}")
                 
                 # HTML 파싱
-                item = parse_item_detail_from_html(detail_html, item_id)
+                item = parse_item_detail_bounded(detail_html, item_id, parse_timeout)
                 
                 if not item:
                     print(f"  Warning: Failed to parse item {item_id}")
@@ -245,8 +254,7 @@ def resume_scraping_from_checkpoint(search_url, html_dir, output_file, delay=2):
         
         merged_items.sort(key=sort_key)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(merged_items, f, ensure_ascii=False, indent=2)
+        save_json_file(output_file, merged_items, source=Path(__file__).stem)
         
         print(f"\n{'='*60}")
         print(f"Summary:")
@@ -260,15 +268,15 @@ def resume_scraping_from_checkpoint(search_url, html_dir, output_file, delay=2):
         import traceback
         traceback.print_exc()
     finally:
-        if driver:
-            driver.quit()
+        fetcher.close()
 
 
 def main():
     if len(sys.argv) < 2:
         print("Usage:")
-        print("  python resume_scraping.py --reparse-html <html_dir> [--skip-existing]")
-        print("  python resume_scraping.py --resume <search_url> <html_dir> [--delay <seconds>]")
+        print("  python resume_scraping.py --reparse-html <html_dir | corpus.pack> [--skip-existing] [--parse-timeout <seconds>]")
+        print("  python resume_scraping.py --resume <search_url> <html_dir> [--interval <seconds>] [--browsers <n>] [--tabs <n>]"
+              " [--parse-timeout <seconds>]")
         print("\nExamples:")
         print("  # 저장된 HTML 파일들을 다시 파싱")
         print("  python resume_scraping.py --reparse-html src/request/scraped")
@@ -276,7 +284,14 @@ def main():
         print("  python resume_scraping.py --resume 'https://...' src/request/scraped")
         sys.exit(1)
     
-    output_file = ROOT_DIR / 'src' / 'data' / 'item_data.json'
+    output_file = get_data_path('item_data.json')
+    
+    # 파일/페이지당 파싱 시간 제한 (regex_guard). 넘기면 실패로 세고 입력을 src/request/pathological/에 저장
+    parse_timeout = None
+    if '--parse-timeout' in sys.argv:
+        idx = sys.argv.index('--parse-timeout')
+        if idx + 1 < len(sys.argv):
+            parse_timeout = float(sys.argv[idx + 1])
     
     if sys.argv[1] == '--reparse-html':
         html_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else None
@@ -285,7 +300,7 @@ def main():
             sys.exit(1)
         
         skip_existing = '--skip-existing' in sys.argv
-        parse_saved_html_files(html_dir, output_file, skip_existing)
+        parse_saved_html_files(html_dir, output_file, skip_existing, parse_timeout)
         
     elif sys.argv[1] == '--resume':
         if len(sys.argv) < 4:
@@ -294,14 +309,27 @@ def main():
         
         search_url = sys.argv[2]
         html_dir = Path(sys.argv[3])
-        delay = 2
+        interval = 0.5
+        browsers = 2
+        tabs = 4
         
-        if '--delay' in sys.argv:
-            idx = sys.argv.index('--delay')
+        # --delay는 이전 버전 호환용 (호스트별 최소 요청 간격으로 사용)
+        for flag in ('--interval', '--delay'):
+            if flag in sys.argv:
+                idx = sys.argv.index(flag)
+                if idx + 1 < len(sys.argv):
+                    interval = float(sys.argv[idx + 1])
+        if '--browsers' in sys.argv:
+            idx = sys.argv.index('--browsers')
+            if idx + 1 < len(sys.argv):
+                browsers = int(sys.argv[idx + 1])
+        if '--tabs' in sys.argv:
+            idx = sys.argv.index('--tabs')
             if idx + 1 < len(sys.argv):
-                delay = float(sys.argv[idx + 1])
+                tabs = int(sys.argv[idx + 1])
         
-        resume_scraping_from_checkpoint(search_url, html_dir, output_file, delay)
+        resume_scraping_from_checkpoint(search_url, html_dir, output_file, interval, browsers, tabs,
+                                        parse_timeout=parse_timeout)
     else:
         print("Error: Unknown option. Use --reparse-html or --resume")
         sys.exit(1)
@@ -7,26 +7,28 @@ HTML을 추출하여 파싱하는 자동화 스크립트
 import re
 import json
 import sys
-import time
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-except ImportError:
-    print("Error: selenium is not installed. Please install it with: pip install selenium")
-    sys.exit(1)
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
 
 # 프로젝트 루트 디렉토리
 ROOT_DIR = Path(__file__).parent.parent.parent
 
-# 상세 페이지 파싱 함수 임포트
+# 상세 페이지 파싱 함수 및 브라우저 풀 임포트
 sys.path.insert(0, str(ROOT_DIR / 'scripts' / 'parse'))
-from parse_item_detail import parse_item_detail_from_html, merge_with_existing_data
+sys.path.insert(0, str(ROOT_DIR / 'scripts'))
+from parse_item_detail import parse_item_detail_bounded, merge_with_existing_data
+from regex_guard import ParseTimeout
+from fetch_strategy import ITEM_DETAIL_MARKER, ITEM_LINK_MARKER, StrategyFetcher
+from crawl_metrics import METRICS_DIR_DEFAULT, CrawlMetrics
+
+# 페이지가 제대로 렌더링되었는지 판단하는 마커 (HTTP 응답에 없으면 브라우저로 재시도)
+SEARCH_MARKERS = [ITEM_LINK_MARKER]
+DETAIL_MARKERS = [ITEM_DETAIL_MARKER]
 
 
 def extract_item_urls_from_search_page(html_text, base_url):
@@ -53,166 +55,194 @@ def extract_item_urls_from_search_page(html_text, base_url):
     return urls
 
 
-def scrape_item_details(search_url, output_dir=None, max_items=None, delay=2):
+def scrape_item_details(search_urls, output_dir=None, max_items=None, browsers=2, tabs=4, interval=0.5, ready_timeout=15,
+                        metrics_dir=METRICS_DIR_DEFAULT, parse_timeout=None):
     """
     검색 페이지에서 아이템 목록을 가져와서 각 상세 페이지를 방문하고 데이터를 추출
     
     Args:
-        search_url: 검색 결과 페이지 URL
+        search_urls: 검색 결과 페이지 URL (문자열 또는 목록). 여러 검색어도 같은 브라우저들을 재사용
         output_dir: HTML 파일을 저장할 디렉토리 (선택적)
         max_items: 최대 처리할 아이템 수 (None이면 전체)
-        delay: 각 페이지 사이 대기 시간 (초)
+        browsers: 동시에 띄울 브라우저 수
+        tabs: 브라우저당 탭 수
+        interval: 같은 호스트에 대한 최소 요청 간격 (초)
+        ready_timeout: 페이지 준비 대기 최대 시간 (초)
+        metrics_dir: 트레이스/.prom 저장 위치 (crawl_metrics)
+        parse_timeout: 페이지당 파싱 시간 제한 (초, regex_guard). 넘기면 해당 아이템은 건너뜀
     """
+    if isinstance(search_urls, str):
+        search_urls = [search_urls]
+    
     # 출력 디렉토리 설정
     if output_dir:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Selenium 웹드라이버 설정
-    print("Initializing browser...")
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless')  # 브라우저 창 없이 실행
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--window-size=1920,1080')
-    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-    
-    driver = None
+    metrics = CrawlMetrics("scrape_item_details", metrics_dir=metrics_dir)
+    
+    # 데이터 파일 경로
+    output_file = get_data_path('item_data.json')
+    
+    # 기존 데이터 로드 (한 번만 로드)
+    print(f"Loading existing data from: {output_file}")
+    if output_file.exists():
+        with open(output_file, 'r', encoding='utf-8') as f:
+            existing_items = json.load(f)
+    else:
+        existing_items = []
+    
+    # ID를 키로 하는 딕셔너리 생성
+    items_dict = {item['id']: item for item in existing_items}
+    
+    processed = 0
+    added = 0
+    updated = 0
+    timed_out = 0
+    parse_timeouts = 0
+    
+    # HTTP로 먼저 가져오고, 마커가 없는 페이지만 브라우저 풀({browsers}개 x 탭 {tabs}개)로 재시도
     try:
-        driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(10)
-        
-        # 검색 페이지 방문
-        print(f"Visiting search page: {search_url}")
-        driver.get(search_url)
-        time.sleep(3)  # 페이지 로딩 대기
-        
-        # 검색 페이지 HTML 가져오기
-        search_html = driver.page_source
-        
-        # 아이템 URL 목록 추출
-        base_url = f"{urlparse(search_url).scheme}://{urlparse(search_url).netloc}"
-        item_urls = extract_item_urls_from_search_page(search_html, base_url)
-        
-        print(f"Found {len(item_urls)} items in search results")
-        
-        if max_items:
-            item_urls = item_urls[:max_items]
-            print(f"Processing first {max_items} items...")
-        
-        # 데이터 파일 경로
-        output_file = ROOT_DIR / 'src' / 'data' / 'item_data.json'
-        
-        # 기존 데이터 로드 (한 번만 로드)
-        print(f"Loading existing data from: {output_file}")
-        if output_file.exists():
-            with open(output_file, 'r', encoding='utf-8') as f:
-                existing_items = json.load(f)
-        else:
-            existing_items = []
-        
-        # ID를 키로 하는 딕셔너리 생성
-        items_dict = {item['id']: item for item in existing_items}
-        
-        # 각 아이템 상세 페이지 방문
-        processed = 0
-        added = 0
-        updated = 0
-        
-        for i, (item_url, item_id) in enumerate(item_urls, 1):
-            try:
-                print(f"\n[{i}/{len(item_urls)}] Processing item {item_id}...")
-                
-                # 상세 페이지 방문
-                driver.get(item_url)
-                time.sleep(delay)  # 페이지 로딩 대기
-                
-                # HTML 가져오기
-                detail_html = driver.page_source
-                
-                # HTML 파일로 저장 (선택적)
-                if output_dir:
-                    html_file = output_dir / f"item_{item_id}.html"
-                    with open(html_file, 'w', encoding='utf-8') as f:
-                        f.write(detail_html)
-                    print(f"  Saved HTML to: {html_file}")
-                
-                # HTML 파싱
-                item = parse_item_detail_from_html(detail_html, item_id)
-                
-                if not item:
-                    print(f"  Warning: Failed to parse item {item_id}")
+        with StrategyFetcher(per_host_interval=interval, browsers=browsers, tabs_per_browser=tabs,
+                             ready_timeout=ready_timeout) as fetcher:
+            # 검색 페이지 방문 (여러 검색어를 동시에)
+            item_urls = []
+            seen_ids = set()
+            for result in fetcher.fetch_many(search_urls, markers=SEARCH_MARKERS):
+                metrics.on_fetch(result)
+                if result.error:
+                    print(f"Error visiting search page {result.url}: {result.error}")
                     continue
-                
-                print(f"  Parsed: {item['name']}")
-                
-                # 데이터 병합
-                if item_id in items_dict:
-                    items_dict[item_id] = item
-                    updated += 1
-                    print(f"  Result: Updated")
-                else:
-                    items_dict[item_id] = item
-                    added += 1
-                    print(f"  Result: Added")
-                
-                processed += 1
-                
-            except Exception as e:
-                print(f"  Error processing item {item_id}: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
-        
-        # 최종 결과 저장
-        merged_items = list(items_dict.values())
-        
-        # ID로 정렬
-        def sort_key(item):
-            item_id = item['id']
-            try:
-                return (0, int(item_id))
-            except ValueError:
-                return (1, item_id)
-        
-        merged_items.sort(key=sort_key)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(merged_items, f, ensure_ascii=False, indent=2)
-        
-        print(f"\n{'='*60}")
-        print(f"Summary:")
-        print(f"  - Total items processed: {processed}")
-        print(f"  - Added: {added}")
-        print(f"  - Updated: {updated}")
-        print(f"  - Output file: {output_file}")
+                base_url = f"{urlparse(result.url).scheme}://{urlparse(result.url).netloc}"
+                found = extract_item_urls_from_search_page(result.html, base_url)
+                print(f"Found {len(found)} items in search results ({result.via}): {result.url}"
+                      f"{' (timed out)' if result.timed_out else ''}")
+                for item_url, item_id in found:
+                    if item_id not in seen_ids:
+                        seen_ids.add(item_id)
+                        item_urls.append((item_url, item_id))
+            
+            if max_items:
+                item_urls = item_urls[:max_items]
+                print(f"Processing first {max_items} items...")
+            
+            url_to_id = {item_url: item_id for item_url, item_id in item_urls}
+            
+            # 각 아이템 상세 페이지 방문 (모든 탭에서 병렬로)
+            for i, result in enumerate(fetcher.fetch_many(url_to_id, markers=DETAIL_MARKERS), 1):
+                item_id = url_to_id[result.url]
+                metrics.on_fetch(result)
+                try:
+                    print(f"\n[{i}/{len(item_urls)}] Processing item {item_id} ({result.via}, {result.elapsed:.2f}s)...")
+                    
+                    if result.error:
+                        print(f"  Error loading item {item_id}: {result.error}")
+                        continue
+                    if result.timed_out:
+                        timed_out += 1
+                        metrics.count("timed_out")
+                        print(f"  Warning: page not ready within {ready_timeout}s, parsing partial HTML")
+                    
+                    detail_html = result.html
+                    
+                    # HTML 파일로 저장 (선택적)
+                    if output_dir:
+                        html_file = output_dir / f"item_{item_id}.html"
+                        with open(html_file, 'w', encoding='utf-8') as f:
+                            f.write(detail_html)
+                        print(f"  Saved HTML to: {html_file}")
+                    
+                    # HTML 파싱
+                    try:
+                        with metrics.stage("parse"):
+                            item = parse_item_detail_bounded(detail_html, item_id, parse_timeout)
+                    except ParseTimeout as e:
+                        parse_timeouts += 1
+                        metrics.count("parse_timeouts")
+                        print(f"  Warning: {e}")
+                        continue
+                    
+                    if not item:
+                        print(f"  Warning: Failed to parse item {item_id}")
+                        continue
+                    
+                    print(f"  Parsed: {item['name']}")
+                    
+                    # 데이터 병합
+                    with metrics.stage("merge"):
+                        if item_id in items_dict:
+                            items_dict[item_id] = item
+                            updated += 1
+                            print(f"  Result: Updated")
+                        else:
+                            items_dict[item_id] = item
+                            added += 1
+                            print(f"  Result: Added")
+                    
+                    processed += 1
+                    
+                except Exception as e:
+                    print(f"  Error processing item {item_id}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    continue
+            fetch_counts = dict(fetcher.counts)
+        print(f"\nFetched via http {fetch_counts['http']}, browser {fetch_counts['browser']}")
         
     except Exception as e:
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        if driver:
-            driver.quit()
-            print("\nBrowser closed.")
+    
+    # 최종 결과 저장
+    merged_items = list(items_dict.values())
+    
+    # ID로 정렬
+    def sort_key(item):
+        item_id = item['id']
+        try:
+            return (0, int(item_id))
+        except ValueError:
+            return (1, item_id)
+    
+    merged_items.sort(key=sort_key)
+    
+    with metrics.stage("save"):
+        save_json_file(output_file, merged_items, source=Path(__file__).stem)
+    
+    print(f"\n{'='*60}")
+    print(f"Summary:")
+    print(f"  - Total items processed: {processed}")
+    print(f"  - Added: {added}")
+    print(f"  - Updated: {updated}")
+    print(f"  - Timed out (partial HTML): {timed_out}")
+    print(f"  - Parse timeouts (skipped): {parse_timeouts}")
+    print(f"  - Output file: {output_file}")
+    metrics.finish()
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python scrape_item_details.py <search_url> [--output-dir <dir>] [--max-items <n>] [--delay <seconds>]")
+        print("Usage: python scrape_item_details.py <search_url> [<search_url> ...] [--output-dir <dir>] [--max-items <n>]"
+              " [--browsers <n>] [--tabs <n>] [--interval <seconds>] [--ready-timeout <seconds>] [--metrics-dir <dir>]"
+              " [--parse-timeout <seconds>]")
         print("\nExample:")
         print("  python scrape_item_details.py 'https://xn--o80b01o9mlw3kdzc.com/itemnote_search?searchInput=주문서'")
-        print("  python scrape_item_details.py 'https://xn--o80b01o9mlw3kdzc.com/itemnote_search?searchInput=주문서' --max-items 10 --delay 3")
+        print("  python scrape_item_details.py 'https://xn--o80b01o9mlw3kdzc.com/itemnote_search?searchInput=주문서' 'https://xn--o80b01o9mlw3kdzc.com/itemnote_search?searchInput=표창' --max-items 10 --browsers 2 --tabs 4")
         sys.exit(1)
     
-    search_url = sys.argv[1]
+    search_urls = []
     output_dir = None
     max_items = None
-    delay = 2
+    browsers = 2
+    tabs = 4
+    interval = 0.5
+    ready_timeout = 15
+    metrics_dir = METRICS_DIR_DEFAULT
+    parse_timeout = None
     
     # 명령줄 인자 파싱
-    i = 2
+    i = 1
     while i < len(sys.argv):
         if sys.argv[i] == '--output-dir' and i + 1 < len(sys.argv):
             output_dir = sys.argv[i + 1]
@@ -220,13 +250,33 @@ def main():
         elif sys.argv[i] == '--max-items' and i + 1 < len(sys.argv):
             max_items = int(sys.argv[i + 1])
             i += 2
-        elif sys.argv[i] == '--delay' and i + 1 < len(sys.argv):
-            delay = float(sys.argv[i + 1])
+        elif sys.argv[i] == '--browsers' and i + 1 < len(sys.argv):
+            browsers = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--tabs' and i + 1 < len(sys.argv):
+            tabs = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] in ('--interval', '--delay') and i + 1 < len(sys.argv):
+            # --delay는 이전 버전 호환용 (이제는 페이지당 고정 대기가 아니라 호스트별 최소 요청 간격)
+            interval = float(sys.argv[i + 1])
             i += 2
+        elif sys.argv[i] == '--ready-timeout' and i + 1 < len(sys.argv):
+            ready_timeout = float(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--metrics-dir' and i + 1 < len(sys.argv):
+            metrics_dir = Path(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--parse-timeout' and i + 1 < len(sys.argv):
+            parse_timeout = float(sys.argv[i + 1])
+            i += 2
+        elif not sys.argv[i].startswith('--'):
+            search_urls.append(sys.argv[i])
+            i += 1
         else:
             i += 1
     
-    scrape_item_details(search_url, output_dir, max_items, delay)
+    scrape_item_details(search_urls, output_dir, max_items, browsers, tabs, interval, ready_timeout, metrics_dir,
+                        parse_timeout)
 
 
 if __name__ == "__main__":
@@ -20,24 +20,49 @@ import html as html_lib
 import json
 import re
 import ssl
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.request import Request, urlopen
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from regex_guard import BoundedRunner, ParseTimeout
+from provenance import SOURCE_MAPLENOTE, ProvenanceTable, monster_group_payloads
+from region_index import classify_map_region
+from changelog import save_json_file
+from crawl_metrics import METRICS_DIR_DEFAULT, CrawlMetrics
+from fetcher import rewrite_url
+from utils import get_data_dir
+
 
 ROOT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / "src" / "data"
+DATA_DIR = get_data_dir()
 SCRAPED_DIR_DEFAULT = ROOT_DIR / "src" / "request" / "scraped_monsters" / "crimsonwood"
 
 LIST_URL_DEFAULT = "https://xn--o80b01o9mlw3kdzc.com/monsternote?foundAt=6100"
 DETAIL_URL_TEMPLATE = "https://xn--o80b01o9mlw3kdzc.com/monster_detail/{monster_id}"
 
+# 상세 페이지 추출 패턴 (validate/fuzz_regex.py에서도 사용)
+STATS_SECTION_PATTERN = re.compile(
+    r'<h2[^>]*>STATS</h2>(.*?)(?=<h2|<div[^>]*class="section"|<h1|</body>|\Z)',
+    re.DOTALL | re.IGNORECASE,
+)
+SPAWN_PATTERN = re.compile(
+    r'href="[^"]*?/map_detail/(\d+)"[^>]*>[\s\S]*?<h3[^>]*>([\s\S]*?)</h3>',
+    re.IGNORECASE,
+)
+DROP_PATTERN = re.compile(
+    r'href="[^"]*?/item_detail/(\d+)"[^>]*>[\s\S]*?<div class="drop-rate-box">\s*([^<]*?)\s*</div>',
+    re.IGNORECASE,
+)
+
 
 def fetch_bytes(url: str, timeout: int = 30) -> bytes:
     req = Request(
-        url,
+        rewrite_url(url),
         headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
     )
     return urlopen(req, context=ssl.create_default_context(), timeout=timeout).read()
@@ -61,9 +86,7 @@ def load_json(path: Path, default):
 
 
 def save_json(path: Path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_json_file(path, data, source=Path(__file__).stem)
 
 
 def sort_key_id(id_value: str):
@@ -114,19 +137,15 @@ def parse_stats_section(html_text: str) -> Optional[Dict]:
     ...
     """
     # <h2>STATS</h2> 섹션 찾기
-    stats_match = re.search(
-        r'<h2[^>]*>STATS</h2>(.*?)(?=<h2|<div[^>]*class="section"|<h1|</body>|\Z)',
-        html_text,
-        re.DOTALL | re.IGNORECASE
-    )
+    stats_match = STATS_SECTION_PATTERN.search(html_text)
     if not stats_match:
         return None
     
     stats_text = stats_match.group(1)
     stats = {}
     
-    # HTML 태그 제거하여 텍스트만 추출
-    clean_text = strip_tags(stats_text)
+    # HTML 태그 제거하여 텍스트만 추출 (태그 자리는 공백으로: "메소 : 487.5</span><span>65레벨"이 487.565로 붙지 않게)
+    clean_text = strip_tags(re.sub(r"<[^>]+>", " ", stats_text))
     
     # HP : 14.5K 또는 HP : 14500 형식
     hp_match = re.search(r"HP\s*:\s*([0-9.]+(?:K|k)?)", clean_text, re.IGNORECASE)
@@ -219,6 +238,9 @@ def guess_crimsonwood_region_id_from_map_id(map_id: str) -> str:
     크림슨우드 권역은 대개 61xxxxxxx 형태(예: 610010000)로 관찰될 수 있습니다.
     크림슨우드 도감(foundAt=6100) 컨텍스트에서는 'masteria-crimsonwood'로 귀속시킵니다.
     """
+    region_id = classify_map_region(map_id)
+    if region_id:
+        return region_id
     if map_id.startswith("61"):
         return "masteria-crimsonwood"
     # 일부 특수/이벤트 맵이 섞여도, 크림슨우드 도감(foundAt=6100) 컨텍스트에서는 일단 masteria-crimsonwood로 둠
@@ -251,21 +273,13 @@ def parse_monster_detail_html(html_text: str, monster_id: str) -> ParsedMonsterD
     
     # SPAWN 맵 파싱
     spawn_maps: List[Tuple[str, str]] = []
-    spawn_pattern = re.compile(
-        r'href="[^"]*?/map_detail/(\d+)"[^>]*>[\s\S]*?<h3[^>]*>([\s\S]*?)</h3>',
-        re.IGNORECASE,
-    )
-    for map_id, h3_inner in spawn_pattern.findall(html_text):
+    for map_id, h3_inner in SPAWN_PATTERN.findall(html_text):
         name = strip_tags(h3_inner) or f"map-{map_id}"
         spawn_maps.append((map_id, name))
 
     # GET 드롭 아이템 파싱
     drops: List[Tuple[str, Optional[float]]] = []
-    drop_pattern = re.compile(
-        r'href="[^"]*?/item_detail/(\d+)"[^>]*>[\s\S]*?<div class="drop-rate-box">\s*([^<]+?)\s*</div>',
-        re.IGNORECASE,
-    )
-    for item_id, rate_text in drop_pattern.findall(html_text):
+    for item_id, rate_text in DROP_PATTERN.findall(html_text):
         rate_text = rate_text.strip()
         rate: Optional[float]
         try:
@@ -459,13 +473,17 @@ def main():
     parser.add_argument("--max-monsters", type=int, default=None)
     parser.add_argument("--delay", type=float, default=2.0)
     parser.add_argument("--skip-save-html", action="store_true")
+    parser.add_argument("--metrics-dir", type=Path, default=METRICS_DIR_DEFAULT, help="트레이스/.prom 저장 위치")
+    parser.add_argument("--parse-timeout", type=float, default=None,
+                        help="페이지당 파싱 시간 제한 (초). 넘기면 건너뛰고 입력을 src/request/pathological/에 저장")
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"Fetching list page: {args.list_url}")
-    list_raw = fetch_bytes(args.list_url)
+    metrics = CrawlMetrics(Path(__file__).stem, metrics_dir=args.metrics_dir)
+    list_raw = metrics.timed_fetch(fetch_bytes, args.list_url)
     list_html = choose_decode(list_raw)
     monster_ids = extract_monster_ids(list_html)
 
@@ -483,6 +501,9 @@ def main():
     maps = load_json(map_file, [])
     relations = load_json(rel_file, [])
     monsters = load_json(monster_file, [])
+    provenance = ProvenanceTable()
+    runner = BoundedRunner(args.parse_timeout) if args.parse_timeout else None
+    parse_timeouts = []
 
     added_rel_total = 0
     updated_rel_total = 0
@@ -495,56 +516,77 @@ def main():
     for i, mid in enumerate(monster_ids, 1):
         url = DETAIL_URL_TEMPLATE.format(monster_id=mid)
         print(f"\n[{i}/{len(monster_ids)}] Fetching {mid}: {url}")
-        raw = fetch_bytes(url)
+        raw = metrics.timed_fetch(fetch_bytes, url)
 
         if not args.skip_save_html:
             out = output_dir / f"monster_{mid}.html"
             out.write_bytes(raw)
             print(f"  Saved HTML: {out}")
 
-        html_text = choose_decode(raw)
-        parsed = parse_monster_detail_html(html_text, monster_id=mid)
-
-        # STATS 업데이트
-        monsters, updated_stats = merge_monster_stats(monsters, mid, parsed.stats)
-        updated_monsters_stats_total += updated_stats
-        if parsed.stats:
-            print(f"  Stats: {parsed.stats}")
-            if updated_stats:
-                print("  [OK] Updated monster stats")
-
-        # 드롭 아이템 관계 업데이트
-        relations, added_rel, updated_rel = merge_monster_item_relations(relations, mid, parsed.drops)
-        added_rel_total += added_rel
-        updated_rel_total += updated_rel
-        print(f"  Drops: {len(parsed.drops)} (added rel {added_rel}, updated rel {updated_rel})")
-
-        # 스폰 맵 업데이트
-        maps, added_maps, updated_maps = merge_maps(maps, mid, parsed.spawn_maps)
-        added_maps_total += added_maps
-        updated_maps_total += updated_maps
-        print(f"  Spawn maps: {len(parsed.spawn_maps)} (added maps {added_maps}, updated maps {updated_maps})")
-
-        # regionIds 업데이트
-        map_by_id = {m["id"]: m for m in maps}
-        monsters, updated_region, found_by_id = merge_monster_region_ids(
-            monsters,
-            mid,
-            [m[0] for m in parsed.spawn_maps],
-            map_by_id,
-        )
-        updated_monsters_region_total += updated_region
-        if updated_region:
-            print("  [OK] Updated monster.regionIds")
-        if not found_by_id:
-            missing_monster_ids.append(mid)
-            print(f"  WARNING: Monster ID {mid} not found in monster_data.json (may need name matching)")
+        with metrics.stage("decode"):
+            html_text = choose_decode(raw)
+        try:
+            with metrics.stage("parse"):
+                if runner is not None:
+                    parsed = runner.call(parse_monster_detail_html, html_text, monster_id=mid)
+                else:
+                    parsed = parse_monster_detail_html(html_text, monster_id=mid)
+        except ParseTimeout as e:
+            parse_timeouts.append(mid)
+            metrics.count("parse_timeouts")
+            print(f"  WARNING: {e}")
+            continue
+        for group, payload in monster_group_payloads(
+            parsed.stats, parsed.drops, [m[0] for m in parsed.spawn_maps]
+        ).items():
+            provenance.record("monster", mid, group, SOURCE_MAPLENOTE, payload)
+
+        with metrics.stage("merge"):
+            # STATS 업데이트
+            monsters, updated_stats = merge_monster_stats(monsters, mid, parsed.stats)
+            updated_monsters_stats_total += updated_stats
+            if parsed.stats:
+                print(f"  Stats: {parsed.stats}")
+                if updated_stats:
+                    print("  [OK] Updated monster stats")
+
+            # 드롭 아이템 관계 업데이트
+            relations, added_rel, updated_rel = merge_monster_item_relations(relations, mid, parsed.drops)
+            added_rel_total += added_rel
+            updated_rel_total += updated_rel
+            print(f"  Drops: {len(parsed.drops)} (added rel {added_rel}, updated rel {updated_rel})")
+
+            # 스폰 맵 업데이트
+            maps, added_maps, updated_maps = merge_maps(maps, mid, parsed.spawn_maps)
+            added_maps_total += added_maps
+            updated_maps_total += updated_maps
+            print(f"  Spawn maps: {len(parsed.spawn_maps)} (added maps {added_maps}, updated maps {updated_maps})")
+
+            # regionIds 업데이트
+            map_by_id = {m["id"]: m for m in maps}
+            monsters, updated_region, found_by_id = merge_monster_region_ids(
+                monsters,
+                mid,
+                [m[0] for m in parsed.spawn_maps],
+                map_by_id,
+            )
+            updated_monsters_region_total += updated_region
+            if updated_region:
+                print("  [OK] Updated monster.regionIds")
+            if not found_by_id:
+                missing_monster_ids.append(mid)
+                print(f"  WARNING: Monster ID {mid} not found in monster_data.json (may need name matching)")
 
         time.sleep(args.delay)
 
-    save_json(map_file, maps)
-    save_json(rel_file, relations)
-    save_json(monster_file, monsters)
+    if runner is not None:
+        runner.close()
+
+    with metrics.stage("save"):
+        save_json(map_file, maps)
+        save_json(rel_file, relations)
+        save_json(monster_file, monsters)
+        provenance.save()
 
     print("\n" + "=" * 60)
     print("Summary")
@@ -556,9 +598,13 @@ def main():
     if missing_monster_ids:
         print(f"  - Missing monster IDs (need name matching): {missing_monster_ids}")
     print(f"  - HTML dir: {output_dir}")
+    if parse_timeouts:
+        print(f"  - Parse timeouts (skipped): {parse_timeouts}")
     print(f"  - map_data.json: {map_file}")
     print(f"  - monster_item_relations.json: {rel_file}")
     print(f"  - monster_data.json: {monster_file}")
+    print(f"  - provenance: {provenance.path}")
+    metrics.finish()
 
 
 if __name__ == "__main__":
@@ -16,14 +16,21 @@ import html as html_lib
 import json
 import re
 import ssl
+import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.request import Request, urlopen
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from fetcher import rewrite_url
+from utils import get_data_dir
+
 
 ROOT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / "src" / "data"
+DATA_DIR = get_data_dir()
 REQUEST_DIR = ROOT_DIR / "src" / "request"
 SCRAPED_DIR_DEFAULT = ROOT_DIR / "src" / "request" / "scraped_items"
 
@@ -33,7 +40,7 @@ DETAIL_URL_TEMPLATE = "https://xn--o80b01o9mlw3kdzc.com/item_detail/{item_id}"
 
 def fetch_bytes(url: str, timeout: int = 30) -> bytes:
     req = Request(
-        url,
+        rewrite_url(url),
         headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
     )
     return urlopen(req, context=ssl.create_default_context(), timeout=timeout).read()
@@ -57,9 +64,7 @@ def load_json(path: Path, default):
 
 
 def save_json(path: Path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_json_file(path, data, source=Path(__file__).stem)
 
 
 def sort_key_id(id_value: str):
@@ -16,25 +16,39 @@ import html as html_lib
 import json
 import re
 import ssl
+import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.request import Request, urlopen
 
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from provenance import SOURCE_MAPLEDB, ProvenanceTable, monster_group_payloads
+from changelog import save_json_file
+from fetcher import rewrite_url
+from utils import get_data_dir
+
 
 ROOT_DIR = Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / "src" / "data"
+DATA_DIR = get_data_dir()
 SCRAPED_DIR_DEFAULT = ROOT_DIR / "src" / "request" / "scraped_monsters" / "mapledb"
 
 
 BASE_URL = "https://mapledb.kr/search.php"
 DETAIL_URL_TEMPLATE = f"{BASE_URL}?q={{monster_id}}&t=mob"
 
+# <h4>라벨</h4><span>숫자</span> 필드 패턴
+FIELD_PATTERNS = {
+    label: re.compile(rf"<h4>{label}</h4>\s*<span>(\d+)</span>")
+    for label in ("LEVEL", "EXP", "HP", "MP", "물리 방어력", "마법 방어력", "필요 명중률", "회피율")
+}
+
 
 def fetch_html(url: str, timeout: int = 30) -> str:
     """HTML 가져오기"""
     req = Request(
-        url,
+        rewrite_url(url),
         headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
     )
     ctx = ssl.create_default_context()
@@ -68,38 +82,38 @@ def parse_monster_detail_html(html_text: str, monster_id: str) -> Optional[Dict]
     result = {}
     
     # 기본 정보 파싱: LEVEL, EXP, HP, MP
-    level_match = re.search(r'<h4>LEVEL</h4>\s*<span>(\d+)</span>', html_text)
+    level_match = FIELD_PATTERNS["LEVEL"].search(html_text)
     if level_match:
         result["level"] = int(level_match.group(1))
     
-    exp_match = re.search(r'<h4>EXP</h4>\s*<span>(\d+)</span>', html_text)
+    exp_match = FIELD_PATTERNS["EXP"].search(html_text)
     if exp_match:
         result["exp"] = int(exp_match.group(1))
     
-    hp_match = re.search(r'<h4>HP</h4>\s*<span>(\d+)</span>', html_text)
+    hp_match = FIELD_PATTERNS["HP"].search(html_text)
     if hp_match:
         result["hp"] = int(hp_match.group(1))
     
-    mp_match = re.search(r'<h4>MP</h4>\s*<span>(\d+)</span>', html_text)
+    mp_match = FIELD_PATTERNS["MP"].search(html_text)
     if mp_match:
         result["mp"] = int(mp_match.group(1))
     
     # 세부 정보 파싱: 물리 방어력, 마법 방어력, 필요 명중률, 회피율
     stats = {}
     
-    phys_def_match = re.search(r'<h4>물리 방어력</h4>\s*<span>(\d+)</span>', html_text)
+    phys_def_match = FIELD_PATTERNS["물리 방어력"].search(html_text)
     if phys_def_match:
         stats["physicalDefense"] = int(phys_def_match.group(1))
     
-    mag_def_match = re.search(r'<h4>마법 방어력</h4>\s*<span>(\d+)</span>', html_text)
+    mag_def_match = FIELD_PATTERNS["마법 방어력"].search(html_text)
     if mag_def_match:
         stats["magicDefense"] = int(mag_def_match.group(1))
     
-    acc_match = re.search(r'<h4>필요 명중률</h4>\s*<span>(\d+)</span>', html_text)
+    acc_match = FIELD_PATTERNS["필요 명중률"].search(html_text)
     if acc_match:
         stats["requiredAccuracy"] = int(acc_match.group(1))
     
-    eva_match = re.search(r'<h4>회피율</h4>\s*<span>(\d+)</span>', html_text)
+    eva_match = FIELD_PATTERNS["회피율"].search(html_text)
     if eva_match:
         stats["evasion"] = int(eva_match.group(1))
     
@@ -119,9 +133,7 @@ def load_json(path: Path, default):
 
 def save_json(path: Path, data):
     """JSON 파일 저장"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_json_file(path, data, source=Path(__file__).stem)
 
 
 def sort_key_id(id_value: str):
@@ -219,6 +231,7 @@ def main():
     # 데이터 파일 로드
     monster_data_file = DATA_DIR / "monster_data.json"
     monsters = load_json(monster_data_file, [])
+    provenance = ProvenanceTable()
     
     print(f"Processing {len(monster_ids)} monster(s)...")
     
@@ -257,6 +270,12 @@ def main():
                 continue
             
             print(f"  Parsed data: {parsed_data}")
+
+            # 출처 기록 (evasion 등 타입에 없는 필드도 해시에는 포함)
+            flat = {k: v for k, v in parsed_data.items() if k != "stats"}
+            flat.update(parsed_data.get("stats", {}))
+            for group, payload in monster_group_payloads(flat).items():
+                provenance.record("monster", monster_id, group, SOURCE_MAPLEDB, payload)
             
             # 데이터 업데이트
             updated = update_monster_data(monsters, monster_id, parsed_data)
@@ -281,6 +300,8 @@ def main():
         save_json(monster_data_file, monsters)
         print(f"[OK] Saved {updated_count} updated monster(s)")
     
+    provenance.save()
+
     # 결과 요약
     print(f"\n=== Summary ===")
     print(f"Total processed: {len(monster_ids)}")
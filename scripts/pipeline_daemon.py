@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데이터 유지보수 데몬 (localhost HTTP)
+
+작은 스크립트를 연달아 실행하면(fix -> featured drops -> validate -> build) 매번 인터프리터 기동과
+src/data JSON 전체 파싱을 다시 합니다. 데몬은 데이터셋과 인덱스(ID, 몬스터별/아이템별 드랍 관계, 이름)를
+메모리에 올려 두고 작업을 받아서 처리합니다.
+
+- 트랜잭션(POST /tx): set/unset/upsert/delete/replace_item_id 연산 목록을 복사본에 적용하고,
+  전부 성공하면 변경된 파일만 이력(changelog)과 함께 저장합니다. 하나라도 실패하면 아무것도 쓰지 않습니다.
+  시작 이후 디스크 파일이 바뀌었으면 409(충돌)로 거절합니다.
+- 스크립트 작업(POST /run): python -m scripts 작업을 데몬 프로세스에서 실행합니다. (공통 모듈 import는 한 번만)
+  실패(종료 코드 != 0)하면 데이터 파일과 이력 로그를 실행 전 상태로 되돌립니다.
+  출력은 작업 스레드(와 작업이 띄운 스레드)에서 쓴 것만 그 작업의 응답으로 모으고, 다른 요청/감시 스레드 출력은 섞지 않습니다.
+- 조회(GET): /status, /entity/<dataset>/<key>, /drops/<monsterId>, /droppers/<itemId>, /search?name=
+- 감시: src/data 파일의 mtime/size를 주기적으로 확인해서 외부에서 수정되면 해당 데이터셋만 다시 읽습니다.
+
+Unix 소켓 대신 127.0.0.1 HTTP를 쓰는 이유는 Windows 개발 환경에서도 같은 방식으로 쓰기 위해서입니다.
+
+사용 예시:
+    python scripts/pipeline_daemon.py serve --port 8765
+    python scripts/pipeline_daemon.py get monster_data.json 100100
+    python scripts/pipeline_daemon.py tx ops.json --tag 2025-12-23-patch
+    echo '{"ops": [{"op": "set", "dataset": "monster_data.json", "key": "100100", "field": "exp", "value": 4}]}' \\
+        | python scripts/pipeline_daemon.py tx -
+    python scripts/pipeline_daemon.py run "migrate fix-featured-drops-and-item-names"
+    python scripts/pipeline_daemon.py stop
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shlex
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+from urllib.request import Request, urlopen
+
+from changelog import ChangeLog, diff_entities, entity_key
+from utils import get_data_path
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+WATCH_INTERVAL_DEFAULT = 0.5
+OUTPUT_LIMIT = 20000
+
+DATASETS = (
+    "monster_data.json",
+    "item_data.json",
+    "map_data.json",
+    "monster_item_relations.json",
+    "region_data.json",
+    "job_data.json",
+)
+RELATIONS = "monster_item_relations.json"
+
+
+class TxError(Exception):
+    """잘못된 연산 (400)"""
+
+
+class TxConflict(Exception):
+    """트랜잭션 시작 이후 디스크 파일이 바뀜 (409)"""
+
+
+def fingerprint(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def write_json_atomic(path: Path, data) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+class _RoutedStream:
+    """sys.stdout/sys.stderr 자리에 두고 JobOutput이 정한 버퍼(없으면 원래 스트림)로 보냄"""
+
+    def __init__(self, stream, output: "JobOutput"):
+        self.stream = stream
+        self.output = output
+
+    def write(self, text: str) -> int:
+        target = self.output.target()
+        return (target if target is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class JobOutput:
+    """작업별 출력 수집
+
+    contextlib.redirect_stdout은 프로세스 전체의 sys.stdout을 바꾸므로, 작업 중에 다른 HTTP 요청이나
+    감시 스레드가 출력하면 작업 응답에 섞이고, 반대로 작업 출력이 다른 곳으로 새기도 합니다.
+    sys.stdout/sys.stderr를 한 번만 라우터로 바꿔 두고 쓰는 스레드를 보고 보낼 곳을 정합니다.
+    - capture() 중인 스레드 -> 그 작업 버퍼
+    - 데몬 내부 스레드(mark_internal: HTTP 처리/감시) -> 원래 스트림
+    - 그 밖의 스레드(작업이 띄운 작업자 스레드)는 작업 실행 중이면 그 작업 버퍼
+    작업은 daemon.lock 아래에서 하나씩만 실행되므로 실행 중인 작업 버퍼는 최대 하나입니다.
+    """
+
+    def __init__(self):
+        self.local = threading.local()
+        self.active: Optional[io.StringIO] = None
+        self.installed = False
+
+    def install(self) -> None:
+        if not self.installed:
+            sys.stdout = _RoutedStream(sys.stdout, self)
+            sys.stderr = _RoutedStream(sys.stderr, self)
+            self.installed = True
+
+    def mark_internal(self) -> None:
+        self.local.internal = True
+
+    def target(self) -> Optional[io.StringIO]:
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is not None:
+            return buffer
+        if self.active is not None and not getattr(self.local, "internal", False):
+            return self.active
+        return None
+
+    @contextlib.contextmanager
+    def capture(self):
+        self.install()
+        buffer = io.StringIO()
+        self.local.buffer = self.active = buffer
+        try:
+            yield buffer
+        finally:
+            self.local.buffer = self.active = None
+
+
+class Table:
+    """데이터셋 하나 (행 목록 + 키 -> 위치 인덱스)"""
+
+    def __init__(self, name: str, rows: List[dict], fp: Optional[Tuple[int, int]]):
+        self.name = name
+        self.rows = rows
+        self.fp = fp
+        self.positions = {entity_key(name, row): i for i, row in enumerate(rows)}
+
+    def get(self, key: str) -> Optional[dict]:
+        pos = self.positions.get(key)
+        return self.rows[pos] if pos is not None else None
+
+
+class Dataset:
+    """메모리에 올린 src/data 전체 + 보조 인덱스"""
+
+    def __init__(self):
+        self.tables: Dict[str, Table] = {}
+        self.drops_by_monster: Dict[str, List[int]] = {}
+        self.drops_by_item: Dict[str, List[int]] = {}
+        self.monsters_by_name: Dict[str, List[str]] = {}
+        self.reloads: Dict[str, int] = defaultdict(int)
+
+    def load(self, name: str) -> None:
+        path = get_data_path(name)
+        fp = fingerprint(path)
+        rows: List[dict] = []
+        if fp is not None:
+            with open(path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+        self.tables[name] = Table(name, rows, fp)
+        self.reloads[name] += 1
+        self.reindex(name)
+
+    def load_all(self) -> None:
+        for name in DATASETS:
+            self.load(name)
+
+    def reindex(self, name: str) -> None:
+        if name == RELATIONS:
+            by_monster: Dict[str, List[int]] = defaultdict(list)
+            by_item: Dict[str, List[int]] = defaultdict(list)
+            for i, r in enumerate(self.tables[name].rows):
+                by_monster[r.get("monsterId")].append(i)
+                by_item[r.get("itemId")].append(i)
+            self.drops_by_monster, self.drops_by_item = dict(by_monster), dict(by_item)
+        elif name == "monster_data.json":
+            by_name: Dict[str, List[str]] = defaultdict(list)
+            for m in self.tables[name].rows:
+                by_name[m.get("name")].append(m.get("id"))
+            self.monsters_by_name = dict(by_name)
+
+    def changed_on_disk(self) -> List[str]:
+        return [name for name, t in self.tables.items() if fingerprint(get_data_path(name)) != t.fp]
+
+    def drops(self, monster_id: str) -> List[dict]:
+        rows = self.tables[RELATIONS].rows
+        return [rows[i] for i in self.drops_by_monster.get(monster_id, [])]
+
+    def droppers(self, item_id: str) -> List[dict]:
+        rows = self.tables[RELATIONS].rows
+        return [rows[i] for i in self.drops_by_item.get(item_id, [])]
+
+
+class Transaction:
+    """연산을 복사본에 적용. 건드린 데이터셋만 행 목록을 얕은 복사하고, 수정하는 행만 dict 복사"""
+
+    def __init__(self, data: Dataset):
+        self.data = data
+        self.rows: Dict[str, List[Optional[dict]]] = {}
+        self.positions: Dict[str, Dict[str, int]] = {}
+
+    def _table(self, name: str) -> Tuple[List[Optional[dict]], Dict[str, int]]:
+        if name not in self.data.tables:
+            raise TxError(f"unknown dataset: {name}")
+        if name not in self.rows:
+            table = self.data.tables[name]
+            self.rows[name] = list(table.rows)
+            self.positions[name] = dict(table.positions)
+        return self.rows[name], self.positions[name]
+
+    def _entity(self, name: str, key: str) -> Tuple[int, dict]:
+        rows, positions = self._table(name)
+        pos = positions.get(key)
+        if pos is None:
+            raise TxError(f"{name}: no entity {key}")
+        entity = dict(rows[pos])
+        rows[pos] = entity
+        return pos, entity
+
+    def set(self, dataset: str, key: str, field: str, value) -> None:
+        self._entity(dataset, key)[1][field] = value
+
+    def unset(self, dataset: str, key: str, field: str) -> None:
+        self._entity(dataset, key)[1].pop(field, None)
+
+    def upsert(self, dataset: str, value: dict) -> None:
+        rows, positions = self._table(dataset)
+        key = entity_key(dataset, value)
+        if key in ("None", "None:None"):
+            raise TxError(f"{dataset}: upsert value has no key")
+        if key in positions:
+            rows[positions[key]] = dict(value)
+        else:
+            positions[key] = len(rows)
+            rows.append(dict(value))
+
+    def delete(self, dataset: str, key: str) -> None:
+        rows, positions = self._table(dataset)
+        pos = positions.pop(key, None)
+        if pos is None:
+            raise TxError(f"{dataset}: no entity {key}")
+        rows[pos] = None
+
+    def replace_item_id(self, old: str, new: str) -> None:
+        """아이템 ID 통합 (fix/replace_item_id_* 스크립트와 같은 규칙)
+        old 아이템 삭제, 드랍 관계 itemId 변경(같은 몬스터에 new 관계가 이미 있으면 old 관계 삭제),
+        monster_data의 dropItemIds/featuredDropItemIds 치환"""
+        if old == new:
+            raise TxError("replace_item_id: old and new are the same")
+        items, item_pos = self._table("item_data.json")
+        if new not in item_pos:
+            raise TxError(f"replace_item_id: target item {new} does not exist")
+        if old in item_pos:
+            self.delete("item_data.json", old)
+        rows, positions = self._table(RELATIONS)
+        for key in [k for k in positions if k.endswith(f":{old}")]:
+            monster_id = key.rsplit(":", 1)[0]
+            pos = positions.pop(key)
+            new_key = f"{monster_id}:{new}"
+            if new_key in positions:
+                rows[pos] = None
+            else:
+                row = dict(rows[pos])
+                row["itemId"] = new
+                rows[pos] = row
+                positions[new_key] = pos
+        monsters, _ = self._table("monster_data.json")
+        for pos, m in enumerate(monsters):
+            if m is None:
+                continue
+            touched = {}
+            for field in ("dropItemIds", "featuredDropItemIds"):
+                ids = m.get(field)
+                if ids and old in ids:
+                    replaced = []
+                    for item_id in ids:
+                        item_id = new if item_id == old else item_id
+                        if item_id not in replaced:
+                            replaced.append(item_id)
+                    touched[field] = replaced
+            if touched:
+                monsters[pos] = {**m, **touched}
+
+    def apply(self, op: dict) -> None:
+        if not isinstance(op, dict):
+            raise TxError(f"op must be an object: {op!r}")
+        kind = op.get("op")
+        for name in ("dataset", "field"):
+            if name in op and not isinstance(op[name], str):
+                raise TxError(f"{kind}: {name} must be a string")
+        if kind == "upsert" and "value" in op and not isinstance(op["value"], dict):
+            raise TxError("upsert: value must be an object")
+        try:
+            if kind == "set":
+                self.set(op["dataset"], str(op["key"]), op["field"], op["value"])
+            elif kind == "unset":
+                self.unset(op["dataset"], str(op["key"]), op["field"])
+            elif kind == "upsert":
+                self.upsert(op["dataset"], op["value"])
+            elif kind == "delete":
+                self.delete(op["dataset"], str(op["key"]))
+            elif kind == "replace_item_id":
+                self.replace_item_id(str(op["old"]), str(op["new"]))
+            else:
+                raise TxError(f"unknown op: {kind}")
+        except KeyError as e:
+            raise TxError(f"{kind}: missing {e}") from None
+
+    def result(self) -> Dict[str, List[dict]]:
+        return {name: [row for row in rows if row is not None] for name, rows in self.rows.items()}
+
+
+class PipelineDaemon:
+    def __init__(self, watch_interval: float = WATCH_INTERVAL_DEFAULT):
+        self.data = Dataset()
+        self.changelog = ChangeLog()
+        self.lock = threading.RLock()
+        self.watch_interval = watch_interval
+        self.started = time.monotonic()
+        self.stats: Dict[str, int] = defaultdict(int)
+        self.output = JobOutput()
+        self._stop = threading.Event()
+        with self.lock:
+            self.data.load_all()
+
+    # ---------- 감시 ----------
+
+    def refresh(self) -> List[str]:
+        """디스크에서 바뀐 데이터셋 다시 읽기"""
+        with self.lock:
+            changed = self.data.changed_on_disk()
+            for name in changed:
+                self.data.load(name)
+            return changed
+
+    def watch(self) -> None:
+        self.output.mark_internal()
+        while not self._stop.wait(self.watch_interval):
+            changed = self.refresh()
+            if changed:
+                self.stats["externalReloads"] += len(changed)
+                print(f"[watch] reloaded {', '.join(changed)}", flush=True)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # ---------- 트랜잭션 ----------
+
+    def transact(self, ops: List[dict], tag: Optional[str] = None, source: Optional[str] = None,
+                 dry_run: bool = False) -> Dict[str, object]:
+        if not isinstance(ops, list):
+            raise TxError("ops must be a list")
+        started = time.perf_counter()
+        with self.lock:
+            # 마지막 감시 주기 이후의 외부 수정은 충돌로 처리 (메모리 상태가 디스크와 다름)
+            stale = self.data.changed_on_disk()
+            if stale:
+                raise TxConflict(f"modified on disk: {', '.join(stale)} (retry after reload)")
+            tx = Transaction(self.data)
+            for op in ops:
+                tx.apply(op)
+            changes = {}
+            for name, rows in tx.result().items():
+                before = self.data.tables[name].rows
+                events = diff_entities(name, before, rows)
+                if events:
+                    changes[name] = (rows, len(events))
+            if not dry_run:
+                for name, (rows, _) in changes.items():
+                    self.changelog.record(name, self.data.tables[name].rows, rows, tag=tag, source=source or "pipeline_daemon")
+                    path = get_data_path(name)
+                    write_json_atomic(path, rows)
+                    self.data.tables[name] = Table(name, rows, fingerprint(path))
+                    self.data.reindex(name)
+                self.stats["transactions"] += 1
+        return {
+            "ok": True,
+            "dryRun": dry_run,
+            "changes": {name: n for name, (_, n) in changes.items()},
+            "ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    # ---------- 스크립트 작업 ----------
+
+    def _checkpoint(self) -> Dict[Path, Optional[bytes]]:
+        """데이터 파일 + 이력 메타데이터의 현재 내용 (이벤트 로그는 크기만)"""
+        saved: Dict[Path, Optional[bytes]] = {}
+        for name in DATASETS:
+            path = get_data_path(name)
+            saved[path] = path.read_bytes() if path.exists() else None
+        for path in (self.changelog.tags_file, self.changelog.snapshot_index_file):
+            saved[path] = path.read_bytes() if path.exists() else None
+        return saved
+
+    def _rollback(self, saved: Dict[Path, Optional[bytes]], events_size: int) -> None:
+        for path, content in saved.items():
+            if content is None:
+                if path.exists():
+                    path.unlink()
+            elif not path.exists() or path.read_bytes() != content:
+                path.write_bytes(content)
+        events = self.changelog.events_file
+        if events.exists() and events.stat().st_size > events_size:
+            with open(events, "r+b") as f:
+                f.truncate(events_size)
+
+    def run_script(self, line: str, args: Optional[List[str]] = None) -> Dict[str, object]:
+        from cli import discover, resolve, run_job
+
+        parts = shlex.split(line) + list(args or [])
+        path = resolve(discover(), parts[0], parts[1]) if len(parts) >= 2 else None
+        if path is None:
+            raise TxError(f"unknown job: {line}")
+        started = time.perf_counter()
+        with self.lock:
+            stale = self.data.changed_on_disk()
+            for name in stale:
+                self.data.load(name)
+            saved = self._checkpoint()
+            events = self.changelog.events_file
+            events_size = events.stat().st_size if events.exists() else 0
+            with self.output.capture() as out:
+                try:
+                    code = run_job(path, parts[2:])
+                except Exception as e:  # 스크립트 내부 예외도 실패로 처리
+                    print(f"{type(e).__name__}: {e}")
+                    code = 1
+            rolled_back = code != 0
+            if rolled_back:
+                self._rollback(saved, events_size)
+            reloaded = self.refresh()
+            self.stats["scripts"] += 1
+        output = out.getvalue()
+        return {
+            "ok": code == 0,
+            "exitCode": code,
+            "rolledBack": rolled_back,
+            "reloaded": reloaded,
+            "output": output[-OUTPUT_LIMIT:],
+            "ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    # ---------- 조회 ----------
+
+    def status(self) -> Dict[str, object]:
+        with self.lock:
+            return {
+                "uptimeSeconds": round(time.monotonic() - self.started, 1),
+                "datasets": {name: {"rows": len(t.rows), "loads": self.data.reloads[name]} for name, t in self.data.tables.items()},
+                "stats": dict(self.stats),
+            }
+
+
+def make_handler(daemon: PipelineDaemon, server_ref: List[ThreadingHTTPServer]):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, status: int, payload) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self) -> dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+        def do_GET(self):
+            daemon.output.mark_internal()
+            parts = urlsplit(self.path)
+            segments = [unquote(s) for s in parts.path.strip("/").split("/") if s]
+            query = parse_qs(parts.query)
+            with daemon.lock:
+                if segments == ["status"]:
+                    return self._send(200, daemon.status())
+                if len(segments) == 3 and segments[0] == "entity":
+                    table = daemon.data.tables.get(segments[1])
+                    row = table.get(segments[2]) if table else None
+                    return self._send(200 if row else 404, row or {"error": "not found"})
+                if len(segments) == 2 and segments[0] == "drops":
+                    return self._send(200, daemon.data.drops(segments[1]))
+                if len(segments) == 2 and segments[0] == "droppers":
+                    return self._send(200, daemon.data.droppers(segments[1]))
+                if segments == ["search"]:
+                    name = (query.get("name") or [""])[0]
+                    monsters = daemon.data.tables["monster_data.json"]
+                    exact = daemon.data.monsters_by_name.get(name, [])
+                    partial = [m["id"] for m in monsters.rows if name and name in m.get("name", "") and m["id"] not in exact]
+                    return self._send(200, [monsters.get(mid) for mid in exact + partial])
+            self._send(404, {"error": f"unknown path: {parts.path}"})
+
+        def do_POST(self):
+            daemon.output.mark_internal()
+            path = urlsplit(self.path).path.strip("/")
+            try:
+                body = self._body()
+                if not isinstance(body, dict):
+                    raise TxError("request body must be a JSON object")
+                if path == "tx":
+                    return self._send(200, daemon.transact(body.get("ops") or [], tag=body.get("tag"),
+                                                           source=body.get("source"), dry_run=bool(body.get("dryRun"))))
+                if path == "run":
+                    result = daemon.run_script(body.get("job", ""), body.get("args"))
+                    return self._send(200 if result["ok"] else 500, result)
+                if path == "reload":
+                    with daemon.lock:
+                        daemon.data.load_all()
+                    return self._send(200, daemon.status())
+                if path == "shutdown":
+                    self._send(200, {"ok": True})
+                    daemon.stop()
+                    threading.Thread(target=server_ref[0].shutdown, daemon=True).start()
+                    return
+            except (TxError, json.JSONDecodeError) as e:
+                return self._send(400, {"ok": False, "error": str(e)})
+            except TxConflict as e:
+                return self._send(409, {"ok": False, "error": str(e)})
+            except Exception as e:
+                # 처리 스레드가 응답 없이 죽지 않도록
+                traceback.print_exc()
+                return self._send(500, {"ok": False, "error": f"{type(e).__name__}: {e}"})
+            self._send(404, {"error": f"unknown path: {path}"})
+
+    return Handler
+
+
+def serve(host: str, port: int, watch_interval: float) -> None:
+    started = time.perf_counter()
+    daemon = PipelineDaemon(watch_interval=watch_interval)
+    server_ref: List[ThreadingHTTPServer] = []
+    server = ThreadingHTTPServer((host, port), make_handler(daemon, server_ref))
+    server_ref.append(server)
+    daemon.output.install()
+    daemon.output.mark_internal()
+    threading.Thread(target=daemon.watch, daemon=True).start()
+    rows = sum(len(t.rows) for t in daemon.data.tables.values())
+    print(f"Loaded {rows} rows in {time.perf_counter() - started:.2f}s; serving on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+        server.server_close()
+
+
+# ---------- 클라이언트 ----------
+
+def call(base_url: str, method: str, path: str, payload: Optional[dict] = None) -> Tuple[int, object]:
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else None
+    req = Request(base_url.rstrip("/") + path, data=data, method=method,
+                  headers={"Content-Type": "application/json"} if data else {})
+    try:
+        with urlopen(req, timeout=600) as resp:
+            return resp.status, json.loads(resp.read() or b"null")
+    except HTTPError as e:
+        return e.code, json.loads(e.read() or b"null")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="src/data 유지보수 데몬")
+    parser.add_argument("--url", default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", help="클라이언트 명령이 접속할 데몬 주소")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_serve = sub.add_parser("serve", help="데몬 실행")
+    p_serve.add_argument("--host", default=DEFAULT_HOST)
+    p_serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    p_serve.add_argument("--watch-interval", type=float, default=WATCH_INTERVAL_DEFAULT, help="src/data 변경 확인 주기 (초)")
+
+    sub.add_parser("status", help="상태")
+    p_get = sub.add_parser("get", help="엔티티 조회")
+    p_get.add_argument("dataset")
+    p_get.add_argument("key")
+    p_tx = sub.add_parser("tx", help="트랜잭션 제출 (JSON 파일 또는 -: {\"ops\": [...]})")
+    p_tx.add_argument("file")
+    p_tx.add_argument("--tag", default=None)
+    p_tx.add_argument("--dry-run", action="store_true")
+    p_run = sub.add_parser("run", help='스크립트 작업 실행 (예: "validate check-data")')
+    p_run.add_argument("job")
+    p_run.add_argument("args", nargs=argparse.REMAINDER)
+    sub.add_parser("reload", help="전체 다시 읽기")
+    sub.add_parser("stop", help="데몬 종료")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.host, args.port, args.watch_interval)
+        return
+
+    if args.command == "status":
+        status, result = call(args.url, "GET", "/status")
+    elif args.command == "get":
+        status, result = call(args.url, "GET", f"/entity/{quote(args.dataset)}/{quote(args.key)}")
+    elif args.command == "tx":
+        text = sys.stdin.read() if args.file == "-" else Path(args.file).read_text(encoding="utf-8")
+        payload = json.loads(text)
+        if isinstance(payload, list):
+            payload = {"ops": payload}
+        if args.tag:
+            payload["tag"] = args.tag
+        payload["dryRun"] = args.dry_run or payload.get("dryRun", False)
+        status, result = call(args.url, "POST", "/tx", payload)
+    elif args.command == "run":
+        status, result = call(args.url, "POST", "/run", {"job": args.job, "args": args.args})
+        if isinstance(result, dict) and "output" in result:
+            print(result.pop("output"), end="")
+    elif args.command == "reload":
+        status, result = call(args.url, "POST", "/reload", {})
+    else:
+        status, result = call(args.url, "POST", "/shutdown", {})
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if status >= 400:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+필드 그룹 단위 출처(provenance) 기록 + TTL 기반 재수집 스케줄러
+
+src/data/meta/provenance.json (side table) 형식:
+{
+  "monster:6300001": {
+    "stats": {"source": "maplenote", "fetchedAt": "...", "changedAt": "...", "contentHash": "..."},
+    "drops": {...},
+    ...
+  }
+}
+
+- fetchedAt: 마지막으로 해당 출처에서 확인한 시각
+- changedAt: contentHash가 마지막으로 바뀐 시각 (값이 그대로면 fetchedAt만 갱신)
+- 스케줄러는 (경과 시간 / TTL)이 1 이상인 엔티티 중 조회수가 많은 것부터 요청 예산(budget)만큼 고릅니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from utils import get_data_path
+
+PROVENANCE_FILE = get_data_path("meta/provenance.json")
+
+SOURCE_MAPLENOTE = "maplenote"
+SOURCE_MAPLEDB = "mapledb"
+
+# 엔티티 종류별 필드 그룹 (그룹 이름 -> 포함 필드)
+FIELD_GROUPS: Dict[str, Dict[str, List[str]]] = {
+    "monster": {
+        "core": ["level", "hp", "exp"],
+        "stats": ["stats"],
+        "drops": ["monster_item_relations"],
+        "spawns": ["map_data.monsterIds"],
+    },
+    "map": {
+        "spawns": ["monsterIds", "monsterSpawns"],
+        "portals": ["portalMapIds"],
+    },
+    "item": {
+        "core": ["name", "reqLevel", "shopPrice"],
+    },
+}
+
+# 필드 그룹별 재수집 주기 (일). 드랍 테이블이 가장 자주 바뀌고, 레벨/HP는 패치 때만 바뀝니다.
+DEFAULT_TTL_DAYS: Dict[str, float] = {
+    "core": 90,
+    "stats": 30,
+    "drops": 14,
+    "spawns": 60,
+    "portals": 180,
+}
+
+
+def now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def to_iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def from_iso(text: str) -> datetime:
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def content_hash(payload) -> str:
+    """필드 그룹 값의 정규화된 JSON 해시 (키 순서와 무관)"""
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def entity_ref(entity_type: str, entity_id: str) -> str:
+    return f"{entity_type}:{entity_id}"
+
+
+class ProvenanceTable:
+    """provenance.json 로드/기록/저장"""
+
+    def __init__(self, path: Path = PROVENANCE_FILE):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, dict]] = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def get(self, entity_type: str, entity_id: str, group: str) -> Optional[dict]:
+        return self.entries.get(entity_ref(entity_type, entity_id), {}).get(group)
+
+    def record(
+        self,
+        entity_type: str,
+        entity_id: str,
+        group: str,
+        source: str,
+        payload,
+        fetched_at: Optional[datetime] = None,
+    ) -> bool:
+        """
+        필드 그룹 출처 기록.
+        Returns: 내용(contentHash)이 이전 기록과 달라졌으면 True
+        """
+        ts = to_iso(fetched_at or now_utc())
+        digest = content_hash(payload)
+        groups = self.entries.setdefault(entity_ref(entity_type, entity_id), {})
+        prev = groups.get(group)
+        changed = prev is None or prev.get("contentHash") != digest
+        groups[group] = {
+            "source": source,
+            "fetchedAt": ts,
+            "changedAt": ts if changed else prev.get("changedAt", ts),
+            "contentHash": digest,
+        }
+        return changed
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(self.entries.items())), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+
+    def staleness(
+        self,
+        entity_type: str,
+        entity_id: str,
+        now: datetime,
+        ttl_days: Dict[str, float] = DEFAULT_TTL_DAYS,
+    ) -> Dict[str, float]:
+        """
+        필드 그룹별 (경과 시간 / TTL). 1.0 이상이면 만료.
+        한 번도 수집하지 않은 그룹은 math.inf입니다.
+        """
+        groups = self.entries.get(entity_ref(entity_type, entity_id), {})
+        result: Dict[str, float] = {}
+        for group in FIELD_GROUPS[entity_type]:
+            entry = groups.get(group)
+            if not entry:
+                result[group] = math.inf
+                continue
+            age_days = (now - from_iso(entry["fetchedAt"])).total_seconds() / 86400
+            result[group] = age_days / ttl_days.get(group, DEFAULT_TTL_DAYS["core"])
+        return result
+
+
+@dataclass
+class RefreshCandidate:
+    entity_id: str
+    score: float
+    staleness: float
+    views: int
+    stale_groups: List[str]
+
+
+def plan_refresh(
+    table: ProvenanceTable,
+    entity_type: str,
+    entity_ids: Iterable[str],
+    budget: int,
+    views: Optional[Dict[str, int]] = None,
+    ttl_days: Dict[str, float] = DEFAULT_TTL_DAYS,
+    now: Optional[datetime] = None,
+) -> List[RefreshCandidate]:
+    """
+    재수집 대상 선정.
+
+    상세 페이지 1회 요청으로 모든 필드 그룹을 다시 받으므로 엔티티 단위로 예산을 씁니다.
+    점수 = min(staleness, 10) * (1 + log1p(조회수)) 이고, 만료되지 않은(staleness < 1) 엔티티는 제외합니다.
+    한 번도 수집하지 않은 엔티티는 staleness 10으로 취급해 조회수만으로 순서를 정합니다.
+    """
+    now = now or now_utc()
+    views = views or {}
+    candidates: List[RefreshCandidate] = []
+    for entity_id in entity_ids:
+        per_group = table.staleness(entity_type, entity_id, now, ttl_days)
+        stale_groups = [g for g, s in per_group.items() if s >= 1.0]
+        if not stale_groups:
+            continue
+        worst = min(max(per_group.values()), 10.0)
+        view_count = int(views.get(entity_id, 0))
+        score = worst * (1.0 + math.log1p(view_count))
+        candidates.append(RefreshCandidate(entity_id, score, worst, view_count, stale_groups))
+    return heapq.nlargest(budget, candidates, key=lambda c: (c.score, c.views))
+
+
+def load_views(path: Optional[Path]) -> Dict[str, int]:
+    """조회수 파일 ({"엔티티ID": 조회수}) 로드. 없으면 빈 dict"""
+    if path is None or not Path(path).exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {str(k): int(v) for k, v in json.load(f).items()}
+
+
+def monster_group_payloads(
+    stats: Optional[dict],
+    drops: Optional[list] = None,
+    spawn_map_ids: Optional[list] = None,
+) -> Dict[str, object]:
+    """
+    파싱 결과를 몬스터 필드 그룹별 payload로 나눕니다.
+    (maplenote STATS 섹션은 hp/exp를 함께 주므로 core와 stats로 분리)
+    """
+    payloads: Dict[str, object] = {}
+    if stats:
+        core = {k: stats[k] for k in FIELD_GROUPS["monster"]["core"] if k in stats}
+        rest = {k: v for k, v in stats.items() if k not in ("level", "hp", "exp")}
+        if core:
+            payloads["core"] = core
+        if rest:
+            payloads["stats"] = rest
+    if drops is not None:
+        payloads["drops"] = sorted([list(d) for d in drops])
+    if spawn_map_ids is not None:
+        payloads["spawns"] = sorted(spawn_map_ids)
+    return payloads
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파서 실행 시간 제한 (정규식 역추적 폭주 대비)
+
+[\\s\\S]*?, DOTALL .*? 같은 패턴은 잘리거나 깨진 페이지에서 입력 길이에 비해 훨씬 오래 걸릴 수 있습니다.
+Python re는 매칭 중에 시그널/스레드로 중단할 수 없으므로, 파서를 별도 워커 프로세스에서 실행하고
+시간 제한을 넘기면 프로세스를 종료한 뒤 ParseTimeout을 던집니다. (워커는 다음 호출 때 다시 띄움)
+시간 초과된 입력은 재현할 수 있도록 격리 디렉토리에 저장합니다.
+
+사용 예시:
+    from regex_guard import ParseTimeout, bounded_call
+
+    try:
+        parsed = bounded_call(parse_monster_detail_html, html_text, monster_id=mid, timeout=2.0)
+    except ParseTimeout as e:
+        print(f"pathological page skipped: {e.input_path}")
+
+bounded_call이 스레드별로 띄운 워커는 close_all()로 (또는 인터프리터 종료 시 atexit로) 정리됩니다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import multiprocessing
+import threading
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from utils import PROJECT_ROOT
+
+QUARANTINE_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "pathological"
+DEFAULT_TIMEOUT = 2.0
+
+
+class ParseTimeout(Exception):
+    """시간 제한 안에 파싱이 끝나지 않음"""
+
+    def __init__(self, func_name: str, timeout: float, input_path: Optional[Path] = None):
+        super().__init__(f"{func_name} exceeded {timeout}s" + (f" (input saved: {input_path})" if input_path else ""))
+        self.func_name = func_name
+        self.timeout = timeout
+        self.input_path = input_path
+
+
+def _worker_loop(conn) -> None:
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        func, args, kwargs = message
+        try:
+            conn.send((True, func(*args, **kwargs)))
+        except Exception as e:  # 파서 예외는 호출한 쪽에서 다시 던짐
+            conn.send((False, e))
+
+
+class BoundedRunner:
+    """워커 프로세스 1개로 함수를 시간 제한 실행 (스레드 하나당 하나씩 사용)"""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, quarantine_dir: Optional[Path] = QUARANTINE_DIR_DEFAULT):
+        self.timeout = timeout
+        self.quarantine_dir = quarantine_dir
+        self._process = None
+        self._conn = None
+        self.timeouts = 0
+
+    def _start(self) -> None:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def _kill(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(1)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        self._kill()
+
+    def _quarantine(self, func_name: str, args: tuple) -> Optional[Path]:
+        if self.quarantine_dir is None or not args or not isinstance(args[0], str):
+            return None
+        data = args[0].encode("utf-8", "ignore")
+        path = Path(self.quarantine_dir) / f"{func_name}_{hashlib.sha1(data).hexdigest()[:12]}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    def call(self, func: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """func(*args, **kwargs)를 워커에서 실행. 시간 초과 시 ParseTimeout (첫 인자가 문자열이면 격리 저장)"""
+        limit = self.timeout if timeout is None else timeout
+        if self._process is None or not self._process.is_alive():
+            self._start()
+        self._conn.send((func, args, kwargs))
+        if not self._conn.poll(limit):
+            self._kill()
+            self.timeouts += 1
+            raise ParseTimeout(func.__name__, limit, self._quarantine(func.__name__, args))
+        ok, value = self._conn.recv()
+        if not ok:
+            raise value
+        return value
+
+    def __enter__(self) -> "BoundedRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_local = threading.local()
+_runners: List[BoundedRunner] = []
+_runners_lock = threading.Lock()
+
+
+def bounded_call(func: Callable[..., Any], *args, timeout: float = DEFAULT_TIMEOUT, **kwargs) -> Any:
+    """스레드별 BoundedRunner로 func를 시간 제한 실행합니다. (크롤 워커 스레드에서 그대로 사용)"""
+    runner = getattr(_local, "runner", None)
+    if runner is None:
+        runner = _local.runner = BoundedRunner(timeout)
+        with _runners_lock:
+            _runners.append(runner)
+    return runner.call(func, *args, timeout=timeout, **kwargs)
+
+
+def close_all() -> None:
+    """bounded_call이 만든 워커 프로세스를 모두 종료합니다. (러너는 다음 호출 때 워커를 다시 띄움)"""
+    with _runners_lock:
+        runners = list(_runners)
+    for runner in runners:
+        runner.close()
+
+
+atexit.register(close_all)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지역 계층 클로저 테이블 + 맵 ID 접두사 지역 분류기
+
+1. 클로저 테이블: region_data.json의 parentId 사슬(victoria -> victoria-henesys)을 펼쳐
+   지역마다 조상/자손 집합을 미리 만들어 둡니다. 조상/자손 여부는 집합 조회 한 번이고,
+   지역 필터는 expand()로 하위 지역 전체를 한 번에 매칭할 수 있습니다.
+2. 접두사 분류기: map_data.json의 (맵 ID, regionId)로 숫자 트라이를 만들고, 접두사마다
+   가장 많은 지역이 --min-purity 이상이고 맵이 --min-support개 이상이면 그 접두사를 그 지역으로 정합니다.
+   부모 접두사와 결정이 같은 규칙은 버려서 "접두사 -> 지역" 규칙표가 작게 남습니다.
+   트라이 경로는 "자릿수:맵 ID"(예: 9:240010000)라서 메이플 아일랜드 같은 짧은 ID가 9자리 규칙에 걸리지 않습니다.
+   분류는 이미 있는 맵이면 그 regionId, 아니면 가장 긴 접두사 규칙 (맵 ID 길이만큼의 dict 조회).
+   region_data에 없는 regionId(예: ripa)는 학습에서 빼고 요약에 보고합니다.
+
+지역별 updater의 guess_<region>_region_id_from_map_id는 classify_map_region()을 먼저 보고,
+분류기가 모르는 접두사일 때만 기존처럼 도감 지역으로 둡니다.
+
+사용 예시:
+    python scripts/region_index.py                 # 규칙표/클로저 저장 + 홀드아웃 정확도
+    python scripts/region_index.py --classify 240010000 261020000 999000000
+    python scripts/region_index.py --subtree victoria
+
+    from region_index import classify_map_region, RegionClosure
+    classify_map_region("240010000", default="leafre")
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from utils import PROJECT_ROOT, get_data_path
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "region_index.json"
+MIN_SUPPORT_DEFAULT = 3
+MIN_PURITY_DEFAULT = 0.8
+HOLDOUT_BUCKETS = 5
+
+
+class RegionClosure:
+    """지역별 조상/자손 집합 (자기 자신 포함)"""
+
+    def __init__(self, regions: List[dict]):
+        self.parent: Dict[str, Optional[str]] = {r["id"]: r.get("parentId") for r in regions}
+        self.ancestors: Dict[str, Tuple[str, ...]] = {}
+        for region_id in self.parent:
+            chain, seen = [], set()
+            current: Optional[str] = region_id
+            while current is not None and current not in seen:
+                seen.add(current)
+                chain.append(current)
+                current = self.parent.get(current)
+            self.ancestors[region_id] = tuple(chain)          # 자기 자신 -> 루트 순서
+        descendants: Dict[str, set] = {region_id: set() for region_id in self.parent}
+        for region_id, chain in self.ancestors.items():
+            for ancestor in chain:
+                descendants.setdefault(ancestor, set()).add(region_id)
+        self.descendants: Dict[str, FrozenSet[str]] = {k: frozenset(v) for k, v in descendants.items()}
+        self._ancestor_sets = {k: frozenset(v) for k, v in self.ancestors.items()}
+
+    def __contains__(self, region_id: str) -> bool:
+        return region_id in self.parent
+
+    def is_ancestor(self, ancestor: str, region_id: str) -> bool:
+        """ancestor가 region_id 자신이거나 그 상위 지역인지"""
+        return ancestor in self._ancestor_sets.get(region_id, ())
+
+    def subtree(self, region_id: str) -> FrozenSet[str]:
+        return self.descendants.get(region_id, frozenset({region_id}))
+
+    def expand(self, region_ids: Iterable[str]) -> FrozenSet[str]:
+        """지역 필터 -> 하위 지역까지 포함한 집합"""
+        result: set = set()
+        for region_id in region_ids:
+            result |= self.subtree(region_id)
+        return frozenset(result)
+
+    def rows(self) -> List[Tuple[str, str, int]]:
+        """(조상, 자손, 깊이 차이) 클로저 테이블 행"""
+        return [(ancestor, region_id, depth)
+                for region_id, chain in sorted(self.ancestors.items())
+                for depth, ancestor in enumerate(chain)]
+
+
+class _TrieNode:
+    __slots__ = ("children", "counts")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.counts: Counter = Counter()
+
+
+def trie_key(map_id: str) -> str:
+    return f"{len(map_id)}:{map_id}"
+
+
+class MapRegionClassifier:
+    """맵 ID 접두사 -> 지역 규칙표 (가장 긴 접두사 우선, 키는 trie_key)"""
+
+    def __init__(self, rules: Dict[str, str], exact: Optional[Dict[str, str]] = None):
+        self.rules = rules
+        self.exact = exact or {}
+        self.max_prefix = max((len(p) for p in rules), default=0)
+
+    @classmethod
+    def learn(cls, pairs: Iterable[Tuple[str, str]], min_support: int = MIN_SUPPORT_DEFAULT,
+              min_purity: float = MIN_PURITY_DEFAULT) -> "MapRegionClassifier":
+        pairs = list(pairs)
+        root = _TrieNode()
+        for map_id, region_id in pairs:
+            node = root
+            node.counts[region_id] += 1
+            for digit in trie_key(map_id):
+                node = node.children.setdefault(digit, _TrieNode())
+                node.counts[region_id] += 1
+
+        rules: Dict[str, str] = {}
+        stack: List[Tuple[str, _TrieNode, Optional[str]]] = [("", root, None)]
+        while stack:
+            prefix, node, inherited = stack.pop()
+            decision = inherited
+            support = sum(node.counts.values())
+            if support >= min_support:
+                region_id, count = node.counts.most_common(1)[0]
+                if count / support >= min_purity:
+                    decision = region_id
+                elif prefix:
+                    decision = None      # 섞인 접두사는 상위 결정을 물려받지 않음
+            if decision != inherited and decision is not None:
+                rules[prefix] = decision
+            elif decision is None and inherited is not None:
+                rules[prefix] = ""       # 상위 규칙 끊기 (모름)
+            for digit, child in node.children.items():
+                stack.append((prefix + digit, child, decision))
+        return cls(rules, dict(pairs))
+
+    def classify(self, map_id: str, default: Optional[str] = None) -> Optional[str]:
+        if map_id in self.exact:
+            return self.exact[map_id]
+        key = trie_key(map_id)
+        for length in range(min(len(key), self.max_prefix), -1, -1):
+            region_id = self.rules.get(key[:length])
+            if region_id is not None:
+                return region_id or default
+        return default
+
+
+def load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def training_pairs(maps: List[dict], closure: RegionClosure) -> Tuple[List[Tuple[str, str]], Counter]:
+    """(맵 ID, regionId) 학습 쌍, region_data에 없는 regionId 개수"""
+    pairs, unknown = [], Counter()
+    for game_map in maps:
+        region_id = game_map.get("regionId")
+        if not region_id:
+            continue
+        if region_id not in closure:
+            unknown[region_id] += 1
+            continue
+        pairs.append((game_map["id"], region_id))
+    return pairs, unknown
+
+
+@lru_cache(maxsize=1)
+def default_classifier() -> MapRegionClassifier:
+    closure = RegionClosure(load_json(get_data_path("region_data.json"), []))
+    pairs, _ = training_pairs(load_json(get_data_path("map_data.json"), []), closure)
+    return MapRegionClassifier.learn(pairs)
+
+
+def classify_map_region(map_id: str, default: Optional[str] = None) -> Optional[str]:
+    """현재 map_data로 학습한 분류기로 맵 ID의 지역 추정 (모르면 default)"""
+    return default_classifier().classify(map_id, default)
+
+
+def holdout_accuracy(pairs: List[Tuple[str, str]], min_support: int, min_purity: float) -> Tuple[int, int, int]:
+    """맵 ID 해시로 1/HOLDOUT_BUCKETS를 떼어 규칙만으로 분류. (시험 수, 분류된 수, 맞은 수)"""
+    test = [p for p in pairs if zlib.crc32(p[0].encode()) % HOLDOUT_BUCKETS == 0]
+    train = [p for p in pairs if zlib.crc32(p[0].encode()) % HOLDOUT_BUCKETS != 0]
+    classifier = MapRegionClassifier.learn(train, min_support, min_purity)
+    classifier.exact = {}
+    predicted = [(classifier.classify(map_id), region_id) for map_id, region_id in test]
+    covered = [(p, r) for p, r in predicted if p]
+    return len(test), len(covered), sum(1 for p, r in covered if p == r)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지역 클로저 테이블 + 맵 ID 접두사 지역 분류기")
+    parser.add_argument("--min-support", type=int, default=MIN_SUPPORT_DEFAULT, help="규칙이 되려면 필요한 맵 수")
+    parser.add_argument("--min-purity", type=float, default=MIN_PURITY_DEFAULT, help="규칙이 되려면 필요한 최다 지역 비율")
+    parser.add_argument("--classify", nargs="+", metavar="MAP_ID", help="맵 ID 지역 분류만 출력")
+    parser.add_argument("--subtree", metavar="REGION_ID", help="지역의 하위 지역 목록만 출력")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    args = parser.parse_args()
+
+    closure = RegionClosure(load_json(get_data_path("region_data.json"), []))
+    if args.subtree:
+        print(" ".join(sorted(closure.subtree(args.subtree))))
+        return
+
+    pairs, unknown = training_pairs(load_json(get_data_path("map_data.json"), []), closure)
+    classifier = MapRegionClassifier.learn(pairs, args.min_support, args.min_purity)
+    if args.classify:
+        for map_id in args.classify:
+            print(f"  {map_id:<11} {classifier.classify(map_id) or '-'}")
+        return
+
+    tested, covered, correct = holdout_accuracy(pairs, args.min_support, args.min_purity)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "closure": [list(row) for row in closure.rows()],
+            "descendants": {k: sorted(v) for k, v in sorted(closure.descendants.items())},
+            "prefixRules": dict(sorted(classifier.rules.items())),
+            "settings": {"minSupport": args.min_support, "minPurity": args.min_purity},
+        }, f, ensure_ascii=False, indent=2)
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Regions: {len(closure.parent)} (closure rows: {len(closure.rows())})")
+    print(f"  - Training maps: {len(pairs)}; regionIds not in region_data: {dict(unknown) or '-'}")
+    print(f"  - Prefix rules: {len(classifier.rules)} (longest key {classifier.max_prefix} chars)")
+    if tested:
+        print(f"  - Holdout: {covered}/{tested} classified, {correct}/{covered or 1} correct "
+              f"({correct / (covered or 1):.1%})")
+    print(f"  - Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비슷한 몬스터 k-NN 인덱스 (스탯 벡터 + 드랍 MinHash)
+
+사람이 몰리는 몬스터 대신 잡을 만한 몬스터를 찾도록, 몬스터마다 가장 비슷한 k마리를 미리 계산해 둡니다.
+조회는 출력 파일에서 ID로 바로 찾기만 하면 됩니다.
+
+- 스탯 벡터: level, log(hp), log(exp), 물리/마법 방어력 (없는 값은 열 중앙값, 열마다 표준화)
+- 드랍 MinHash: 드랍 아이템 집합마다 해시 함수 --num-hashes개의 최솟값 서명 (uint32)
+  두 서명이 같은 칸 비율 = 자카드 유사도 추정. 관계가 늘어도 몬스터당 서명 크기는 그대로
+- 거리 = 스탯 유클리드 거리 / sqrt(차원) + --drop-weight x (1 - 자카드 추정)
+- 행 블록 단위로 (블록 x 전체) 거리 행렬을 만들어 argpartition으로 상위 k개를 고름 (메모리 상한 고정)
+- --level-window를 주면 레벨 차이가 그보다 큰 몬스터는 후보에서 제외
+
+numpy가 필요합니다. (pip install numpy)
+
+사용 예시:
+    python scripts/similar_monsters.py --k 10
+    python scripts/similar_monsters.py --k 5 --level-window 10 --drop-weight 1.0
+    python scripts/similar_monsters.py --show 7130500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from meso_economics import id_code
+from monster_analytics import MonsterColumns, np, require_numpy
+from utils import PROJECT_ROOT, get_data_path
+
+OUTPUT_DEFAULT = PROJECT_ROOT / "src" / "request" / "analytics" / "similar_monsters.json"
+MERSENNE_PRIME = (1 << 31) - 1
+NUM_HASHES_DEFAULT = 64
+BLOCK_ELEMENTS = 1 << 25     # 블록 하나의 (행 x 열 x 해시) 원소 상한
+
+
+def stat_features(cols: MonsterColumns) -> "np.ndarray":
+    """(n, 5) 표준화 스탯 벡터"""
+    raw = np.column_stack([
+        cols.level.astype(np.float64),
+        np.log1p(cols.hp),
+        np.log1p(cols.exp),
+        cols.stats["physicalDefense"],
+        cols.stats["magicDefense"],
+    ])
+    medians = np.nanmedian(raw, axis=0)
+    raw = np.where(np.isnan(raw), np.where(np.isnan(medians), 0.0, medians), raw)
+    std = raw.std(axis=0)
+    return (raw - raw.mean(axis=0)) / np.where(std == 0, 1.0, std)
+
+
+def minhash_signatures(ids: List[str], drops: Dict[str, set], num_hashes: int,
+                       seed: int = 0) -> "np.ndarray":
+    """(n, num_hashes) uint32 MinHash 서명. 드랍이 없는 몬스터는 전부 MERSENNE_PRIME"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, MERSENNE_PRIME, size=num_hashes, dtype=np.uint64)
+    b = rng.integers(0, MERSENNE_PRIME, size=num_hashes, dtype=np.uint64)
+
+    owners, codes = [], []
+    for i, mid in enumerate(ids):
+        for item_id in drops.get(mid, ()):
+            owners.append(i)
+            codes.append(id_code(item_id) % MERSENNE_PRIME)
+    signatures = np.full((len(ids), num_hashes), MERSENNE_PRIME, dtype=np.uint64)
+    if owners:
+        x = np.array(codes, dtype=np.uint64)[:, None]
+        hashed = (a[None, :] * x + b[None, :]) % np.uint64(MERSENNE_PRIME)
+        np.minimum.at(signatures, np.array(owners, dtype=np.int64), hashed)
+    return signatures.astype(np.uint32)
+
+
+def nearest(features: "np.ndarray", signatures: "np.ndarray", has_drops: "np.ndarray", level: "np.ndarray",
+            k: int, drop_weight: float, level_window: Optional[int]) -> "tuple[np.ndarray, np.ndarray]":
+    """몬스터별 상위 k 이웃 (인덱스, 거리). 후보가 k보다 적으면 -1 / inf로 채움"""
+    n, dims = features.shape
+    num_hashes = signatures.shape[1]
+    k = min(k, max(0, n - 1))
+    norms = (features ** 2).sum(axis=1)
+    block = max(1, BLOCK_ELEMENTS // max(1, n * num_hashes))
+    out_idx = np.full((n, k), -1, dtype=np.int64)
+    out_dist = np.full((n, k), np.inf, dtype=np.float64)
+    if k == 0:
+        return out_idx, out_dist
+
+    for start in range(0, n, block):
+        rows = slice(start, min(n, start + block))
+        sq = norms[rows, None] + norms[None, :] - 2.0 * features[rows] @ features.T
+        dist = np.sqrt(np.maximum(sq, 0.0)) / np.sqrt(dims)
+        jaccard = (signatures[rows, None, :] == signatures[None, :, :]).mean(axis=2)
+        jaccard = np.where(has_drops[rows, None] & has_drops[None, :], jaccard, 0.0)
+        dist += drop_weight * (1.0 - jaccard)
+        dist[np.arange(dist.shape[0]), np.arange(rows.start, rows.stop)] = np.inf
+        if level_window is not None:
+            dist[np.abs(level[rows, None] - level[None, :]) > level_window] = np.inf
+        part = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        part_dist = np.take_along_axis(dist, part, axis=1)
+        order = np.argsort(part_dist, axis=1, kind="stable")
+        idx = np.take_along_axis(part, order, axis=1)
+        d = np.take_along_axis(part_dist, order, axis=1)
+        out_idx[rows] = np.where(np.isinf(d), -1, idx)
+        out_dist[rows] = d
+    return out_idx, out_dist
+
+
+def load_json(path: Path, default):
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비슷한 몬스터 k-NN 인덱스 생성")
+    parser.add_argument("--k", type=int, default=10, help="몬스터당 이웃 수")
+    parser.add_argument("--num-hashes", type=int, default=NUM_HASHES_DEFAULT, help="MinHash 서명 길이")
+    parser.add_argument("--drop-weight", type=float, default=1.0, help="드랍 비유사도 가중치")
+    parser.add_argument("--level-window", type=int, default=None, help="레벨 차이가 이보다 큰 몬스터는 제외")
+    parser.add_argument("--seed", type=int, default=0, help="MinHash 해시 함수 시드")
+    parser.add_argument("--show", metavar="MONSTER_ID", help="저장된 인덱스에서 이 몬스터의 이웃 출력")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DEFAULT)
+    args = parser.parse_args()
+
+    if args.show:
+        index = load_json(args.output, {})
+        names = index.get("names", {})
+        for neighbour_id, distance in index.get("neighbours", {}).get(args.show, []):
+            print(f"  {neighbour_id:<9} {names.get(neighbour_id, ''):<16} {distance:.3f}")
+        return
+
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    started = time.perf_counter()
+    monsters = load_json(get_data_path("monster_data.json"), [])
+    cols = MonsterColumns.from_data(monsters, load_json(get_data_path("item_data.json"), []))
+    drops: Dict[str, set] = defaultdict(set)
+    for r in load_json(get_data_path("monster_item_relations.json"), []):
+        drops[r["monsterId"]].add(r["itemId"])
+
+    features = stat_features(cols)
+    signatures = minhash_signatures(cols.ids, drops, args.num_hashes, args.seed)
+    has_drops = np.array([bool(drops.get(mid)) for mid in cols.ids], dtype=bool)
+    prepared = time.perf_counter()
+    idx, dist = nearest(features, signatures, has_drops, cols.level.astype(np.int64), args.k,
+                        args.drop_weight, args.level_window)
+    searched = time.perf_counter()
+
+    neighbours = {
+        mid: [[cols.ids[j], round(float(d), 3)] for j, d in zip(idx[i], dist[i]) if j >= 0]
+        for i, mid in enumerate(cols.ids)
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "settings": {"k": args.k, "numHashes": args.num_hashes, "dropWeight": args.drop_weight,
+                         "levelWindow": args.level_window, "seed": args.seed},
+            "names": dict(zip(cols.ids, cols.names)),
+            "neighbours": neighbours,
+        }, f, ensure_ascii=False, separators=(",", ":"))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Monsters: {len(cols)} (with drops: {int(has_drops.sum())})")
+    print(f"  - Features: {features.shape[1]} stats + {args.num_hashes} MinHash, {(prepared - started) * 1000:.1f}ms")
+    print(f"  - Top-{args.k} search: {(searched - prepared) * 1000:.1f}ms")
+    print(f"  - Output: {args.output} ({args.output.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
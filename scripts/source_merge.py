@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 출처(maplenote, mapledb.kr)의 몬스터 필드를 우선순위 규칙으로 병합하는 엔진
+
+- 필드마다 출처 우선순위를 설정 (DEFAULT_FIELD_PRIORITY, JSON 파일로 재정의 가능)
+- 출처 간 값이 다르면 충돌(FieldConflict)로 기록
+- Monster 타입에 없는 필드(예: mapledb의 회피율 stats.evasion)는 버리지 않고
+  side store(src/data/meta/source_fields.json)에 출처별로 보관
+
+필드 이름은 monster_data.json 기준 경로입니다 (예: "hp", "stats.physicalDefense").
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from provenance import SOURCE_MAPLEDB, SOURCE_MAPLENOTE
+from utils import get_data_path
+
+SOURCE_FIELDS_FILE = get_data_path("meta/source_fields.json")
+
+# src/types/monster.ts에 정의된 필드 (이 외의 필드는 side store로 보냄)
+MONSTER_SCHEMA_FIELDS = {
+    "level",
+    "hp",
+    "exp",
+    "stats.mp",
+    "stats.knockbackDamage",
+    "stats.physicalDamage",
+    "stats.magicDamage",
+    "stats.physicalDefense",
+    "stats.magicDefense",
+    "stats.speed",
+    "stats.requiredAccuracy",
+    "stats.mesos",
+}
+
+# 필드별 출처 우선순위. "*"는 기본값.
+# maplenote STATS의 HP/MP는 "14.5K"처럼 반올림 표기라 정확한 정수를 주는 mapledb를 먼저 봅니다.
+DEFAULT_FIELD_PRIORITY: Dict[str, List[str]] = {
+    "*": [SOURCE_MAPLENOTE, SOURCE_MAPLEDB],
+    "hp": [SOURCE_MAPLEDB, SOURCE_MAPLENOTE],
+    "stats.mp": [SOURCE_MAPLEDB, SOURCE_MAPLENOTE],
+}
+
+
+def normalize_maplenote(stats: Optional[dict]) -> Dict[str, object]:
+    """maplenote STATS 섹션 파싱 결과(parse_stats_section) -> 필드 경로 dict"""
+    if not stats:
+        return {}
+    result: Dict[str, object] = {}
+    for key, value in stats.items():
+        if key in ("level", "hp", "exp"):
+            result[key] = value
+        else:
+            result[f"stats.{key}"] = value
+    return result
+
+
+def normalize_mapledb(parsed: Optional[dict]) -> Dict[str, object]:
+    """mapledb.kr 파싱 결과(update_monsters_from_mapledb.parse_monster_detail_html) -> 필드 경로 dict"""
+    if not parsed:
+        return {}
+    result: Dict[str, object] = {}
+    for key in ("level", "exp", "hp"):
+        if key in parsed:
+            result[key] = parsed[key]
+    if "mp" in parsed:
+        result["stats.mp"] = parsed["mp"]
+    for key, value in (parsed.get("stats") or {}).items():
+        result[f"stats.{key}"] = value
+    return result
+
+
+def get_field(monster: dict, path: str):
+    node = monster
+    for part in path.split("."):
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    return node
+
+
+def set_field(monster: dict, path: str, value) -> None:
+    parts = path.split(".")
+    node = monster
+    for part in parts[:-1]:
+        node = node.setdefault(part, {})
+    node[parts[-1]] = value
+
+
+def values_equal(a, b, rel_tol: float) -> bool:
+    """숫자는 상대 오차(rel_tol) 이내면 같은 값으로 봅니다. (K 표기 반올림 차이 흡수)"""
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return math.isclose(float(a), float(b), rel_tol=rel_tol, abs_tol=1e-9)
+    return a == b
+
+
+@dataclass
+class FieldConflict:
+    monster_id: str
+    field: str
+    values: Dict[str, object]
+    chosen_source: str
+    chosen: object
+
+    def to_dict(self) -> dict:
+        return {
+            "monsterId": self.monster_id,
+            "field": self.field,
+            "values": self.values,
+            "chosenSource": self.chosen_source,
+            "chosen": self.chosen,
+        }
+
+
+@dataclass
+class MergeResult:
+    monster_id: str
+    resolved: Dict[str, object] = field(default_factory=dict)
+    chosen_sources: Dict[str, str] = field(default_factory=dict)
+    conflicts: List[FieldConflict] = field(default_factory=list)
+    extras: Dict[str, Dict[str, object]] = field(default_factory=dict)  # source -> {field: value}
+
+
+class MergeEngine:
+    """필드별 우선순위 기반 병합기"""
+
+    def __init__(
+        self,
+        priorities: Optional[Dict[str, List[str]]] = None,
+        schema_fields=MONSTER_SCHEMA_FIELDS,
+        rel_tol: float = 0.01,
+    ):
+        self.priorities = {**DEFAULT_FIELD_PRIORITY, **(priorities or {})}
+        self.schema_fields = set(schema_fields)
+        self.rel_tol = rel_tol
+
+    def priority_for(self, field_path: str) -> List[str]:
+        return self.priorities.get(field_path) or self.priorities["*"]
+
+    def merge(self, monster_id: str, by_source: Dict[str, Dict[str, object]]) -> MergeResult:
+        """by_source: {source: {field_path: value}}"""
+        result = MergeResult(monster_id=monster_id)
+        all_fields = sorted({f for values in by_source.values() for f in values})
+
+        for field_path in all_fields:
+            present = {src: values[field_path] for src, values in by_source.items() if field_path in values}
+
+            if field_path not in self.schema_fields:
+                for src, value in present.items():
+                    result.extras.setdefault(src, {})[field_path] = value
+                continue
+
+            order = self.priority_for(field_path)
+            ranked = [src for src in order if src in present] + sorted(src for src in present if src not in order)
+            chosen_source = ranked[0]
+            chosen = present[chosen_source]
+            result.resolved[field_path] = chosen
+            result.chosen_sources[field_path] = chosen_source
+
+            if any(not values_equal(chosen, v, self.rel_tol) for v in present.values()):
+                result.conflicts.append(FieldConflict(monster_id, field_path, present, chosen_source, chosen))
+
+        return result
+
+
+def apply_resolved(monster: dict, resolved: Dict[str, object]) -> List[Tuple[str, object, object]]:
+    """병합 결과를 몬스터에 반영하고 (필드, 이전 값, 새 값) 변경 목록을 반환합니다."""
+    changes = []
+    for field_path, value in resolved.items():
+        old = get_field(monster, field_path)
+        if old != value:
+            set_field(monster, field_path, value)
+            changes.append((field_path, old, value))
+    return changes
+
+
+def load_priorities(path: Optional[Path]) -> Dict[str, List[str]]:
+    """우선순위 재정의 JSON 로드 (예: {"exp": ["mapledb", "maplenote"]})"""
+    if path is None:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class SourceFieldStore:
+    """스키마 밖 출처 전용 필드 side store ({monsterId: {source: {field: value}}})"""
+
+    def __init__(self, path: Path = SOURCE_FIELDS_FILE):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Dict[str, object]]] = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def update(self, monster_id: str, extras: Dict[str, Dict[str, object]]) -> None:
+        for source, values in extras.items():
+            self.entries.setdefault(monster_id, {}).setdefault(source, {}).update(values)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(self.entries.items())), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+maplenote / mapledb.kr 대역 로컬 HTTP 서버 (asyncio, 오프라인 처리량 벤치마크용)
+
+실제 사이트에 요청하지 않고 수집기(fetcher.Fetcher, 지역별 스크립트, browser_pool)를 부하 테스트할 수 있도록
+다음 경로를 로컬에서 응답합니다.
+- /monsternote?foundAt=<id>
+- /monster_detail/<id>, /map_detail/<id>, /item_detail/<id>
+- /search.php?q=<id>&t=mob (mapledb.kr)
+
+응답은 HTML 아카이브(html_archive, --archive)에 저장된 페이지를 우선 사용하고,
+없으면 src/data의 몬스터/맵/아이템/드랍 데이터로 각 파서가 읽을 수 있는 형태의 합성 페이지를 만듭니다.
+--latency/--jitter로 응답 지연, --error-rate로 500 응답, --rate-limit으로 초당 요청 제한(429 + Retry-After)을 흉내냅니다.
+
+수집기 쪽은 MAPLE_SITE_OVERRIDE 환경변수로 요청을 이 서버로 돌립니다. (fetcher.rewrite_url)
+
+사용 예시:
+    python scripts/standin_server.py --port 8800 --latency 0.05 --error-rate 0.02 --rate-limit 50
+    MAPLE_SITE_OVERRIDE=http://127.0.0.1:8800 python scripts/parse/crawl_map_details.py --all --skip-save-html
+    curl http://127.0.0.1:8800/__stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import html as html_lib
+import json
+import random
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from crawl_frontier import BASE_URL
+from html_archive import DEFAULT_ARCHIVE, ArchiveReader
+from utils import get_data_path
+
+MAPLEDB_BASE_URL = "https://mapledb.kr"
+
+# monsternote?foundAt= -> 합성 목록 페이지에 넣을 regionIds 접두어 (지역별 스크립트 기준)
+FOUND_AT_REGIONS: Dict[str, Tuple[str, ...]] = {
+    "10": ("victoria",),
+    "2000": ("orbis",),
+    "2110": ("orbis",),
+    "2200": ("ludibrium",),
+    "2210": ("ludus-lake-earth-defense-hq",),
+    "2220": ("ludus-lake-underground-town",),
+    "2300": ("aqua-road",),
+    "2400": ("leafre",),
+    "25": ("mu-lung",),
+    "2600": ("nihan-ariant", "nihan-desert"),
+    "2610": ("nihan-magatia",),
+    "6000": ("masteria-newleafcity",),
+    "6100": ("masteria-crimsonwood",),
+}
+
+DETAIL_PATH = re.compile(r"^/(monster_detail|map_detail|item_detail)/(\d+)/?$")
+
+STATUS_TEXT = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error"}
+
+
+def _esc(value) -> str:
+    return html_lib.escape(str(value))
+
+
+# item_data.json majorCategory -> 사이트 대분류 표기 (parse_item_detail의 역매핑)
+ITEM_MAJOR_LABELS = {"consumable": "소비", "weapon": "무기"}
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>메이플노트 클래식 - {_esc(title)}</title></head><body>{body}</body></html>"
+    )
+
+
+def _k(value) -> str:
+    """maplenote 표기 (10000 이상은 K 단위)"""
+    value = float(value or 0)
+    return f"{value / 1000:.1f}K" if value >= 10000 else str(int(value))
+
+
+class SyntheticSite:
+    """src/data 기반 합성 페이지"""
+
+    def __init__(self):
+        def load(name):
+            path = get_data_path(name)
+            if not path.exists():
+                return []
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        self.monsters = {m["id"]: m for m in load("monster_data.json")}
+        self.maps = {m["id"]: m for m in load("map_data.json")}
+        self.items = {i["id"]: i for i in load("item_data.json")}
+        self.drops: Dict[str, List[dict]] = {}
+        for rel in load("monster_item_relations.json"):
+            self.drops.setdefault(rel["monsterId"], []).append(rel)
+        self.spawn_maps: Dict[str, List[str]] = {}
+        for game_map in self.maps.values():
+            for mid in game_map.get("monsterIds") or []:
+                self.spawn_maps.setdefault(mid, []).append(game_map["id"])
+
+    def monster_list(self, found_at: str) -> Optional[str]:
+        prefixes = FOUND_AT_REGIONS.get(found_at)
+        if prefixes is None:
+            return None
+        links = "".join(
+            f'<a href="/monster_detail/{m["id"]}"><h3>{_esc(m["name"])}</h3><span>Lv.{m.get("level", 0)}</span></a>'
+            for m in self.monsters.values()
+            if any(r.startswith(p) for r in m.get("regionIds") or [] for p in prefixes)
+        )
+        return _page("몬스터 도감", f"<h1>몬스터 도감</h1><div class=\"list\">{links}</div>")
+
+    def monster_detail(self, monster_id: str) -> Optional[str]:
+        m = self.monsters.get(monster_id)
+        if m is None:
+            return None
+        stats = m.get("stats") or {}
+        spans = [
+            f'<span class="hp-box">HP : {_k(m.get("hp"))}</span>',
+            f'<span class="mp-box">MP : {_k(stats.get("mp"))}</span>',
+            f'<span class="exp-box">EXP : {_k(m.get("exp"))}</span>',
+        ]
+        labels = [
+            ("knockbackDamage", "넉백 가능 데미지"), ("physicalDamage", "물리 데미지"), ("magicDamage", "마법 데미지"),
+            ("physicalDefense", "물리 방어력"), ("magicDefense", "마법 방어력"), ("speed", "속도"), ("mesos", "메소"),
+        ]
+        for key, label in labels:
+            if key in stats:
+                spans.append(f'<span class="acc">{label} : {_esc(stats[key])}</span>')
+        if "requiredAccuracy" in stats:
+            spans.append(f'<span class="acc">{m.get("level", 0)}레벨 에서의 필요 명중 : {stats["requiredAccuracy"]}</span>')
+        spawn = "".join(
+            f'<a href="/map_detail/{map_id}"><h3>{_esc(self.maps[map_id].get("name", ""))}</h3></a>'
+            for map_id in self.spawn_maps.get(monster_id, [])
+        )
+        drops = "".join(
+            f'<a href="/item_detail/{rel["itemId"]}"><span>{_esc(self.items.get(rel["itemId"], {}).get("name", ""))}</span>'
+            f'<div class="drop-rate-box">{rel.get("dropRate", "")}</div></a>'
+            for rel in self.drops.get(monster_id, [])
+        )
+        body = (
+            f"<h1>{_esc(m['name'])}</h1><h2>STATS</h2>{''.join(spans)}"
+            f"<h2>SPAWN</h2>{spawn}<h2>GET</h2>{drops}"
+        )
+        return _page(m["name"], body)
+
+    def map_detail(self, map_id: str) -> Optional[str]:
+        game_map = self.maps.get(map_id)
+        if game_map is None:
+            return None
+        spawns = game_map.get("monsterSpawns") or {}
+        monsters = "".join(
+            f'<a href="/monster_detail/{mid}"><h3>{_esc(self.monsters.get(mid, {}).get("name", ""))}</h3>'
+            + (f"<span>{spawns[mid]}마리</span>" if mid in spawns else "") + "</a>"
+            for mid in game_map.get("monsterIds") or []
+        )
+        portals = "".join(
+            f'<a href="/map_detail/{pid}"><h3>{_esc(self.maps.get(pid, {}).get("name", ""))}</h3></a>'
+            for pid in game_map.get("portalMapIds") or []
+        )
+        body = f"<h1>{_esc(game_map['name'])}</h1><h2>MONSTER</h2>{monsters}"
+        if portals:
+            body += f"<h2>PORTAL</h2>{portals}"
+        return _page(game_map["name"], body)
+
+    def item_detail(self, item_id: str) -> Optional[str]:
+        item = self.items.get(item_id)
+        if item is None:
+            return None
+        droppers = "".join(
+            f'<a href="/monster_detail/{mid}"><h3>{_esc(m["name"])}</h3></a>'
+            for mid, m in self.monsters.items()
+            if item_id in (m.get("dropItemIds") or [])
+        )
+        major = ITEM_MAJOR_LABELS.get(item.get("majorCategory"), "장비")
+        category = (f'<div class="item-category">대분류: {major}<br>'
+                    f'중분류: {_esc(item.get("mediumCategory") or "")}</div>')
+        return _page(item["name"], f"<h1>{_esc(item['name'])}</h1><h2>CATEGORY</h2>{category}<h2>DROP</h2>{droppers}")
+
+    def mapledb_monster(self, monster_id: str) -> Optional[str]:
+        m = self.monsters.get(monster_id)
+        if m is None:
+            return None
+        stats = m.get("stats") or {}
+        rows = [("LEVEL", m.get("level")), ("EXP", m.get("exp")), ("HP", m.get("hp")), ("MP", stats.get("mp")),
+                ("물리 방어력", stats.get("physicalDefense")), ("마법 방어력", stats.get("magicDefense")),
+                ("필요 명중률", stats.get("requiredAccuracy"))]
+        body = "".join(f"<div><h4>{label}</h4><span>{int(value)}</span></div>" for label, value in rows if value is not None)
+        return _page(m["name"], f"<h1>{_esc(m['name'])}</h1>{body}")
+
+
+class TokenBucket:
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class StandInServer:
+    def __init__(
+        self,
+        archive: Optional[ArchiveReader] = None,
+        synthetic: bool = True,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.archive = archive
+        self.site = SyntheticSite() if synthetic else None
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.bucket = TokenBucket(rate_limit)
+        self.rng = random.Random(seed)
+        self.counts: Counter = Counter()
+
+    def resolve(self, target: str) -> Optional[Tuple[bytes, str]]:
+        """요청 경로 -> (본문, 출처). 없으면 None"""
+        parts = urlsplit(target)
+        query = parse_qs(parts.query)
+        if parts.path == "/search.php":
+            canonical = f"{MAPLEDB_BASE_URL}{target}"
+            key = (query.get("q") or [""])[0]
+            make = (lambda: self.site.mapledb_monster(key)) if (query.get("t") or [""])[0] == "mob" else None
+        elif parts.path.rstrip("/") == "/monsternote":
+            canonical = f"{BASE_URL}{target}"
+            key = (query.get("foundAt") or [""])[0]
+            make = lambda: self.site.monster_list(key)
+        else:
+            m = DETAIL_PATH.match(parts.path)
+            if not m:
+                return None
+            canonical = f"{BASE_URL}/{m.group(1)}/{m.group(2)}"
+            make = lambda: getattr(self.site, m.group(1))(m.group(2))
+
+        if self.archive is not None:
+            body = self.archive.get(canonical)
+            if body is not None:
+                return body, "archive"
+        if self.site is not None and make is not None:
+            text = make()
+            if text is not None:
+                return text.encode("utf-8"), "synthetic"
+        return None
+
+    async def respond(self, target: str) -> Tuple[int, bytes, Dict[str, str]]:
+        if target.startswith("/__stats"):
+            return 200, json.dumps(dict(self.counts)).encode("utf-8"), {"Content-Type": "application/json"}
+        if not self.bucket.take():
+            self.counts["429"] += 1
+            return 429, b"rate limited", {"Retry-After": "1"}
+        delay = self.latency + (self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.counts["500"] += 1
+            return 500, b"injected error", {}
+        found = self.resolve(target)
+        if found is None:
+            self.counts["404"] += 1
+            return 404, b"not found", {}
+        body, origin = found
+        self.counts["200"] += 1
+        self.counts[origin] += 1
+        return 200, body, {"Content-Type": "text/html; charset=utf-8"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                status, body, extra = await self.respond(target)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                head = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}", f"Content-Length: {len(body)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head += [f"{k}: {v}" for k, v in extra.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+                if method != "HEAD":
+                    writer.write(body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Stand-in server on http://{host}:{port} "
+              f"(archive {'on' if self.archive else 'off'}, synthetic {'on' if self.site else 'off'})")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="maplenote/mapledb.kr 대역 로컬 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--archive", type=Path, default=None, help=f"HTML 아카이브 (예: {DEFAULT_ARCHIVE})")
+    parser.add_argument("--no-synthetic", action="store_true", help="아카이브에 없는 페이지는 404")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 편차 (초, 균등 분포)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="초당 허용 요청 수 (초과 시 429, 0이면 무제한)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        archive=ArchiveReader(args.archive) if args.archive else None,
+        synthetic=not args.no_synthetic,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
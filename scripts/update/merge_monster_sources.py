@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+maplenote(monster_detail)와 mapledb.kr을 동시에 수집해 필드별 우선순위로 몬스터 데이터를 병합합니다.
+
+- 두 출처의 모든 요청을 한 번에 동시 수집 (fetcher.Fetcher)
+- 필드별 우선순위 병합 (source_merge.MergeEngine), 출처 간 불일치는 충돌 리포트로 저장
+- 스키마에 없는 필드(예: 회피율)는 src/data/meta/source_fields.json에 보관
+- 대상 미지정 시 stats가 없는 출시 몬스터(상세 페이지가 없던 몬스터 포함)를 한 번에 채움
+
+사용 예시:
+    python scripts/update/merge_monster_sources.py                       # stats 없는 몬스터 일괄 보충
+    python scripts/update/merge_monster_sources.py --monster-ids 9420005,9420006
+    python scripts/update/merge_monster_sources.py --all --workers 12 --priorities priorities.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+# scripts/ 공통 모듈 및 parse/ 스크립트 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "parse"))
+import update_monsters_from_mapledb as mapledb_site
+from changelog import save_with_history
+from crawl_metrics import METRICS_DIR_DEFAULT, CrawlMetrics
+from fetcher import Fetcher, choose_decode
+from provenance import SOURCE_MAPLEDB, SOURCE_MAPLENOTE, ProvenanceTable, monster_group_payloads
+from source_merge import (
+    MergeEngine,
+    SourceFieldStore,
+    apply_resolved,
+    load_priorities,
+    normalize_mapledb,
+    normalize_maplenote,
+)
+from update_crimsonwood_monsters_from_site import load_json, parse_stats_section
+from utils import PROJECT_ROOT, get_data_path
+
+MAPLENOTE_URL_TEMPLATE = "https://xn--o80b01o9mlw3kdzc.com/monster_detail/{monster_id}"
+MAPLEDB_URL_TEMPLATE = mapledb_site.DETAIL_URL_TEMPLATE
+REPORT_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "merge_reports"
+SCRAPED_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "scraped_monsters"
+
+SOURCE_URL_TEMPLATES = {
+    SOURCE_MAPLENOTE: MAPLENOTE_URL_TEMPLATE,
+    SOURCE_MAPLEDB: MAPLEDB_URL_TEMPLATE,
+}
+
+
+def parse_source(source: str, html_text: str, monster_id: str) -> Dict[str, object]:
+    if source == SOURCE_MAPLENOTE:
+        return normalize_maplenote(parse_stats_section(html_text))
+    return normalize_mapledb(mapledb_site.parse_monster_detail_html(html_text, monster_id))
+
+
+def select_targets(monsters: List[dict], args) -> List[str]:
+    if args.monster_ids:
+        return [mid.strip() for mid in args.monster_ids.split(",") if mid.strip()]
+    released = [m for m in monsters if m.get("isReleased", False)]
+    if args.all:
+        return [m["id"] for m in released]
+    return [m["id"] for m in released if not m.get("stats")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="maplenote + mapledb.kr 몬스터 데이터 병합")
+    parser.add_argument("--monster-ids", type=str, default=None, help="쉼표로 구분된 몬스터 ID 목록")
+    parser.add_argument("--all", action="store_true", help="출시된 모든 몬스터 대상")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--interval", type=float, default=0.5, help="호스트별 최소 요청 간격 (초)")
+    parser.add_argument("--priorities", type=Path, default=None, help="필드 우선순위 재정의 JSON")
+    parser.add_argument("--rel-tol", type=float, default=0.01, help="숫자 값 일치 판정 상대 오차")
+    parser.add_argument("--report-dir", type=Path, default=REPORT_DIR_DEFAULT)
+    parser.add_argument("--output-dir", type=Path, default=SCRAPED_DIR_DEFAULT)
+    parser.add_argument("--skip-save-html", action="store_true")
+    parser.add_argument("--dry-run", action="store_true", help="데이터 파일은 저장하지 않고 리포트만 생성")
+    parser.add_argument("--metrics-dir", type=Path, default=METRICS_DIR_DEFAULT, help="트레이스/.prom 저장 위치")
+    args = parser.parse_args()
+
+    monster_file = get_data_path("monster_data.json")
+    monsters = load_json(monster_file, [])
+    monsters_by_id = {m["id"]: m for m in monsters}
+    targets = [mid for mid in select_targets(monsters, args) if mid in monsters_by_id]
+    if not targets:
+        print("No target monsters.")
+        return
+
+    url_to_job = {}
+    for mid in targets:
+        for source, template in SOURCE_URL_TEMPLATES.items():
+            url_to_job[template.format(monster_id=mid)] = (source, mid)
+    print(f"Fetching {len(url_to_job)} pages for {len(targets)} monsters "
+          f"({args.workers} workers, {args.interval}s/host)...")
+
+    by_monster: Dict[str, Dict[str, Dict[str, object]]] = {mid: {} for mid in targets}
+    fetched_at: Dict[tuple, datetime] = {}
+    fetch_errors = 0
+    metrics = CrawlMetrics("merge_monster_sources", metrics_dir=args.metrics_dir)
+    fetcher = Fetcher(workers=args.workers, per_host_interval=args.interval, on_result=metrics.on_fetch)
+    for done, result in enumerate(fetcher.fetch_many(url_to_job), 1):
+        source, mid = url_to_job[result.url]
+        if not result.ok:
+            fetch_errors += 1
+            print(f"  [{done}/{len(url_to_job)}] {source:<9} {mid}: {result.error}")
+            continue
+        if not args.skip_save_html:
+            with metrics.stage("save", kind="html"):
+                out_dir = args.output_dir / ("merge" if source == SOURCE_MAPLENOTE else "mapledb")
+                out_dir.mkdir(parents=True, exist_ok=True)
+                (out_dir / f"monster_{mid}.html").write_bytes(result.body)
+        with metrics.stage("decode"):
+            html_text = choose_decode(result.body)
+        with metrics.stage("parse", source=source):
+            values = parse_source(source, html_text, mid)
+        if values:
+            by_monster[mid][source] = values
+            fetched_at[(source, mid)] = datetime.now(timezone.utc)
+        print(f"  [{done}/{len(url_to_job)}] {source:<9} {mid}: {len(values)} fields ({result.elapsed:.2f}s)")
+
+    engine = MergeEngine(priorities=load_priorities(args.priorities), rel_tol=args.rel_tol)
+    side_store = SourceFieldStore()
+    provenance = ProvenanceTable()
+    conflicts = []
+    changed_monsters = 0
+    no_data = []
+
+    for mid in targets:
+        sources = by_monster[mid]
+        if not sources:
+            no_data.append(mid)
+            continue
+        with metrics.stage("merge"):
+            merged = engine.merge(mid, sources)
+            changes = apply_resolved(monsters_by_id[mid], merged.resolved)
+        if changes:
+            changed_monsters += 1
+            print(f"  {mid} {monsters_by_id[mid].get('name')}: "
+                  + ", ".join(f"{f} {old}->{new} ({merged.chosen_sources[f]})" for f, old, new in changes))
+        conflicts.extend(c.to_dict() for c in merged.conflicts)
+        side_store.update(mid, merged.extras)
+        for source, values in sources.items():
+            flat = {path.split(".")[-1]: value for path, value in values.items()}
+            for group, payload in monster_group_payloads(flat).items():
+                provenance.record("monster", mid, group, source, payload, fetched_at=fetched_at[(source, mid)])
+
+    args.report_dir.mkdir(parents=True, exist_ok=True)
+    report_file = args.report_dir / f"monster_merge_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.json"
+    with open(report_file, "w", encoding="utf-8") as f:
+        json.dump({
+            "priorities": engine.priorities,
+            "targets": len(targets),
+            "changedMonsters": changed_monsters,
+            "noData": no_data,
+            "conflicts": conflicts,
+        }, f, ensure_ascii=False, indent=2)
+
+    if not args.dry_run:
+        with metrics.stage("save"):
+            save_with_history("monster_data.json", monsters, tag="merge-monster-sources", source="merge_monster_sources")
+            side_store.save()
+            provenance.save()
+    metrics.count("monsters_changed", changed_monsters)
+    metrics.count("conflicts", len(conflicts))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Targets: {len(targets)} (fetch errors {fetch_errors}, no data {len(no_data)})")
+    print(f"  - Monsters changed: {changed_monsters}{' (dry run, not saved)' if args.dry_run else ''}")
+    print(f"  - Conflicts: {len(conflicts)}")
+    print(f"  - Report: {report_file}")
+    print(f"  - Source-only fields: {side_store.path}")
+    metrics.finish()
+
+
+if __name__ == "__main__":
+    main()
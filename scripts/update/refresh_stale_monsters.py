@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+provenance(src/data/meta/provenance.json) 기준으로 오래된 몬스터만 골라 maplenote에서 다시 수집합니다.
+
+- 필드 그룹(core/stats/drops/spawns)별 TTL이 지난 몬스터 중 조회수가 많은 순서로 --budget개만 요청
+- monster_detail 페이지 파싱은 지역별 업데이트 스크립트(update_crimsonwood_monsters_from_site.py)와 동일
+- 변경된 데이터는 changelog(save_with_history)로 저장, 수집 기록은 provenance에 남깁니다
+
+사용 예시:
+    python scripts/update/refresh_stale_monsters.py --budget 30 --views src/request/monster_views.json
+    python scripts/update/refresh_stale_monsters.py --budget 100 --ttl-days drops=7 --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+# scripts/ 공통 모듈 및 parse/ 스크립트 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "parse"))
+from changelog import save_with_history
+from provenance import (
+    DEFAULT_TTL_DAYS,
+    SOURCE_MAPLENOTE,
+    ProvenanceTable,
+    load_views,
+    monster_group_payloads,
+    plan_refresh,
+)
+from update_crimsonwood_monsters_from_site import (
+    choose_decode,
+    fetch_bytes,
+    load_json,
+    merge_monster_item_relations,
+    merge_monster_stats,
+    parse_monster_detail_html,
+    sort_key_id,
+)
+from utils import PROJECT_ROOT, get_data_path
+
+DETAIL_URL_TEMPLATE = "https://xn--o80b01o9mlw3kdzc.com/monster_detail/{monster_id}"
+SCRAPED_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "scraped_monsters" / "refresh"
+
+
+def parse_ttl_overrides(values: List[str]) -> Dict[str, float]:
+    """--ttl-days group=days 인자 파싱"""
+    ttl = dict(DEFAULT_TTL_DAYS)
+    for value in values:
+        group, _, days = value.partition("=")
+        if group not in ttl or not days:
+            raise ValueError(f"Invalid --ttl-days value: {value} (groups: {', '.join(ttl)})")
+        ttl[group] = float(days)
+    return ttl
+
+
+def merge_spawn_map_ids(maps: List[dict], monster_id: str, spawn_map_ids: List[str]) -> tuple[int, List[str]]:
+    """
+    이미 map_data.json에 있는 맵의 monsterIds만 갱신합니다.
+    (새 맵의 regionId 추정은 지역별 스크립트의 몫이므로 여기서는 목록만 반환)
+    """
+    maps_by_id = {m["id"]: m for m in maps}
+    updated = 0
+    unknown: List[str] = []
+    for map_id in spawn_map_ids:
+        m = maps_by_id.get(map_id)
+        if m is None:
+            unknown.append(map_id)
+            continue
+        monster_ids = m.get("monsterIds") or []
+        if monster_id not in monster_ids:
+            m["monsterIds"] = sorted(set(monster_ids) | {monster_id}, key=sort_key_id)
+            updated += 1
+    return updated, unknown
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오래된 몬스터 데이터만 선택적으로 재수집")
+    parser.add_argument("--budget", type=int, default=30, help="이번 실행에서 보낼 최대 요청 수")
+    parser.add_argument("--views", type=Path, default=None, help='조회수 JSON ({"몬스터ID": 조회수})')
+    parser.add_argument("--ttl-days", action="append", default=[], help="필드 그룹 TTL 재정의 (예: drops=7)")
+    parser.add_argument("--delay", type=float, default=2.0)
+    parser.add_argument("--output-dir", type=Path, default=SCRAPED_DIR_DEFAULT)
+    parser.add_argument("--skip-save-html", action="store_true")
+    parser.add_argument("--dry-run", action="store_true", help="대상만 출력하고 요청하지 않음")
+    args = parser.parse_args()
+
+    ttl_days = parse_ttl_overrides(args.ttl_days)
+    monsters = load_json(get_data_path("monster_data.json"), [])
+    relations = load_json(get_data_path("monster_item_relations.json"), [])
+    maps = load_json(get_data_path("map_data.json"), [])
+    table = ProvenanceTable()
+    views = load_views(args.views)
+
+    candidates = plan_refresh(
+        table,
+        "monster",
+        [m["id"] for m in monsters if m.get("isReleased", False)],
+        budget=args.budget,
+        views=views,
+        ttl_days=ttl_days,
+    )
+    print(f"Refresh candidates: {len(candidates)} (budget {args.budget})")
+    for c in candidates:
+        staleness = "never" if c.staleness >= 10 else f"{c.staleness:.2f}"
+        print(f"  {c.entity_id:<10} score {c.score:7.2f}  staleness {staleness:<6} views {c.views:<6} stale: {','.join(c.stale_groups)}")
+    if args.dry_run or not candidates:
+        return
+
+    stats_updated = 0
+    rel_added = 0
+    rel_updated = 0
+    maps_updated = 0
+    changed_groups = 0
+    errors = 0
+    unknown_maps: Dict[str, List[str]] = {}
+
+    for i, c in enumerate(candidates, 1):
+        mid = c.entity_id
+        url = DETAIL_URL_TEMPLATE.format(monster_id=mid)
+        print(f"\n[{i}/{len(candidates)}] Fetching {mid}: {url}")
+        try:
+            raw = fetch_bytes(url)
+        except Exception as e:
+            print(f"  Error: {e}")
+            errors += 1
+            continue
+        fetched_at = datetime.now(timezone.utc)
+
+        if not args.skip_save_html:
+            args.output_dir.mkdir(parents=True, exist_ok=True)
+            (args.output_dir / f"monster_{mid}.html").write_bytes(raw)
+
+        parsed = parse_monster_detail_html(choose_decode(raw), monster_id=mid)
+        spawn_map_ids = [m[0] for m in parsed.spawn_maps]
+
+        monsters, updated = merge_monster_stats(monsters, mid, parsed.stats)
+        stats_updated += updated
+        relations, added, updated_rel = merge_monster_item_relations(relations, mid, parsed.drops)
+        rel_added += added
+        rel_updated += updated_rel
+        updated_maps, unknown = merge_spawn_map_ids(maps, mid, spawn_map_ids)
+        maps_updated += updated_maps
+        if unknown:
+            unknown_maps[mid] = unknown
+
+        payloads = monster_group_payloads(parsed.stats, parsed.drops, spawn_map_ids)
+        for group, payload in payloads.items():
+            if table.record("monster", mid, group, SOURCE_MAPLENOTE, payload, fetched_at=fetched_at):
+                changed_groups += 1
+        print(f"  Drops {len(parsed.drops)} (+{added}/~{updated_rel}), spawns {len(spawn_map_ids)}, "
+              f"groups recorded: {', '.join(payloads) or '-'}")
+
+        if i < len(candidates):
+            time.sleep(args.delay)
+
+    tag = f"refresh-{datetime.now(timezone.utc).strftime('%Y%m%d')}"
+    save_with_history("monster_data.json", monsters, tag=tag, source="refresh_stale_monsters")
+    save_with_history("monster_item_relations.json", relations, tag=tag, source="refresh_stale_monsters")
+    save_with_history("map_data.json", maps, tag=tag, source="refresh_stale_monsters")
+    table.save()
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print(f"  - Requests: {len(candidates)} (errors {errors})")
+    print(f"  - Field groups changed since last fetch: {changed_groups}")
+    print(f"  - Stats updated: {stats_updated}")
+    print(f"  - Relations: +{rel_added} / ~{rel_updated}")
+    print(f"  - Maps updated(monsterIds): {maps_updated}")
+    if unknown_maps:
+        print(f"  - Spawn maps not in map_data.json (run the regional updater): {unknown_maps}")
+    print(f"  - provenance: {table.path}")
+
+
+if __name__ == "__main__":
+    main()
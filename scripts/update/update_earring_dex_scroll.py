@@ -7,6 +7,7 @@ from pathlib import Path
 
 # scripts/utils.py import를 위한 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
 from utils import get_data_path
 
 # 귀장식 민첩 주문서 60% ID
@@ -45,8 +46,7 @@ def main():
             updated_count += 1
     
     # 저장
-    with open(get_data_path('monster_data.json'), 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(get_data_path('monster_data.json'), monsters, source=Path(__file__).stem)
     
     print(f"\n총 {updated_count}개 몬스터 업데이트됨")
 
@@ -1,6 +1,12 @@
 import json
+import sys
 from pathlib import Path
 
+# scripts/utils.py import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import get_data_path
+
 # 업데이트할 몬스터의 경험치 정보
 # (몬스터 이름, 기존 경험치, 새로운 경험치)
 EXP_UPDATES = [
@@ -62,8 +68,7 @@ def update_monster_exp(input_file, output_file=None):
             print(f"  [WARN] {monster_name} (기존 exp: {old_exp})를 찾을 수 없습니다.")
     
     # 파일에 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, monsters, source=Path(__file__).stem)
     
     print(f"\n총 {updated_count}개의 몬스터 경험치가 업데이트되었습니다.")
     print(f"업데이트된 데이터가 {output_file}에 저장되었습니다.")
@@ -71,5 +76,5 @@ def update_monster_exp(input_file, output_file=None):
     return updated_count
 
 if __name__ == "__main__":
-    input_file = Path(__file__).parent / "monster_data.json"
+    input_file = get_data_path("monster_data.json")
     update_monster_exp(input_file)
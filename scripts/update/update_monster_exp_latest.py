@@ -8,6 +8,10 @@ from pathlib import Path
 # scripts/utils.py import를 위한 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils import get_data_path
+from changelog import save_with_history
+
+# 변경 이력(src/data/history)에 남길 패치 태그
+PATCH_TAG = "2025-12-23-patch"
 
 # 최신 패치에서 업데이트할 몬스터의 경험치 정보
 # (몬스터 ID, 기존 경험치, 새로운 경험치)
@@ -53,8 +57,8 @@ def main():
     
     # 파일에 저장
     monster_file = get_data_path('monster_data.json')
-    with open(monster_file, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    recorded = save_with_history('monster_data.json', monsters, tag=PATCH_TAG, source='update_monster_exp_latest')
+    print(f"변경 이력 {recorded}건 기록 (태그: {PATCH_TAG})")
     
     print(f"\n총 {updated_count}개의 몬스터 경험치가 업데이트되었습니다.")
     print(f"업데이트된 데이터가 {monster_file}에 저장되었습니다.")
@@ -1,6 +1,12 @@
 import json
+import sys
 from pathlib import Path
 
+# scripts/utils.py import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from changelog import save_json_file
+from utils import PROJECT_ROOT, get_data_path
+
 def update_monster_ids(input_file, output_file=None):
     """
     몬스터의 ID와 imageUrl을 업데이트합니다.
@@ -46,8 +52,7 @@ def update_monster_ids(input_file, output_file=None):
             print(f"  [UPDATE] {monster_name}: {old_id} -> {new_id}")
     
     # 파일에 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, ensure_ascii=False, indent=2)
+    save_json_file(output_file, monsters, source=Path(__file__).stem)
     
     print(f"\n총 {updated_count}개의 몬스터 ID가 업데이트되었습니다.")
     print(f"업데이트된 데이터가 {output_file}에 저장되었습니다.")
@@ -56,8 +61,8 @@ def update_monster_ids(input_file, output_file=None):
 
 if __name__ == "__main__":
     # 프로젝트 루트와 src/data 모두 업데이트
-    root_file = Path(__file__).parent / "monster_data.json"
-    src_file = Path(__file__).parent / "src" / "data" / "monster_data.json"
+    root_file = PROJECT_ROOT / "monster_data.json"
+    src_file = get_data_path("monster_data.json")
     
     if root_file.exists():
         print("루트 monster_data.json 업데이트 중...")
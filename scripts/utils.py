@@ -1,15 +1,31 @@
 """
 스크립트 공통 유틸리티
 """
+import os
 from pathlib import Path
 
 # 프로젝트 루트 디렉토리 (scripts/ 폴더의 부모 디렉토리)
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# 설정하면 src/data 대신 이 디렉토리를 데이터 디렉토리로 사용 (합성 데이터셋 부하 테스트용)
+DATA_DIR_ENV = "MAPLE_DATA_DIR"
+
+
+def get_data_dir() -> Path:
+    """
+    데이터 디렉토리(src/data/) 경로를 반환합니다.
+    MAPLE_DATA_DIR 환경 변수가 있으면 그 디렉토리를 반환합니다.
+    """
+    override = os.environ.get(DATA_DIR_ENV)
+    if override:
+        return Path(override)
+    return PROJECT_ROOT / "src" / "data"
+
 
 def get_data_path(filename: str) -> Path:
     """
     src/data/ 폴더 내 파일의 경로를 반환합니다.
+    MAPLE_DATA_DIR 환경 변수가 있으면 그 디렉토리 기준으로 반환합니다.
     
     Args:
         filename: 파일 이름 (예: 'monster_data.json')
@@ -17,7 +33,7 @@ def get_data_path(filename: str) -> Path:
     Returns:
         파일의 전체 경로
     """
-    return PROJECT_ROOT / "src" / "data" / filename
+    return get_data_dir() / filename
 
 
 def get_root_path(filename: str) -> Path:
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 파서 골든 코퍼스 검증 + 벤치마크
+
+정규식 위주 파서들(parse_monster_detail_html, parse_stats_section, parse_item_detail_from_html,
+parse_equipment_table_html, parse_weapon_table_html, mapledb parse_monster_detail_html, parse_map_detail_html)을
+버전이 있는 골든 코퍼스(scripts/validate/golden_corpus/)로 실행해서
+- 출력이 스냅샷과 같은지 (정확성)
+- 초당 처리 페이지 수(ops/sec)와 최대 메모리(tracemalloc peak)가 기준선 대비 얼마나 변했는지 (성능)
+를 확인합니다. 정확성이 깨지거나 성능이 임계값 이상 나빠지면 종료 코드 1로 끝납니다.
+
+코퍼스는 src/data 기반 합성 페이지(standin_server.SyntheticSite)와 표 템플릿으로 만들고(build),
+실제로 수집한 페이지는 HTML 아카이브/디렉토리에서 추가할 수 있습니다(add).
+합성 페이지는 파서 출력만 스냅샷하면 자기 자신과 비교하는 셈이므로, 페이지를 만든 src/data 값을
+케이스의 "expect"로 함께 저장하고 run에서 파서 출력이 그 값과 맞는지도 확인합니다.
+스냅샷은 "지금과 같은가", expect는 "원본 데이터와 같은가"를 봅니다.
+합성 페이지는 실제 사이트 마크업의 근사치일 뿐이니, 크롤링한 아카이브가 있으면 add로 실제 페이지를
+커밋해 두세요 (run이 케이스 출처별 개수를 출력합니다).
+성능 기준선은 실행 환경마다 다르므로 커밋하지 않고 src/request/benchmarks/에 저장합니다.
+
+사용 예시:
+    python scripts/validate/benchmark_parsers.py build            # 합성 코퍼스 생성 + 스냅샷 갱신
+    python scripts/validate/benchmark_parsers.py add --archive src/request/corpus.pack --limit 20
+    python scripts/validate/benchmark_parsers.py snapshot         # 파서 출력 변경을 의도한 경우 스냅샷 갱신
+    python scripts/validate/benchmark_parsers.py run --save-baseline
+    python scripts/validate/benchmark_parsers.py run --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# scripts/ 공통 모듈 및 parse/ 스크립트 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "parse"))
+import update_monsters_from_mapledb as mapledb_site
+from crawl_map_details import parse_map_detail_html
+from parse_equipment_table import parse_equipment_table_html
+from parse_item_detail import parse_item_detail_from_html
+from parse_weapon_table import parse_weapon_table_html
+from update_crimsonwood_monsters_from_site import parse_monster_detail_html, parse_stats_section
+from utils import PROJECT_ROOT
+
+CORPUS_DIR = Path(__file__).parent / "golden_corpus"
+MANIFEST_FILE = CORPUS_DIR / "manifest.json"
+SNAPSHOT_FILE = CORPUS_DIR / "snapshots.json"
+BASELINE_FILE_DEFAULT = PROJECT_ROOT / "src" / "request" / "benchmarks" / "parser_baseline.json"
+
+# 코퍼스 페이지 구성이 바뀌면 올림 (스냅샷/기준선은 같은 버전끼리만 비교)
+CORPUS_VERSION = 2
+
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_TIME = 0.3
+
+
+def _monster_detail(html_text: str, args: Dict[str, str]):
+    return parse_monster_detail_html(html_text, monster_id=args["monster_id"])
+
+
+# 파서 이름 -> (html, args) 호출
+PARSERS: Dict[str, Callable[[str, Dict[str, str]], object]] = {
+    "maplenote.monster_detail": _monster_detail,
+    "maplenote.stats_section": lambda html_text, args: parse_stats_section(html_text),
+    "maplenote.item_detail": lambda html_text, args: parse_item_detail_from_html(html_text, args.get("item_id")),
+    "maplenote.map_detail": lambda html_text, args: parse_map_detail_html(html_text, args["map_id"]),
+    "table.equipment": lambda html_text, args: parse_equipment_table_html(html_text, args.get("job_category", "common")),
+    "table.weapon": lambda html_text, args: parse_weapon_table_html(html_text),
+    "mapledb.monster_detail": lambda html_text, args: mapledb_site.parse_monster_detail_html(html_text, args["monster_id"]),
+}
+
+
+def to_jsonable(value):
+    """dataclass/tuple 출력을 스냅샷과 비교 가능한 JSON 값으로"""
+    if is_dataclass(value):
+        value = asdict(value)
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def run_parser(parser: str, html_text: str, args: Dict[str, str]):
+    # 표 파서는 알 수 없는 카테고리를 print하므로 측정 중 출력은 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        return PARSERS[parser](html_text, args)
+
+
+# ---------- 코퍼스 ----------
+
+def load_manifest() -> Dict[str, object]:
+    if not MANIFEST_FILE.exists():
+        return {"version": CORPUS_VERSION, "cases": []}
+    with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: Dict[str, object]) -> None:
+    manifest["cases"] = sorted(manifest["cases"], key=lambda c: c["id"])
+    CORPUS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def add_case(
+    manifest: Dict[str, object],
+    case_id: str,
+    parser: str,
+    html_text: str,
+    args: Dict[str, str],
+    origin: str = "synthetic",
+    expect: Optional[object] = None,
+) -> None:
+    filename = re.sub(r"[^0-9A-Za-z_.-]+", "_", case_id) + ".html"
+    (CORPUS_DIR / "pages").mkdir(parents=True, exist_ok=True)
+    (CORPUS_DIR / "pages" / filename).write_text(html_text, encoding="utf-8")
+    cases = [c for c in manifest["cases"] if c["id"] != case_id]
+    case = {"id": case_id, "parser": parser, "file": f"pages/{filename}", "args": args, "origin": origin}
+    if expect is not None:
+        case["expect"] = expect
+    cases.append(case)
+    manifest["cases"] = cases
+
+
+def load_cases(manifest: Dict[str, object]) -> List[Tuple[Dict[str, object], str]]:
+    return [((case), (CORPUS_DIR / case["file"]).read_text(encoding="utf-8")) for case in manifest["cases"]]
+
+
+# 합성 페이지에 그대로 찍히는 monster stats 키 (hp는 "11.0K"처럼 반올림되어 찍히므로 제외)
+EXPECTED_STAT_KEYS = ("mp", "exp", "knockbackDamage", "physicalDamage", "magicDamage", "physicalDefense",
+                      "magicDefense", "speed", "mesos", "requiredAccuracy")
+
+
+def _expected_stats(monster: dict) -> Dict[str, object]:
+    stats = dict(monster.get("stats") or {})
+    stats["exp"] = monster.get("exp")
+    return {key: stats[key] for key in EXPECTED_STAT_KEYS if stats.get(key) is not None}
+
+
+def _expected_monster_detail(site, monster: dict) -> Dict[str, object]:
+    return {
+        "monster_id": monster["id"],
+        "stats": _expected_stats(monster),
+        "spawn_maps": [[map_id, site.maps[map_id].get("name", "")] for map_id in site.spawn_maps.get(monster["id"], [])],
+        "drops": [[rel["itemId"], rel.get("dropRate")] for rel in site.drops.get(monster["id"], [])],
+    }
+
+
+def _expected_mapledb(monster: dict) -> Dict[str, object]:
+    stats = monster.get("stats") or {}
+    expect = {key: int(monster[key]) for key in ("level", "exp", "hp") if monster.get(key) is not None}
+    if stats.get("mp") is not None:
+        expect["mp"] = int(stats["mp"])
+    return expect
+
+
+def _expected_map_detail(game_map: dict) -> Dict[str, object]:
+    return {
+        "map_id": game_map["id"],
+        "name": game_map["name"],
+        "monster_ids": list(game_map.get("monsterIds") or []),
+        "monster_spawns": dict(game_map.get("monsterSpawns") or {}),
+        # 파서는 자기 자신으로 가는 포탈을 버림
+        "portal_map_ids": [pid for pid in game_map.get("portalMapIds") or [] if pid != game_map["id"]],
+    }
+
+
+def _expected_table(groups: List[List[dict]]) -> List[Dict[str, object]]:
+    return [{"id": item["id"], "name": item["name"]} for rows in groups for item in rows]
+
+
+def matches_expected(expected, actual) -> bool:
+    """expect에 적힌 키만 비교 (dict는 부분 일치, list는 길이와 순서까지 일치)"""
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and matches_expected(value, actual[key]) for key, value in expected.items()
+        )
+    if isinstance(expected, list):
+        return (isinstance(actual, list) and len(expected) == len(actual)
+                and all(matches_expected(e, a) for e, a in zip(expected, actual)))
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool) and isinstance(actual, (int, float)):
+        return abs(expected - actual) < 1e-9
+    return expected == actual
+
+
+def _table_rows(items: List[dict]) -> str:
+    return "".join(
+        f'<tr>\n<td>{item.get("reqLevel", "")}</td>\n'
+        f'<td><a href="/item_detail/{item["id"]}"><img src="{item.get("imageUrl", "")}"></a></td>\n'
+        f'<td>{item["name"]}</td>\n</tr>\n'
+        for item in items
+    )
+
+
+def build_synthetic(manifest: Dict[str, object], per_kind: int = 6) -> int:
+    """src/data로 합성 페이지를 만들어 코퍼스에 추가합니다. (id 순으로 골라 결정적)"""
+    from standin_server import SyntheticSite
+
+    site = SyntheticSite()
+    added = 0
+
+    def id_key(entity_id: str):
+        return (0, int(entity_id)) if entity_id.isdigit() else (1, entity_id)
+
+    monsters = sorted(
+        (m for m in site.monsters.values() if m.get("stats") and site.drops.get(m["id"])),
+        key=lambda m: id_key(m["id"]),
+    )[:per_kind]
+    for m in monsters:
+        page = site.monster_detail(m["id"])
+        add_case(manifest, f"monster_detail/{m['id']}", "maplenote.monster_detail", page, {"monster_id": m["id"]},
+                 expect=_expected_monster_detail(site, m))
+        add_case(manifest, f"stats_section/{m['id']}", "maplenote.stats_section", page, {},
+                 expect=_expected_stats(m))
+        add_case(manifest, f"mapledb/{m['id']}", "mapledb.monster_detail", site.mapledb_monster(m["id"]),
+                 {"monster_id": m["id"]}, expect=_expected_mapledb(m))
+        added += 3
+    if monsters:
+        # 중간에 끊긴 페이지 (정규식 최악 경우 확인용, 출력은 스냅샷으로만 비교)
+        page = site.monster_detail(monsters[0]["id"])
+        add_case(manifest, f"monster_detail/{monsters[0]['id']}-truncated", "maplenote.monster_detail",
+                 page[: len(page) * 3 // 5], {"monster_id": monsters[0]["id"]})
+        added += 1
+
+    maps = sorted(site.maps.values(), key=lambda m: (not m.get("monsterSpawns"), not m.get("portalMapIds"), id_key(m["id"])))
+    for game_map in maps[:per_kind]:
+        add_case(manifest, f"map_detail/{game_map['id']}", "maplenote.map_detail", site.map_detail(game_map["id"]),
+                 {"map_id": game_map["id"]}, expect=_expected_map_detail(game_map))
+        added += 1
+
+    items = sorted(site.items.values(), key=lambda i: id_key(i["id"]))
+    for item in items[:per_kind]:
+        add_case(manifest, f"item_detail/{item['id']}", "maplenote.item_detail", site.item_detail(item["id"]),
+                 {"item_id": item["id"]}, expect={"id": item["id"], "name": item["name"]})
+        added += 1
+
+    equips = [i for i in items if i.get("majorCategory") == "common" and i.get("mediumCategory") in ("hat", "gloves", "shoes")]
+    by_category = {label: [i for i in equips if i.get("mediumCategory") == cat][:8]
+                   for label, cat in (("모자", "hat"), ("장갑", "gloves"), ("신발", "shoes"))}
+    v1 = "".join(f"<!-- ``` {label} -->\n<table>\n{_table_rows(rows)}</table>\n<!-- ``` -->\n"
+                 for label, rows in by_category.items())
+    v2 = "".join(f"<!-- {label} -->\n<table>\n{_table_rows(rows)}</table>\n<!-- {label} 끝 -->\n"
+                 for label, rows in by_category.items())
+    expect = _expected_table(list(by_category.values()))
+    add_case(manifest, "equipment_table/v1", "table.equipment", v1, {"job_category": "common"}, expect=expect)
+    add_case(manifest, "equipment_table/v2", "table.equipment", v2, {"job_category": "common"}, expect=expect)
+
+    weapons = [i for i in items if i.get("majorCategory") == "weapon" and i.get("reqLevel")]
+    weapon_groups = {label: [i for i in weapons if i.get("mediumCategory") == cat][:8]
+                     for label, cat in (("한손검", "one-handed-sword"), ("활", "bow"), ("완드", "wand"))}
+    code_block = "".join(f"```{label}\n<table>\n{_table_rows(rows)}</table>\n```\n" for label, rows in weapon_groups.items())
+    comment = "".join(f"<!-- {label} -->\n<table>\n{_table_rows(rows)}</table>\n" for label, rows in weapon_groups.items())
+    expect = _expected_table(list(weapon_groups.values()))
+    add_case(manifest, "weapon_table/code-block", "table.weapon", code_block, {}, expect=expect)
+    add_case(manifest, "weapon_table/comment", "table.weapon", comment, {}, expect=expect)
+    return added + 4
+
+
+def add_from_pages(manifest: Dict[str, object], pages: List[Tuple[str, str]], limit: Optional[int]) -> int:
+    """(URL 또는 파일명, html) 목록에서 종류를 추정해 실제 페이지를 코퍼스에 추가"""
+    added = 0
+    for source, html_text in pages:
+        if limit is not None and added >= limit:
+            break
+        m = re.search(r"(monster_detail|map_detail|item_detail)/(\d+)", source) or \
+            re.search(r"(monster|map|item)_(\d+)\.html$", source)
+        mdb = re.search(r"mapledb\.kr/search\.php\?q=(\d+)", source)
+        if mdb:
+            add_case(manifest, f"mapledb/{mdb.group(1)}-real", "mapledb.monster_detail", html_text,
+                     {"monster_id": mdb.group(1)}, origin="real")
+        elif m and m.group(1).startswith("monster"):
+            add_case(manifest, f"monster_detail/{m.group(2)}-real", "maplenote.monster_detail", html_text,
+                     {"monster_id": m.group(2)}, origin="real")
+        elif m and m.group(1).startswith("map"):
+            add_case(manifest, f"map_detail/{m.group(2)}-real", "maplenote.map_detail", html_text, {"map_id": m.group(2)},
+                     origin="real")
+        elif m:
+            add_case(manifest, f"item_detail/{m.group(2)}-real", "maplenote.item_detail", html_text,
+                     {"item_id": m.group(2)}, origin="real")
+        else:
+            continue
+        added += 1
+    return added
+
+
+# ---------- 스냅샷 / 벤치마크 ----------
+
+def compute_outputs(manifest: Dict[str, object]) -> Dict[str, object]:
+    return {case["id"]: to_jsonable(run_parser(case["parser"], html_text, case["args"]))
+            for case, html_text in load_cases(manifest)}
+
+
+def save_snapshots(manifest: Dict[str, object]) -> int:
+    outputs = compute_outputs(manifest)
+    with open(SNAPSHOT_FILE, "w", encoding="utf-8") as f:
+        json.dump({"version": manifest["version"], "outputs": outputs}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+    return len(outputs)
+
+
+def check_snapshots(manifest: Dict[str, object]) -> List[str]:
+    if not SNAPSHOT_FILE.exists():
+        return ["snapshots.json not found (run: benchmark_parsers.py snapshot)"]
+    with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != manifest["version"]:
+        return [f"snapshot version {snapshot.get('version')} != corpus version {manifest['version']}"]
+    expected = snapshot["outputs"]
+    failures = []
+    for case_id, output in compute_outputs(manifest).items():
+        if case_id not in expected:
+            failures.append(f"{case_id}: no snapshot")
+        elif output != expected[case_id]:
+            failures.append(f"{case_id}: output differs from snapshot")
+    return failures
+
+
+def check_expectations(manifest: Dict[str, object]) -> List[str]:
+    """합성 케이스의 파서 출력이 페이지를 만든 src/data 값(expect)과 맞는지"""
+    failures = []
+    for case, html_text in load_cases(manifest):
+        if "expect" not in case:
+            continue
+        output = to_jsonable(run_parser(case["parser"], html_text, case["args"]))
+        if not matches_expected(case["expect"], output):
+            failures.append(f"{case['id']}: output differs from source data")
+    return failures
+
+
+def benchmark(manifest: Dict[str, object], min_time: float) -> Dict[str, Dict[str, float]]:
+    """파서별 ops/sec (코퍼스 페이지 1개 파싱 = 1 op)와 tracemalloc 최대 메모리(KiB)"""
+    by_parser: Dict[str, List[Tuple[str, Dict[str, str]]]] = {}
+    for case, html_text in load_cases(manifest):
+        by_parser.setdefault(case["parser"], []).append((html_text, case["args"]))
+
+    results = {}
+    for parser, cases in sorted(by_parser.items()):
+        for html_text, args in cases:  # 워밍업
+            run_parser(parser, html_text, args)
+        ops = 0
+        started = time.perf_counter()
+        while True:
+            for html_text, args in cases:
+                run_parser(parser, html_text, args)
+            ops += len(cases)
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+
+        tracemalloc.start()
+        for html_text, args in cases:
+            run_parser(parser, html_text, args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[parser] = {"cases": len(cases), "opsPerSec": round(ops / elapsed, 1), "peakKiB": round(peak / 1024, 1)}
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    regressions = []
+    for parser, r in results.items():
+        base = baseline.get(parser)
+        if not base:
+            continue
+        if r["opsPerSec"] < base["opsPerSec"] * (1 - threshold):
+            regressions.append(f"{parser}: ops/sec {base['opsPerSec']} -> {r['opsPerSec']}")
+        if r["peakKiB"] > base["peakKiB"] * (1 + threshold):
+            regressions.append(f"{parser}: peak memory {base['peakKiB']}KiB -> {r['peakKiB']}KiB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 골든 코퍼스 검증 + 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="src/data 기반 합성 코퍼스 생성 + 스냅샷 갱신")
+    p_build.add_argument("--per-kind", type=int, default=6)
+
+    p_add = sub.add_parser("add", help="실제 수집 페이지 추가 (아카이브 또는 디렉토리)")
+    p_add.add_argument("--archive", type=Path, default=None)
+    p_add.add_argument("--dir", type=Path, default=None)
+    p_add.add_argument("--limit", type=int, default=20)
+
+    sub.add_parser("snapshot", help="현재 파서 출력으로 스냅샷 갱신")
+
+    p_run = sub.add_parser("run", help="스냅샷 비교 + 벤치마크")
+    p_run.add_argument("--baseline", type=Path, default=BASELINE_FILE_DEFAULT)
+    p_run.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    p_run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용 성능 저하 비율 (기본 0.25)")
+    p_run.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="파서별 최소 측정 시간 (초)")
+
+    args = parser.parse_args()
+    manifest = load_manifest()
+
+    if args.command == "build":
+        manifest["version"] = CORPUS_VERSION
+        added = build_synthetic(manifest, per_kind=args.per_kind)
+        save_manifest(manifest)
+        print(f"Corpus: {added} synthetic cases written, {len(manifest['cases'])} total")
+        print(f"Snapshots: {save_snapshots(manifest)} outputs -> {SNAPSHOT_FILE}")
+        return
+
+    if args.command == "add":
+        pages: List[Tuple[str, str]] = []
+        if args.archive:
+            from html_archive import ArchiveReader
+            reader = ArchiveReader(args.archive)
+            pages += [(entry.url, body.decode("utf-8", "ignore")) for entry, body in reader.iter_latest()]
+        if args.dir:
+            pages += [(p.name, p.read_text(encoding="utf-8", errors="ignore")) for p in sorted(args.dir.glob("*.html"))]
+        added = add_from_pages(manifest, pages, args.limit)
+        # 코퍼스가 바뀌었으므로 버전을 올리고 스냅샷을 새로 만듦
+        manifest["version"] = manifest.get("version", CORPUS_VERSION) + (1 if added else 0)
+        save_manifest(manifest)
+        print(f"Added {added} real pages (corpus version {manifest['version']})")
+        print(f"Snapshots: {save_snapshots(manifest)} outputs -> {SNAPSHOT_FILE}")
+        return
+
+    if args.command == "snapshot":
+        print(f"Snapshots: {save_snapshots(manifest)} outputs -> {SNAPSHOT_FILE}")
+        return
+
+    if not manifest["cases"]:
+        print("Corpus is empty. Run: python scripts/validate/benchmark_parsers.py build")
+        sys.exit(1)
+
+    failures = check_snapshots(manifest) + check_expectations(manifest)
+    results = benchmark(manifest, args.min_time)
+
+    baseline_data = {}
+    if args.baseline.exists():
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline_data = json.load(f)
+    baseline = baseline_data.get("results", {}) if baseline_data.get("version") == manifest["version"] else {}
+    regressions = compare(results, baseline, args.threshold)
+
+    origins: Dict[str, int] = {}
+    for case in manifest["cases"]:
+        origin = case.get("origin", "synthetic")
+        origins[origin] = origins.get(origin, 0) + 1
+    print(f"Corpus version {manifest['version']}, {len(manifest['cases'])} cases "
+          f"({', '.join(f'{k} {v}' for k, v in sorted(origins.items()))})")
+    if not origins.get("real"):
+        print("  (no real pages yet: add crawled pages with `benchmark_parsers.py add --archive ...`)")
+    print(f"{'parser':<26} {'cases':>5} {'ops/sec':>10} {'peak KiB':>9} {'vs baseline':>12}")
+    for name, r in results.items():
+        base = baseline.get(name)
+        delta = f"{(r['opsPerSec'] / base['opsPerSec'] - 1) * 100:+.1f}%" if base else "-"
+        print(f"{name:<26} {r['cases']:>5} {r['opsPerSec']:>10.1f} {r['peakKiB']:>9.1f} {delta:>12}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"version": manifest["version"], "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\nBaseline saved: {args.baseline}")
+
+    if failures:
+        print("\nCorrectness failures:")
+        for line in failures:
+            print(f"  - {line}")
+    if regressions:
+        print(f"\nPerformance regressions (threshold {args.threshold:.0%}):")
+        for line in regressions:
+            print(f"  - {line}")
+    if failures or regressions:
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 추출 정규식 역추적 퍼징
+
+골든 코퍼스(validate/golden_corpus/) 페이지를 변형해서
+1) 패턴별 성장률: 닫는 태그 제거/잘림/따옴표 깨짐 등으로 변형한 페이지를 1, 2, 4, 8배로 늘려가며
+   각 정규식 실행 시간을 재고, log(시간)/log(크기) 기울기가 임계값(기본 1.5)을 넘으면 초선형으로 표시
+2) 파서 무작위 퍼징: 무작위로 자르고/복제하고/태그를 끼워 넣은 페이지로 파서를 시간 제한 모드(regex_guard)에서 실행해
+   시간 초과나 예외가 나는 입력을 src/request/fuzz/에 저장
+를 수행합니다. 문제가 발견되면 종료 코드 1.
+
+측정 자체도 워커 프로세스에서 시간 제한으로 실행하므로 폭주하는 패턴이 있어도 하네스가 멈추지 않습니다.
+
+사용 예시:
+    python scripts/validate/fuzz_regex.py
+    python scripts/validate/fuzz_regex.py --iterations 500 --timeout 1 --seed 7
+    python scripts/validate/fuzz_regex.py --patterns-only --max-scale 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import math
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# scripts/ 공통 모듈 import를 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "parse"))
+from benchmark_parsers import PARSERS, load_cases, load_manifest
+from regex_guard import BoundedRunner, ParseTimeout
+from utils import PROJECT_ROOT
+
+FUZZ_DIR_DEFAULT = PROJECT_ROOT / "src" / "request" / "fuzz"
+
+# 추출 패턴을 가져올 파서 모듈 (모듈 최상위의 컴파일된 re.Pattern, 또는 그 dict/tuple을 모두 수집)
+PATTERN_MODULES = (
+    "crawl_map_details",
+    "parse_equipment_table",
+    "parse_item_detail",
+    "parse_weapon_table",
+    "update_monsters_from_mapledb",
+) + tuple(sorted(p.stem for p in (Path(__file__).parent.parent / "parse").glob("update_*_monsters_from_site.py")))
+
+
+def _module_patterns(module: ModuleType) -> Iterator[Tuple[str, re.Pattern]]:
+    for name, value in vars(module).items():
+        if name.startswith("_"):
+            continue
+        if isinstance(value, re.Pattern):
+            yield name, value
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                if isinstance(item, re.Pattern):
+                    yield f"{name}[{key}]", item
+        elif isinstance(value, (list, tuple)):
+            for i, item in enumerate(value):
+                if isinstance(item, re.Pattern):
+                    yield f"{name}[{i}]", item
+
+
+def collect_patterns(modules=PATTERN_MODULES) -> List[Tuple[str, re.Pattern]]:
+    """
+    파서 모듈에서 실제로 쓰는 컴파일된 패턴을 (모듈.이름, 패턴) 목록으로 모읍니다.
+    지역별 스크립트처럼 같은 패턴이 여러 모듈에 있으면 처음 발견한 이름 하나로만 측정합니다.
+    """
+    seen = set()
+    patterns: List[Tuple[str, re.Pattern]] = []
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        for name, compiled in _module_patterns(module):
+            key = (compiled.pattern, compiled.flags)
+            if key in seen:
+                continue
+            seen.add(key)
+            patterns.append((f"{module_name}.{name}", compiled))
+    return patterns
+
+
+# 결정적 변형 (성장률 측정용)
+MUTATIONS: Dict[str, Callable[[str], str]] = {
+    "original": lambda s: s,
+    "no-closing-h3": lambda s: re.sub(r"</h3>", "", s, flags=re.IGNORECASE),
+    "no-closing-div": lambda s: s.replace("</div>", ""),
+    "no-closing-td": lambda s: s.replace("</td>", ""),
+    "no-h2": lambda s: re.sub(r"</?h2[^>]*>", "", s, flags=re.IGNORECASE),
+    "unclosed-quote": lambda s: re.sub(r'(/(?:map|item|monster)_detail/\d+)"', r"\1", s),
+    "truncated": lambda s: s[: len(s) // 2],
+    "no-comment-close": lambda s: s.replace("-->", ""),
+}
+
+
+def time_pattern(pattern: str, flags: int, text: str) -> float:
+    """워커 프로세스에서 실행되는 측정 함수 (findall 1회)"""
+    compiled = re.compile(pattern, flags)
+    started = time.perf_counter()
+    compiled.findall(text)
+    return time.perf_counter() - started
+
+
+def growth_slope(points: List[Tuple[int, float]]) -> Optional[float]:
+    """(크기, 시간) 로그-로그 최소제곱 기울기. 1이면 선형, 2면 제곱"""
+    pts = [(math.log(n), math.log(max(t, 1e-7))) for n, t in points if n > 0]
+    if len(pts) < 2:
+        return None
+    mx = sum(x for x, _ in pts) / len(pts)
+    my = sum(y for _, y in pts) / len(pts)
+    var = sum((x - mx) ** 2 for x, _ in pts)
+    return sum((x - mx) * (y - my) for x, y in pts) / var if var else None
+
+
+def pattern_growth(runner: BoundedRunner, patterns: List[Tuple[str, re.Pattern]], pages: List[str], scales: List[int],
+                   timeout: float, slope_limit: float, min_seconds: float) -> List[Dict[str, object]]:
+    """패턴 x 변형 조합별 성장률 측정 결과"""
+    rows = []
+    base = "\n".join(pages)
+    for name, compiled in patterns:
+        for mutation, mutate in MUTATIONS.items():
+            mutated = mutate(base)
+            points: List[Tuple[int, float]] = []
+            timed_out = False
+            for k in scales:
+                text = mutated * k
+                try:
+                    points.append((len(text), runner.call(time_pattern, compiled.pattern, compiled.flags, text, timeout=timeout)))
+                except ParseTimeout:
+                    timed_out = True
+                    points.append((len(text), timeout))
+                    break
+            slope = growth_slope(points)
+            worst = max(t for _, t in points)
+            # 아주 짧은 시간은 측정 잡음이 크므로 min_seconds 이상일 때만 기울기로 판정
+            flagged = timed_out or (slope is not None and slope > slope_limit and worst >= min_seconds)
+            rows.append({
+                "pattern": name,
+                "mutation": mutation,
+                "sizes": [n for n, _ in points],
+                "seconds": [round(t, 6) for _, t in points],
+                "slope": round(slope, 2) if slope is not None else None,
+                "timedOut": timed_out,
+                "flagged": flagged,
+            })
+    return rows
+
+
+def random_mutation(rng: random.Random, html_text: str) -> str:
+    """무작위 변형 1~3회 (자르기, 구간 복제, 구간 삭제, 태그 조각 삽입)"""
+    fragments = ['<a href="/map_detail/1">', '<a href="/item_detail/2">', "<h3>", "<h2>", "<tr><td>1</td>",
+                 '<div class="drop-rate-box">', "<!-- ", "```", '"', "<"]
+    text = html_text
+    for _ in range(rng.randint(1, 3)):
+        if not text:
+            break
+        op = rng.choice(("truncate", "duplicate", "delete", "insert"))
+        i = rng.randrange(len(text))
+        j = min(len(text), i + rng.randint(1, max(1, len(text) // 4)))
+        if op == "truncate":
+            text = text[:i]
+        elif op == "duplicate":
+            text = text[:j] + text[i:j] * rng.randint(2, 50) + text[j:]
+        elif op == "delete":
+            text = text[:i] + text[j:]
+        else:
+            text = text[:i] + rng.choice(fragments) * rng.randint(1, 200) + text[i:]
+    return text
+
+
+def parser_fuzz(runner: BoundedRunner, manifest, iterations: int, timeout: float, rng: random.Random,
+                out_dir: Path) -> Dict[str, Dict[str, object]]:
+    cases = load_cases(manifest)
+    stats: Dict[str, Dict[str, object]] = {}
+    for n in range(iterations):
+        case, html_text = rng.choice(cases)
+        parser = case["parser"]
+        mutated = random_mutation(rng, html_text)
+        s = stats.setdefault(parser, {"runs": 0, "maxSeconds": 0.0, "timeouts": [], "errors": []})
+        s["runs"] += 1
+        started = time.perf_counter()
+        try:
+            runner.call(_run_parser, parser, mutated, case["args"], timeout=timeout)
+        except ParseTimeout:
+            path = out_dir / f"timeout_{parser}_{n}.html"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(mutated, encoding="utf-8")
+            s["timeouts"].append(str(path))
+        except Exception as e:
+            path = out_dir / f"error_{parser}_{n}.html"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(mutated, encoding="utf-8")
+            s["errors"].append(f"{type(e).__name__}: {e} ({path})")
+        s["maxSeconds"] = round(max(s["maxSeconds"], time.perf_counter() - started), 4)
+    return stats
+
+
+def _run_parser(parser: str, html_text: str, args: Dict[str, str]):
+    """워커 프로세스용 (결과는 버리고 완료 여부만 확인)"""
+    import contextlib
+    import io
+    with contextlib.redirect_stdout(io.StringIO()):
+        PARSERS[parser](html_text, args)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 추출 정규식 역추적 퍼징")
+    parser.add_argument("--iterations", type=int, default=200, help="파서 무작위 퍼징 횟수")
+    parser.add_argument("--timeout", type=float, default=2.0, help="실행 1회 시간 제한 (초)")
+    parser.add_argument("--max-scale", type=int, default=8, help="성장률 측정 최대 배수 (1, 2, 4, ... max)")
+    parser.add_argument("--slope", type=float, default=1.5, help="초선형 판정 기울기")
+    parser.add_argument("--min-seconds", type=float, default=0.01, help="기울기 판정에 필요한 최소 실행 시간")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--patterns-only", action="store_true")
+    parser.add_argument("--output-dir", type=Path, default=FUZZ_DIR_DEFAULT)
+    args = parser.parse_args()
+
+    manifest = load_manifest()
+    if not manifest["cases"]:
+        print("Corpus is empty. Run: python scripts/validate/benchmark_parsers.py build")
+        sys.exit(1)
+    pages = [html_text for _, html_text in load_cases(manifest)]
+    scales = [1]
+    while scales[-1] * 2 <= args.max_scale:
+        scales.append(scales[-1] * 2)
+
+    patterns = collect_patterns()
+    with BoundedRunner(args.timeout, quarantine_dir=None) as runner:
+        print(f"Pattern growth ({len(patterns)} patterns x {len(MUTATIONS)} mutations, scales {scales})...")
+        growth = pattern_growth(runner, patterns, pages, scales, args.timeout, args.slope, args.min_seconds)
+        fuzz = {}
+        if not args.patterns_only:
+            print(f"Parser fuzzing ({args.iterations} iterations, timeout {args.timeout}s)...")
+            fuzz = parser_fuzz(runner, manifest, args.iterations, args.timeout, random.Random(args.seed),
+                               args.output_dir)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_file = args.output_dir / "report.json"
+    with open(report_file, "w", encoding="utf-8") as f:
+        json.dump({"patterns": growth, "parsers": fuzz}, f, ensure_ascii=False, indent=2)
+
+    width = max([30] + [len(name) for name, _ in patterns])
+    print(f"\n{'pattern':<{width}} {'worst mutation':<18} {'slope':>6} {'max s':>9}")
+    for name, _ in patterns:
+        rows = [r for r in growth if r["pattern"] == name]
+        worst = max(rows, key=lambda r: (r["flagged"], max(r["seconds"])))
+        mark = "  <-- super-linear" if worst["flagged"] else ""
+        print(f"{name:<{width}} {worst['mutation']:<18} {worst['slope'] if worst['slope'] is not None else '-':>6} "
+              f"{max(worst['seconds']):>9.4f}{mark}")
+    for name, s in fuzz.items():
+        print(f"  {name:<28} runs {s['runs']:<5} max {s['maxSeconds']:.4f}s  timeouts {len(s['timeouts'])}  errors {len(s['errors'])}")
+
+    flagged = [r for r in growth if r["flagged"]]
+    problems = sum(len(s["timeouts"]) + len(s["errors"]) for s in fuzz.values())
+    print(f"\nReport: {report_file}")
+    if flagged or problems:
+        print(f"Found {len(flagged)} super-linear pattern/mutation pairs, {problems} parser timeouts/errors")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()